@@ -15,4 +15,5 @@
 * limitations under the License.
 """
 
+from .capture_mesh_index import *  # noqa: F401
 from .core import *  # noqa: F401
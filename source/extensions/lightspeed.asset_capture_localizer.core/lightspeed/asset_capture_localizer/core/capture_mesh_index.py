@@ -0,0 +1,165 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["CaptureMeshIndex"]
+
+import os
+from typing import Dict, Iterable, List, Optional
+
+import carb
+import carb.tokens
+import omni.client
+from omni.flux.utils.common.path_utils import read_json_file as _read_json_file
+from omni.flux.utils.common.path_utils import write_json_file as _write_json_file
+from pxr import Sdf
+
+_INDEX_VERSION = 1
+_DEFAULT_INDEX_PATH = "${data}/lightspeed.asset_capture_localizer.core/capture_mesh_index.json"
+
+
+class CaptureMeshIndex:
+    """
+    Persistent index of the prim names (mesh, material, light hashes, etc.) authored in every capture layer.
+
+    Capture layers are only walked again when their size or modified time changed since the last update.
+    """
+
+    def __init__(self, index_path: str = _DEFAULT_INDEX_PATH):
+        self._index_path = carb.tokens.get_tokens_interface().resolve(index_path)
+        # {capture path: {"size": int, "modified_time": str, "prims": [prim names]}}
+        self._captures: Dict[str, Dict] = {}
+        # {prim name: capture path}
+        self._prim_captures: Dict[str, str] = {}
+        self._load()
+
+    @property
+    def index_path(self) -> str:
+        return self._index_path
+
+    def update(self, capture_paths: Iterable[str]) -> bool:
+        """
+        Update the index for the given capture layers. Captures that are not listed anymore are dropped.
+
+        Args:
+            capture_paths: the capture layers to index. When a prim exists in many captures, the last capture wins.
+
+        Returns:
+            True if the index changed
+        """
+        capture_paths = list(capture_paths)
+        changed = set(self._captures.keys()) != set(capture_paths)
+
+        captures = {}
+        for capture_path in capture_paths:
+            signature = self._get_signature(capture_path)
+            entry = self._captures.get(capture_path)
+            if entry is None or signature is None or [entry.get("size"), entry.get("modified_time")] != signature:
+                entry = {
+                    "size": signature[0] if signature else None,
+                    "modified_time": signature[1] if signature else None,
+                    "prims": self._walk_prim_names(capture_path),
+                }
+                changed = True
+            captures[capture_path] = entry
+
+        self._captures = captures
+        self._prim_captures = {
+            prim_name: capture_path for capture_path, entry in captures.items() for prim_name in entry["prims"]
+        }
+        if changed:
+            self._save()
+        return changed
+
+    def get_capture_path(self, prim_name: str) -> Optional[str]:
+        """
+        Get the capture layer a prim was captured in
+
+        Args:
+            prim_name: the name of the prim. Example: mesh_0123456789ABCDEF
+
+        Returns:
+            The capture layer path, or None if the prim is not in any indexed capture
+        """
+        return self._prim_captures.get(prim_name)
+
+    def get_mesh_dict(self) -> Dict[str, str]:
+        """
+        Get the prim name to capture layer path mapping
+
+        Returns:
+            A copy of the mapping
+        """
+        return dict(self._prim_captures)
+
+    @staticmethod
+    def _get_signature(path: str) -> Optional[List]:
+        result, entry = omni.client.stat(path)
+        if result != omni.client.Result.OK:
+            return None
+        # Lists to compare with the values read from the json file
+        return [entry.size, str(entry.modified_time)]
+
+    @staticmethod
+    def _walk_prim_names(capture_path: str) -> List[str]:
+        """Walk the prim specs of the capture layer without composing a stage"""
+        layer = Sdf.Layer.FindOrOpen(capture_path)
+        if not layer:
+            carb.log_warn(f"Unable to open the capture layer: {capture_path}")
+            return []
+        prim_names = []
+        stack = list(reversed(layer.pseudoRoot.nameChildren))
+        while stack:
+            prim_spec = stack.pop()
+            prim_names.append(prim_spec.name)
+            stack.extend(reversed(prim_spec.nameChildren))
+        return prim_names
+
+    @staticmethod
+    def _is_valid_entry(entry) -> bool:
+        return (
+            isinstance(entry, dict)
+            and isinstance(entry.get("prims"), list)
+            and all(isinstance(prim_name, str) for prim_name in entry["prims"])
+        )
+
+    def _load(self):
+        if not os.path.exists(self._index_path):
+            return
+        try:
+            data = _read_json_file(self._index_path)
+        except (IOError, ValueError) as e:
+            carb.log_warn(f"Unable to read the capture mesh index {self._index_path}: {e}")
+            return
+        if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+            return
+        captures = data.get("captures")
+        if not isinstance(captures, dict):
+            return
+        # Malformed entries are dropped and walked again on the next update
+        self._captures = {
+            capture_path: entry for capture_path, entry in captures.items() if self._is_valid_entry(entry)
+        }
+        self._prim_captures = {
+            prim_name: capture_path for capture_path, entry in self._captures.items() for prim_name in entry["prims"]
+        }
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self._index_path), exist_ok=True)
+        if not _write_json_file(
+            self._index_path, {"version": _INDEX_VERSION, "captures": self._captures}, raise_if_error=False
+        ):
+            carb.log_warn(f"Unable to write the capture mesh index {self._index_path}")
@@ -26,6 +26,8 @@ from lightspeed.layer_manager.core import LayerManagerCore, LayerType
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
 from pxr import Sdf, Usd
 
+from .capture_mesh_index import CaptureMeshIndex as _CaptureMeshIndex
+
 
 class AssetCaptureLocalizerCore:
     def __init__(self, context: omni.usd.UsdContext):
@@ -35,6 +37,7 @@ class AssetCaptureLocalizerCore:
 
         self._context = context
         self._layer_manager = LayerManagerCore()
+        self._capture_mesh_index = None
 
     def __traverse_instanced_children(self, prim):
         for child in prim.GetFilteredChildren(Usd.PrimAllPrimsPredicate):
@@ -53,17 +56,19 @@ class AssetCaptureLocalizerCore:
                     capture_usd_files.append(capture_usd)
         return capture_usd_files
 
+    def get_capture_mesh_index(self) -> _CaptureMeshIndex:
+        """
+        Get the prim name to capture index, updated for the current capture files.
+
+        Only the capture files that changed since the last update are read again.
+        """
+        if self._capture_mesh_index is None:
+            self._capture_mesh_index = _CaptureMeshIndex()
+        self._capture_mesh_index.update(self.get_capture_usd_files())
+        return self._capture_mesh_index
+
     def get_capture_mesh_dict(self):
-        capture_files = self.get_capture_usd_files()
-        result = {}
-        for layer_path in capture_files:
-            sub_stage = Usd.Stage.Open(layer_path)
-            all_prims = list(self.__traverse_instanced_children(sub_stage.GetPseudoRoot()))
-            if not all_prims:
-                continue
-            for prim in all_prims:
-                result[prim.GetName()] = layer_path
-        return result
+        return self.get_capture_mesh_index().get_mesh_dict()
 
     def get_all_user_references(self) -> List[Tuple[Usd.Prim, Sdf.Reference, Sdf.Layer, str]]:
         stage = self._context.get_stage()
@@ -71,7 +76,7 @@ class AssetCaptureLocalizerCore:
         all_prims = list(self.__traverse_instanced_children(stage.GetPseudoRoot()))
         if not all_prims:
             return []
-        capture_prims_dict = self.get_capture_mesh_dict()
+        capture_mesh_index = self.get_capture_mesh_index()
         regex_pattern = re.compile("^.*\/([a-zA-Z]+)_([A-Z0-9]{16})(_[0-9]+)*$")  # noqa
         for prim in all_prims:
             if not regex_pattern.match(prim.GetPath().pathString):
@@ -86,12 +91,10 @@ class AssetCaptureLocalizerCore:
                         match = re.match(f"^{MESHES_FILE_PREFIX}(.*).usd$", os.path.basename(ref.assetPath))
                         if match:
                             continue
-                        if capture_prims_dict.get(prim.GetName()):
-                            capture_layer_path = capture_prims_dict[prim.GetName()]
+                        capture_layer_path = capture_mesh_index.get_capture_path(prim.GetName()) or capture_layer_path
                         result.append((prim, ref, layer, capture_layer_path))
             else:
-                if capture_prims_dict.get(prim.GetName()):
-                    capture_layer_path = capture_prims_dict[prim.GetName()]
+                capture_layer_path = capture_mesh_index.get_capture_path(prim.GetName()) or capture_layer_path
                 result.append((prim, None, None, capture_layer_path))
         return result
 
@@ -0,0 +1,118 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from lightspeed.asset_capture_localizer.core import CaptureMeshIndex
+from omni.kit.test.async_unittest import AsyncTestCase
+
+
+class TestCaptureMeshIndex(AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.index_path = str(Path(self.temp_dir.name) / "index" / "capture_mesh_index.json")
+
+    # After running each test
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+        self.temp_dir = None
+
+    def _write_capture(self, name: str, mesh_hashes) -> str:
+        meshes = "".join(f'        def Xform "mesh_{mesh_hash}"\n        {{\n        }}\n' for mesh_hash in mesh_hashes)
+        path = Path(self.temp_dir.name) / name
+        path.write_text(
+            f'#usda 1.0\n\ndef Xform "RootNode"\n{{\n    def Scope "meshes"\n    {{\n{meshes}    }}\n}}\n',
+            encoding="utf8",
+        )
+        return str(path)
+
+    async def test_update_should_index_the_prims_of_every_capture(self):
+        # Arrange
+        capture_0 = self._write_capture("capture_0.usda", ["0123456789ABCDEF", "1123456789ABCDEF"])
+        capture_1 = self._write_capture("capture_1.usda", ["1123456789ABCDEF", "2123456789ABCDEF"])
+        index = CaptureMeshIndex(index_path=self.index_path)
+
+        # Act
+        changed = index.update([capture_0, capture_1])
+
+        # Assert
+        self.assertTrue(changed)
+        self.assertEqual(capture_0, index.get_capture_path("mesh_0123456789ABCDEF"))
+        # The last capture wins
+        self.assertEqual(capture_1, index.get_capture_path("mesh_1123456789ABCDEF"))
+        self.assertEqual(capture_1, index.get_capture_path("mesh_2123456789ABCDEF"))
+        self.assertEqual(capture_1, index.get_mesh_dict()["mesh_1123456789ABCDEF"])
+        self.assertIsNone(index.get_capture_path("mesh_3123456789ABCDEF"))
+        self.assertTrue(Path(self.index_path).exists())
+
+    async def test_reload_should_not_walk_unchanged_captures(self):
+        # Arrange
+        capture_0 = self._write_capture("capture_0.usda", ["0123456789ABCDEF"])
+        CaptureMeshIndex(index_path=self.index_path).update([capture_0])
+
+        # Act
+        index = CaptureMeshIndex(index_path=self.index_path)
+        with patch.object(CaptureMeshIndex, "_walk_prim_names") as walk_mock:
+            changed = index.update([capture_0])
+
+        # Assert
+        self.assertFalse(changed)
+        self.assertEqual(0, walk_mock.call_count)
+        self.assertEqual(capture_0, index.get_capture_path("mesh_0123456789ABCDEF"))
+
+    async def test_update_should_walk_changed_captures_and_drop_removed_captures(self):
+        # Arrange
+        capture_0 = self._write_capture("capture_0.usda", ["0123456789ABCDEF"])
+        capture_1 = self._write_capture("capture_1.usda", ["1123456789ABCDEF"])
+        index = CaptureMeshIndex(index_path=self.index_path)
+        index.update([capture_0, capture_1])
+
+        # Act
+        self._write_capture("capture_0.usda", ["0123456789ABCDEF", "3123456789ABCDEF"])
+        changed = index.update([capture_0])
+
+        # Assert
+        self.assertTrue(changed)
+        self.assertEqual(capture_0, index.get_capture_path("mesh_3123456789ABCDEF"))
+        self.assertIsNone(index.get_capture_path("mesh_1123456789ABCDEF"))
+        self.assertFalse(index.update([capture_0]))
+
+    async def test_load_should_rebuild_a_corrupt_index(self):
+        # Arrange
+        capture_0 = self._write_capture("capture_0.usda", ["0123456789ABCDEF"])
+        capture_1 = self._write_capture("capture_1.usda", ["1123456789ABCDEF"])
+        CaptureMeshIndex(index_path=self.index_path).update([capture_0, capture_1])
+        data = json.loads(Path(self.index_path).read_text(encoding="utf8"))
+        # An entry written by an older version or edited by hand
+        del data["captures"][capture_1]["prims"]
+
+        for content in [json.dumps(data), "{not json", json.dumps([1, 2]), json.dumps({"version": 1, "captures": 0})]:
+            with self.subTest(content=content):
+                Path(self.index_path).write_text(content, encoding="utf8")
+
+                # Act
+                index = CaptureMeshIndex(index_path=self.index_path)
+                changed = index.update([capture_0, capture_1])
+
+                # Assert
+                self.assertTrue(changed)
+                self.assertEqual(capture_0, index.get_capture_path("mesh_0123456789ABCDEF"))
+                self.assertEqual(capture_1, index.get_capture_path("mesh_1123456789ABCDEF"))
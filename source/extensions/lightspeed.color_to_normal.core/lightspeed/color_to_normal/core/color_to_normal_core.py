@@ -27,10 +27,13 @@ from pathlib import Path
 
 import carb
 import carb.tokens
-import numpy as np
 import omni.usd
 from lightspeed.common import constants
-from PIL import Image
+from omni.flux.utils.common import lazy_import as _lazy_import
+
+# Only imported when a texture is converted, to keep them out of the app startup
+np = _lazy_import("numpy")
+Image = _lazy_import("PIL.Image")
 
 
 class ColorToNormalCore:
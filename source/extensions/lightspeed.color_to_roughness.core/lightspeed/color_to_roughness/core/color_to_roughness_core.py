@@ -31,7 +31,11 @@ import carb.tokens
 # import numpy as np
 import omni.usd
 from lightspeed.common import constants
-from PIL import Image, ImageOps
+from omni.flux.utils.common import lazy_import as _lazy_import
+
+# Only imported when a texture is converted, to keep them out of the app startup
+Image = _lazy_import("PIL.Image")
+ImageOps = _lazy_import("PIL.ImageOps")
 
 
 class ColorToRoughnessCore:
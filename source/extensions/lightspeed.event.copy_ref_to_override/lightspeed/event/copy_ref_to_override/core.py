@@ -15,7 +15,9 @@
 * limitations under the License.
 """
 
+import difflib
 import re
+from typing import Optional, Set
 
 import carb
 import carb.settings
@@ -32,9 +34,11 @@ from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
 from omni.flux.utils.common.decorators import ignore_function_decorator as _ignore_function_decorator
 from omni.kit.usd.layers import LayerUtils as _LayerUtils
 from omni.usd.commands import remove_prim_spec as _remove_prim_spec
-from pxr import Sdf, Usd
+from pxr import Sdf, Tf, Usd
 
 _CONTEXT = "/exts/lightspeed.event.copy_ref_to_override/context"
+_VERIFY_INCREMENTAL_BAKE = "/exts/lightspeed.event.copy_ref_to_override/verify_incremental_bake"
+_MAX_LOGGED_DIFF_LINES = 100
 
 
 class CopyRefToPrimCore(_ILSSEvent):
@@ -42,6 +46,7 @@ class CopyRefToPrimCore(_ILSSEvent):
         super().__init__()
         self.default_attr = {
             "_subscription_layer": None,
+            "_stage_listener": None,
             "_layer_manager": None,
         }
         for attr, value in self.default_attr.items():
@@ -51,6 +56,18 @@ class CopyRefToPrimCore(_ILSSEvent):
         self._context = omni.usd.get_context(self._context_name)
         self._layer_manager = _LayerManagerCore(self._context_name)
 
+        # Change tracking used to only re-bake the prims that were touched since the last bake
+        self._baked_folder_paths = [
+            Sdf.Path(_constants.ROOTNODE_LIGHTS),
+            Sdf.Path(_constants.ROOTNODE_LOOKS),
+            Sdf.Path(_constants.ROOTNODE_MESHES),
+        ]
+        self._tracked_stage = None
+        self._touched_prim_paths: Set[Sdf.Path] = set()
+        self._full_bake_required = True
+        self._last_bake_key = None
+        self._last_bake_signature = None
+
     @property
     def name(self) -> str:
         """Name of the event"""
@@ -67,6 +84,48 @@ class CopyRefToPrimCore(_ILSSEvent):
             self.__on_layer_event, name="LayerChange"
         )
 
+    def _install_stage_listener(self, stage: Usd.Stage):
+        self._uninstall_stage_listener()
+        self._tracked_stage = stage
+        self._stage_listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_usd_changed, stage)
+
+    def _uninstall_stage_listener(self):
+        if self._stage_listener:
+            self._stage_listener.Revoke()
+        self._stage_listener = None
+        self._tracked_stage = None
+        self._full_bake_required = True
+
+    def _on_usd_changed(self, notice, _stage):
+        if self._full_bake_required:
+            return
+        for path in list(notice.GetResyncedPaths()) + list(notice.GetChangedInfoOnlyPaths()):
+            prim_path = path.GetPrimPath()
+            for folder_path in self._baked_folder_paths:
+                # A change above the baked prims (sublayers, root node, etc.) can impact any baked prim
+                if folder_path.HasPrefix(prim_path):
+                    self._full_bake_required = True
+                    self._touched_prim_paths.clear()
+                    return
+                # Track the baked prim (/RootNode/meshes/mesh_*, etc.) the changed path belongs to
+                if prim_path.HasPrefix(folder_path):
+                    self._touched_prim_paths.add(prim_path.GetPrefixes()[folder_path.pathElementCount])
+                    break
+
+    def _reset_bake_tracking(self, stage: Usd.Stage, bake_key: tuple):
+        if self._tracked_stage != stage:
+            self._install_stage_listener(stage)
+        self._touched_prim_paths.clear()
+        self._full_bake_required = False
+        self._last_bake_key = bake_key
+
+    @staticmethod
+    def _get_layer_signature(layer: Sdf.Layer):
+        result, entry = omni.client.stat(layer.realPath)
+        if result != omni.client.Result.OK:
+            return None
+        return entry.size, entry.modified_time
+
     def __create_capture_package_layer(self):
         replacement_layer = self._layer_manager.get_layer(_LayerType.replacement)
         if not replacement_layer:
@@ -207,7 +266,19 @@ class CopyRefToPrimCore(_ILSSEvent):
             op.orderedItems = CopyRefToPrimCore._make_refs_relative(src_layer, dst_layer, op.orderedItems)
         return op
 
-    def __create_default_stage_nodes(self, stage, source_layer, output_layer, all_replacements_layers):
+    def __create_default_stage_nodes(
+        self, stage, source_layer, output_layer, all_replacements_layers, prim_paths: Optional[Set[Sdf.Path]] = None
+    ):
+        """
+        Bake the capture references of the overridden prims into the output layer
+
+        Args:
+            stage: the stage to bake the prims from
+            source_layer: the capture layer
+            output_layer: the capture baker layer
+            all_replacements_layers: the layers the user works on
+            prim_paths: only bake those prims (/RootNode/meshes/mesh_*, etc.). If None, every prim is baked.
+        """
 
         regex_to_update = re.compile(_constants.REGEX_MAT_MESH_LIGHT_PATH)
 
@@ -236,7 +307,8 @@ class CopyRefToPrimCore(_ILSSEvent):
 
         # we copy the children of the root node
         # we can use the current capture layer because all captures have the same root nodes
-        if source_layer.GetPrimAtPath(_constants.ROOTNODE):
+        # the root nodes only change with the capture layer, so they are not copied again when baking specific prims
+        if prim_paths is None and source_layer.GetPrimAtPath(_constants.ROOTNODE):
             Sdf.CopySpec(
                 source_layer,
                 _constants.ROOTNODE,
@@ -270,7 +342,17 @@ class CopyRefToPrimCore(_ILSSEvent):
             if not prim or not prim.IsValid():  # noqa PLE1101
                 continue
             # loop over /RootNode/lights, /RootNode/Looks, /RootNode/meshes
-            for prim_child in prim.GetAllChildren():  # noqa PLE1101
+            if prim_paths is None:
+                prim_children = prim.GetAllChildren()  # noqa PLE1101
+            else:
+                prim_children = [
+                    stage.GetPrimAtPath(prim_path)
+                    for prim_path in sorted(prim_paths)
+                    if prim_path.GetParentPath() == prim.GetPath()  # noqa PLE1101
+                ]
+            for prim_child in prim_children:
+                if not prim_child.IsValid():
+                    continue
                 # if the prim has any override(s)
                 is_override = CopyRefToPrimCore._is_prim_overridden(prim_child.GetPath(), all_replacements_layers)
                 if not is_override:
@@ -405,23 +487,87 @@ class CopyRefToPrimCore(_ILSSEvent):
         # we grab the replacement layer + all sublayers (but exclude sublayer/replacement layers from others mods)
         all_replacements_layers = self.__get_all_replacement_layers(replacements_layer)
         all_replacements_layers.insert(0, replacements_layer)
+
+        # only re-bake the touched prims when the stage, capture & replacement layers are the same as the last bake
+        # and the capture_baker layer was not modified outside of this event
+        bake_key = (current_capture_layer.identifier, tuple(layer.identifier for layer in all_replacements_layers))
+        existing_capture_baker_layer = self._layer_manager.get_layer(_LayerType.capture_baker)
+        incremental = (
+            not self._full_bake_required
+            and self._tracked_stage == stage
+            and self._last_bake_key == bake_key
+            and existing_capture_baker_layer is not None
+            and self._get_layer_signature(existing_capture_baker_layer) == self._last_bake_signature
+        )
+        if incremental and not self._touched_prim_paths:
+            carb.log_info("CopyRefToPrimCore: No captured prim was changed since the last bake")
+            return
+        prim_paths = set(self._touched_prim_paths) if incremental else None
+
         # we create/insert the capture_baker layer.
         capture_package_layer = self.__create_capture_package_layer()
         with Sdf.ChangeBlock():
             self.__create_default_stage_nodes(
+                stage, current_capture_layer, capture_package_layer, all_replacements_layers, prim_paths=prim_paths
+            )
+        if incremental and carb.settings.get_settings().get(_VERIFY_INCREMENTAL_BAKE):
+            self.__verify_incremental_bake(
                 stage, current_capture_layer, capture_package_layer, all_replacements_layers
             )
 
+        # the changes done while baking are not user changes
+        self._reset_bake_tracking(stage, bake_key)
+
+        if not capture_package_layer.dirty:
+            carb.log_info(f"CopyRefToPrimCore: Nothing to bake into {capture_package_layer.realPath}")
+            self._last_bake_signature = self._get_layer_signature(capture_package_layer)
+            return
+
         # we save the layer
-        carb.log_info(f"Bake references into {capture_package_layer.realPath}")
+        carb.log_info(
+            f"Bake references into {capture_package_layer.realPath} "
+            f"({len(prim_paths) if incremental else 'all'} prims)"
+        )
         self._layer_manager.save_layer(_LayerType.capture_baker, show_checkpoint_error=False)
+        self._last_bake_signature = self._get_layer_signature(capture_package_layer)
+
+    def __verify_incremental_bake(self, stage, source_layer, output_layer, all_replacements_layers) -> bool:
+        """
+        Run a full bake over the incremental bake and make sure both results are the same.
+
+        The result of the full bake is kept.
+
+        Returns:
+            True if the incremental bake matched the full bake
+        """
+        incremental_result = output_layer.ExportToString()
+        with Sdf.ChangeBlock():
+            self.__create_default_stage_nodes(stage, source_layer, output_layer, all_replacements_layers)
+        full_result = output_layer.ExportToString()
+        if incremental_result == full_result:
+            carb.log_info("CopyRefToPrimCore: The incremental bake matches the full bake")
+            return True
+        diff = list(
+            difflib.unified_diff(
+                incremental_result.splitlines(),
+                full_result.splitlines(),
+                fromfile="incremental",
+                tofile="full",
+                lineterm="",
+            )
+        )
+        carb.log_warn(
+            "CopyRefToPrimCore: The incremental bake doesn't match the full bake. The full bake was kept:\n"
+            + "\n".join(diff[:_MAX_LOGGED_DIFF_LINES])
+        )
+        return False
 
     def __process_layer(self, stage: Usd.Stage = None):
         if stage is None:
             stage = self._context.get_stage()
-        # each time we save a layer part of the replacement layer, we process the whole
-        # replacement layer + capture_baker. We do that as a whole process because we want to be sure that if an user
-        # edit the capture_baker layer externally, we are still cleaning up and processing the whole thing nicely
+        # each time we save a layer part of the replacement layer, we process the prims that were touched since the last
+        # bake. The whole replacement layer + capture_baker are processed if the capture_baker layer was edited
+        # externally or if the layer stack changed, to be sure that we are still cleaning up the whole thing nicely
         self.__do_process_layer(stage)
 
     @_ignore_function_decorator(attrs=["_ignore_on_event"])
@@ -456,6 +602,7 @@ class CopyRefToPrimCore(_ILSSEvent):
     def _uninstall(self):
         """Function that will delete the behavior"""
         self._uninstall_layer_listener()
+        self._uninstall_stage_listener()
 
     def _uninstall_layer_listener(self):
         self._subscription_layer = None
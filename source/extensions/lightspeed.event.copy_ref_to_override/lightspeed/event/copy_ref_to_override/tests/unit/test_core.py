@@ -17,13 +17,21 @@
 
 import contextlib
 import tempfile
+from unittest.mock import patch
 
+import carb
+import carb.settings
 import omni.kit.app
 import omni.usd
+from lightspeed.common import constants as _constants
 from lightspeed.layer_manager.core import LayerManagerCore as _LayerManagerCore
 from lightspeed.layer_manager.core.data_models import LayerType as _LayerType
 from omni.kit.test.async_unittest import AsyncTestCase
-from pxr import Usd, UsdGeom
+from pxr import Sdf, Usd, UsdGeom
+
+_VERIFY_INCREMENTAL_BAKE = "/exts/lightspeed.event.copy_ref_to_override/verify_incremental_bake"
+_MESH_A_PATH = f"{_constants.ROOTNODE_MESHES}/mesh_0123456789ABCDEF"
+_MESH_B_PATH = f"{_constants.ROOTNODE_MESHES}/mesh_FEDCBA9876543210"
 
 
 @contextlib.asynccontextmanager
@@ -73,6 +81,23 @@ class TestCore(AsyncTestCase):
         # return stage, layer_replacement
         return stage, layer_replacement, layer_capture
 
+    async def __create_captured_meshes(self, layer_capture):
+        for mesh_path in [_MESH_A_PATH, _MESH_B_PATH]:
+            prim_spec = Sdf.CreatePrimInLayer(layer_capture, mesh_path)
+            prim_spec.specifier = Sdf.SpecifierDef
+            prim_spec.typeName = "Xform"
+        layer_capture.Save()
+        await omni.kit.app.get_app().next_update_async()
+
+    async def __override_and_save(self, stage, layer_replacement, prim_path):
+        edit_target = stage.GetEditTargetForLocalLayer(layer_replacement)
+        stage.SetEditTarget(edit_target)
+        stage.GetPrimAtPath(prim_path).CreateAttribute("test_attr", Sdf.ValueTypeNames.Int).Set(1)
+        await omni.kit.app.get_app().next_update_async()
+        layer_replacement.Save()
+        # wait for the event
+        await omni.kit.app.get_app().next_update_async()
+
     async def __create_a_cube(self, stage, layer_replacement):
         # set the replacement layer as target
         edit_target = stage.GetEditTargetForLocalLayer(layer_replacement)
@@ -172,3 +197,58 @@ class TestCore(AsyncTestCase):
                 layer_replacement.subLayerPaths[:3],
                 [layer_random_01.identifier, layer_random_02.identifier, layer_random_03.identifier],
             )
+
+    async def test_capture_baker_bakes_touched_prims_incrementally(self):
+        context = omni.usd.get_context()
+        async with make_temp_directory(context) as temp_dir:
+            stage, layer_replacement, layer_capture = await self.__create_stage_and_layers(temp_dir=temp_dir)
+            await self.__create_captured_meshes(layer_capture)
+
+            # the first bake is a full bake
+            await self.__override_and_save(stage, layer_replacement, _MESH_A_PATH)
+            capture_baker_layer = self._layer_manager.get_layer(_LayerType.capture_baker)
+            self.assertTrue(capture_baker_layer.GetPrimAtPath(_MESH_A_PATH))
+            self.assertFalse(capture_baker_layer.GetPrimAtPath(_MESH_B_PATH))
+
+            # the next bakes only bake the touched prims
+            await self.__override_and_save(stage, layer_replacement, _MESH_B_PATH)
+            capture_baker_layer = self._layer_manager.get_layer(_LayerType.capture_baker)
+            self.assertTrue(capture_baker_layer.GetPrimAtPath(_MESH_A_PATH))
+            self.assertTrue(capture_baker_layer.GetPrimAtPath(_MESH_B_PATH))
+
+    async def test_capture_baker_is_not_saved_when_no_captured_prim_changed(self):
+        context = omni.usd.get_context()
+        async with make_temp_directory(context) as temp_dir:
+            stage, layer_replacement, layer_capture = await self.__create_stage_and_layers(temp_dir=temp_dir)
+            await self.__create_captured_meshes(layer_capture)
+            await self.__override_and_save(stage, layer_replacement, _MESH_A_PATH)
+
+            with patch.object(_LayerManagerCore, "save_layer") as save_layer_mock:
+                # a prim that is not baked
+                await self.__create_a_cube(stage, layer_replacement)
+                await omni.kit.app.get_app().next_update_async()
+                layer_replacement.Save()
+
+                # wait for the event
+                await omni.kit.app.get_app().next_update_async()
+
+            self.assertEqual(0, save_layer_mock.call_count)
+
+    async def test_capture_baker_incremental_bake_matches_full_bake(self):
+        context = omni.usd.get_context()
+        settings = carb.settings.get_settings()
+        settings.set(_VERIFY_INCREMENTAL_BAKE, True)
+        try:
+            async with make_temp_directory(context) as temp_dir:
+                stage, layer_replacement, layer_capture = await self.__create_stage_and_layers(temp_dir=temp_dir)
+                await self.__create_captured_meshes(layer_capture)
+                await self.__override_and_save(stage, layer_replacement, _MESH_A_PATH)
+
+                with patch.object(carb, "log_warn") as log_warn_mock:
+                    await self.__override_and_save(stage, layer_replacement, _MESH_B_PATH)
+
+                self.assertFalse(
+                    [c for c in log_warn_mock.call_args_list if "doesn't match the full bake" in str(c.args[0])]
+                )
+        finally:
+            settings.set(_VERIFY_INCREMENTAL_BAKE, False)
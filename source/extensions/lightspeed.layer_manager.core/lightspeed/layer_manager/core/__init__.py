@@ -23,6 +23,7 @@ __all__ = [
     "LSS_LAYER_MOD_NOTES",
     "LSS_LAYER_MOD_VERSION",
     "LayerManagerCore",
+    "LayerManagerCoreExtension",
     "LayerType",
     "LayerTypeKeys",
 ]
@@ -37,3 +38,4 @@ from .constants import (
 )
 from .core import LayerManagerCore
 from .data_models import LayerType, LayerTypeKeys
+from .extension import LayerManagerCoreExtension
@@ -16,7 +16,6 @@
 """
 
 import asyncio
-import re
 from contextlib import nullcontext
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple, Union
@@ -28,7 +27,7 @@ import omni.kit.commands
 import omni.kit.undo
 import omni.kit.window.file
 import omni.usd
-from lightspeed.common.constants import CAPTURE_FOLDER, REGEX_HASH, REGEX_INSTANCE_PATH, REMIX_CAPTURE_FOLDER
+from lightspeed.common.constants import CAPTURE_FOLDER, REMIX_CAPTURE_FOLDER
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
 from omni.flux.utils.common.omni_url import OmniUrl
 from omni.kit.usd.layers import LayerUtils
@@ -57,6 +56,7 @@ from .data_models import (
     SaveLayerPathParamModel,
     SetEditTargetPathParamModel,
 )
+from .layer_hashes import get_layer_hashes_cache_instance as _get_layer_hashes_cache_instance
 from .layers import autoupscale, capture, capture_baker, i_layer, replacement, workfile
 
 
@@ -798,42 +798,15 @@ class LayerManagerCore:
         This function does not take in consideration the layer composition arcs.
         It only evaluates the given layer and no sub-layers.
 
+        The result is cached until the layer changes.
+
         Args:
             layer: The layer to traverse
 
         Returns:
             A dictionary of the various hashes found and their respective prims
         """
-
-        def get_prims_recursive_no_comp_arcs(parents: List[Sdf.PrimSpec]):
-            """
-            Composition Arcs are not taken in consideration when fetching the prims.
-            The prims will therefore all belong to the same layer but prims in
-            sub-layers will be ignored.
-            """
-            prims = set()
-            for prim in parents:
-                prims.add(prim)
-                prims = prims.union(get_prims_recursive_no_comp_arcs(prim.nameChildren))
-            return prims
-
-        hashes = {}
-        regex_hash = re.compile(REGEX_HASH)
-        regex_instance = re.compile(REGEX_INSTANCE_PATH)
-        for prim in get_prims_recursive_no_comp_arcs(layer.rootPrims):
-            match = regex_hash.match(str(prim.path))
-            if not match:
-                continue
-            if regex_instance.match(str(prim.path)):
-                continue
-            # Always select the shortest path. This is an optimized way to make this function deterministic.
-            # Otherwise, the order of the prim paths is not guaranteed, and we sometimes return:
-            # - `/RootNode/meshes/mesh_6CA2F12444DEBE09/mesh` or `/RootNode/meshes/mesh_6CA2F12444DEBE09`
-            # - `/RootNode/Looks/mat_8D1946B4993CE5A3/Shader` or `/RootNode/Looks/mat_8D1946B4993CE5A3`
-            # etc.
-            if match.group(3) not in hashes or len(str(prim.path)) < len(str(hashes[match.group(3)])):
-                hashes[match.group(3)] = prim.path
-        return hashes
+        return _get_layer_hashes_cache_instance().get(layer)
 
     def open_stage(self, layer_identifier: str, callback: Callable[[], None] = None) -> str:
         # Obtain the previous stage root layer identifier if not anonymous
@@ -0,0 +1,183 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = [
+    "LayerHashesCache",
+    "destroy_layer_hashes_cache_instance",
+    "get_layer_hashes_cache_instance",
+    "scan_layer_hashes",
+]
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import omni.client
+from lightspeed.common.constants import INSTANCE_NAME_PREFIX, REGEX_HASH
+from pxr import Sdf, Tf
+
+# A single pattern matching the hashed prim paths, excluding the instance prims (`REGEX_INSTANCE_PATH`).
+# The negative lookahead doesn't capture, so the hash is still the 3rd group of `REGEX_HASH`.
+_REGEX_NON_INSTANCE_HASH = re.compile(
+    rf"^(?!.*{re.escape(INSTANCE_NAME_PREFIX)}[A-Z0-9]{{16}}(?:_[0-9]+)*$){REGEX_HASH.removeprefix('^')}"
+)
+
+_INSTANCE = None
+
+
+def scan_layer_hashes(layer: Sdf.Layer) -> Dict[str, Sdf.Path]:
+    """
+    Scan the prim specs of a layer for hashes. Composition arcs, including the prims authored in variants, are ignored.
+
+    Args:
+        layer: The layer to scan
+
+    Returns:
+        A dictionary of the hashes found and the shortest prim path they were found in
+    """
+    hashes = {}
+    match_hash = _REGEX_NON_INSTANCE_HASH.match
+
+    def visit(path: Sdf.Path):
+        # `Traverse` can't prune a subtree, so the property and variant specs are rejected as cheaply as possible
+        if not path.IsPrimPath() or path.ContainsPrimVariantSelection():
+            return
+        path_str = path.pathString
+        match = match_hash(path_str)
+        if not match:
+            return
+        # Always select the shortest path. This is an optimized way to make this function deterministic.
+        # Otherwise, the order of the prim paths is not guaranteed, and we sometimes return:
+        # - `/RootNode/meshes/mesh_6CA2F12444DEBE09/mesh` or `/RootNode/meshes/mesh_6CA2F12444DEBE09`
+        # - `/RootNode/Looks/mat_8D1946B4993CE5A3/Shader` or `/RootNode/Looks/mat_8D1946B4993CE5A3`
+        # etc.
+        hash_value = match.group(3)
+        current = hashes.get(hash_value)
+        if current is None or len(path_str) < len(current):
+            hashes[hash_value] = path_str
+
+    layer.Traverse(Sdf.Path.absoluteRootPath, visit)
+    return {hash_value: Sdf.Path(path) for hash_value, path in hashes.items()}
+
+
+@dataclass
+class _LayerHashesEntry:
+    hashes: Dict[str, Sdf.Path]
+    dirty: bool
+    # The opened layer the hashes were scanned in
+    layer_handle: int
+    # The (size, modified time) of the layer file when it was scanned. None for anonymous layers.
+    signature: Optional[Tuple[int, str]]
+
+
+class LayerHashesCache:
+    """
+    Cache the hashes found in layers until the layers change
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _LayerHashesEntry] = {}
+        self.hits = 0
+        self.misses = 0
+        self._listener = Tf.Notice.RegisterGlobally(Sdf.Notice.LayersDidChange, self._on_layers_changed)
+
+    def get(self, layer: Sdf.Layer) -> Dict[str, Sdf.Path]:
+        """
+        Get the hashes found in a layer. The layer is only scanned if no valid result was cached.
+
+        A cached result is valid until the layer is edited, reloaded, closed or its dirty state changes. A layer without
+        unsaved changes is also scanned again if its file changed on disk.
+
+        Args:
+            layer: The layer to get the hashes for
+
+        Returns:
+            A dictionary of the hashes found and their respective prims
+        """
+        identifier = layer.identifier
+        entry = self._entries.get(identifier)
+        if entry is not None and self._is_valid(entry, layer):
+            self.hits += 1
+            return dict(entry.hashes)
+
+        self.misses += 1
+        self._drop_closed_layers()
+        entry = _LayerHashesEntry(
+            hashes=scan_layer_hashes(layer),
+            dirty=layer.dirty,
+            layer_handle=hash(layer),
+            signature=self._get_signature(layer),
+        )
+        self._entries[identifier] = entry
+        return dict(entry.hashes)
+
+    def invalidate(self, identifier: Optional[str] = None):
+        """
+        Invalidate the cached hashes
+
+        Args:
+            identifier: The layer identifier to invalidate the hashes for. If None, every layer will be invalidated.
+        """
+        if identifier is None:
+            self._entries.clear()
+            return
+        self._entries.pop(identifier, None)
+
+    @staticmethod
+    def _get_signature(layer: Sdf.Layer) -> Optional[Tuple[int, str]]:
+        if layer.anonymous or not layer.realPath:
+            return None
+        result, entry = omni.client.stat(layer.realPath)
+        if result != omni.client.Result.OK:
+            return None
+        return entry.size, str(entry.modified_time)
+
+    def _is_valid(self, entry: _LayerHashesEntry, layer: Sdf.Layer) -> bool:
+        if entry.layer_handle != hash(layer) or entry.dirty != layer.dirty:
+            return False
+        # Opening a layer again sends no change notice: make sure the file was not changed on disk since the scan
+        return layer.dirty or entry.signature == self._get_signature(layer)
+
+    def _drop_closed_layers(self):
+        for identifier, entry in list(self._entries.items()):
+            layer = Sdf.Layer.Find(identifier)
+            if not layer or hash(layer) != entry.layer_handle:
+                del self._entries[identifier]
+
+    def _on_layers_changed(self, notice, _):
+        for layer in notice.GetLayers():
+            self.invalidate(layer.identifier)
+
+    def destroy(self):
+        if self._listener:
+            self._listener.Revoke()
+        self._listener = None
+        self.invalidate()
+
+
+def get_layer_hashes_cache_instance() -> LayerHashesCache:
+    global _INSTANCE
+    if _INSTANCE is None:
+        _INSTANCE = LayerHashesCache()
+    return _INSTANCE
+
+
+def destroy_layer_hashes_cache_instance():
+    global _INSTANCE
+    if _INSTANCE is not None:
+        _INSTANCE.destroy()
+    _INSTANCE = None
@@ -16,4 +16,5 @@
 """
 
 from .unit.test_core import TestLayerManagerCore
+from .unit.test_layer_hashes import TestLayerHashes
 from .unit.test_validators import TestLayerManagerValidators
@@ -0,0 +1,178 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+
+import carb
+from lightspeed.common.constants import REGEX_HASH, REGEX_INSTANCE_PATH
+from lightspeed.layer_manager.core.layer_hashes import LayerHashesCache, scan_layer_hashes
+from omni.kit.test.async_unittest import AsyncTestCase
+from pxr import Sdf
+
+# Every mesh is authored with 4 specs: the mesh prim, its child prim and 2 attributes
+_BENCHMARK_MESH_COUNT = 250_000 if os.environ.get("FLUX_RUN_LARGE_BENCHMARKS") else 12_500
+
+
+def _scan_layer_hashes_recursive(layer: Sdf.Layer):
+    """The previous implementation, walking the prim specs recursively, used as the benchmark reference"""
+
+    def get_prims_recursive_no_comp_arcs(parents):
+        prims = set()
+        for prim in parents:
+            prims.add(prim)
+            prims = prims.union(get_prims_recursive_no_comp_arcs(prim.nameChildren))
+        return prims
+
+    hashes = {}
+    regex_hash = re.compile(REGEX_HASH)
+    regex_instance = re.compile(REGEX_INSTANCE_PATH)
+    for prim in get_prims_recursive_no_comp_arcs(layer.rootPrims):
+        match = regex_hash.match(str(prim.path))
+        if not match or regex_instance.match(str(prim.path)):
+            continue
+        if match.group(3) not in hashes or len(str(prim.path)) < len(str(hashes[match.group(3)])):
+            hashes[match.group(3)] = prim.path
+    return hashes
+
+
+class TestLayerHashes(AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.cache = LayerHashesCache()
+
+    # After running each test
+    async def tearDown(self):
+        self.cache.destroy()
+        self.cache = None
+
+    def _create_layer(self, mesh_count: int) -> Sdf.Layer:
+        layer = Sdf.Layer.CreateAnonymous()
+        with Sdf.ChangeBlock():
+            for index in range(mesh_count):
+                prim_spec = Sdf.CreatePrimInLayer(layer, f"/RootNode/meshes/mesh_{index:016X}/mesh")
+                Sdf.AttributeSpec(prim_spec, "points", Sdf.ValueTypeNames.Point3fArray)
+                Sdf.AttributeSpec(prim_spec, "normals", Sdf.ValueTypeNames.Normal3fArray)
+        return layer
+
+    async def test_scan_layer_hashes_should_ignore_instances_properties_and_variants(self):
+        # Arrange
+        layer = Sdf.Layer.CreateAnonymous()
+        with Sdf.ChangeBlock():
+            Sdf.CreatePrimInLayer(layer, "/RootNode/meshes/mesh_0123456789ABCDEF/mesh")
+            Sdf.CreatePrimInLayer(layer, "/RootNode/instances/inst_1123456789ABCDEF_0")
+            Sdf.CreatePrimInLayer(layer, "/RootNode/lights/light_2123456789ABCDEF")
+            Sdf.CreatePrimInLayer(layer, "/RootNode/Looks/mat_3123456789ABCDEF/Shader")
+            variant_prim = Sdf.CreatePrimInLayer(layer, "/RootNode/variants")
+            variant_set = Sdf.VariantSetSpec(variant_prim, "test")
+            variant = Sdf.VariantSpec(variant_set, "a")
+            Sdf.PrimSpec(variant.primSpec, "mesh_4123456789ABCDEF", Sdf.SpecifierOver)
+
+        # Act
+        value = scan_layer_hashes(layer)
+
+        # Assert
+        self.assertDictEqual(
+            value,
+            {
+                "0123456789ABCDEF": Sdf.Path("/RootNode/meshes/mesh_0123456789ABCDEF"),
+                "2123456789ABCDEF": Sdf.Path("/RootNode/lights/light_2123456789ABCDEF"),
+                "3123456789ABCDEF": Sdf.Path("/RootNode/Looks/mat_3123456789ABCDEF"),
+            },
+        )
+
+    async def test_get_should_use_cache_until_layer_changes(self):
+        # Arrange
+        layer = self._create_layer(3)
+
+        # Act
+        first_value = self.cache.get(layer)
+        second_value = self.cache.get(layer)
+        Sdf.CreatePrimInLayer(layer, "/RootNode/lights/light_2123456789ABCDEF")
+        third_value = self.cache.get(layer)
+
+        # Assert
+        self.assertDictEqual(first_value, second_value)
+        self.assertEqual(len(first_value), 3)
+        self.assertEqual(len(third_value), 4)
+        self.assertIn("2123456789ABCDEF", third_value)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 2)
+
+    async def test_get_reopened_layer_should_scan_the_file_again(self):
+        # Arrange
+        with tempfile.TemporaryDirectory() as temp_dir:
+            layer_path = Path(temp_dir) / "capture.usda"
+            layer_path.write_text(
+                '#usda 1.0\n\nover "RootNode"\n{\n    over "meshes"\n    {\n'
+                '        over "mesh_0123456789ABCDEF"\n        {\n        }\n    }\n}\n',
+                encoding="utf8",
+            )
+            layer = Sdf.Layer.FindOrOpen(str(layer_path))
+            first_value = self.cache.get(layer)
+            identifier = layer.identifier
+            # Close the layer and change the file on disk: no change notice is sent
+            layer = None
+            layer_path.write_text(
+                '#usda 1.0\n\nover "RootNode"\n{\n    over "lights"\n    {\n'
+                '        over "light_1123456789ABCDEF"\n        {\n        }\n'
+                '        over "light_2123456789ABCDEF"\n        {\n        }\n    }\n}\n',
+                encoding="utf8",
+            )
+
+            # Act
+            layer = Sdf.Layer.FindOrOpen(str(layer_path))
+            second_value = self.cache.get(layer)
+
+        # Assert
+        self.assertEqual(identifier, layer.identifier)
+        self.assertListEqual(["0123456789ABCDEF"], list(first_value))
+        self.assertListEqual(["1123456789ABCDEF", "2123456789ABCDEF"], sorted(second_value))
+        self.assertEqual(self.cache.misses, 2)
+
+    async def test_benchmark_scan_layer_hashes(self):
+        # Arrange
+        layer = self._create_layer(_BENCHMARK_MESH_COUNT)
+
+        # Act
+        start = time.perf_counter()
+        recursive_value = _scan_layer_hashes_recursive(layer)
+        recursive_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        traverse_value = scan_layer_hashes(layer)
+        traverse_duration = time.perf_counter() - start
+
+        self.cache.get(layer)
+        start = time.perf_counter()
+        cached_value = self.cache.get(layer)
+        cached_duration = time.perf_counter() - start
+
+        carb.log_info(
+            f"Layer hashes scan of {_BENCHMARK_MESH_COUNT * 4} specs: recursive {recursive_duration:.3f}s, "
+            f"traverse {traverse_duration:.3f}s, cached {cached_duration:.6f}s"
+        )
+
+        # Assert
+        self.assertDictEqual(traverse_value, recursive_value)
+        self.assertDictEqual(cached_value, recursive_value)
+        self.assertEqual(len(traverse_value), _BENCHMARK_MESH_COUNT)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
@@ -39,6 +39,8 @@ from pydantic import constr
 
 
 class LayerManagerService(ServiceBase):
+    cache_responses = True
+
     def __init__(self, context_name: str = ""):
         """
         A service class that provides access to layer management functionality in a RestAPI.
@@ -50,7 +52,7 @@ class LayerManagerService(ServiceBase):
         self.__context_name = context_name
         self.__layer_core = LayerManagerCore(context_name=context_name)
 
-        super().__init__()
+        super().__init__(context_name=context_name)
 
     @classmethod
     @property
@@ -21,10 +21,9 @@ import carb
 import omni.usd
 from lightspeed.trex.viewports.manipulators.global_selection import GlobalSelection
 from omni.kit.scene_view.opengl import ViewportOpenGLSceneView
-from pxr import Tf, Usd, UsdGeom, UsdLux
+from pxr import Tf, Usd
 
-from .manipulator import LightGizmosManipulator
-from .model import LightGizmosModel
+from .manager import LightGizmosManager
 
 CARB_SETTING_GIZMO_SCALE = "/persistent/app/viewport/gizmo/scale"
 CARB_SETTING_CONST_GIZMO_SCALE = "/persistent/app/viewport/gizmo/constantScale"
@@ -36,6 +35,7 @@ class LightGizmosLayer:
 
     def __init__(self, desc: dict):
         self._scene_view = None
+        self._manager = None
         self._viewport_api = desc.get("viewport_api")
 
         # Save the UsdContext name (we currently only work with single Context)
@@ -68,11 +68,14 @@ class LightGizmosLayer:
         # Register the SceneView with the Viewport to get projection and view updates
         self._viewport_api.add_scene_view(self._scene_view)
 
-        self._manipulators = {}
+        self._manager = LightGizmosManager(self._viewport_api, self._scene_view, self._usd_context_name)
 
         # Trigger a settings update to obtain defaults
         self._light_gizmo_setting_change(None, carb.settings.ChangeEventType.CHANGED)
 
+        # The stage might already be opened when the layer is created
+        self._on_stage_opened()
+
     def __del__(self):
         self.destroy()
 
@@ -115,8 +118,8 @@ class LightGizmosLayer:
     def gizmo_scale(self, value):
         if self._gizmo_scale != value:
             self._gizmo_scale = value
-            for manipulator in self._manipulators.values():
-                manipulator.model.set_gizmo_scale(value)
+            if self._manager:
+                self._manager.gizmo_scale = value
 
     def _get_context(self) -> Usd.Stage:
         # Get the UsdContext we are attached to
@@ -127,7 +130,9 @@ class LightGizmosLayer:
             # Be a good citizen, and un-register the SceneView from Viewport updates
             self._viewport_api.remove_scene_view(self._scene_view)
         self._revoke_listeners()
-        self._destroy_manipulators()
+        if self._manager:
+            self._manager.destroy()
+            self._manager = None
         # Remove our references to these objects
         self._viewport_api = None
         self._scene_view = None
@@ -145,83 +150,44 @@ class LightGizmosLayer:
             return
         if event.type == int(omni.usd.StageEventType.SELECTION_CHANGED):
             GlobalSelection.get_instance().on_selection_changed(
-                self._get_context(), self._viewport_api, list(self._manipulators.values())
+                self._get_context(), self._viewport_api, list(self._manager.manipulators.values())
             )
         elif event.type == int(omni.usd.StageEventType.OPENED):
-            self._current_stage = self._get_context().get_stage()
-            self._create_listener(self._current_stage)
+            self._on_stage_opened()
         elif event.type == int(omni.usd.StageEventType.HIERARCHY_CHANGED) or event.type == int(
             omni.usd.StageEventType.ACTIVE_LIGHT_COUNTS_CHANGED
         ):
-            stage = self._get_context().get_stage()
-            # Create the manipulators
-            self._create_manipulators(stage)
+            # The lights are updated incrementally by the stage listener
+            if self._get_context().get_stage() != self._current_stage:
+                self._on_stage_opened()
         elif event.type == int(omni.usd.StageEventType.CLOSED):
             self._revoke_listeners()
-            self._destroy_manipulators()
+            self._current_stage = None
+            self._manager.clear()
+
+    def _on_stage_opened(self):
+        self._current_stage = self._get_context().get_stage()
+        self._create_listener(self._current_stage)
+        # trigger settings update
+        self._light_gizmo_setting_change(None, carb.settings.ChangeEventType.CHANGED)
+        self._manager.rebuild(self._current_stage)
 
     def _create_listener(self, stage):
         # Do no work if there is no stage
         if not stage:
             return
-        # Add a Tf.Notice listener to update the transforms of all lights
+        # Add a Tf.Notice listener to update the lights
         if self._stage_listener:
             self._revoke_listeners()
         self._stage_listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._notice_changed, stage)
 
     def _notice_changed(self, notice, stage):
         """Called by Tf.Notice"""
-        # Check to see if we need to update some transforms
+        # Only update the lights affected by the changes
         if self._ignore_update or stage != self._current_stage:
             return
         self._ignore_update = True
-        for path in notice.GetChangedInfoOnlyPaths():
-            if not path.IsPropertyPath():
-                continue
-            prim_path = str(path.GetPrimPath())
-            if prim_path in self._manipulators:
-                self._manipulators[prim_path].model.update_from_prim()
-            else:
-                # Update on any parent transformation changes too
-                for manipulator in self._manipulators.values():
-                    if not manipulator.model.get_prim_path().startswith(prim_path):
-                        continue
-                    if UsdGeom.Xformable.IsTransformationAffectedByAttrNamed(path.name):
-                        manipulator.model.update_from_prim()
-        GlobalSelection.g_set_lightmanipulators(self._manipulators)
-        self._ignore_update = False
-
-    def _create_manipulators(self, stage):
-        # Do no work if there is no stage
-        if not stage:
-            return
-
-        # Release stale manipulators
-        self._destroy_manipulators()
-
-        # trigger settings update
-        self._light_gizmo_setting_change(None, carb.settings.ChangeEventType.CHANGED)
-
-        # Add the manipulator into the SceneView's scene
-        with self._scene_view.scene:
-            lights = [
-                prim
-                for prim in stage.TraverseAll()
-                if (prim.HasAPI(UsdLux.LightAPI) if hasattr(UsdLux, "LightAPI") else prim.IsA(UsdLux.Light))
-            ]
-            for light in lights:
-                manipulator = LightGizmosManipulator(
-                    self._viewport_api, model=LightGizmosModel(light, self._usd_context_name, self._gizmo_scale)
-                )
-                self._manipulators[str(light.GetPrimPath())] = manipulator
-            GlobalSelection.g_set_lightmanipulators(self._manipulators)
-
-    def _destroy_manipulators(self):
-        if self._scene_view:
-            self._scene_view.scene.clear()
-
-        # Release stale manipulators
-        for manipulator in self._manipulators.values():
-            manipulator.destroy()
-        self._manipulators = {}
-        GlobalSelection.g_set_lightmanipulators(self._manipulators)
+        try:
+            self._manager.process_changes(notice.GetResyncedPaths(), notice.GetChangedInfoOnlyPaths())
+        finally:
+            self._ignore_update = False
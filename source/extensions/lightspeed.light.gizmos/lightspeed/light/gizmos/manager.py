@@ -0,0 +1,370 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["LightGizmosManager"]
+
+import asyncio
+import heapq
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+import carb
+import carb.settings
+import omni.kit.app
+from lightspeed.trex.viewports.manipulators.global_selection import GlobalSelection
+from pxr import Gf, Sdf, Usd, UsdGeom, UsdLux
+
+from .manipulator import LightGizmosManipulator
+from .model import LightGizmosModel
+
+CARB_SETTING_MAX_MANIPULATORS = "/exts/lightspeed.light.gizmos/max_manipulators"
+CARB_SETTING_MAX_DISTANCE = "/exts/lightspeed.light.gizmos/max_distance"
+CARB_SETTING_FRUSTUM_CULLING = "/exts/lightspeed.light.gizmos/frustum_culling"
+
+# Keep the gizmos slightly outside the frustum so icons centered near the edges are still drawn
+_NDC_MARGIN = 1.1
+
+
+def _is_light(prim: Usd.Prim) -> bool:
+    return prim.HasAPI(UsdLux.LightAPI) if hasattr(UsdLux, "LightAPI") else prim.IsA(UsdLux.Light)
+
+
+class LightGizmosManager:
+    """
+    Keep the light gizmos of a viewport up to date incrementally.
+
+    Only the lights affected by a change notice are updated, and only the lights inside the camera frustum and closer
+    than the maximum distance get a manipulator. The number of manipulators is capped: the closest lights are kept and
+    the manipulators of culled lights are reused for the lights becoming visible.
+    """
+
+    def __init__(self, viewport_api, scene_view, usd_context_name: str, gizmo_scale: float = 1.0):
+        self._viewport_api = viewport_api
+        self._scene_view = scene_view
+        self._usd_context_name = usd_context_name
+        self._gizmo_scale = gizmo_scale
+
+        self._max_manipulators = 0
+        self._max_distance = 0.0
+        self._frustum_culling = True
+        self.__read_settings()
+
+        self._stage = None
+        # The world position of every light on the stage
+        self._positions: Dict[Sdf.Path, Gf.Vec3d] = {}
+        # The camera distance of the lights inside the frustum and the culling distance
+        self._visible_distances: Dict[Sdf.Path, float] = {}
+        # The manipulators currently displaying a light, keyed by the light path
+        self._manipulators: Dict[str, LightGizmosManipulator] = {}
+        # The hidden manipulators ready to be reused
+        self._pool: List[LightGizmosManipulator] = []
+
+        self._update_task = None
+        self._view_change_sub = None
+        if viewport_api and hasattr(viewport_api, "subscribe_to_view_change"):
+            self._view_change_sub = viewport_api.subscribe_to_view_change(self._on_view_changed)
+
+        settings = carb.settings.get_settings()
+        self._settings_subs = [
+            settings.subscribe_to_node_change_events(setting, self._on_culling_setting_changed)
+            for setting in (CARB_SETTING_MAX_MANIPULATORS, CARB_SETTING_MAX_DISTANCE, CARB_SETTING_FRUSTUM_CULLING)
+        ]
+
+        # Statistics of the last update
+        self.last_update_duration = 0.0
+        self.last_updated_count = 0
+
+    @property
+    def manipulators(self) -> Dict[str, LightGizmosManipulator]:
+        """The live manipulators, keyed by light path"""
+        return self._manipulators
+
+    @property
+    def light_count(self) -> int:
+        return len(self._positions)
+
+    @property
+    def manipulator_count(self) -> int:
+        """The number of manipulators created, displayed or hidden"""
+        return len(self._manipulators) + len(self._pool)
+
+    @property
+    def max_manipulators(self) -> int:
+        return self._max_manipulators
+
+    @max_manipulators.setter
+    def max_manipulators(self, value: int):
+        self._max_manipulators = value
+        self._refresh_manipulators(set())
+
+    @property
+    def max_distance(self) -> float:
+        return self._max_distance
+
+    @max_distance.setter
+    def max_distance(self, value: float):
+        self._max_distance = value
+        self.update_culling()
+
+    @property
+    def gizmo_scale(self) -> float:
+        return self._gizmo_scale
+
+    @gizmo_scale.setter
+    def gizmo_scale(self, value: float):
+        self._gizmo_scale = value
+        for manipulator in self._manipulators.values():
+            manipulator.model.set_gizmo_scale(value)
+
+    def rebuild(self, stage: Optional[Usd.Stage]):
+        """
+        Find every light of a stage and create the manipulators of the visible lights
+
+        Args:
+            stage: The stage to display the light gizmos for
+        """
+        start = time.perf_counter()
+        self._stage = stage
+        self._positions = {}
+        self._visible_distances = {}
+        if stage:
+            self._update_positions(prim.GetPath() for prim in stage.TraverseAll() if _is_light(prim))
+        # The live manipulators may display the prims of a previous stage
+        lights = set(self._positions)
+        self._cull_lights(lights)
+        self._refresh_manipulators(lights, resynced_lights=lights)
+        self._set_statistics(start, len(lights))
+
+    def process_changes(self, resynced_paths: Iterable[Sdf.Path], changed_info_paths: Iterable[Sdf.Path]):
+        """
+        Update the lights affected by an `Usd.Notice.ObjectsChanged` notice
+
+        Args:
+            resynced_paths: The resynced paths of the notice
+            changed_info_paths: The changed info only paths of the notice
+        """
+        if not self._stage:
+            return
+        start = time.perf_counter()
+
+        # Property resyncs (new attributes, etc.) don't change the lights of the stage
+        dirty_properties = []
+        resynced_prims = set()
+        for path in resynced_paths:
+            if path.IsPropertyPath():
+                dirty_properties.append(path)
+            else:
+                resynced_prims.add(path)
+        dirty_properties.extend(changed_info_paths)
+
+        if Sdf.Path.absoluteRootPath in resynced_prims:
+            self.rebuild(self._stage)
+            return
+
+        resynced_lights = self._resync_lights(resynced_prims)
+        dirty_lights = set(resynced_lights)
+        dirty_lights.update(self._get_lights_affected_by(dirty_properties))
+        if not dirty_lights:
+            return
+
+        self._update_positions(dirty_lights)
+        # Only the lights that moved or were added or removed need to be culled again
+        self._cull_lights(dirty_lights)
+        self._refresh_manipulators(dirty_lights, resynced_lights=resynced_lights)
+        self._set_statistics(start, len(dirty_lights))
+
+    def update_culling(self):
+        """Update the manipulators after the camera, the culling distance or the maximum manipulator count changed"""
+        self._visible_distances = {}
+        self._cull_lights(self._positions)
+        self._refresh_manipulators(set())
+
+    def _resync_lights(self, resynced_prims: Set[Sdf.Path]) -> Set[Sdf.Path]:
+        if not resynced_prims:
+            return set()
+        dirty_lights = set()
+        for light_path in list(self._positions):
+            if any(prefix in resynced_prims for prefix in light_path.GetPrefixes()):
+                del self._positions[light_path]
+                dirty_lights.add(light_path)
+        for path in resynced_prims:
+            prim = self._stage.GetPrimAtPath(path)
+            if not prim:
+                continue
+            dirty_lights.update(
+                child.GetPath() for child in Usd.PrimRange(prim, Usd.PrimAllPrimsPredicate) if _is_light(child)
+            )
+        return dirty_lights
+
+    def _get_lights_affected_by(self, property_paths: Iterable[Sdf.Path]) -> Set[Sdf.Path]:
+        affected = set()
+        ancestor_paths = set()
+        for path in property_paths:
+            prim_path = path.GetPrimPath()
+            if prim_path in self._positions:
+                affected.add(prim_path)
+            elif path.IsPropertyPath() and (
+                path.name == UsdGeom.Tokens.visibility
+                or UsdGeom.Xformable.IsTransformationAffectedByAttrNamed(path.name)
+            ):
+                # Update on any parent transformation or visibility changes too
+                ancestor_paths.add(prim_path)
+        if ancestor_paths:
+            affected.update(
+                light_path
+                for light_path in self._positions
+                if any(prefix in ancestor_paths for prefix in light_path.GetPrefixes())
+            )
+        return affected
+
+    def _update_positions(self, light_paths: Iterable[Sdf.Path]):
+        xform_cache = UsdGeom.XformCache(Usd.TimeCode.Default())
+        for light_path in light_paths:
+            prim = self._stage.GetPrimAtPath(light_path)
+            if not prim or not _is_light(prim):
+                self._positions.pop(light_path, None)
+                continue
+            self._positions[light_path] = xform_cache.GetLocalToWorldTransform(prim).ExtractTranslation()
+
+    def _cull_lights(self, light_paths: Iterable[Sdf.Path]):
+        """Update the camera distance of the given lights, or forget them if they are culled or removed"""
+        world_to_ndc = None
+        camera_position = None
+        if self._viewport_api:
+            world_to_ndc = self._viewport_api.world_to_ndc
+            camera_position = self._viewport_api.transform.Transform(Gf.Vec3d(0, 0, 0))
+        for path in light_paths:
+            self._visible_distances.pop(path, None)
+            position = self._positions.get(path)
+            if position is None:
+                continue
+            if world_to_ndc is None:
+                self._visible_distances[path] = 0.0
+                continue
+            distance = (position - camera_position).GetLength()
+            if self._max_distance and distance > self._max_distance:
+                continue
+            if self._frustum_culling:
+                ndc_position = world_to_ndc.Transform(position)
+                # Lights behind the camera have a NDC depth greater than 1
+                if ndc_position[2] > 1.0 or abs(ndc_position[0]) > _NDC_MARGIN or abs(ndc_position[1]) > _NDC_MARGIN:
+                    continue
+            self._visible_distances[path] = distance
+
+    def _get_displayed_lights(self) -> Set[str]:
+        """Get the lights inside the frustum and culling distance, capped to the closest lights"""
+        if self._max_manipulators and len(self._visible_distances) > self._max_manipulators:
+            closest = heapq.nsmallest(
+                self._max_manipulators, self._visible_distances.items(), key=lambda item: (item[1], item[0])
+            )
+            return {str(path) for path, _ in closest}
+        return {str(path) for path in self._visible_distances}
+
+    def _refresh_manipulators(self, dirty_lights: Set[Sdf.Path], resynced_lights: Set[Sdf.Path] = frozenset()):
+        if not self._scene_view:
+            return
+        displayed = self._get_displayed_lights()
+
+        # Release the manipulators of the culled or removed lights first so they can be reused
+        for light_path in [path for path in self._manipulators if path not in displayed]:
+            manipulator = self._manipulators.pop(light_path)
+            manipulator.set_enabled(False)
+            self._pool.append(manipulator)
+
+        for light_path in displayed:
+            manipulator = self._manipulators.get(light_path)
+            sdf_path = Sdf.Path(light_path)
+            if manipulator is not None and sdf_path not in resynced_lights:
+                if sdf_path in dirty_lights:
+                    manipulator.model.update_from_prim()
+                continue
+            model = LightGizmosModel(self._stage.GetPrimAtPath(sdf_path), self._usd_context_name, self._gizmo_scale)
+            if manipulator is not None:
+                # The prim was resynced so the model needs the new prim
+                manipulator.model = model
+                manipulator.invalidate()
+            elif self._pool:
+                manipulator = self._pool.pop()
+                manipulator.model = model
+                manipulator.set_enabled(True)
+                manipulator.invalidate()
+            else:
+                with self._scene_view.scene:
+                    manipulator = LightGizmosManipulator(self._viewport_api, model=model)
+            self._manipulators[light_path] = manipulator
+
+        GlobalSelection.g_set_lightmanipulators(self._manipulators)
+
+    def _set_statistics(self, start: float, updated_count: int):
+        self.last_update_duration = time.perf_counter() - start
+        self.last_updated_count = updated_count
+        carb.log_verbose(
+            f"[lightspeed.light.gizmos] Updated {updated_count} lights in {self.last_update_duration:.4f}s: "
+            f"{len(self._manipulators)} gizmos displayed for {len(self._positions)} lights"
+        )
+
+    def __read_settings(self):
+        settings = carb.settings.get_settings()
+        self._max_manipulators = settings.get(CARB_SETTING_MAX_MANIPULATORS) or 0
+        self._max_distance = settings.get(CARB_SETTING_MAX_DISTANCE) or 0.0
+        frustum_culling = settings.get(CARB_SETTING_FRUSTUM_CULLING)
+        self._frustum_culling = True if frustum_culling is None else bool(frustum_culling)
+
+    def _on_culling_setting_changed(self, _item, event_type):
+        if event_type != carb.settings.ChangeEventType.CHANGED:
+            return
+        self.__read_settings()
+        self.update_culling()
+
+    def _on_view_changed(self, *_):
+        # The view changes every frame while the camera moves, so the culling is only updated once per frame
+        if self._update_task is not None:
+            return
+        self._update_task = asyncio.ensure_future(self._deferred_update_culling())
+
+    async def _deferred_update_culling(self):
+        try:
+            await omni.kit.app.get_app().next_update_async()
+            self.update_culling()
+        finally:
+            self._update_task = None
+
+    def clear(self):
+        """Destroy every manipulator and forget the lights of the stage"""
+        if self._scene_view:
+            self._scene_view.scene.clear()
+        for manipulator in [*self._manipulators.values(), *self._pool]:
+            manipulator.destroy()
+        self._manipulators = {}
+        self._pool = []
+        self._positions = {}
+        self._visible_distances = {}
+        self._stage = None
+        GlobalSelection.g_set_lightmanipulators(self._manipulators)
+
+    def destroy(self):
+        if self._update_task is not None:
+            self._update_task.cancel()
+            self._update_task = None
+        self._view_change_sub = None
+        settings = carb.settings.get_settings()
+        for subscription in self._settings_subs:
+            settings.unsubscribe_to_change_events(subscription)
+        self._settings_subs = []
+        self.clear()
+        self._viewport_api = None
+        self._scene_view = None
@@ -510,8 +510,15 @@ class LightGizmosManipulator(sc.Manipulator):
         self._root = None
         self._viewport_api = None
 
+    def set_enabled(self, value: bool):
+        """Show or hide the gizmo without destroying it so it can be reused for another light"""
+        if self._root:
+            self._root.visible = value
+
     def on_build(self):
         """Called when the model is changed and rebuilds the whole gizmo"""
+        # The gizmo is built again when the manipulator is reused with a different model
+        self._root.clear()
         self.model.update_from_prim()
 
         # get up to date state
@@ -16,3 +16,4 @@
 """
 
 from .e2e.test_info import TestInfo
+from .e2e.test_manager import TestLightGizmosManager
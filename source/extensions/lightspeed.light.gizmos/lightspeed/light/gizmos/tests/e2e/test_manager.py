@@ -0,0 +1,213 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["TestLightGizmosManager"]
+
+import os
+import time
+
+import carb
+import omni.kit.app
+import omni.kit.test
+import omni.usd
+from lightspeed.light.gizmos.manager import CARB_SETTING_MAX_MANIPULATORS, LightGizmosManager
+from omni.kit.test_suite.helpers import wait_stage_loading
+from omni.ui import scene as sc
+from omni.ui.tests.test_base import OmniUiTest
+from pxr import Gf, Sdf, UsdGeom, UsdLux
+
+_BENCHMARK_LIGHT_COUNT = 10_000 if os.environ.get("FLUX_RUN_LARGE_BENCHMARKS") else 2_000
+_BENCHMARK_FRAME_COUNT = 30
+
+
+class _CountingMatrix:
+    """An identity world to NDC transform counting the transformed positions"""
+
+    def __init__(self):
+        self.transform_count = 0
+
+    def Transform(self, position):  # noqa N802
+        self.transform_count += 1
+        return position
+
+
+class _FakeViewportApi:
+    def __init__(self):
+        self.world_to_ndc = _CountingMatrix()
+        # The camera is at the origin
+        self.transform = Gf.Matrix4d(1)
+
+
+class TestLightGizmosManager(OmniUiTest):
+    # Before running each test
+    async def setUp(self):
+        await super().setUp()
+        self.context = omni.usd.get_context()
+        await self.context.new_stage_async()
+        self.stage = self.context.get_stage()
+
+    # After running each test
+    async def tearDown(self):
+        await wait_stage_loading()
+        if self.context.can_close_stage():
+            await self.context.close_stage_async()
+        self.stage = None
+        self.context = None
+        await super().tearDown()
+
+    def _create_lights(self, count: int):
+        with Sdf.ChangeBlock():
+            for index in range(count):
+                light = UsdLux.SphereLight.Define(self.stage, f"/RootNode/lights/light_{index:016X}")
+                UsdGeom.XformCommonAPI(light).SetTranslate((index % 100, 0, index // 100))
+
+    async def _create_manager(self, max_manipulators: int, viewport_api=None) -> LightGizmosManager:
+        window = await self.create_test_window(width=256, height=256)
+        with window.frame:
+            scene_view = sc.SceneView()
+        # No viewport means no frustum or distance culling: only the cap is applied
+        manager = LightGizmosManager(viewport_api, scene_view, "")
+        manager.max_manipulators = max_manipulators
+        return manager
+
+    async def _get_frame_time(self) -> float:
+        app = omni.kit.app.get_app()
+        await app.next_update_async()
+        start = time.perf_counter()
+        for _ in range(_BENCHMARK_FRAME_COUNT):
+            await app.next_update_async()
+        return (time.perf_counter() - start) / _BENCHMARK_FRAME_COUNT
+
+    async def test_rebuild_should_cap_manipulators(self):
+        # Arrange
+        self._create_lights(10)
+        manager = await self._create_manager(4)
+
+        # Act
+        manager.rebuild(self.stage)
+
+        # Assert
+        self.assertEqual(manager.light_count, 10)
+        self.assertEqual(len(manager.manipulators), 4)
+        self.assertEqual(manager.manipulator_count, 4)
+
+        manager.destroy()
+
+    async def test_process_changes_should_only_update_affected_lights(self):
+        # Arrange
+        self._create_lights(10)
+        manager = await self._create_manager(0)
+        manager.rebuild(self.stage)
+
+        # Act
+        UsdLux.DiskLight.Define(self.stage, "/RootNode/lights/light_0123456789ABCDEF")
+        manager.process_changes([Sdf.Path("/RootNode/lights/light_0123456789ABCDEF")], [])
+        added_count = manager.last_updated_count
+
+        self.stage.RemovePrim("/RootNode/lights/light_0000000000000000")
+        manager.process_changes([Sdf.Path("/RootNode/lights/light_0000000000000000")], [])
+
+        # Assert
+        self.assertEqual(added_count, 1)
+        self.assertEqual(manager.light_count, 10)
+        self.assertIn("/RootNode/lights/light_0123456789ABCDEF", manager.manipulators)
+        self.assertNotIn("/RootNode/lights/light_0000000000000000", manager.manipulators)
+        # The manipulator of the removed light is kept to be reused
+        self.assertEqual(manager.manipulator_count, 11)
+
+        manager.destroy()
+
+    async def test_process_changes_should_only_cull_affected_lights(self):
+        # Arrange
+        self._create_lights(10)
+        viewport_api = _FakeViewportApi()
+        manager = await self._create_manager(0, viewport_api=viewport_api)
+        manager.rebuild(self.stage)
+        rebuild_transform_count = viewport_api.world_to_ndc.transform_count
+
+        # Act
+        translate = self.stage.GetAttributeAtPath("/RootNode/lights/light_0000000000000005.xformOp:translate")
+        translate.Set((0.5, 0.0, 0.0))
+        manager.process_changes([], [translate.GetPath()])
+
+        # Assert
+        # The lights with a NDC position outside of the frustum margin are culled
+        self.assertEqual(rebuild_transform_count, 10)
+        self.assertEqual(viewport_api.world_to_ndc.transform_count, 11)
+        self.assertSetEqual(
+            {
+                "/RootNode/lights/light_0000000000000000",
+                "/RootNode/lights/light_0000000000000001",
+                "/RootNode/lights/light_0000000000000005",
+            },
+            set(manager.manipulators),
+        )
+
+        manager.destroy()
+
+    async def test_culling_setting_changed_should_update_manipulators(self):
+        # Arrange
+        self._create_lights(10)
+        manager = await self._create_manager(0)
+        manager.rebuild(self.stage)
+        settings = carb.settings.get_settings()
+        previous_value = settings.get(CARB_SETTING_MAX_MANIPULATORS)
+
+        try:
+            # Act
+            settings.set(CARB_SETTING_MAX_MANIPULATORS, 3)
+            await omni.kit.app.get_app().next_update_async()
+
+            # Assert
+            self.assertEqual(manager.max_manipulators, 3)
+            self.assertEqual(len(manager.manipulators), 3)
+        finally:
+            settings.set(CARB_SETTING_MAX_MANIPULATORS, previous_value or 0)
+            manager.destroy()
+
+    async def test_benchmark_build_and_frame_time(self):
+        # Arrange
+        self._create_lights(_BENCHMARK_LIGHT_COUNT)
+        results = {}
+
+        for label, max_manipulators in (("uncapped", 0), ("capped", 500)):
+            manager = await self._create_manager(max_manipulators)
+
+            # Act
+            start = time.perf_counter()
+            manager.rebuild(self.stage)
+            build_duration = time.perf_counter() - start
+            frame_time = await self._get_frame_time()
+
+            translate = self.stage.GetAttributeAtPath("/RootNode/lights/light_0000000000000000.xformOp:translate")
+            translate.Set((-float(max_manipulators), 0.0, 0.0))
+            start = time.perf_counter()
+            manager.process_changes([], [translate.GetPath()])
+            update_duration = time.perf_counter() - start
+
+            results[label] = (build_duration, frame_time, update_duration, len(manager.manipulators))
+            manager.destroy()
+
+        for label, (build_duration, frame_time, update_duration, count) in results.items():
+            carb.log_info(
+                f"Light gizmos ({label}) for {_BENCHMARK_LIGHT_COUNT} lights: {count} gizmos, "
+                f"build {build_duration:.3f}s, frame {frame_time * 1000:.2f}ms, single update {update_duration:.4f}s"
+            )
+
+        # Assert
+        self.assertEqual(results["uncapped"][3], _BENCHMARK_LIGHT_COUNT)
+        self.assertEqual(results["capped"][3], 500)
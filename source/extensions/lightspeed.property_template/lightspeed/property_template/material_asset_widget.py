@@ -21,6 +21,7 @@ import omni.ui as ui
 import omni.usd
 from lightspeed.common import constants
 from lightspeed.tool.material.widget import MaterialButtons
+from omni.flux.utils.common.material_binding_index import get_material_binding_index as _get_material_binding_index
 from omni.kit.property.material.scripts.usd_attribute_widget import UsdMaterialAttributeWidget
 from omni.kit.property.usd.prim_selection_payload import PrimSelectionPayload
 from omni.kit.property.usd.usd_property_widget import UsdPropertiesWidget
@@ -135,17 +136,16 @@ class MaterialAssetsWidget(UsdPropertiesWidget):
 
         def get_mat_from_geo(prim, prototype):
             if prim.IsA(UsdGeom.Subset) or prim.IsA(UsdGeom.Mesh):
-                material, _ = UsdShade.MaterialBindingAPI(prim).ComputeBoundMaterial()
-                if material:
-                    mat_path = material.GetPath()
-                    if mat_path not in self.__prototypes_data[str(prototype)]:
-                        self.__prototypes_data[str(prototype)].append(mat_path)
+                mat_path = binding_index.get_bound_material(prim.GetPath())
+                if mat_path and mat_path not in self.__prototypes_data[str(prototype)]:
+                    self.__prototypes_data[str(prototype)].append(mat_path)
 
         if len(payloads) == 0:
             super().on_new_payload(payloads)
             return False
 
         stage = payloads.get_stage()
+        binding_index = _get_material_binding_index(stage)
         for p in payloads:  # noqa PLR1702
             prim = stage.GetPrimAtPath(p)
             if prim.IsValid():
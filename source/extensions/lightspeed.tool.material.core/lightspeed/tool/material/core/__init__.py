@@ -16,3 +16,4 @@
 """
 
 from .core import ToolMaterialCore
+from .material_library_index import MaterialLibraryIndex, get_material_library_index_instance
@@ -27,8 +27,11 @@ import omni.kit.undo
 import omni.usd
 from lightspeed.common import constants
 from lightspeed.layer_manager.core import LayerManagerCore, LayerType
+from omni.flux.utils.common.material_binding_index import get_material_binding_index as _get_material_binding_index
 from pxr import Sdf, Usd, UsdGeom, UsdShade
 
+from .material_library_index import get_material_library_index_instance as _get_material_library_index_instance
+
 
 class ToolMaterialCore:
     @staticmethod
@@ -72,16 +75,17 @@ class ToolMaterialCore:
 
     @staticmethod
     def get_materials_from_prim_paths(prim_paths: List[str], context_name: str = ""):
+        usd_context = omni.usd.get_context(context_name)
+        stage = usd_context.get_stage()
+        binding_index = _get_material_binding_index(stage)
+
         def get_mat_from_geo(_prim):
             if _prim.IsA(UsdGeom.Subset) or _prim.IsA(UsdGeom.Mesh):
-                _material, _ = UsdShade.MaterialBindingAPI(_prim).ComputeBoundMaterial()
-                if _material:
-                    return _material
+                _material_path = binding_index.get_bound_material(_prim.GetPath())
+                if _material_path:
+                    return UsdShade.Material(stage.GetPrimAtPath(_material_path))
             return None
 
-        usd_context = omni.usd.get_context(context_name)
-        stage = usd_context.get_stage()
-
         material_prims = []
         for prim_path in prim_paths:  # noqa PLR1702
             prim = stage.GetPrimAtPath(prim_path)
@@ -103,25 +107,23 @@ class ToolMaterialCore:
     def get_corresponding_usd_mat_from_mdl_path(material_files, mdl_path) -> Optional[str]:
         # grab the good reference material
         sub_id = os.path.basename(mdl_path).rpartition(".")[0]
-        for material_file in material_files:
-            stage = Usd.Stage.Open(material_file)
-            iterator = iter(stage.TraverseAll())
-            for prim in iterator:
-                if prim.IsValid() and prim.IsA(UsdShade.Shader):
-                    shader = UsdShade.Shader(prim)
-                    if sub_id == shader.GetSourceAssetSubIdentifier("mdl"):
-                        return material_file
-        return None
+        result = _get_material_library_index_instance().get_material_file(material_files, sub_id)
+        return result[0] if result else None
+
+    @staticmethod
+    def get_mat_prim_path_from_usd(material_file) -> Optional[Sdf.Path]:
+        # grab the good reference material without opening a stage
+        material_path = _get_material_library_index_instance().get_first_material_path(material_file)
+        return Sdf.Path(material_path) if material_path else None
 
     @staticmethod
     def get_mat_prim_from_usd(material_file) -> Optional[Usd.Prim]:
         # grab the good reference material
-        stage = Usd.Stage.Open(material_file)
-        iterator = iter(stage.TraverseAll())
-        for prim in iterator:
-            if prim.IsValid() and prim.IsA(UsdShade.Material):
-                return prim
-        return None
+        material_path = ToolMaterialCore.get_mat_prim_path_from_usd(material_file)
+        if not material_path:
+            return None
+        stage = Usd.Stage.Open(material_file, Usd.Stage.LoadNone)
+        return stage.GetPrimAtPath(material_path)
 
     @staticmethod
     def anchor_reference_asset_path_to_layer(ref: Sdf.Reference, intro_layer: Sdf.Layer, anchor_layer: Sdf.Layer):
@@ -158,7 +160,7 @@ class ToolMaterialCore:
                     break
 
         edit_layer = stage.GetEditTarget().GetLayer()
-        default_ref_prim = ToolMaterialCore.get_mat_prim_from_usd(new_mat_ref_path)
+        default_ref_prim_path = ToolMaterialCore.get_mat_prim_path_from_usd(new_mat_ref_path)
         final_path = new_mat_ref_path
         # make the path relative to current edit target layer
         if not edit_layer.anonymous:
@@ -167,7 +169,7 @@ class ToolMaterialCore:
             for mat, _ in material_dict.items():
                 refs_and_layers = omni.usd.get_composed_references_from_prim(mat.GetPrim())
                 for ref, layer in refs_and_layers:
-                    new_ref = Sdf.Reference(assetPath=final_path, primPath=default_ref_prim.GetPath())
+                    new_ref = Sdf.Reference(assetPath=final_path, primPath=default_ref_prim_path)
                     ref_remove = ToolMaterialCore.anchor_reference_asset_path_to_layer(ref, layer, edit_layer)
 
                     omni.kit.commands.execute(
@@ -0,0 +1,177 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["MaterialLibraryIndex", "get_material_library_index_instance"]
+
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import carb
+import carb.tokens
+import omni.client
+from omni.flux.utils.common.path_utils import read_json_file as _read_json_file
+from omni.flux.utils.common.path_utils import write_json_file as _write_json_file
+from pxr import Sdf
+
+_INDEX_VERSION = 1
+_DEFAULT_INDEX_PATH = "${data}/lightspeed.tool.material.core/material_library_index.json"
+
+_MATERIAL_TYPE_NAME = "Material"
+_SHADER_TYPE_NAME = "Shader"
+_SUB_IDENTIFIER_ATTRIBUTE = "info:mdl:sourceAsset:subIdentifier"
+
+_INSTANCE = None
+
+
+class MaterialLibraryIndex:
+    """
+    Persistent index of the material library files: the MDL sub-identifiers of their shaders and their material prims.
+
+    The files are read at the Sdf level without composing a stage, and only read again when their size or modified
+    time changed since they were indexed.
+    """
+
+    def __init__(self, index_path: str = _DEFAULT_INDEX_PATH):
+        self._index_path = carb.tokens.get_tokens_interface().resolve(index_path)
+        # {material file: {"size": int, "modified_time": str, "materials": [path], "sub_identifiers": {id: path}}}
+        self._files: Dict[str, Dict] = {}
+        self._load()
+
+    @property
+    def index_path(self) -> str:
+        return self._index_path
+
+    def get_material_file(self, material_files: Iterable[str], sub_identifier: str) -> Optional[Tuple[str, str]]:
+        """
+        Find the first material file with a shader using the given MDL sub-identifier
+
+        Args:
+            material_files: the material library files to look into, in order of priority
+            sub_identifier: the MDL sub-identifier. Example: AperturePBR_Opacity
+
+        Returns:
+            The material file and the path of the material prim of the shader, or None if no file matched
+        """
+        for material_file in material_files:
+            material_path = self._get_entry(material_file)["sub_identifiers"].get(sub_identifier)
+            if material_path is not None:
+                return material_file, material_path
+        return None
+
+    def get_first_material_path(self, material_file: str) -> Optional[str]:
+        """
+        Get the first material prim of a material file, in depth-first order
+
+        Args:
+            material_file: the material library file
+
+        Returns:
+            The material prim path or None if the file has no material
+        """
+        materials = self._get_entry(material_file)["materials"]
+        return materials[0] if materials else None
+
+    def _get_entry(self, material_file: str) -> Dict:
+        signature = self._get_signature(material_file)
+        entry = self._files.get(material_file)
+        if entry is not None and signature is not None and [entry.get("size"), entry.get("modified_time")] == signature:
+            return entry
+
+        materials, sub_identifiers = self._read_material_file(material_file)
+        entry = {
+            "size": signature[0] if signature else None,
+            "modified_time": signature[1] if signature else None,
+            "materials": materials,
+            "sub_identifiers": sub_identifiers,
+        }
+        self._files[material_file] = entry
+        if signature is not None:
+            self._save()
+        return entry
+
+    @staticmethod
+    def _get_signature(path: str) -> Optional[List]:
+        result, entry = omni.client.stat(path)
+        if result != omni.client.Result.OK:
+            return None
+        # Lists to compare with the values read from the json file
+        return [entry.size, str(entry.modified_time)]
+
+    @staticmethod
+    def _read_material_file(material_file: str) -> Tuple[List[str], Dict[str, str]]:
+        """Walk the prim specs of the material file without composing a stage"""
+        # Read the file from disk even if an outdated version of the layer is already opened
+        layer = Sdf.Layer.OpenAsAnonymous(material_file)
+        if not layer:
+            carb.log_warn(f"Unable to open the material file: {material_file}")
+            return [], {}
+
+        materials = []
+        sub_identifiers = {}
+        # (prim spec, closest material ancestor path)
+        stack = [(prim_spec, None) for prim_spec in reversed(layer.pseudoRoot.nameChildren)]
+        while stack:
+            prim_spec, material_path = stack.pop()
+            if prim_spec.typeName == _MATERIAL_TYPE_NAME:
+                material_path = prim_spec.path.pathString
+                materials.append(material_path)
+            elif prim_spec.typeName == _SHADER_TYPE_NAME:
+                attribute = prim_spec.attributes.get(_SUB_IDENTIFIER_ATTRIBUTE)
+                sub_identifier = str(attribute.default) if attribute and attribute.default else None
+                # Keep the first shader found for a sub-identifier, like a stage traversal would
+                if sub_identifier and sub_identifier not in sub_identifiers:
+                    sub_identifiers[sub_identifier] = material_path or prim_spec.path.GetParentPath().pathString
+            stack.extend((child, material_path) for child in reversed(prim_spec.nameChildren))
+        return materials, sub_identifiers
+
+    def _load(self):
+        if not os.path.exists(self._index_path):
+            return
+        try:
+            data = _read_json_file(self._index_path)
+        except (IOError, ValueError) as e:
+            carb.log_warn(f"Unable to read the material library index {self._index_path}: {e}")
+            return
+        if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+            return
+        files = data.get("files")
+        if not isinstance(files, dict):
+            return
+        # Malformed entries are dropped and read again when they are needed
+        self._files = {material_file: entry for material_file, entry in files.items() if self._is_valid_entry(entry)}
+
+    @staticmethod
+    def _is_valid_entry(entry) -> bool:
+        return (
+            isinstance(entry, dict)
+            and isinstance(entry.get("materials"), list)
+            and isinstance(entry.get("sub_identifiers"), dict)
+        )
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self._index_path), exist_ok=True)
+        if not _write_json_file(
+            self._index_path, {"version": _INDEX_VERSION, "files": self._files}, raise_if_error=False
+        ):
+            carb.log_warn(f"Unable to write the material library index {self._index_path}")
+
+
+def get_material_library_index_instance() -> MaterialLibraryIndex:
+    global _INSTANCE
+    if _INSTANCE is None:
+        _INSTANCE = MaterialLibraryIndex()
+    return _INSTANCE
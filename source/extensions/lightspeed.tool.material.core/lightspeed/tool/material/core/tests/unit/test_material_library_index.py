@@ -0,0 +1,128 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from lightspeed.tool.material.core import MaterialLibraryIndex
+from omni.kit.test.async_unittest import AsyncTestCase
+
+_MATERIAL_TEMPLATE = """    def Material "{name}"
+    {{
+        def Shader "Shader"
+        {{
+            uniform token info:implementationSource = "sourceAsset"
+            uniform asset info:mdl:sourceAsset = @{sub_identifier}.mdl@
+            uniform token info:mdl:sourceAsset:subIdentifier = "{sub_identifier}"
+        }}
+    }}
+"""
+
+
+class TestMaterialLibraryIndex(AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.index_path = str(Path(self.temp_dir.name) / "index" / "material_library_index.json")
+
+    # After running each test
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+        self.temp_dir = None
+
+    def _write_material_file(self, name: str, materials: list[tuple[str, str]]) -> str:
+        path = Path(self.temp_dir.name) / name
+        content = "".join(
+            _MATERIAL_TEMPLATE.format(name=material_name, sub_identifier=sub_identifier)
+            for material_name, sub_identifier in materials
+        )
+        path.write_text(f'#usda 1.0\n\ndef Scope "Looks"\n{{\n{content}}}\n', encoding="utf8")
+        return str(path)
+
+    async def test_get_material_file_should_find_the_first_file_with_the_sub_identifier(self):
+        # Arrange
+        library_0 = self._write_material_file("library_0.usda", [("Opaque", "AperturePBR_Opacity")])
+        library_1 = self._write_material_file(
+            "library_1.usda", [("Translucent", "AperturePBR_Translucent"), ("Opaque", "AperturePBR_Opacity")]
+        )
+        index = MaterialLibraryIndex(index_path=self.index_path)
+
+        # Act
+        opacity_value = index.get_material_file([library_0, library_1], "AperturePBR_Opacity")
+        translucent_value = index.get_material_file([library_0, library_1], "AperturePBR_Translucent")
+        missing_value = index.get_material_file([library_0, library_1], "AperturePBR_Missing")
+        first_material_value = index.get_first_material_path(library_1)
+
+        # Assert
+        self.assertEqual((library_0, "/Looks/Opaque"), opacity_value)
+        self.assertEqual((library_1, "/Looks/Translucent"), translucent_value)
+        self.assertIsNone(missing_value)
+        self.assertEqual("/Looks/Translucent", first_material_value)
+
+    async def test_get_material_file_changed_file_should_read_the_file_again(self):
+        # Arrange
+        library = self._write_material_file("library.usda", [("Opaque", "AperturePBR_Opacity")])
+        index = MaterialLibraryIndex(index_path=self.index_path)
+        index.get_material_file([library], "AperturePBR_Opacity")
+
+        # Act
+        self._write_material_file(
+            "library.usda", [("Translucent", "AperturePBR_Translucent"), ("Opaque", "AperturePBR_Opacity")]
+        )
+        value = index.get_material_file([library], "AperturePBR_Translucent")
+
+        # Assert
+        self.assertEqual((library, "/Looks/Translucent"), value)
+        self.assertEqual("/Looks/Translucent", index.get_first_material_path(library))
+
+    async def test_index_should_be_reloaded_from_the_json_file(self):
+        # Arrange
+        library = self._write_material_file("library.usda", [("Opaque", "AperturePBR_Opacity")])
+        MaterialLibraryIndex(index_path=self.index_path).get_material_file([library], "AperturePBR_Opacity")
+
+        # Act
+        index = MaterialLibraryIndex(index_path=self.index_path)
+        with patch.object(MaterialLibraryIndex, "_read_material_file") as read_mock:
+            value = index.get_material_file([library], "AperturePBR_Opacity")
+
+        # Assert
+        self.assertEqual(0, read_mock.call_count)
+        self.assertEqual((library, "/Looks/Opaque"), value)
+        data = json.loads(Path(self.index_path).read_text(encoding="utf8"))
+        self.assertListEqual(["/Looks/Opaque"], data["files"][library]["materials"])
+        self.assertDictEqual({"AperturePBR_Opacity": "/Looks/Opaque"}, data["files"][library]["sub_identifiers"])
+
+    async def test_index_malformed_json_file_should_be_rebuilt(self):
+        # Arrange
+        library = self._write_material_file("library.usda", [("Opaque", "AperturePBR_Opacity")])
+        MaterialLibraryIndex(index_path=self.index_path).get_material_file([library], "AperturePBR_Opacity")
+        data = json.loads(Path(self.index_path).read_text(encoding="utf8"))
+        del data["files"][library]["sub_identifiers"]
+
+        for content in [json.dumps(data), "{not json", json.dumps({"version": 1, "files": []})]:
+            with self.subTest(content=content):
+                Path(self.index_path).write_text(content, encoding="utf8")
+
+                # Act
+                value = MaterialLibraryIndex(index_path=self.index_path).get_material_file(
+                    [library], "AperturePBR_Opacity"
+                )
+
+                # Assert
+                self.assertEqual((library, "/Looks/Opaque"), value)
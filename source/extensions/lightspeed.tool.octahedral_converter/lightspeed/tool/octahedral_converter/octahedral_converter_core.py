@@ -18,8 +18,11 @@
 from pathlib import Path
 
 import carb
-import numpy as np
-from PIL import Image
+from omni.flux.utils.common import lazy_import as _lazy_import
+
+# Only imported when a texture is converted, to keep them out of the app startup
+np = _lazy_import("numpy")
+Image = _lazy_import("PIL.Image")
 
 
 # Converts either OpenGL or DirectX style normal maps to RTX Remix compatible Hemispherical Octahedral maps.
@@ -19,8 +19,15 @@ __all__ = [
     "AppendReferenceRequestModel",
     "AssetPathResponseModel",
     "AssetReplacementsValidators",
+    "BulkInstancesRequestModel",
+    "BulkInstancesResponseModel",
+    "BulkInstancesResultModel",
+    "BulkTexturesRequestModel",
+    "BulkTexturesResponseModel",
+    "BulkTexturesResultModel",
     "GetPrimsQueryModel",
     "GetTexturesQueryModel",
+    "PaginatedPrimsResponseModel",
     "PrimInstancesPathParamModel",
     "PrimReferencePathParamModel",
     "PrimTexturesPathParamModel",
@@ -35,8 +42,15 @@ __all__ = [
 from .models import (
     AppendReferenceRequestModel,
     AssetPathResponseModel,
+    BulkInstancesRequestModel,
+    BulkInstancesResponseModel,
+    BulkInstancesResultModel,
+    BulkTexturesRequestModel,
+    BulkTexturesResponseModel,
+    BulkTexturesResultModel,
     GetPrimsQueryModel,
     GetTexturesQueryModel,
+    PaginatedPrimsResponseModel,
     PrimInstancesPathParamModel,
     PrimReferencePathParamModel,
     PrimsResponseModel,
@@ -19,7 +19,7 @@ from pathlib import Path
 
 from lightspeed.trex.utils.common.prim_utils import PrimTypes
 from omni.flux.asset_importer.core.data_models import TextureTypeNames
-from omni.flux.service.shared import BaseServiceModel
+from omni.flux.service.shared import BaseServiceModel, validate_page
 from pydantic import root_validator
 
 from .validators import AssetReplacementsValidators
@@ -33,8 +33,7 @@ class SetSelectionPathParamModel(BaseServiceModel):
     @root_validator(allow_reuse=True)
     def root_validators(cls, values):  # noqa
 
-        for asset_path in values.get("asset_paths"):
-            AssetReplacementsValidators.is_valid_prim(asset_path, values.get("context_name"))
+        AssetReplacementsValidators.are_valid_prims(values.get("asset_paths"), values.get("context_name"))
         return values
 
 
@@ -79,12 +78,16 @@ class GetPrimsQueryModel(BaseServiceModel):
     filter_session_prims: bool = False
     layer_identifier: Path | None = None
     exists: bool = True
+    # Pagination: the paginated results are returned in the stage traversal order
+    limit: int | None = None
+    cursor: str | None = None
 
     context_name: str = ""  # This is only used to validate the layer_identifier
 
     @root_validator(allow_reuse=True)
     def root_validators(cls, values):  # noqa
         AssetReplacementsValidators.layer_is_in_project(values.get("layer_identifier"), values.get("context_name"))
+        validate_page(values.get("limit"), values.get("cursor"))
         return values
 
 
@@ -99,6 +102,11 @@ class PrimsResponseModel(BaseServiceModel):
     asset_paths: list[str]
 
 
+class PaginatedPrimsResponseModel(PrimsResponseModel):
+    # The cursor to use to get the next page. None if this is the last page.
+    next_cursor: str | None = None
+
+
 class TexturesResponseModel(BaseServiceModel):
     # Format: [(asset_path, texture_path)]
     textures: list[tuple[str, Path]]
@@ -113,6 +121,27 @@ class AssetPathResponseModel(BaseServiceModel):
     asset_path: str
 
 
+class BulkInstancesResultModel(BaseServiceModel):
+    asset_path: str
+    instances: list[str] = []
+    error: str | None = None
+
+
+class BulkInstancesResponseModel(BaseServiceModel):
+    results: list[BulkInstancesResultModel]
+
+
+class BulkTexturesResultModel(BaseServiceModel):
+    asset_path: str
+    # Format: [(asset_path, texture_path)]
+    textures: list[tuple[str, Path]] = []
+    error: str | None = None
+
+
+class BulkTexturesResponseModel(BaseServiceModel):
+    results: list[BulkTexturesResultModel]
+
+
 # REQUEST MODELS
 
 
@@ -136,3 +165,14 @@ class ReplaceReferenceRequestModel(AppendReferenceRequestModel):
     existing_asset_layer_id: Path | None = None
 
     # Extra validation is done in the endpoint since it requires both the path parameter & the body
+
+
+class BulkInstancesRequestModel(BaseServiceModel):
+    # Every item is validated by the core so the results can be returned per item
+    asset_paths: list[str]
+
+
+class BulkTexturesRequestModel(BaseServiceModel):
+    # Every item is validated by the core so the results can be returned per item
+    asset_paths: list[str]
+    texture_types: set[TextureTypeNames] | None = None
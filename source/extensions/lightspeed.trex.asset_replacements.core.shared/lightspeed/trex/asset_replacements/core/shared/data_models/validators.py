@@ -24,14 +24,41 @@ import omni.usd
 from lightspeed.common import constants
 from lightspeed.trex.utils.common.asset_utils import is_asset_ingested
 from lightspeed.trex.utils.common.prim_utils import is_material
+from omni.flux.service.shared import cached_validator as _cached_validator
+from omni.flux.service.shared import get_validation_cache as _get_validation_cache
 from omni.flux.utils.common import path_utils
 from omni.flux.utils.common.omni_url import OmniUrl
-from pxr import Sdf
+from pxr import Sdf, Usd
 
 
 class AssetReplacementsValidators:
     @classmethod
+    @_cached_validator
     def is_valid_prim(cls, prim_path: str, context_name: str):
+        return cls._validate_prim_path(omni.usd.get_context(context_name).get_stage(), prim_path)
+
+    @classmethod
+    def are_valid_prims(cls, prim_paths: list[str], context_name: str):
+        """
+        Validate a list of prim paths with a single stage lookup.
+
+        The result of every item is shared with `is_valid_prim` in the active validation cache scope.
+        """
+        stage = omni.usd.get_context(context_name).get_stage()
+        cache = _get_validation_cache()
+        # Duplicated items are only validated once
+        for prim_path in dict.fromkeys(prim_paths):
+            if cache is None:
+                cls._validate_prim_path(stage, prim_path)
+                continue
+            cache.get_or_compute(
+                cls.is_valid_prim.cache_key(cls, prim_path, context_name),
+                lambda path=prim_path: cls._validate_prim_path(stage, path),
+            )
+        return prim_paths
+
+    @classmethod
+    def _validate_prim_path(cls, stage: Usd.Stage, prim_path: str):
         try:
             path = Sdf.Path(prim_path)
             if not path:
@@ -39,12 +66,13 @@ class AssetReplacementsValidators:
         except Exception as e:
             raise ValueError(f"The string is not a valid prim path: {prim_path}") from e
 
-        if not omni.usd.get_context(context_name).get_stage().GetPrimAtPath(path):
+        if not stage.GetPrimAtPath(path):
             raise ValueError(f"The prim path does not exist in the current stage: {prim_path}")
 
         return prim_path
 
     @classmethod
+    @_cached_validator
     def is_valid_mesh(cls, prim_path: str):
         if not re.match(constants.REGEX_MESH_PATH, prim_path):
             raise ValueError(f"The prim path does not point to a model: {prim_path}")
@@ -52,6 +80,7 @@ class AssetReplacementsValidators:
         return prim_path
 
     @classmethod
+    @_cached_validator
     def is_valid_material(cls, prim_path: str, context_name: str):
         prim = omni.usd.get_context(context_name).get_stage().GetPrimAtPath(prim_path)
         if not prim:
@@ -63,6 +92,7 @@ class AssetReplacementsValidators:
         return prim_path
 
     @classmethod
+    @_cached_validator
     def has_at_least_one_ref(cls, prim_path: str, context_name: str):
         prim = omni.usd.get_context(context_name).get_stage().GetPrimAtPath(prim_path)
         references = omni.usd.get_composed_references_from_prim(prim)
@@ -73,6 +103,7 @@ class AssetReplacementsValidators:
         return prim_path
 
     @classmethod
+    @_cached_validator
     def ref_exists_in_prim(cls, asset_path: Path, layer_id: Path, prim_path: str, context_name: str):
         prim = omni.usd.get_context(context_name).get_stage().GetPrimAtPath(prim_path)
         references = omni.usd.get_composed_references_from_prim(prim)
@@ -87,12 +118,14 @@ class AssetReplacementsValidators:
         raise ValueError(f"The reference ({asset_path}) does not exist for prim: {prim_path}")
 
     @classmethod
+    @_cached_validator
     def is_valid_file_path(cls, asset_path: Path):
         if not path_utils.is_file_path_valid(str(asset_path), log_error=False):
             raise ValueError(f"The file path is invalid: {asset_path}")
         return asset_path
 
     @classmethod
+    @_cached_validator
     def is_asset_ingested(cls, asset_path: Path):
         if not is_asset_ingested(asset_path):
             raise ValueError(
@@ -102,6 +135,7 @@ class AssetReplacementsValidators:
         return asset_path
 
     @classmethod
+    @_cached_validator
     def layer_is_in_project(cls, layer_id: Path | None, context_name: str):
         if layer_id is None:
             return layer_id
@@ -39,8 +39,11 @@ from lightspeed.trex.utils.common.prim_utils import filter_prims_paths as _filte
 from lightspeed.trex.utils.common.prim_utils import get_children_prims
 from lightspeed.trex.utils.common.prim_utils import get_extended_selection as _get_extended_selection
 from lightspeed.trex.utils.common.prim_utils import get_prim_paths as _get_prim_paths
+from lightspeed.trex.utils.common.prim_utils import iter_prim_paths as _iter_prim_paths
 from omni.flux.asset_importer.core.data_models import SUPPORTED_TEXTURE_EXTENSIONS as _SUPPORTED_TEXTURE_EXTENSIONS
 from omni.flux.asset_importer.core.data_models import TextureTypes as _TextureTypes
+from omni.flux.service.shared import decode_cursor as _decode_cursor
+from omni.flux.service.shared import paginate as _paginate
 from omni.flux.utils.common import path_utils as _path_utils
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
@@ -56,8 +59,16 @@ if typing.TYPE_CHECKING:
 from .data_models import (
     AppendReferenceRequestModel,
     AssetPathResponseModel,
+    AssetReplacementsValidators,
+    BulkInstancesRequestModel,
+    BulkInstancesResponseModel,
+    BulkInstancesResultModel,
+    BulkTexturesRequestModel,
+    BulkTexturesResponseModel,
+    BulkTexturesResultModel,
     GetPrimsQueryModel,
     GetTexturesQueryModel,
+    PaginatedPrimsResponseModel,
     PrimInstancesPathParamModel,
     PrimReferencePathParamModel,
     PrimsResponseModel,
@@ -92,7 +103,11 @@ class Setup:
     def select_prim_paths_with_data_model(self, body: SetSelectionPathParamModel):
         self.select_prim_paths(body.asset_path)
 
-    def get_prim_paths_with_data_model(self, query: GetPrimsQueryModel) -> PrimsResponseModel:
+    def get_prim_paths_with_data_model(self, query: GetPrimsQueryModel) -> PaginatedPrimsResponseModel:
+        if query.limit is not None or query.cursor is not None:
+            prim_paths, next_cursor = _paginate(self.iter_prim_paths_with_data_model(query), query.limit, str)
+            return PaginatedPrimsResponseModel(asset_paths=prim_paths, next_cursor=next_cursor)
+
         prim_paths = []
 
         selection = None
@@ -110,7 +125,22 @@ class Setup:
                 context_name=self._context_name,
             )
 
-        return PrimsResponseModel(asset_paths=prim_paths)
+        return PaginatedPrimsResponseModel(asset_paths=prim_paths)
+
+    def iter_prim_paths_with_data_model(self, query: GetPrimsQueryModel) -> typing.Iterator[str]:
+        """
+        Lazily get the prim paths matching the query in the stage traversal order, starting after the query cursor.
+        """
+        return _iter_prim_paths(
+            asset_hashes=query.asset_hashes,
+            prim_types=query.asset_types,
+            selection=_get_extended_selection(self._context_name) if query.return_selection else None,
+            filter_session_prims=query.filter_session_prims,
+            layer_id=query.layer_identifier,
+            exists=query.exists,
+            context_name=self._context_name,
+            start_after=_decode_cursor(query.cursor) if query.cursor is not None else None,
+        )
 
     def get_instances_with_data_model(self, params: PrimInstancesPathParamModel) -> PrimsResponseModel:
         return PrimsResponseModel(asset_paths=list(self.get_instances_from_mesh_path(params.asset_path)))
@@ -122,6 +152,47 @@ class Setup:
             textures=self.get_textures_from_material_path(params.asset_path, query.texture_types)
         )
 
+    def get_instances_bulk_with_data_model(self, body: BulkInstancesRequestModel) -> BulkInstancesResponseModel:
+        errors = {}
+        valid_paths = []
+        for asset_path in body.asset_paths:
+            try:
+                AssetReplacementsValidators.is_valid_prim(asset_path, self._context_name)
+                AssetReplacementsValidators.is_valid_mesh(asset_path)
+            except ValueError as e:
+                errors[asset_path] = str(e)
+                continue
+            valid_paths.append(asset_path)
+
+        instances = self.get_instances_from_mesh_paths(valid_paths)
+        return BulkInstancesResponseModel(
+            results=[
+                BulkInstancesResultModel(
+                    asset_path=asset_path,
+                    instances=sorted(instances.get(asset_path, [])),
+                    error=errors.get(asset_path),
+                )
+                for asset_path in body.asset_paths
+            ]
+        )
+
+    def get_textures_bulk_with_data_model(self, body: BulkTexturesRequestModel) -> BulkTexturesResponseModel:
+        results = []
+        for asset_path in body.asset_paths:
+            try:
+                AssetReplacementsValidators.is_valid_prim(asset_path, self._context_name)
+                AssetReplacementsValidators.is_valid_material(asset_path, self._context_name)
+            except ValueError as e:
+                results.append(BulkTexturesResultModel(asset_path=asset_path, error=str(e)))
+                continue
+            results.append(
+                BulkTexturesResultModel(
+                    asset_path=asset_path,
+                    textures=self.get_textures_from_material_path(asset_path, body.texture_types),
+                )
+            )
+        return BulkTexturesResponseModel(results=results)
+
     def get_reference_with_data_model(self, params: PrimReferencePathParamModel) -> ReferenceResponseModel:
         stage = self._context.get_stage()
         prim = stage.GetPrimAtPath(params.asset_path)
@@ -227,6 +298,33 @@ class Setup:
             instances.add(constants.COMPILED_REGEX_MESH_TO_INSTANCE_SUB.sub(instance_path, prim_path))
         return instances
 
+    def get_instances_from_mesh_paths(self, prim_paths: list[str]) -> dict[str, set[str]]:
+        """
+        Get the instances of many meshes with a single traversal of the stage
+
+        Args:
+            prim_paths: The mesh prim paths
+
+        Returns:
+            A dictionary of mesh prim path to the set of instance prim paths
+        """
+        if not prim_paths:
+            return {}
+
+        # {hash: [instance paths]}
+        hash_instances = {}
+        instance_pattern = re.compile(constants.REGEX_INSTANCE_PATH)
+        for instance_path in _filter_prims_paths(lambda prim: bool(instance_pattern.match(str(prim.GetPath())))):
+            hash_instances.setdefault(Setup.get_prim_hash(instance_path), []).append(instance_path)
+
+        return {
+            prim_path: {
+                constants.COMPILED_REGEX_MESH_TO_INSTANCE_SUB.sub(instance_path, prim_path)
+                for instance_path in hash_instances.get(Setup.get_prim_hash(prim_path), [])
+            }
+            for prim_path in prim_paths
+        }
+
     def get_textures_from_material_path(
         self, prim_path: str, texture_types: Optional[set[_TextureTypes]]
     ) -> list[tuple[str, str]]:
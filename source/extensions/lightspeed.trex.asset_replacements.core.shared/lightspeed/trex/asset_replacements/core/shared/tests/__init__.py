@@ -16,4 +16,5 @@
 """
 
 from .unit.test_core import TestAssetReplacementsCore
+from .unit.test_pagination import TestAssetReplacementsPagination
 from .unit.test_validators import TestAssetReplacementsValidators
@@ -0,0 +1,182 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import json
+import os
+import time
+import tracemalloc
+
+import carb
+import omni.usd
+from lightspeed.trex.asset_replacements.core.shared import Setup as _AssetReplacementsCore
+from lightspeed.trex.asset_replacements.core.shared.data_models import GetPrimsQueryModel, PrimTypes
+from omni.flux.service.shared import stream_ndjson as _stream_ndjson
+from omni.kit.test.async_unittest import AsyncTestCase
+from omni.kit.test_suite.helpers import wait_stage_loading
+from pxr import Sdf
+
+_BENCHMARK_MATERIAL_COUNT = 300_000 if os.environ.get("FLUX_RUN_LARGE_BENCHMARKS") else 20_000
+_BENCHMARK_PAGE_SIZE = 1_000
+
+
+class TestAssetReplacementsPagination(AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.context = omni.usd.get_context()
+        await self.context.new_stage_async()
+        self.stage = self.context.get_stage()
+        self.core = _AssetReplacementsCore("")
+
+    # After running each test
+    async def tearDown(self):
+        await wait_stage_loading()
+        if self.context.can_close_stage():
+            await self.context.close_stage_async()
+        self.core = None
+        self.stage = None
+        self.context = None
+
+    def _create_materials(self, count: int, groups: int = 1) -> list[str]:
+        layer = self.stage.GetRootLayer()
+        material_paths = []
+        with Sdf.ChangeBlock():
+            for index in range(count):
+                # Split the materials in groups to exercise the resumed traversal pruning
+                material_path = f"/RootNode/Looks_{index % groups}/mat_{index:016X}"
+                prim_spec = Sdf.CreatePrimInLayer(layer, material_path)
+                prim_spec.specifier = Sdf.SpecifierDef
+                prim_spec.typeName = "Material"
+                material_paths.append(material_path)
+        # Return the paths in the stage traversal order
+        return [str(prim.GetPath()) for prim in self.stage.TraverseAll() if prim.GetTypeName() == "Material"]
+
+    def _get_query(self, **kwargs) -> GetPrimsQueryModel:
+        return GetPrimsQueryModel(asset_types={PrimTypes.MATERIALS}, **kwargs)
+
+    async def test_get_prim_paths_paginated_should_return_every_prim_once_in_order(self):
+        # Arrange
+        material_paths = self._create_materials(25, groups=3)
+
+        # Act
+        pages = []
+        cursor = None
+        while True:
+            response = self.core.get_prim_paths_with_data_model(self._get_query(limit=10, cursor=cursor))
+            pages.append(response.asset_paths)
+            cursor = response.next_cursor
+            if cursor is None:
+                break
+
+        # Assert
+        self.assertEqual([10, 10, 5], [len(page) for page in pages])
+        self.assertListEqual(material_paths, [path for page in pages for path in page])
+
+    async def test_get_prim_paths_not_paginated_should_not_return_cursor(self):
+        # Arrange
+        material_paths = self._create_materials(5)
+
+        # Act
+        response = self.core.get_prim_paths_with_data_model(self._get_query())
+
+        # Assert
+        self.assertListEqual(material_paths, response.asset_paths)
+        self.assertIsNone(response.next_cursor)
+
+    async def test_get_prim_paths_removed_cursor_prim_should_raise(self):
+        # Arrange
+        self._create_materials(5)
+        response = self.core.get_prim_paths_with_data_model(self._get_query(limit=2))
+        self.stage.RemovePrim(response.asset_paths[-1])
+
+        # Act
+        with self.assertRaises(ValueError):
+            self.core.get_prim_paths_with_data_model(self._get_query(limit=2, cursor=response.next_cursor))
+
+    async def test_stream_prim_paths_stage_edited_between_chunks_should_not_truncate_silently(self):
+        # Arrange
+        material_paths = self._create_materials(25, groups=3)
+        stream = _stream_ndjson(self.core.iter_prim_paths_with_data_model(self._get_query()), chunk_size=5)
+
+        # Act
+        lines = (await stream.__anext__()).splitlines()
+        self.stage.RemovePrim("/RootNode")
+        async for chunk in stream:
+            lines.extend(chunk.splitlines())
+
+        # Assert
+        items = [json.loads(line) for line in lines]
+        paths = [item for item in items if isinstance(item, str)]
+        self.assertListEqual(material_paths[: len(paths)], paths)
+        # The stream either ends once the removed prims are no longer traversed or with an explicit error line
+        if len(items) > len(paths):
+            self.assertEqual(len(paths) + 1, len(items))
+            self.assertIn("error", items[-1])
+
+    async def test_get_prims_query_invalid_pagination_should_raise(self):
+        # Act
+        with self.assertRaises(ValueError):
+            self._get_query(limit=0)
+        with self.assertRaises(ValueError):
+            self._get_query(cursor="not a cursor")
+
+    async def test_benchmark_get_prim_paths_full_paginated_and_streamed(self):
+        # Arrange
+        self._create_materials(_BENCHMARK_MATERIAL_COUNT, groups=100)
+
+        # Act
+        tracemalloc.start()
+        start = time.perf_counter()
+        full_response = self.core.get_prim_paths_with_data_model(self._get_query())
+        full_duration = time.perf_counter() - start
+        _, full_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        start = time.perf_counter()
+        first_page = self.core.get_prim_paths_with_data_model(self._get_query(limit=_BENCHMARK_PAGE_SIZE))
+        page_duration = time.perf_counter() - start
+        _, page_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        start = time.perf_counter()
+        next_page = self.core.get_prim_paths_with_data_model(
+            self._get_query(limit=_BENCHMARK_PAGE_SIZE, cursor=first_page.next_cursor)
+        )
+        next_page_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        iterator = self.core.iter_prim_paths_with_data_model(self._get_query())
+        next(iterator)
+        first_item_duration = time.perf_counter() - start
+        streamed_count = 1 + sum(1 for _ in iterator)
+        _, stream_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        carb.log_info(
+            f"Listing {_BENCHMARK_MATERIAL_COUNT} materials: "
+            f"full list {full_duration:.3f}s peak {full_peak / 1024:.0f}KiB, "
+            f"first page {page_duration:.3f}s peak {page_peak / 1024:.0f}KiB, "
+            f"second page {next_page_duration:.3f}s, "
+            f"stream first item {first_item_duration * 1000:.2f}ms peak {stream_peak / 1024:.0f}KiB"
+        )
+
+        # Assert
+        self.assertEqual(_BENCHMARK_MATERIAL_COUNT, len(full_response.asset_paths))
+        self.assertEqual(_BENCHMARK_MATERIAL_COUNT, streamed_count)
+        self.assertListEqual(full_response.asset_paths[: _BENCHMARK_PAGE_SIZE], first_page.asset_paths)
+        self.assertListEqual(
+            full_response.asset_paths[_BENCHMARK_PAGE_SIZE : _BENCHMARK_PAGE_SIZE * 2], next_page.asset_paths
+        )
@@ -15,10 +15,12 @@
 * limitations under the License.
 """
 
+from fastapi import Depends
 from lightspeed.trex.asset_replacements.core.shared import Setup as AssetReplacementsCore
 from lightspeed.trex.asset_replacements.core.shared.data_models import (
     AssetReplacementsValidators,
     GetPrimsQueryModel,
+    PaginatedPrimsResponseModel,
     PrimsResponseModel,
     PrimTypes,
     SetSelectionPathParamModel,
@@ -26,6 +28,10 @@ from lightspeed.trex.asset_replacements.core.shared.data_models import (
 from lightspeed.trex.asset_replacements.core.shared.data_models.models import (
     AppendReferenceRequestModel,
     AssetPathResponseModel,
+    BulkInstancesRequestModel,
+    BulkInstancesResponseModel,
+    BulkTexturesRequestModel,
+    BulkTexturesResponseModel,
     GetTexturesQueryModel,
     PrimInstancesPathParamModel,
     PrimReferencePathParamModel,
@@ -39,6 +45,8 @@ from omni.flux.service.factory import ServiceBase
 
 
 class AssetReplacementsService(ServiceBase):
+    cache_responses = True
+
     def __init__(self, context_name: str = ""):
         """
         A service class that provides access to asset replacement functionality in a RestAPI.
@@ -50,7 +58,7 @@ class AssetReplacementsService(ServiceBase):
         self.__context_name = context_name
         self.__asset_core = AssetReplacementsCore(context_name=context_name)
 
-        super().__init__()
+        super().__init__(context_name=context_name)
 
     @classmethod
     @property
@@ -61,12 +69,7 @@ class AssetReplacementsService(ServiceBase):
         context_name = self.__context_name
         asset_path_description = "The asset path to the asset that will be inspected for {0}"
 
-        @self.router.get(
-            path="/",
-            description="Get the the assets in the current stage.",
-            response_model=PrimsResponseModel,
-        )
-        async def get_assets(
+        def get_prims_query(
             asset_hashes: set[str] | None = ServiceBase.describe_query_param(  # noqa B008
                 None, "Filter assets to keep specific hashes"
             ),
@@ -90,22 +93,80 @@ class AssetReplacementsService(ServiceBase):
                 "Filter an asset if it exists or not on a given layer. Use in conjunction with `layer_identifier` "
                 "to filter on a given layer, otherwise this parameter will be ignored.",
             ),
-        ) -> PrimsResponseModel:
+            limit: int | None = ServiceBase.describe_query_param(  # noqa B008
+                None,
+                "The maximum number of assets to return. Paginated assets are returned in the stage traversal order.",
+            ),
+            cursor: str | None = ServiceBase.describe_query_param(  # noqa B008
+                None, "The `next_cursor` value of the previous page to get the next page of assets"
+            ),
+        ) -> GetPrimsQueryModel:
             try:
-                return self.__asset_core.get_prim_paths_with_data_model(
-                    GetPrimsQueryModel(
-                        asset_hashes=asset_hashes,
-                        asset_types=asset_types,
-                        return_selection=selection,
-                        filter_session_prims=filter_session_assets,
-                        layer_identifier=layer_identifier,
-                        exists=exists,
-                        context_name=context_name,
-                    )
+                return GetPrimsQueryModel(
+                    asset_hashes=asset_hashes,
+                    asset_types=asset_types,
+                    return_selection=selection,
+                    filter_session_prims=filter_session_assets,
+                    layer_identifier=layer_identifier,
+                    exists=exists,
+                    limit=limit,
+                    cursor=cursor,
+                    context_name=context_name,
                 )
             except ValueError as e:
                 ServiceBase.raise_error(422, e)
 
+        @self.router.get(
+            path="/",
+            description="Get the the assets in the current stage.",
+            response_model=PaginatedPrimsResponseModel,
+        )
+        async def get_assets(
+            query: GetPrimsQueryModel = Depends(get_prims_query),  # noqa B008
+        ) -> PaginatedPrimsResponseModel:
+            try:
+                return self.__asset_core.get_prim_paths_with_data_model(query)
+            except ValueError as e:
+                ServiceBase.raise_error(422, e)
+
+        @self.router.get(
+            path="/stream",
+            description=(
+                "Stream the assets in the current stage as newline-delimited JSON, one asset path per line, "
+                "in the stage traversal order. The assets are sent as they are found."
+            ),
+        )
+        async def stream_assets(
+            query: GetPrimsQueryModel = Depends(get_prims_query),  # noqa B008
+        ):
+            return ServiceBase.stream_ndjson_response(self.__asset_core.iter_prim_paths_with_data_model(query))
+
+        @self.router.post(
+            path="/bulk/instances",
+            description=(
+                "Get the instances of many models. The assets must be models. "
+                "Every asset is validated individually and the results are returned per asset."
+            ),
+            response_model=BulkInstancesResponseModel,
+        )
+        async def get_model_instances_bulk(
+            body: ServiceBase.inject_hidden_fields(BulkInstancesRequestModel, context_name=context_name)
+        ) -> BulkInstancesResponseModel:
+            return self.__asset_core.get_instances_bulk_with_data_model(body)
+
+        @self.router.post(
+            path="/bulk/textures",
+            description=(
+                "Get the textures of many materials. The assets must be materials. "
+                "Every asset is validated individually and the results are returned per asset."
+            ),
+            response_model=BulkTexturesResponseModel,
+        )
+        async def get_material_textures_bulk(
+            body: ServiceBase.inject_hidden_fields(BulkTexturesRequestModel, context_name=context_name)
+        ) -> BulkTexturesResponseModel:
+            return self.__asset_core.get_textures_bulk_with_data_model(body)
+
         @self.router.get(
             path="/{asset_path:path}/instances",
             description="Get a given model's instances. The asset must be a model.",
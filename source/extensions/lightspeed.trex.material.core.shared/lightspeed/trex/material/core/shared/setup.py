@@ -19,7 +19,8 @@ import typing
 
 import omni.usd
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
-from pxr import Usd, UsdGeom, UsdShade
+from omni.flux.utils.common.material_binding_index import get_material_binding_index as _get_material_binding_index
+from pxr import Usd, UsdGeom
 
 if typing.TYPE_CHECKING:
     from pxr import Sdf
@@ -50,10 +51,7 @@ class Setup:
                 yield from traverse_instanced_children(child)
 
         def get_mat_from_geo(_prim):
-            _material, _ = UsdShade.MaterialBindingAPI(_prim).ComputeBoundMaterial()
-            if _material:
-                return _material.GetPath()
-            return None
+            return _get_material_binding_index(_prim.GetStage()).get_bound_material(_prim.GetPath())
 
         result = []
         if prim.IsValid() and (prim.IsA(UsdGeom.Subset) or prim.IsA(UsdGeom.Mesh)):
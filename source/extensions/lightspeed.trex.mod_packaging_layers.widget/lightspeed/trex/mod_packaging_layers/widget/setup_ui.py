@@ -109,9 +109,7 @@ class ModPackagingLayersWidget:
             return
 
         # Find the item corresponding with the mod layer
-        replacement_item = self._layer_tree_model.find_item(
-            replacement_layer.identifier, lambda i, v: i.data["layer"].identifier == v
-        )
+        replacement_item = self._layer_tree_model.get_layer_item(replacement_layer.identifier)
         if not replacement_item:
             return
 
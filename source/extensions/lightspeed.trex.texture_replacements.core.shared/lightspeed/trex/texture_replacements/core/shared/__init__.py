@@ -15,6 +15,7 @@
 * limitations under the License.
 """
 
-__all__ = ["TextureReplacementsCore"]
+__all__ = ["ReplaceTexturesCommand", "TextureReplacementsCore"]
 
+from .commands import ReplaceTexturesCommand
 from .setup import TextureReplacementsCore
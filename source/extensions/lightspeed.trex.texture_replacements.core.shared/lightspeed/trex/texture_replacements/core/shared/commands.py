@@ -0,0 +1,109 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["ReplaceTexturesCommand"]
+
+from typing import Any, List, Optional, Tuple
+
+import carb
+import omni.kit.commands
+import omni.usd
+from omni.usd.commands import remove_prim_spec as _remove_prim_spec
+from pxr import Sdf
+
+
+class ReplaceTexturesCommand(omni.kit.commands.Command):
+    """
+    Author many texture asset paths on the current edit target inside a single Sdf change block. **Command**.
+
+    Args:
+        textures (List[Tuple[str, str]]): A list of (texture property path, asset path) tuples. The asset paths should
+                                          already be relative to the edit target if required.
+        context_name (str): The USD context name.
+    """
+
+    def __init__(self, textures: List[Tuple[str, str]], context_name: str = ""):
+        self._textures = textures
+        self._context_name = context_name
+        self._layer: Optional[Sdf.Layer] = None
+        # (spec property path, spec existed, previous default value)
+        self._previous_values: List[Tuple[Sdf.Path, bool, Any]] = []
+        # The highest prim specs created to hold the overrides
+        self._created_prim_paths: List[Sdf.Path] = []
+
+    def do(self):
+        stage = omni.usd.get_context(self._context_name).get_stage()
+        edit_target = stage.GetEditTarget()
+        self._layer = edit_target.GetLayer()
+        self._previous_values = []
+        self._created_prim_paths = []
+
+        with Sdf.ChangeBlock():
+            for property_path, asset_path in self._textures:
+                usd_attribute = stage.GetAttributeAtPath(property_path)
+                if not usd_attribute:
+                    carb.log_warn(f"{self.__class__.__name__}: The texture property does not exist '{property_path}'")
+                    continue
+
+                spec_path = edit_target.MapToSpecPath(usd_attribute.GetPath())
+                attr_spec = self._layer.GetAttributeAtPath(spec_path)
+                if attr_spec:
+                    self._previous_values.append(
+                        (spec_path, True, attr_spec.default if attr_spec.HasDefaultValue() else None)
+                    )
+                else:
+                    prim_spec = self._layer.GetPrimAtPath(spec_path.GetPrimPath())
+                    if not prim_spec:
+                        self._created_prim_paths.append(self._get_highest_missing_prim_path(spec_path.GetPrimPath()))
+                        prim_spec = Sdf.CreatePrimInLayer(self._layer, spec_path.GetPrimPath())
+                    attr_spec = Sdf.AttributeSpec(
+                        prim_spec, spec_path.name, usd_attribute.GetTypeName(), Sdf.VariabilityVarying
+                    )
+                    self._previous_values.append((spec_path, False, None))
+
+                attr_spec.default = Sdf.AssetPath(str(asset_path))
+
+    def undo(self):
+        if not self._layer:
+            return
+        with Sdf.ChangeBlock():
+            for spec_path, existed, value in reversed(self._previous_values):
+                attr_spec = self._layer.GetAttributeAtPath(spec_path)
+                if not attr_spec:
+                    continue
+                if not existed:
+                    attr_spec.owner.RemoveProperty(attr_spec)
+                elif value is None:
+                    attr_spec.ClearDefaultValue()
+                else:
+                    attr_spec.default = value
+            # The created prim specs only hold the overrides removed above
+            for prim_path in reversed(self._created_prim_paths):
+                if self._layer.GetPrimAtPath(prim_path):
+                    _remove_prim_spec(self._layer, str(prim_path))
+        self._previous_values = []
+        self._created_prim_paths = []
+
+    def _get_highest_missing_prim_path(self, prim_path: Sdf.Path) -> Sdf.Path:
+        # The prefixes are ordered from the shortest to the longest path
+        for prefix_path in prim_path.GetPrefixes():
+            if not self._layer.GetPrimAtPath(prefix_path):
+                return prefix_path
+        return prim_path
+
+
+omni.kit.commands.register_all_commands_in_module(__name__)
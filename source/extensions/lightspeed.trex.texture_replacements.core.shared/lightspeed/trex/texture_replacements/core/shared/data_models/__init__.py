@@ -16,7 +16,14 @@
 """
 
 __all__ = [
+    "BulkReplaceTextureResultModel",
+    "BulkReplaceTexturesRequestModel",
+    "BulkReplaceTexturesResponseModel",
+    "BulkTextureMaterialResultModel",
+    "BulkTextureMaterialsRequestModel",
+    "BulkTextureMaterialsResponseModel",
     "GetTexturesQueryModel",
+    "PaginatedTexturesResponseModel",
     "PrimsResponseModel",
     "ReplaceTexturesRequestModel",
     "TextureFilePathParamModel",
@@ -27,7 +34,14 @@ __all__ = [
 ]
 
 from .models import (
+    BulkReplaceTextureResultModel,
+    BulkReplaceTexturesRequestModel,
+    BulkReplaceTexturesResponseModel,
+    BulkTextureMaterialResultModel,
+    BulkTextureMaterialsRequestModel,
+    BulkTextureMaterialsResponseModel,
     GetTexturesQueryModel,
+    PaginatedTexturesResponseModel,
     PrimsResponseModel,
     ReplaceTexturesRequestModel,
     TextureFilePathParamModel,
@@ -18,7 +18,7 @@
 from pathlib import Path
 
 from omni.flux.asset_importer.core.data_models import TextureTypeNames
-from omni.flux.service.shared import BaseServiceModel
+from omni.flux.service.shared import BaseServiceModel, validate_page
 from pydantic import root_validator
 
 from .validators import TextureReplacementsValidators
@@ -56,12 +56,16 @@ class GetTexturesQueryModel(BaseServiceModel):
     filter_session_prims: bool = False
     layer_identifier: Path | None = None
     exists: bool = True
+    # Pagination: the paginated results are returned in the stage traversal order
+    limit: int | None = None
+    cursor: str | None = None
 
     context_name: str = ""  # This is only used to validate the layer_identifier
 
     @root_validator(allow_reuse=True)
     def root_validators(cls, values):  # noqa
         TextureReplacementsValidators.layer_is_in_project(values.get("layer_identifier"), values.get("context_name"))
+        validate_page(values.get("limit"), values.get("cursor"))
         return values
 
 
@@ -72,6 +76,11 @@ class TexturesResponseModel(BaseServiceModel):
     textures: list[tuple[str, Path]]
 
 
+class PaginatedTexturesResponseModel(TexturesResponseModel):
+    # The cursor to use to get the next page. None if this is the last page.
+    next_cursor: str | None = None
+
+
 class PrimsResponseModel(BaseServiceModel):
     asset_paths: list[str]
 
@@ -80,6 +89,26 @@ class TextureTypesResponseModel(BaseServiceModel):
     texture_types: list[str]
 
 
+class BulkTextureMaterialResultModel(BaseServiceModel):
+    texture_asset_path: str
+    asset_path: str | None = None  # The material prim path
+    error: str | None = None
+
+
+class BulkTextureMaterialsResponseModel(BaseServiceModel):
+    results: list[BulkTextureMaterialResultModel]
+
+
+class BulkReplaceTextureResultModel(BaseServiceModel):
+    texture: tuple[str, Path]
+    success: bool
+    error: str | None = None
+
+
+class BulkReplaceTexturesResponseModel(BaseServiceModel):
+    results: list[BulkReplaceTextureResultModel]
+
+
 # REQUEST MODELS
 
 
@@ -93,3 +122,14 @@ class ReplaceTexturesRequestModel(BaseServiceModel):
             TextureReplacementsValidators.is_valid_texture_prim(texture_entry, values.get("context_name"))
             TextureReplacementsValidators.is_valid_texture_asset(texture_entry, values.get("force"))
         return values
+
+
+class BulkTextureMaterialsRequestModel(BaseServiceModel):
+    # Every item is validated by the core so the results can be returned per item
+    texture_asset_paths: list[str]
+
+
+class BulkReplaceTexturesRequestModel(BaseServiceModel):
+    force: bool = False  # Whether to replace a non-ingested asset or fail the validation instead
+    # Every item is validated by the core so the results can be returned per item
+    textures: list[tuple[str, Path]]
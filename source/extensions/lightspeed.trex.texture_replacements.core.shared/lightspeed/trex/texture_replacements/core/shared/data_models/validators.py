@@ -22,12 +22,14 @@ from pathlib import Path
 import omni.usd
 from lightspeed.trex.utils.common.asset_utils import is_asset_ingested
 from omni.flux.asset_importer.core.data_models import SUPPORTED_TEXTURE_EXTENSIONS
+from omni.flux.service.shared import cached_validator as _cached_validator
 from omni.flux.utils.common.omni_url import OmniUrl
 from pxr import Sdf, UsdShade
 
 
 class TextureReplacementsValidators:
     @classmethod
+    @_cached_validator
     def is_valid_texture_prim(cls, texture_tuple: tuple[str, Path], context_name: str):
         property_path, _ = texture_tuple
 
@@ -53,6 +55,7 @@ class TextureReplacementsValidators:
         return texture_tuple
 
     @classmethod
+    @_cached_validator
     def is_valid_texture_asset(cls, texture_tuple: tuple[str, Path], force: bool):
         _, asset_path = texture_tuple
         asset_url = OmniUrl(asset_path)
@@ -69,6 +72,7 @@ class TextureReplacementsValidators:
         return texture_tuple
 
     @classmethod
+    @_cached_validator
     def layer_is_in_project(cls, layer_id: Path | None, context_name: str):
         if layer_id is None:
             return layer_id
@@ -17,31 +17,41 @@
 
 __all__ = ["TextureReplacementsCore"]
 
+from typing import Iterator
+
 import omni.usd
 from lightspeed.trex.utils.common.asset_utils import TEXTURE_TYPE_INPUT_MAP as _TEXTURE_TYPE_INPUT_MAP
 from lightspeed.trex.utils.common.asset_utils import get_ingested_texture_type as _get_ingested_texture_type
 from lightspeed.trex.utils.common.asset_utils import get_texture_type_input_name as _get_texture_type_input_name
 from lightspeed.trex.utils.common.prim_utils import PrimTypes as _PrimTypes
-from lightspeed.trex.utils.common.prim_utils import filter_prims_paths as _filter_prims_paths
 from lightspeed.trex.utils.common.prim_utils import get_extended_selection as _get_extended_selection
 from lightspeed.trex.utils.common.prim_utils import get_prim_paths as _get_prim_paths
 from lightspeed.trex.utils.common.prim_utils import includes_hash as _includes_hash
+from lightspeed.trex.utils.common.prim_utils import iter_filtered_prims_paths as _iter_filtered_prims_paths
 from lightspeed.trex.utils.common.prim_utils import is_shader as _is_shader
 from omni.flux.asset_importer.core.data_models import SUPPORTED_TEXTURE_EXTENSIONS as _SUPPORTED_TEXTURE_EXTENSIONS
 from omni.flux.asset_importer.core.data_models import TextureTypeNames as _TextureTypeNames
 from omni.flux.asset_importer.core.data_models import TextureTypes as _TextureTypes
+from omni.flux.service.shared import decode_cursor as _decode_cursor
+from omni.flux.service.shared import paginate as _paginate
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
 from omni.flux.utils.common.omni_url import OmniUrl
 from omni.kit import commands, undo
-from pxr import Sdf, UsdShade
+from pxr import Sdf, Usd, UsdShade
 
 from .data_models import (
+    BulkReplaceTextureResultModel,
+    BulkReplaceTexturesRequestModel,
+    BulkReplaceTexturesResponseModel,
+    BulkTextureMaterialResultModel,
+    BulkTextureMaterialsRequestModel,
+    BulkTextureMaterialsResponseModel,
     GetTexturesQueryModel,
+    PaginatedTexturesResponseModel,
     PrimsResponseModel,
     ReplaceTexturesRequestModel,
     TextureMaterialPathParamModel,
     TextureReplacementsValidators,
-    TexturesResponseModel,
 )
 
 
@@ -59,16 +69,23 @@ class TextureReplacementsCore:
 
     # DATA MODEL FUNCTIONS
 
-    def get_texture_prims_assets_with_data_models(self, query: GetTexturesQueryModel) -> TexturesResponseModel:
-        return TexturesResponseModel(
-            textures=self.get_texture_prims_assets(
-                asset_hashes=query.asset_hashes,
-                texture_types=query.texture_types,
-                return_selection=query.return_selection,
-                filter_session_prims=query.filter_session_prims,
-                layer_id=query.layer_identifier,
-                exists=query.exists,
-            )
+    def get_texture_prims_assets_with_data_models(
+        self, query: GetTexturesQueryModel
+    ) -> PaginatedTexturesResponseModel:
+        textures, next_cursor = _paginate(
+            self.iter_texture_prims_assets_with_data_models(query), query.limit, lambda texture: texture[0]
+        )
+        return PaginatedTexturesResponseModel(textures=textures, next_cursor=next_cursor)
+
+    def iter_texture_prims_assets_with_data_models(self, query: GetTexturesQueryModel) -> Iterator[tuple[str, str]]:
+        return self.iter_texture_prims_assets(
+            asset_hashes=query.asset_hashes,
+            texture_types=query.texture_types,
+            return_selection=query.return_selection,
+            filter_session_prims=query.filter_session_prims,
+            layer_id=query.layer_identifier,
+            exists=query.exists,
+            start_after=_decode_cursor(query.cursor) if query.cursor is not None else None,
         )
 
     def replace_texture_with_data_models(self, body: ReplaceTexturesRequestModel):
@@ -80,6 +97,42 @@ class TextureReplacementsCore:
             raise ValueError("Unable to find a material associated to the given texture")
         return PrimsResponseModel(asset_paths=[material_asset_path])
 
+    def get_texture_materials_with_data_models(
+        self, body: BulkTextureMaterialsRequestModel
+    ) -> BulkTextureMaterialsResponseModel:
+        results = []
+        valid_paths = []
+        errors = {}
+        for texture_asset_path in body.texture_asset_paths:
+            try:
+                TextureReplacementsValidators.is_valid_texture_prim((texture_asset_path, None), self._context_name)
+                valid_paths.append(texture_asset_path)
+            except ValueError as e:
+                errors[texture_asset_path] = str(e)
+
+        materials = self.get_texture_materials(valid_paths)
+        for texture_asset_path in body.texture_asset_paths:
+            error = errors.get(texture_asset_path)
+            material_path = materials.get(texture_asset_path)
+            if error is None and material_path is None:
+                error = "Unable to find a material associated to the given texture"
+            results.append(
+                BulkTextureMaterialResultModel(
+                    texture_asset_path=texture_asset_path, asset_path=material_path, error=error
+                )
+            )
+        return BulkTextureMaterialsResponseModel(results=results)
+
+    def replace_textures_bulk_with_data_models(
+        self, body: BulkReplaceTexturesRequestModel
+    ) -> BulkReplaceTexturesResponseModel:
+        return BulkReplaceTexturesResponseModel(
+            results=[
+                BulkReplaceTextureResultModel(texture=texture, success=error is None, error=error)
+                for texture, error in self.replace_textures_bulk(body.textures, force=body.force)
+            ]
+        )
+
     async def get_texture_material_inputs_with_data_models(
         self, params: TextureMaterialPathParamModel
     ) -> PrimsResponseModel:
@@ -130,45 +183,113 @@ class TextureReplacementsCore:
             A list of tuples in the format (texture property, asset path) where the texture property will always be
             a shader input and the asset path will be the absolute path to the texture asset
         """
+        return list(
+            self.iter_texture_prims_assets(
+                asset_hashes,
+                texture_types,
+                return_selection=return_selection,
+                filter_session_prims=filter_session_prims,
+                layer_id=layer_id,
+                exists=exists,
+            )
+        )
+
+    def iter_texture_prims_assets(
+        self,
+        asset_hashes: set[str] | None,
+        texture_types: set[_TextureTypeNames] | None,
+        return_selection: bool = False,
+        filter_session_prims: bool = True,
+        layer_id: str | None = None,
+        exists: bool = True,
+        start_after: str | None = None,
+    ) -> Iterator[tuple[str, str]]:
+        """
+        Lazily get the (texture property, asset path) tuples in the stage traversal order. The textures of a shader are
+        sorted by input name.
+
+        See `get_texture_prims_assets` for the other arguments.
+
+        Args:
+            start_after: Only yield the textures found after this texture property. If the texture property was
+                         removed, the textures of its shader sorted after it are yielded.
+
+        Raises:
+            ValueError: If the shader of `start_after` is not in the stage or the selection
+
+        Returns:
+            An iterator of tuples in the format (texture property, asset path)
+        """
         stage = self._context.get_stage()
-        textures = []
 
         selection = None
         if return_selection:
             selection = _get_extended_selection(self._context_name)
 
+        texture_type_names = None
+        if texture_types is not None:
+            texture_type_names = [
+                _get_texture_type_input_name(_TextureTypes[texture_type.value]) for texture_type in texture_types
+            ]
+
+        start_shader_path = None
+        if start_after is not None:
+            if not Sdf.Path.IsValidPathString(start_after) or not Sdf.Path(start_after).IsPropertyPath():
+                raise ValueError(f"The texture property path is not valid: {start_after}")
+            start_shader_path = str(Sdf.Path(start_after).GetPrimPath())
+
         # Get every asset-type input for every shader and validate that the asset path has a supported texture extension
-        for shader_path in _filter_prims_paths(
+        shader_paths = _iter_filtered_prims_paths(
             lambda prim: bool(_is_shader(prim) and _includes_hash(prim, asset_hashes)),
             prim_paths=selection,
             filter_session_prims=filter_session_prims,
             layer_id=layer_id,
             exists=exists,
             context_name=self._context_name,
-        ):
-            shader = UsdShade.Shader(stage.GetPrimAtPath(shader_path))
-            for shader_input in shader.GetInputs():
-                # Make sure the input matches the filter if set
-                if texture_types is not None:
-                    texture_type_names = [
-                        _get_texture_type_input_name(_TextureTypes[texture_type.value])
-                        for texture_type in texture_types
-                    ]
-                    if shader_input.GetFullName() not in texture_type_names:
-                        continue
-                # Make sure the input expects an asset
-                if shader_input.GetTypeName() != Sdf.ValueTypeNames.Asset:
-                    continue
-                # Make sure the asset is a supported texture
-                texture_asset_path = shader_input.Get().resolvedPath
-                if OmniUrl(texture_asset_path).suffix.lower() not in _SUPPORTED_TEXTURE_EXTENSIONS:
-                    continue
-                # Build the full property path
-                texture_input_path = Sdf.Path(shader_path).AppendProperty(shader_input.GetFullName())
-                # Store the texture property and the asset path
-                textures.append((str(texture_input_path), str(texture_asset_path)))
-
-        return textures
+            start_after=start_shader_path,
+        )
+
+        if start_shader_path is not None:
+            # The cursor shader could have been removed since the previous page
+            if not stage.GetPrimAtPath(start_shader_path):
+                raise ValueError(f"The prim path does not exist in the current stage: {start_shader_path}")
+            if selection is not None and start_shader_path not in selection:
+                raise ValueError(f"The prim path is not in the filtered prim paths: {start_shader_path}")
+            # Resume with the textures of the cursor shader sorted after the cursor,
+            # even if the cursor input was removed
+            start_input_name = Sdf.Path(start_after).name
+            yield from (
+                texture
+                for texture in self._get_shader_textures(stage, start_shader_path, texture_type_names)
+                if Sdf.Path(texture[0]).name > start_input_name
+            )
+
+        for shader_path in shader_paths:
+            yield from self._get_shader_textures(stage, shader_path, texture_type_names)
+
+    @staticmethod
+    def _get_shader_textures(
+        stage: Usd.Stage, shader_path: str, texture_type_names: list[str] | None
+    ) -> list[tuple[str, str]]:
+        textures = []
+        shader = UsdShade.Shader(stage.GetPrimAtPath(shader_path))
+        for shader_input in shader.GetInputs():
+            # Make sure the input matches the filter if set
+            if texture_type_names is not None and shader_input.GetFullName() not in texture_type_names:
+                continue
+            # Make sure the input expects an asset
+            if shader_input.GetTypeName() != Sdf.ValueTypeNames.Asset:
+                continue
+            # Make sure the asset is a supported texture
+            texture_asset_path = shader_input.Get().resolvedPath
+            if OmniUrl(texture_asset_path).suffix.lower() not in _SUPPORTED_TEXTURE_EXTENSIONS:
+                continue
+            # Build the full property path
+            texture_input_path = Sdf.Path(shader_path).AppendProperty(shader_input.GetFullName())
+            # Store the texture property and the asset path
+            textures.append((str(texture_input_path), str(texture_asset_path)))
+        # Sort the inputs so a page can resume after an input that was removed
+        return sorted(textures, key=lambda texture: Sdf.Path(texture[0]).name)
 
     def replace_textures(self, textures: list[tuple[str, str]], force: bool = False):
         """
@@ -179,16 +300,20 @@ class TextureReplacementsCore:
                       a shader input and the asset path should be the absolute path to the texture asset
             force: Whether to force replace the texture or validate it was ingested correctly
         """
-        with undo.group():
-            for texture_attr_path, texture_asset_path in textures:
-                try:
-                    TextureReplacementsValidators.is_valid_texture_prim(
-                        (texture_attr_path, texture_asset_path), self._context_name
-                    )
-                    TextureReplacementsValidators.is_valid_texture_asset((texture_attr_path, texture_asset_path), force)
-                except ValueError:
-                    continue
+        # Validate every texture before editing the stage: stage edits invalidate the cached validation results
+        valid_textures = []
+        for texture_attr_path, texture_asset_path in textures:
+            try:
+                TextureReplacementsValidators.is_valid_texture_prim(
+                    (texture_attr_path, texture_asset_path), self._context_name
+                )
+                TextureReplacementsValidators.is_valid_texture_asset((texture_attr_path, texture_asset_path), force)
+            except ValueError:
+                continue
+            valid_textures.append((texture_attr_path, texture_asset_path))
 
+        with undo.group():
+            for texture_attr_path, texture_asset_path in valid_textures:
                 commands.execute(
                     "ChangeProperty",
                     prop_path=texture_attr_path,
@@ -202,34 +327,90 @@ class TextureReplacementsCore:
                     target_layer=self._context.get_stage().GetEditTarget().GetLayer(),
                 )
 
-    def get_texture_material(self, texture_prim_path: str) -> str | None:
+    def replace_textures_bulk(
+        self, textures: list[tuple[str, str]], force: bool = False
+    ) -> list[tuple[tuple[str, str], str | None]]:
         """
-        Get a material prim path from a texture prim attribute's path
+        Replace a list of textures in a single undoable command and Sdf change block.
+
+        Unlike `replace_textures`, every texture is validated before any edit is made and the validation errors are
+        returned per texture.
 
         Args:
-            texture_prim_path: The prim path to a shader input attribute
+            textures: A list of tuples in the format (texture property, asset path) where the texture property should be
+                      a shader input and the asset path should be the absolute path to the texture asset
+            force: Whether to force replace the texture or validate it was ingested correctly
 
         Returns:
-            the prim path to the associated material or None if no material is found
+            A list of (texture, error) tuples in the input order. The error is None when the texture was replaced.
         """
+        results = []
+        valid_textures = []
+        for texture_attr_path, texture_asset_path in textures:
+            texture = (texture_attr_path, texture_asset_path)
+            try:
+                TextureReplacementsValidators.is_valid_texture_prim(texture, self._context_name)
+                TextureReplacementsValidators.is_valid_texture_asset(texture, force)
+            except ValueError as e:
+                results.append((texture, str(e)))
+                continue
+            valid_textures.append(texture)
+            results.append((texture, None))
+
+        if not valid_textures:
+            return results
+
         stage = self._context.get_stage()
+        with undo.group():
+            commands.execute(
+                "ReplaceTexturesCommand",
+                textures=[
+                    (
+                        texture_attr_path,
+                        omni.usd.make_path_relative_to_current_edit_target(str(texture_asset_path), stage=stage),
+                    )
+                    for texture_attr_path, texture_asset_path in valid_textures
+                ],
+                context_name=self._context_name,
+            )
 
-        # Get the prim path for the shader input
-        shader_path = Sdf.Path(texture_prim_path).GetPrimPath()
-        # Get all materials in the stage. Materials are linked to their shader via their output
-        material_paths = _get_prim_paths(prim_type=_PrimTypes.MATERIALS)
+        return results
+
+    def get_texture_materials(self, texture_prim_paths: list[str]) -> dict[str, str | None]:
+        """
+        Get the material prim paths from many texture prim attribute paths with a single pass over the materials
 
-        for material_path in material_paths:
-            # Get the outputs for the material
+        Args:
+            texture_prim_paths: The prim paths to shader input attributes
+
+        Returns:
+            A dictionary of texture prim path to the associated material prim path or None if no material is found
+        """
+        stage = self._context.get_stage()
+
+        # {shader prim path: material prim path}. The first material connected to a shader wins.
+        shader_materials = {}
+        for material_path in _get_prim_paths(prim_type=_PrimTypes.MATERIALS, context_name=self._context_name):
             for output in UsdShade.Material(stage.GetPrimAtPath(material_path)).GetOutputs():
-                # Get the connection of the output
                 for connection_path in output.GetRawConnectedSourcePaths():
-                    # Make sure the output connection points to our shader
-                    if Sdf.Path(connection_path).GetPrimPath() == shader_path:
-                        return material_path
+                    shader_materials.setdefault(Sdf.Path(connection_path).GetPrimPath(), material_path)
+
+        return {
+            texture_prim_path: shader_materials.get(Sdf.Path(texture_prim_path).GetPrimPath())
+            for texture_prim_path in texture_prim_paths
+        }
+
+    def get_texture_material(self, texture_prim_path: str) -> str | None:
+        """
+        Get a material prim path from a texture prim attribute's path
 
-        # No material is connected to our shader
-        return None
+        Args:
+            texture_prim_path: The prim path to a shader input attribute
+
+        Returns:
+            the prim path to the associated material or None if no material is found
+        """
+        return self.get_texture_materials([texture_prim_path])[texture_prim_path]
 
     async def get_expected_texture_material_inputs(
         self,
@@ -15,5 +15,7 @@
 * limitations under the License.
 """
 
+from .unit.test_commands import TestReplaceTexturesCommand
 from .unit.test_core import TestTextureReplacementsCore
+from .unit.test_pagination import TestTextureReplacementsPagination
 from .unit.test_validators import TestTextureReplacementsValidators
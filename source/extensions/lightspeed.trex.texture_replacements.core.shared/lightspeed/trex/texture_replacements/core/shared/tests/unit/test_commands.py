@@ -0,0 +1,158 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import carb
+import omni.kit.commands
+import omni.kit.undo
+import omni.usd
+from lightspeed.trex.texture_replacements.core.shared import TextureReplacementsCore
+from omni.kit.test.async_unittest import AsyncTestCase
+from omni.kit.test_suite.helpers import wait_stage_loading
+from pxr import Sdf, Usd, UsdShade
+
+_BENCHMARK_TEXTURE_COUNT = 1_000
+
+
+class TestReplaceTexturesCommand(AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.context = omni.usd.get_context()
+        await self.context.new_stage_async()
+        self.stage = self.context.get_stage()
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.texture_path = Path(self.temp_dir.name) / "texture.a.rtex.dds"
+        self.texture_path.touch()
+
+        # Author the shaders on a weaker sublayer so the edit target only holds the overrides
+        self.sublayer = Sdf.Layer.CreateAnonymous()
+        self.stage.GetRootLayer().subLayerPaths.append(self.sublayer.identifier)
+
+    # After running each test
+    async def tearDown(self):
+        await wait_stage_loading()
+        if self.context.can_close_stage():
+            await self.context.close_stage_async()
+        self.temp_dir.cleanup()
+        self.sublayer = None
+        self.stage = None
+        self.context = None
+
+    def _create_materials(self, count: int) -> list[str]:
+        texture_paths = []
+        with Usd.EditContext(self.stage, self.sublayer):
+            for index in range(count):
+                material = UsdShade.Material.Define(self.stage, f"/Looks/Material_{index}")
+                shader = UsdShade.Shader.Define(self.stage, f"/Looks/Material_{index}/Shader")
+                texture_input = shader.CreateInput("diffuse_texture", Sdf.ValueTypeNames.Asset)
+                texture_input.Set(Sdf.AssetPath("./original.dds"))
+                material.CreateSurfaceOutput("mdl").ConnectToSource(shader.ConnectableAPI(), "out")
+                texture_paths.append(str(texture_input.GetAttr().GetPath()))
+        return texture_paths
+
+    async def test_do_undo_should_author_and_remove_overrides(self):
+        # Arrange
+        texture_paths = self._create_materials(2)
+        root_layer = self.stage.GetRootLayer()
+
+        # Act
+        omni.kit.commands.execute(
+            "ReplaceTexturesCommand", textures=[(path, "./replaced.dds") for path in texture_paths]
+        )
+
+        # Assert
+        for texture_path in texture_paths:
+            self.assertEqual("./replaced.dds", root_layer.GetAttributeAtPath(texture_path).default.path)
+            self.assertEqual("./original.dds", self.sublayer.GetAttributeAtPath(texture_path).default.path)
+
+        # Undo
+        omni.kit.undo.undo()
+
+        self.assertFalse(root_layer.GetPrimAtPath("/Looks"))
+        for texture_path in texture_paths:
+            self.assertEqual("./original.dds", self.stage.GetAttributeAtPath(texture_path).Get().path)
+
+    async def test_replace_textures_bulk_should_return_per_item_results(self):
+        # Arrange
+        texture_paths = self._create_materials(2)
+        core = TextureReplacementsCore()
+        invalid_path = "/Looks/Invalid/Shader.inputs:diffuse_texture"
+
+        # Act
+        results = core.replace_textures_bulk(
+            [(texture_paths[0], str(self.texture_path)), (invalid_path, str(self.texture_path))], force=True
+        )
+
+        # Assert
+        self.assertEqual(2, len(results))
+        self.assertIsNone(results[0][1])
+        self.assertEqual(f"The property path does not exist in the current stage: {invalid_path}", results[1][1])
+        self.assertEqual(
+            str(self.texture_path),
+            str(Path(self.stage.GetAttributeAtPath(texture_paths[0]).Get().resolvedPath)),
+        )
+
+    async def test_get_texture_materials_should_resolve_every_texture(self):
+        # Arrange
+        texture_paths = self._create_materials(3)
+        core = TextureReplacementsCore()
+
+        # Act
+        materials = core.get_texture_materials(texture_paths + ["/Looks/Invalid/Shader.inputs:diffuse_texture"])
+
+        # Assert
+        self.assertDictEqual(
+            {
+                texture_paths[0]: "/Looks/Material_0",
+                texture_paths[1]: "/Looks/Material_1",
+                texture_paths[2]: "/Looks/Material_2",
+                "/Looks/Invalid/Shader.inputs:diffuse_texture": None,
+            },
+            materials,
+        )
+
+    async def test_benchmark_replace_textures_single_and_bulk(self):
+        # Arrange
+        texture_paths = self._create_materials(_BENCHMARK_TEXTURE_COUNT)
+        core = TextureReplacementsCore()
+        textures = [(texture_path, str(self.texture_path)) for texture_path in texture_paths]
+
+        # Act
+        start = time.perf_counter()
+        for texture in textures:
+            core.replace_textures([texture], force=True)
+        single_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = core.replace_textures_bulk(textures, force=True)
+        bulk_duration = time.perf_counter() - start
+
+        carb.log_info(
+            f"Replacing {len(textures)} textures: single calls {len(textures) / single_duration:.0f} textures/s, "
+            f"bulk call {len(textures) / bulk_duration:.0f} textures/s"
+        )
+
+        # Assert
+        self.assertTrue(all(error is None for _, error in results))
+        for texture_path in texture_paths[:: _BENCHMARK_TEXTURE_COUNT // 10]:
+            self.assertEqual(
+                str(self.texture_path), str(Path(self.stage.GetAttributeAtPath(texture_path).Get().resolvedPath))
+            )
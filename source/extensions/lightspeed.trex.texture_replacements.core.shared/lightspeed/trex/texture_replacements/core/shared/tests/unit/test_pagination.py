@@ -0,0 +1,128 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import tempfile
+from pathlib import Path
+
+import omni.usd
+from lightspeed.trex.texture_replacements.core.shared import TextureReplacementsCore as _TextureReplacementsCore
+from lightspeed.trex.texture_replacements.core.shared.data_models import GetTexturesQueryModel
+from omni.flux.service.shared import encode_cursor
+from omni.kit.test.async_unittest import AsyncTestCase
+from omni.kit.test_suite.helpers import wait_stage_loading
+from pxr import Sdf
+
+_TEXTURE_INPUTS = ["inputs:diffuse_texture", "inputs:normalmap_texture", "inputs:reflectionroughness_texture"]
+
+
+class TestTextureReplacementsPagination(AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.context = omni.usd.get_context()
+        await self.context.new_stage_async()
+        self.stage = self.context.get_stage()
+        self.core = _TextureReplacementsCore("")
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.texture_path = Path(self.temp_dir.name) / "T_Texture.dds"
+        self.texture_path.touch()
+
+    # After running each test
+    async def tearDown(self):
+        await wait_stage_loading()
+        if self.context.can_close_stage():
+            await self.context.close_stage_async()
+        self.temp_dir.cleanup()
+        self.temp_dir = None
+        self.core = None
+        self.stage = None
+        self.context = None
+
+    def _create_shaders(self, count: int) -> list[str]:
+        layer = self.stage.GetRootLayer()
+        with Sdf.ChangeBlock():
+            for index in range(count):
+                material = Sdf.CreatePrimInLayer(layer, f"/RootNode/Looks/mat_{index:016X}")
+                material.specifier = Sdf.SpecifierDef
+                material.typeName = "Material"
+                shader = Sdf.PrimSpec(material, "Shader", Sdf.SpecifierDef, "Shader")
+                # Author the inputs out of order: the textures of a shader are sorted by input name
+                for input_name in reversed(_TEXTURE_INPUTS):
+                    attribute = Sdf.AttributeSpec(shader, input_name, Sdf.ValueTypeNames.Asset)
+                    attribute.default = Sdf.AssetPath(str(self.texture_path))
+        return [texture for texture, _ in self.core.get_texture_prims_assets(None, None)]
+
+    def _get_page(self, limit: int, cursor: str | None = None):
+        return self.core.get_texture_prims_assets_with_data_models(GetTexturesQueryModel(limit=limit, cursor=cursor))
+
+    async def test_get_textures_paginated_should_return_every_texture_once_in_order(self):
+        # Arrange
+        textures = self._create_shaders(4)
+
+        # Act
+        pages = []
+        cursor = None
+        while True:
+            response = self._get_page(5, cursor=cursor)
+            pages.append([texture for texture, _ in response.textures])
+            cursor = response.next_cursor
+            if cursor is None:
+                break
+
+        # Assert
+        self.assertEqual(12, len(textures))
+        self.assertListEqual(_TEXTURE_INPUTS, [Sdf.Path(texture).name for texture in textures[:3]])
+        self.assertEqual([5, 5, 2], [len(page) for page in pages])
+        self.assertListEqual(textures, [texture for page in pages for texture in page])
+
+    async def test_get_textures_removed_cursor_shader_should_raise(self):
+        # Arrange
+        self._create_shaders(2)
+        response = self._get_page(2)
+        self.stage.RemovePrim(Sdf.Path(response.textures[-1][0]).GetPrimPath())
+
+        # Act
+        with self.assertRaises(ValueError):
+            self._get_page(2, cursor=response.next_cursor)
+
+    async def test_get_textures_invalid_cursor_path_should_raise(self):
+        # Arrange
+        self._create_shaders(1)
+
+        # Act
+        with self.assertRaises(ValueError):
+            self._get_page(2, cursor=encode_cursor("/RootNode/Looks"))
+
+    async def test_get_textures_removed_cursor_input_should_resume_after_its_position(self):
+        # Arrange
+        textures = self._create_shaders(2)
+        first_page = self._get_page(2)
+        last_page = self._get_page(3)
+
+        # Act
+        self.__remove_texture_input(first_page.textures[-1][0])
+        next_page = self._get_page(2, cursor=first_page.next_cursor)
+        # The cursor is the last input of its shader
+        self.__remove_texture_input(last_page.textures[-1][0])
+        next_shader_page = self._get_page(2, cursor=last_page.next_cursor)
+
+        # Assert
+        self.assertListEqual([textures[2], textures[3]], [texture for texture, _ in next_page.textures])
+        self.assertListEqual([textures[3], textures[4]], [texture for texture, _ in next_shader_page.textures])
+
+    def __remove_texture_input(self, texture: str):
+        texture_path = Sdf.Path(texture)
+        self.stage.GetPrimAtPath(texture_path.GetPrimPath()).RemoveProperty(texture_path.name)
@@ -15,13 +15,18 @@
 * limitations under the License.
 """
 
+from fastapi import Depends
 from lightspeed.trex.texture_replacements.core.shared import TextureReplacementsCore
 from lightspeed.trex.texture_replacements.core.shared.data_models import (
+    BulkReplaceTexturesRequestModel,
+    BulkReplaceTexturesResponseModel,
+    BulkTextureMaterialsRequestModel,
+    BulkTextureMaterialsResponseModel,
     GetTexturesQueryModel,
+    PaginatedTexturesResponseModel,
     PrimsResponseModel,
     ReplaceTexturesRequestModel,
     TextureMaterialPathParamModel,
-    TexturesResponseModel,
     TextureTypesResponseModel,
 )
 from omni.flux.asset_importer.core.data_models import TextureTypeNames
@@ -29,6 +34,8 @@ from omni.flux.service.factory import ServiceBase
 
 
 class TextureReplacementsService(ServiceBase):
+    cache_responses = True
+
     def __init__(self, context_name: str = ""):
         """
         A service class that provides access to texture replacement functionality in a RestAPI.
@@ -40,7 +47,7 @@ class TextureReplacementsService(ServiceBase):
         self.__context_name = context_name
         self.__texture_core = TextureReplacementsCore(context_name=context_name)
 
-        super().__init__()
+        super().__init__(context_name=context_name)
 
     @classmethod
     @property
@@ -50,12 +57,7 @@ class TextureReplacementsService(ServiceBase):
     def register_endpoints(self):
         context_name = self.__context_name
 
-        @self.router.get(
-            path="/",
-            description="Get the texture properties and associated asset paths in the current stage.",
-            response_model=TexturesResponseModel,
-        )
-        async def get_textures(
+        def get_textures_query(
             asset_hashes: set[str] | None = ServiceBase.describe_query_param(  # noqa B008
                 None, "Filter textures to keep textures from specific material hashes"
             ),
@@ -79,22 +81,58 @@ class TextureReplacementsService(ServiceBase):
                 "Filter an texture if it exists or not on a given layer. Use in conjunction with `layer_identifier` "
                 "to filter on a given layer, otherwise this parameter will be ignored.",
             ),
-        ) -> TexturesResponseModel:
+            limit: int | None = ServiceBase.describe_query_param(  # noqa B008
+                None,
+                "The maximum number of textures to return. "
+                "Paginated textures are returned in the stage traversal order.",
+            ),
+            cursor: str | None = ServiceBase.describe_query_param(  # noqa B008
+                None, "The `next_cursor` value of the previous page to get the next page of textures"
+            ),
+        ) -> GetTexturesQueryModel:
             try:
-                return self.__texture_core.get_texture_prims_assets_with_data_models(
-                    GetTexturesQueryModel(
-                        asset_hashes=asset_hashes,
-                        texture_types=texture_types,
-                        return_selection=selection,
-                        filter_session_prims=filter_session_prims,
-                        layer_identifier=layer_identifier,
-                        exists=exists,
-                        context_name=context_name,
-                    )
+                return GetTexturesQueryModel(
+                    asset_hashes=asset_hashes,
+                    texture_types=texture_types,
+                    return_selection=selection,
+                    filter_session_prims=filter_session_prims,
+                    layer_identifier=layer_identifier,
+                    exists=exists,
+                    limit=limit,
+                    cursor=cursor,
+                    context_name=context_name,
                 )
             except ValueError as e:
                 ServiceBase.raise_error(422, e)
 
+        @self.router.get(
+            path="/",
+            description="Get the texture properties and associated asset paths in the current stage.",
+            response_model=PaginatedTexturesResponseModel,
+        )
+        async def get_textures(
+            query: GetTexturesQueryModel = Depends(get_textures_query),  # noqa B008
+        ) -> PaginatedTexturesResponseModel:
+            try:
+                return self.__texture_core.get_texture_prims_assets_with_data_models(query)
+            except ValueError as e:
+                ServiceBase.raise_error(422, e)
+
+        @self.router.get(
+            path="/stream",
+            description=(
+                "Stream the texture properties and associated asset paths in the current stage as newline-delimited "
+                "JSON, one `[texture property, asset path]` array per line, in the stage traversal order. "
+                "The textures are sent as they are found."
+            ),
+        )
+        async def stream_textures(
+            query: GetTexturesQueryModel = Depends(get_textures_query),  # noqa B008
+        ):
+            return ServiceBase.stream_ndjson_response(
+                self.__texture_core.iter_texture_prims_assets_with_data_models(query), serialize=list
+            )
+
         @self.router.put(
             path="/",
             description="Override the given textures on the current edit target in the current stage.",
@@ -104,6 +142,32 @@ class TextureReplacementsService(ServiceBase):
         ) -> str:
             return self.__texture_core.replace_texture_with_data_models(body) or "OK"
 
+        @self.router.put(
+            path="/bulk",
+            description=(
+                "Override many textures on the current edit target in the current stage with a single undoable edit. "
+                "Every texture is validated individually and the results are returned per texture."
+            ),
+            response_model=BulkReplaceTexturesResponseModel,
+        )
+        async def override_textures_bulk(
+            body: ServiceBase.inject_hidden_fields(BulkReplaceTexturesRequestModel, context_name=context_name)
+        ) -> BulkReplaceTexturesResponseModel:
+            return self.__texture_core.replace_textures_bulk_with_data_models(body)
+
+        @self.router.post(
+            path="/bulk/material",
+            description=(
+                "Get the parent materials for many texture asset paths. "
+                "The results are returned per texture asset path."
+            ),
+            response_model=BulkTextureMaterialsResponseModel,
+        )
+        async def get_texture_materials_bulk(
+            body: ServiceBase.inject_hidden_fields(BulkTextureMaterialsRequestModel, context_name=context_name)
+        ) -> BulkTextureMaterialsResponseModel:
+            return self.__texture_core.get_texture_materials_with_data_models(body)
+
         @self.router.get(
             path="/types",
             description="Get a list of the available texture types.",
@@ -18,7 +18,9 @@
 __all__ = [
     "PrimTypes",
     "get_prim_paths",
+    "iter_prim_paths",
     "filter_prims_paths",
+    "iter_filtered_prims_paths",
     "is_light",
     "is_material",
     "is_shader",
@@ -30,7 +32,7 @@ __all__ = [
 
 import re
 from enum import Enum
-from typing import Callable
+from typing import Callable, Iterator
 
 import omni.usd
 from lightspeed.common import constants
@@ -110,6 +112,58 @@ def get_prim_paths(
     )
 
 
+def iter_prim_paths(
+    asset_hashes: set[str] = None,
+    prim_types: set[PrimTypes] | None = None,
+    selection: list[str] | None = None,
+    filter_session_prims: bool = True,
+    layer_id: str = None,
+    exists: bool = True,
+    context_name: str = "",
+    start_after: str | None = None,
+) -> Iterator[str]:
+    """
+    Lazily get the prim paths of the given types in the stage or current selection with a single traversal.
+
+    Unlike `get_prim_paths`, the prim paths of every type are returned in the stage traversal (or selection) order,
+    making the order stable for pagination.
+
+    Args:
+        asset_hashes: A set of hashes to filter for
+        prim_types: The types of prim to fetch. If not set, all the types will be fetched.
+        selection: Current stage selection. If not set, all the prim paths in the stage will be used.
+        filter_session_prims: Whether to filter out prims defined on the session prim or not
+        layer_id: Look for assets that exists or not on a given layer. Use the `exists` query parameter to set whether
+                  existing or non-existing prims should be returned.
+        exists: Filter an asset if it exists or not on a given layer. Use in conjunction with `layer_identifier` to
+                filter on a given layer, otherwise this parameter will be ignored.
+        context_name: Context name for the stage to get prim paths from
+        start_after: Only yield the prim paths found after this prim path
+
+    Raises:
+        ValueError: If `start_after` is not in the stage or the selection
+
+    Returns:
+        An iterator of prim paths
+    """
+    type_predicates = {
+        PrimTypes.LIGHTS: is_light,
+        PrimTypes.MATERIALS: is_material,
+        PrimTypes.MODELS: is_model,
+    }
+    predicates = [type_predicates[prim_type] for prim_type in (prim_types or type_predicates.keys())]
+
+    return iter_filtered_prims_paths(
+        lambda prim: any(predicate(prim) for predicate in predicates) and includes_hash(prim, asset_hashes),
+        prim_paths=selection,
+        filter_session_prims=filter_session_prims,
+        layer_id=layer_id,
+        exists=exists,
+        context_name=context_name,
+        start_after=start_after,
+    )
+
+
 def filter_prims_paths(
     predicate: Callable[["Usd.Prim"], bool],
     prim_paths: list[str] | None = None,
@@ -134,13 +188,60 @@ def filter_prims_paths(
     Returns:
         A list of prims paths
     """
+    return list(
+        iter_filtered_prims_paths(
+            predicate,
+            prim_paths=prim_paths,
+            filter_session_prims=filter_session_prims,
+            layer_id=layer_id,
+            exists=exists,
+            context_name=context_name,
+        )
+    )
+
+
+def iter_filtered_prims_paths(
+    predicate: Callable[["Usd.Prim"], bool],
+    prim_paths: list[str] | None = None,
+    filter_session_prims: bool = False,
+    layer_id: str | None = None,
+    exists: bool = True,
+    context_name: str = "",
+    start_after: str | None = None,
+) -> Iterator[str]:
+    """
+    Lazily get the prim paths that match the given predicate in the stage or current selection
+
+    Args:
+        predicate: The predicate to match prims
+        prim_paths: The list of prim paths to filter. If not set, all the prim paths in the stage will be used
+        filter_session_prims: Whether to filter out prims defined on the session prim or not
+        layer_id: Look for assets that exists or not on a given layer. Use the `exists` query parameter to set whether
+                  existing or non-existing prims should be returned.
+        exists: Filter an asset if it exists or not on a given layer. Use in conjunction with `layer_identifier` to
+                filter on a given layer, otherwise this parameter will be ignored.
+        context_name: Context name for the stage to get prim paths from
+        start_after: Only yield the prim paths found after this prim path in the stage traversal or in `prim_paths`
+
+    Raises:
+        ValueError: If `start_after` is not in the stage or in `prim_paths`
+
+    Returns:
+        An iterator of prim paths
+    """
 
     context = omni.usd.get_context(context_name)
     stage = context.get_stage()
     session_layer = stage.GetSessionLayer()
 
     if prim_paths is not None:
-        prims = [stage.GetPrimAtPath(path) for path in prim_paths]
+        if start_after is not None:
+            if start_after not in prim_paths:
+                raise ValueError(f"The prim path is not in the filtered prim paths: {start_after}")
+            prim_paths = prim_paths[prim_paths.index(start_after) + 1 :]
+        prims = (stage.GetPrimAtPath(path) for path in prim_paths)
+    elif start_after is not None:
+        prims = _traverse_all_after(stage, start_after)
     else:
         prims = stage.TraverseAll()
 
@@ -162,9 +263,33 @@ def filter_prims_paths(
                 is_valid = not bool(layer.GetPrimAtPath(prim.GetPath())) and (layer != introducing_layer)
         return is_valid
 
-    filtered_paths = [str(prim.GetPath()) for prim in prims if layer_predicate(prim) and predicate(prim)]
+    for prim in prims:
+        if layer_predicate(prim) and predicate(prim):
+            yield str(prim.GetPath())
+
 
-    return filtered_paths
+def _traverse_all_after(stage: "Usd.Stage", start_after: str) -> Iterator["Usd.Prim"]:
+    """
+    Traverse all the prims of the stage found after the given prim path, in the `Usd.Stage.TraverseAll` order.
+
+    The subtrees found before the prim path are pruned so resuming a traversal doesn't visit every previous prim.
+    """
+    start_path = Sdf.Path(start_after)
+    if not stage.GetPrimAtPath(start_path):
+        raise ValueError(f"The prim path does not exist in the current stage: {start_after}")
+
+    prim_range = Usd.PrimRange.AllPrims(stage.GetPseudoRoot())
+    iterator = iter(prim_range)
+    # Skip the pseudo-root
+    next(iterator)
+    for prim in iterator:
+        prim_path = prim.GetPath()
+        if prim_path == start_path:
+            break
+        # Subtrees that don't contain the start path were fully traversed before it
+        if not start_path.HasPrefix(prim_path):
+            iterator.PruneChildren()
+    yield from iterator
 
 
 def includes_hash(prim: "Usd.Prim", asset_hashes: set[str]) -> bool:
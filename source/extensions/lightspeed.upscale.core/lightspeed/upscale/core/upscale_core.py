@@ -26,7 +26,10 @@ from typing import TYPE_CHECKING, Callable, Union
 import carb
 import omni.usd
 from lightspeed.common import constants
-from PIL import Image
+from omni.flux.utils.common import lazy_import as _lazy_import
+
+# Only imported when a texture is converted, to keep them out of the app startup
+Image = _lazy_import("PIL.Image")
 
 if TYPE_CHECKING:
     from lightspeed.upscale.core.items import BaseUpscaleModel
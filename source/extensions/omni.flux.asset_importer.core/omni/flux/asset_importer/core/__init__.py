@@ -19,6 +19,7 @@ __all__ = [
     "ImporterCore",
     "AssetImporterModel",
     "AssetItemImporterModel",
+    "TextureSetIndex",
     "get_texture_sets",
     "determine_ideal_types",
     "get_texture_type_from_filename",
@@ -30,4 +31,10 @@ __all__ = [
 
 from .asset_importer import AssetImporterModel, AssetItemImporterModel, ImporterCore
 from .scan_folder.dialog import destroy_scanner_dialog, scan_folder, setup_scanner_dialog
-from .utils import determine_ideal_types, get_texture_sets, get_texture_type_from_filename, parse_texture_paths
+from .utils import (
+    TextureSetIndex,
+    determine_ideal_types,
+    get_texture_sets,
+    get_texture_type_from_filename,
+    parse_texture_paths,
+)
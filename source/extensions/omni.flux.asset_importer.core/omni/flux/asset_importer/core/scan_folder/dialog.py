@@ -15,6 +15,7 @@
 * limitations under the License.
 """
 
+import os
 import re
 from pathlib import Path
 from typing import Callable
@@ -86,17 +87,19 @@ class ScanFolderWidget:
         search_term = self._search_term_field.model.get_value_as_string()
         search_exp = re.compile(search_term, re.IGNORECASE)
 
+        # Use the directory entries directly: the file type is known without an extra stat call per file
         found = []
-        for file in input_folder.iterdir():
-            if not file.is_file():
-                continue
-            if file.suffix == ".meta":
-                continue
-            match = search_exp.search(str(file.name))
-            if not match:
-                continue
-
-            found.append(file)
+        with os.scandir(input_folder) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if os.path.splitext(entry.name)[1] == ".meta":
+                    continue
+                match = search_exp.search(entry.name)
+                if not match:
+                    continue
+
+                found.append(input_folder / entry.name)
 
         self.refresh_ui()
         for found_file in found:
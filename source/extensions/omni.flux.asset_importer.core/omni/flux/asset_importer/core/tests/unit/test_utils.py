@@ -1,5 +1,9 @@
+import time
+
+import carb
 import omni.kit.test
 from omni.flux.asset_importer.core import (
+    TextureSetIndex,
     determine_ideal_types,
     get_texture_sets,
     get_texture_type_from_filename,
@@ -94,3 +98,42 @@ class TestAssetUtils(omni.kit.test.AsyncTestCase):
         ideal_types = determine_ideal_types(list(test_paths.keys()))
         for path, texture_type in ideal_types.items():
             self.assertEqual(test_paths[path], texture_type)
+
+    def test_texture_set_index_large_folder(self):
+        # Arrange
+        # Generate a 50k files fixture: 10k materials with 5 textures each, spread across 500 directories
+        set_types = {
+            "Albedo": _TextureTypes.DIFFUSE,
+            "Roughness": _TextureTypes.ROUGHNESS,
+            "Metallic": _TextureTypes.METALLIC,
+            "Emissive": _TextureTypes.EMISSIVE,
+            "Height": _TextureTypes.HEIGHT,
+        }
+        expected_groups = {}
+        expected_types = {}
+        for index in range(10000):
+            prefix = f"C:/textures/dir_{index % 500}/T_Material_{index}_"
+            expected_groups[prefix] = []
+            for set_type, texture_type in set_types.items():
+                path = f"{prefix}{set_type}.png"
+                expected_groups[prefix].append((set_type, path))
+                expected_types[path] = texture_type
+        paths = list(expected_types.keys())
+
+        # Act
+        start = time.perf_counter()
+        index = TextureSetIndex(paths)
+        texture_sets = index.texture_sets
+        indexed = time.perf_counter()
+        texture_types = index.get_ideal_types()
+        typed = time.perf_counter()
+
+        carb.log_info(
+            f"Indexed {len(paths)} textures in {indexed - start:.3f}s, "
+            f"determined their types in {typed - indexed:.3f}s"
+        )
+
+        # Assert
+        self.assertDictEqual(texture_sets, expected_groups)
+        self.assertDictEqual(texture_types, expected_types)
+        self.assertDictEqual(determine_ideal_types(paths[:500]), {p: expected_types[p] for p in paths[:500]})
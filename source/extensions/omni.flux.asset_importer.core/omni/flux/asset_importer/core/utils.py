@@ -15,10 +15,11 @@
 * limitations under the License.
 """
 
+import functools
 import hashlib
 import re
-from collections import defaultdict
-from typing import Dict, List, Tuple
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
 
@@ -59,12 +60,174 @@ def parse_texture_paths(paths_to_parse, required_ext="dds"):
     return parsed_paths
 
 
-def _get_default_prefix(path):
+_TEXTURE_TYPE_PATTERNS = {
+    texture_type: re.compile(_TEXTURE_TYPE_REGEX_MAP[texture_type], re.IGNORECASE)
+    for texture_type in _TextureTypes
+    if _TEXTURE_TYPE_REGEX_MAP.get(texture_type) is not None
+}
+"""
+Pre-compiled texture type regex table, in TextureTypes order
+"""
+
+# Combine all the TextureTypes in 1 regex expression to make building texture sets faster
+_TEXTURE_SET_REGEX = re.compile(
+    rf".*({'|'.join([r for r in _TEXTURE_TYPE_REGEX_MAP.values() if r is not None])})", re.IGNORECASE
+)
+
+
+def _get_default_prefix(url: _OmniUrl):
     # only 8 digit
-    hash_int = int(hashlib.sha256(str(_OmniUrl(path).parent_url).encode("utf-8")).hexdigest(), 16) % 10**8
+    hash_int = int(hashlib.sha256(str(url.parent_url).encode("utf-8")).hexdigest(), 16) % 10**8
     return f"{_PREFIX_TEXTURE_NO_PREFIX}_{hash_int}"
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_texture_type_from_set_type(set_texture_type: str) -> Optional[_TextureTypes]:
+    for texture_type, pattern in _TEXTURE_TYPE_PATTERNS.items():
+        # If the enum REGEX matches with the set texture type, we found the right type
+        if pattern.search(set_texture_type):
+            return texture_type
+    return None
+
+
+class TextureSetIndex:
+    """
+    Group a list of texture paths into PBR texture sets in a single pass.
+
+    Every path is parsed once and matched once against the pre-compiled texture type table. The texture sets are kept
+    in a dictionary keyed by prefix so the ideal texture types can be resolved without re-scanning every path for
+    every texture set.
+    """
+
+    def __init__(self, paths: Iterable[str]):
+        """
+        Args:
+            paths: the texture paths to index
+        """
+        self._texture_sets = defaultdict(list)
+        self._file_paths = {}
+
+        for path in paths:
+            self._index_path(path)
+
+    @property
+    def texture_sets(self) -> Dict[str, List[Tuple[str, str]]]:
+        """The texture sets, keyed by prefix. Every entry is a tuple of (texture type keyword, path)"""
+        return self._texture_sets
+
+    def _index_path(self, path: str):
+        url = _OmniUrl(path)
+        file_path = url.path
+        self._file_paths[path] = file_path
+
+        regex_match = _TEXTURE_SET_REGEX.search(file_path)
+        # No keyword was found
+        if not regex_match:
+            self._texture_sets[file_path].append(("Other", path))
+            return
+
+        # If the individual item expressions have matching group, use those
+        match_index = 1
+        for index, group in enumerate(regex_match.groups()):
+            if not group:
+                continue
+            match_index = index + 1
+        # The possible texture type
+        match_group = regex_match.group(match_index)
+        # Isolate the prefix used for the texture set
+        prefix = file_path[: regex_match.start(match_index)]
+        # if the texture name is Albedo.png/Metal.png/... with no prefix, we hash the full parent directory path
+        prefix = prefix or _get_default_prefix(url)
+        self._texture_sets[prefix].append((match_group, path))
+
+    def get_ideal_types(
+        self, paths: Iterable[str] = None, pref_normal_conv: _TextureTypes = None
+    ) -> Dict[str, _TextureTypes]:
+        """
+        Determine the TextureType of indexed paths based on the texture sets. If no TextureType can be found, no entry
+        will be added to the returned dictionary.
+
+        Args:
+            paths: the indexed paths to get the types for. If None, every indexed path will be used.
+            pref_normal_conv: the normal texture type to use for any normal map found
+
+        Returns:
+            A dictionary of path to texture type
+        """
+        # Sort the sets by length so the more precise prefixes overwrite the less precise prefixes
+        ordered_sets = sorted(self._texture_sets.keys(), key=len)
+        set_ranks = {set_prefix: rank for rank, set_prefix in enumerate(ordered_sets)}
+        no_prefix_sets = [set_prefix for set_prefix in ordered_sets if set_prefix.startswith(_PREFIX_TEXTURE_NO_PREFIX)]
+        set_lookups = {}
+
+        texture_types = {}
+        for path in self._file_paths if paths is None else paths:
+            file_path = self._file_paths.get(path)
+            if file_path is None:
+                file_path = _OmniUrl(path).path
+
+            # Only the sets with a prefix matching the file path (or with no prefix) can contain the file.
+            # Look at the most precise sets first: the first one resolving a texture type wins.
+            # (Example: T_Metal_Normal_OTH.png -> [T_Metal_, T_Metal_Normal_] will end up with value: OTH)
+            candidate_sets = {file_path[:i] for i in range(1, len(file_path) + 1) if file_path[:i] in set_ranks}
+            candidate_sets.update(no_prefix_sets)
+
+            texture_type = None
+            for set_prefix in sorted(candidate_sets, key=set_ranks.get, reverse=True):
+                texture_type = self._get_set_texture_type(set_prefix, file_path, set_lookups)
+                if texture_type:
+                    break
+
+            if not texture_type:
+                continue
+
+            # Special check for normals, which can be in one of three encodings
+            if pref_normal_conv is not None and texture_type in [
+                _TextureTypes.NORMAL_OGL,
+                _TextureTypes.NORMAL_DX,
+                _TextureTypes.NORMAL_OTH,
+            ]:
+                texture_types[path] = pref_normal_conv
+            else:
+                texture_types[path] = texture_type
+
+        return texture_types
+
+    def _get_set_texture_type(
+        self, set_prefix: str, file_path: str, set_lookups: Dict[str, Tuple[Tuple[str, ...], Counter]]
+    ) -> Optional[_TextureTypes]:
+        set_types = self._texture_sets[set_prefix]
+        is_no_prefix = set_prefix.startswith(_PREFIX_TEXTURE_NO_PREFIX)
+
+        # Build the lookups of the set once: every possible start of a file in the set & the count of every type
+        if set_prefix not in set_lookups:
+            starts = {set_prefix + t for t, _ in set_types}
+            if is_no_prefix:
+                starts.update(t for t, _ in set_types)
+            set_lookups[set_prefix] = (tuple(starts), Counter(t.lower() for t, _ in set_types))
+        set_starts, set_type_counts = set_lookups[set_prefix]
+
+        # Quickly skip the sets the file can't be part of
+        if not file_path.startswith(set_starts):
+            return None
+
+        # Get the texture type of the file in the set
+        set_texture_type = None
+        for set_type, _ in set_types:
+            if file_path.startswith(set_prefix + set_type) or (is_no_prefix and file_path.startswith(set_type)):
+                set_texture_type = set_type
+                break
+        if not set_texture_type:
+            return None
+
+        # If the texture type is in the set multiple times, we keep the type as OTHER since it's probably
+        # not the texture type (Example: T_Metal_01.png and T_Metal_02.png)
+        if set_type_counts[set_texture_type.lower()] != 1:
+            return None
+
+        return _get_texture_type_from_set_type(set_texture_type)
+
+
 def get_texture_sets(paths: List[str]) -> Dict[str, List[Tuple[str, str]]]:
     """
     From a list of paths, return a list of set of textures
@@ -75,37 +238,7 @@ def get_texture_sets(paths: List[str]) -> Dict[str, List[Tuple[str, str]]]:
     Returns:
         Set of textures
     """
-    texture_sets = defaultdict(list)
-
-    # Combine all the TextureTypes in 1 regex expression to make building texture sets faster
-    patterns = [r for r in _TEXTURE_TYPE_REGEX_MAP.values() if r is not None]
-    regex_search = re.compile(rf".*({'|'.join(patterns)})", re.IGNORECASE)
-
-    # Build Texture Sets
-    for path in paths:
-        file_path = _OmniUrl(path).path
-        regex_match = re.search(regex_search, file_path)
-        # At least 1 keyword was found
-        if regex_match:
-            # If the individual item expressions have matching group, use those
-            match_index = 1
-            for index, group in enumerate(regex_match.groups()):
-                if not group:
-                    continue
-                match_index = index + 1
-            # The possible texture type
-            match_group = regex_match.group(match_index)
-            # Isolate the prefix used for the texture set
-            prefix = file_path[: regex_match.start(match_index)]
-            # if the texture name is Albedo.png/Metal.png/... with no prefix, we hash the full parent directory path
-            prefix = prefix or _get_default_prefix(path)
-            texture_sets[prefix].append((match_group, path))
-        else:
-            if file_path not in texture_sets:
-                texture_sets[file_path] = []
-            texture_sets[file_path].append(("Other", path))
-
-    return texture_sets
+    return TextureSetIndex(paths).texture_sets
 
 
 def determine_ideal_types(paths: List[str], pref_normal_conv: _TextureTypes = None) -> Dict[str, _TextureTypes]:
@@ -113,65 +246,7 @@ def determine_ideal_types(paths: List[str], pref_normal_conv: _TextureTypes = No
     Will try to determine the TextureType based on the filename. If no TextureType can be found, no entry will be
     added to the returned dictionary.
     """
-
-    texture_types = {}
-
-    texture_sets = get_texture_sets(paths)
-
-    # Sort the sets by length so the more precise prefixes overwrite the less precise prefixes
-    ordered_sets = sorted(texture_sets.keys(), key=len)
-
-    # Find the Texture Types
-    for set_prefix in ordered_sets:
-        set_types = texture_sets[set_prefix]
-
-        for path in paths:
-            file_path = _OmniUrl(path).path
-
-            # Make sure the file is part of the texture set
-            if not file_path.startswith(set_prefix) and not set_prefix.startswith(_PREFIX_TEXTURE_NO_PREFIX):
-                continue
-
-            texture_type = None
-
-            # Get the texture type of the file in the set
-            set_texture_type = None
-            for set_type, _ in set_types:
-                if file_path.startswith(set_prefix + set_type) or (
-                    set_prefix.startswith(_PREFIX_TEXTURE_NO_PREFIX) and file_path.startswith(set_type)
-                ):
-                    set_texture_type = set_type
-                    break
-
-            # Get the enum value matching the texture type
-            # If the texture type is in the set multiple times, we keep the type as OTHER since it's probably
-            # not the texture type (Example: T_Metal_01.png and T_Metal_02.png)
-            if set_texture_type and len([t for t, _ in set_types if t.lower() == set_texture_type.lower()]) == 1:
-                for ttype in _TextureTypes:
-                    pattern = _TEXTURE_TYPE_REGEX_MAP.get(ttype)
-                    if pattern is None:
-                        continue
-                    # If the enum REGEX matches with the set texture type, we found the right type
-                    if re.search(pattern, set_texture_type, re.IGNORECASE):
-                        texture_type = ttype
-                        break
-
-            # Only update the texture type if a type was found.
-            # Since the prefixes are ordered by length, a more precise prefix will override a broader one
-            # (Example: T_Metal_Normal_OTH.png -> [T_Metal_, T_Metal_Normal_] will end up with value: OTH)
-            if texture_type:
-                # Special check for normals, which can be in one of three encodings
-                if pref_normal_conv is not None and texture_type in [
-                    _TextureTypes.NORMAL_OGL,
-                    _TextureTypes.NORMAL_DX,
-                    _TextureTypes.NORMAL_OTH,
-                ]:
-                    texture_types[path] = pref_normal_conv
-                else:
-                    texture_types[path] = texture_type
-
-    # Return the list of explicitly known texture types only
-    return texture_types
+    return TextureSetIndex(paths).get_ideal_types(paths, pref_normal_conv=pref_normal_conv)
 
 
 def get_texture_type_from_filename(filename: str) -> _TextureTypes | None:
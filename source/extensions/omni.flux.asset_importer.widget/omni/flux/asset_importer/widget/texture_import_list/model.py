@@ -76,19 +76,26 @@ class TextureImportListModel(ui.AbstractItemModel):
 
     def add_items(self, paths: List[Union[str, _OmniUrl]]):
         # Don't allow adding the same path 2x
-        current_paths = [c.path.path for c in self._children]
-        paths = [str(path) for path in paths if _OmniUrl(path).path not in current_paths]
+        current_paths = {c.path.path for c in self._children}
+        urls = {}
+        for path in paths:
+            url = _OmniUrl(path)
+            if url.path in current_paths:
+                continue
+            urls[str(path)] = url
+        paths = list(urls.keys())
         texture_types = self._determine_ideal_types(paths)
 
         # Update all existing children texture types
         self.refresh_texture_types(texture_types=texture_types)
 
-        for path in paths:
+        for path, url in urls.items():
             # Don't allow adding the same path 2x
-            if _OmniUrl(path).path in [c.path.path for c in self._children]:
+            if url.path in current_paths:
                 continue
+            current_paths.add(url.path)
 
-            item = TextureImportItem(_OmniUrl(path), texture_types.get(path, TextureTypes.OTHER))
+            item = TextureImportItem(url, texture_types.get(path, TextureTypes.OTHER))
 
             self._children[item] = (
                 item.subscribe_item_texture_type_changed(self._on_texture_type_changed),
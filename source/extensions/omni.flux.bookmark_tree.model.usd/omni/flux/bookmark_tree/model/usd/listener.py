@@ -17,7 +17,10 @@
 
 from omni import ui
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
-from pxr import Tf, Usd
+from pxr import Sdf, Tf, Usd
+
+_COLLECTION_PREFIX = "collection:"
+_INCLUDES_SUFFIX = ":includes"
 
 
 class USDListener:
@@ -71,35 +74,36 @@ class USDListener:
             self._listeners.pop(stage)
 
     def _on_usd_changed(self, notice, stage):
+        paths = notice.GetResyncedPaths() + notice.GetChangedInfoOnlyPaths()
         for model in self._models:
-            if str(model.stage) != "invalid null stage":
-                model_base_path = model.get_bookmarks_base_path()
-                should_refresh = False
-                paths = notice.GetResyncedPaths() + notice.GetChangedInfoOnlyPaths()
-                for path in paths:
-                    # If a bookmark collection was created or deleted with no item inside
-                    if str(path) == model_base_path:
-                        should_refresh = True
-                        break
-
-                    # Only care about paths where the path contains the bookmark base
-                    if model_base_path not in str(path):
-                        continue
-                    # Only allow properties
-                    if not path.IsPropertyPath():
-                        continue
-                    # Make sure it's a collection property
-                    name = path.name
-                    if len(str(name)) < 11 or str(name)[:11] != "collection:":
-                        continue
-                    # Only track "includes" for item inclusions/exclusions
-                    if len(str(name)) < 9 or str(name)[-9:] != ":includes":
-                        continue
-
+            if str(model.stage) == "invalid null stage":
+                continue
+            model_base_path = Sdf.Path(model.get_bookmarks_base_path())
+            should_refresh = False
+            collection_paths = set()
+            for path in paths:
+                # If a bookmark collection was created or deleted
+                if path == model_base_path:
                     should_refresh = True
                     break
-                if should_refresh:
-                    model.refresh()
+
+                # Only care about the properties of the bookmark prim
+                if not path.IsPropertyPath() or path.GetPrimPath() != model_base_path:
+                    continue
+                # Make sure it's a collection property
+                name = str(path.name)
+                if not name.startswith(_COLLECTION_PREFIX):
+                    continue
+                # Only track "includes" for item inclusions/exclusions
+                if not name.endswith(_INCLUDES_SUFFIX):
+                    continue
+
+                collection_paths.add(str(model_base_path.AppendProperty(name[: -len(_INCLUDES_SUFFIX)])))
+            if should_refresh:
+                model.refresh()
+            elif collection_paths:
+                # Only the updated collections need to be built again
+                model.refresh_collections(collection_paths)
 
     def destroy(self):
         for listener in self._listeners.values():
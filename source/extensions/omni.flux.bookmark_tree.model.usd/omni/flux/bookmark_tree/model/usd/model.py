@@ -16,8 +16,9 @@
 """
 
 import asyncio
+import time
 from contextlib import nullcontext
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import omni.usd
 from omni.flux.bookmark_tree.widget import (
@@ -32,7 +33,7 @@ from omni.kit import app, commands, undo
 
 # Required to register commands
 from omni.kit.core.collection import commands as _usd_commands  # noqa F401
-from pxr import Usd
+from pxr import Sdf, Usd
 
 from .extension import get_usd_listener_instance as _get_usd_listener_instance
 
@@ -45,6 +46,12 @@ class UsdBookmarkCollectionModel(BookmarkCollectionModel):
             "_context": None,
             "_stage": None,
             "_stage_event": None,
+            "_collection_items": None,
+            "_child_collections": None,
+            "_root_collections": None,
+            "_root_items": None,
+            "_dirty_collections": None,
+            "_refresh_collections_task": None,
         }
         for attr, value in self._default_attr.items():
             setattr(self, attr, value)
@@ -56,6 +63,19 @@ class UsdBookmarkCollectionModel(BookmarkCollectionModel):
         self._stage = self._context.get_stage()
         self._stage_event = None
 
+        # {collection path: collection items}. A collection included in many collections has an item per parent.
+        self._collection_items: Dict[str, List[BookmarkCollectionItem]] = {}
+        # {collection path: paths of the collections it includes}
+        self._child_collections: Dict[str, Set[str]] = {}
+        # The paths of the collections of the bookmarks prim, in order
+        self._root_collections: List[str] = []
+        # {collection path: root item} for the collections not included in another collection
+        self._root_items: Dict[str, BookmarkCollectionItem] = {}
+        self._dirty_collections: Set[str] = set()
+        self._refresh_collections_task = None
+        # Duration of the last refresh of the items, in seconds
+        self.last_refresh_duration = 0.0
+
     @property
     def stage(self):
         """
@@ -69,6 +89,17 @@ class UsdBookmarkCollectionModel(BookmarkCollectionModel):
         """
         asyncio.ensure_future(self._refresh_async())
 
+    def refresh_collections(self, collection_paths: Iterable[str]):
+        """
+        Update the given collections on the next frame asynchronously, without rebuilding the other collections.
+
+        Args:
+            collection_paths: The paths of the collections with updated includes
+        """
+        self._dirty_collections.update(str(path) for path in collection_paths)
+        if self._refresh_collections_task is None or self._refresh_collections_task.done():
+            self._refresh_collections_task = asyncio.ensure_future(self._refresh_collections_async())
+
     def enable_listeners(self, value):
         """
         Enable USD listeners and refresh the model.
@@ -262,66 +293,156 @@ class UsdBookmarkCollectionModel(BookmarkCollectionModel):
         await app.get_app().next_update_async()
         if not self.stage:
             return
+        start = time.perf_counter()
         with Usd.EditContext(self.stage, self.stage.GetRootLayer()):
             self.set_items(self._get_items_from_usd())
+        self.last_refresh_duration = time.perf_counter() - start
+
+    @omni.usd.handle_exception
+    async def _refresh_collections_async(self):
+        # Wait for 1 frame to group the changes of the frame
+        await app.get_app().next_update_async()
+        collection_paths = self._dirty_collections
+        self._dirty_collections = set()
+        if not self.stage or not collection_paths:
+            return
+        if not self._update_collections(collection_paths):
+            self.refresh()
+
+    def _update_collections(self, collection_paths: Iterable[str]) -> bool:
+        """
+        Build the children of the given collections again and only update their items
+
+        Returns:
+            False if a collection is not indexed and the model should be refreshed instead
+        """
+        start = time.perf_counter()
+        updated_items = []
+        roots_changed = False
+        for collection_path in collection_paths:
+            if collection_path not in self._child_collections:
+                return False
+            collection = Usd.CollectionAPI.GetCollection(self.stage, Sdf.Path(collection_path))
+            child_collections = self.__get_child_collections(collection)
+            # Copy the list: the update of the items can't change the items of the collection itself
+            for item in list(self._collection_items.get(collection_path, [])):
+                for child in item.children:
+                    if child.component_type == ComponentTypes.bookmark_collection.value:
+                        self.__remove_collection_item(child)
+                item.set_children(self.__build_children(collection, self.__get_ancestor_paths(item)))
+                updated_items.append(item)
+            # A collection moved in or out of another collection is removed from or added to the root items
+            roots_changed |= child_collections != self._child_collections[collection_path]
+            self._child_collections[collection_path] = child_collections
+
+        if roots_changed:
+            self.set_items(self.__get_root_items())
+        else:
+            for item in updated_items:
+                self._item_changed(item)
+        self.last_refresh_duration = time.perf_counter() - start
+        return True
 
     def _get_items_from_usd(self):
-        items = []
+        self._collection_items = {}
+        self._child_collections = {}
+        self._root_collections = []
+        self._root_items = {}
         if self.stage is not None:
             prim = self.stage.GetPrimAtPath(self.get_bookmarks_base_path())
             if prim.IsValid():
                 for collection in Usd.CollectionAPI.GetAllCollections(prim):
-                    items.append(self.__build_collection_item(collection))
-                items = self.__remove_children_from_root(items)
-                items.sort(key=lambda i: i.title)
+                    collection_path = str(collection.GetCollectionPath())
+                    self._root_collections.append(collection_path)
+                    self._child_collections[collection_path] = self.__get_child_collections(collection)
+        return self.__get_root_items()
+
+    def __get_root_items(self) -> List:
+        # Collections included in other collections are only displayed as children
+        included = set().union(*self._child_collections.values())
+        root_items = {}
+        for collection_path in self._root_collections:
+            if collection_path in included:
+                continue
+            item = self._root_items.pop(collection_path, None)
+            if item is None:
+                collection = Usd.CollectionAPI.GetCollection(self.stage, Sdf.Path(collection_path))
+                item = self.__build_collection_item(collection, ())
+            item.parent = None
+            root_items[collection_path] = item
+        # The remaining items are the collections moved in another collection
+        for item in self._root_items.values():
+            self.__remove_collection_item(item)
+        self._root_items = root_items
+
+        items = list(root_items.values())
+        items.sort(key=lambda i: i.title)
         # always add the "create" button at the end
         create_item = CreateBookmarkItem(self._on_create_item_clicked)
         items.append(create_item)
         return items
 
-    def __build_collection_item(self, collection):
+    def __build_collection_item(
+        self, collection: Usd.CollectionAPI, ancestor_paths: Tuple[str, ...]
+    ) -> BookmarkCollectionItem:
+        collection_path = str(collection.GetCollectionPath())
+        item = BookmarkCollectionItem(
+            collection.GetName(),
+            data=collection_path,
+            on_mouse_double_clicked_callback=self._on_bookmark_collection_double_clicked,
+        )
+        self._collection_items.setdefault(collection_path, []).append(item)
+        self._child_collections[collection_path] = self.__get_child_collections(collection)
+        item.set_children(self.__build_children(collection, (*ancestor_paths, collection_path)))
+        return item
+
+    def __build_children(self, collection: Usd.CollectionAPI, ancestor_paths: Tuple[str, ...]) -> List:
         children = []
         for target in collection.GetIncludesRel().GetTargets():
             if Usd.CollectionAPI.IsCollectionAPIPath(target):
-                children.append(self.__build_collection_item(Usd.CollectionAPI.GetCollection(self.stage, target)))
+                # Stop on collections including each other
+                if str(target) in ancestor_paths:
+                    continue
+                children.append(
+                    self.__build_collection_item(Usd.CollectionAPI.GetCollection(self.stage, target), ancestor_paths)
+                )
             else:
                 parts = str(target).split("/")
                 if len(parts) < 1:
                     continue
                 children.append(BookmarkItem(parts[-1], str(target)))
+        return children
+
+    @staticmethod
+    def __get_child_collections(collection: Usd.CollectionAPI) -> Set[str]:
+        return {
+            str(target)
+            for target in collection.GetIncludesRel().GetTargets()
+            if Usd.CollectionAPI.IsCollectionAPIPath(target)
+        }
 
-        return BookmarkCollectionItem(
-            collection.GetName(),
-            data=str(collection.GetCollectionPath()),
-            children=children,
-            on_mouse_double_clicked_callback=self._on_bookmark_collection_double_clicked,
-        )
-
-    def __remove_children_from_root(self, items: List[BookmarkCollectionItem]) -> List[BookmarkCollectionItem]:
-        filtered_items = []
-        for item in items:
-            child = self.__find_usd_item(item.data)
-            if child is None:
-                filtered_items.append(item)
-        return filtered_items
-
-    def __find_usd_item(self, path: str, parent: Usd.CollectionAPI = None, find_root_items: bool = False) -> str:
-        found = None
-        collection = []
-        prim = self.stage.GetPrimAtPath(self.get_bookmarks_base_path())
-        if parent is not None:
-            for target in parent.GetIncludesRel().GetTargets():
-                if Usd.CollectionAPI.IsCollectionAPIPath(target):
-                    collection.append(Usd.CollectionAPI.GetCollection(self.stage, target))
-        else:
-            collection = Usd.CollectionAPI.GetAllCollections(prim)
-        for item in collection:
-            found = item if (find_root_items or parent is not None) and str(item.GetCollectionPath()) == path else None
-            if found is None:
-                found = self.__find_usd_item(path, item)
-            if found is not None:
-                break
-        return found
+    @staticmethod
+    def __get_ancestor_paths(item: BookmarkCollectionItem) -> Tuple[str, ...]:
+        """The collection paths from the root item to the given item"""
+        paths = []
+        while item is not None:
+            paths.append(item.data)
+            item = item.parent
+        return tuple(reversed(paths))
+
+    def __remove_collection_item(self, item: BookmarkCollectionItem):
+        """Remove a collection item and its child collection items from the index"""
+        stack = [item]
+        while stack:
+            current = stack.pop()
+            items = self._collection_items.get(current.data, [])
+            if current in items:
+                items.remove(current)
+            if not items:
+                self._collection_items.pop(current.data, None)
+            stack.extend(
+                child for child in current.children if child.component_type == ComponentTypes.bookmark_collection.value
+            )
 
     def __on_stage_event(self, event):
         if event.type != int(omni.usd.StageEventType.SELECTION_CHANGED):
@@ -329,6 +450,8 @@ class UsdBookmarkCollectionModel(BookmarkCollectionModel):
         self._on_active_items_changed(self.get_active_items())
 
     def destroy(self):
+        if self._refresh_collections_task is not None:
+            self._refresh_collections_task.cancel()
         if self._usd_listener is not None:
             self._usd_listener.remove_model(self)
             self._usd_listener = None
@@ -15,8 +15,10 @@
 * limitations under the License.
 """
 
+import time
 from unittest.mock import Mock, call, patch
 
+import carb
 import omni.kit
 import omni.kit.test
 import omni.usd
@@ -25,7 +27,10 @@ from omni.flux.bookmark_tree.model.usd import USDListener
 from omni.flux.bookmark_tree.widget import BookmarkCollectionItem, BookmarkItem, ComponentTypes, CreateBookmarkItem
 from omni.kit import commands
 from omni.kit.test_suite.helpers import wait_stage_loading
-from pxr import Usd
+from pxr import Sdf, Usd
+
+_BENCHMARK_COLLECTION_COUNT = 100
+_BENCHMARK_BOOKMARK_COUNT = 10_000
 
 
 class TestModel(omni.kit.test.AsyncTestCase):
@@ -313,6 +318,103 @@ class TestModel(omni.kit.test.AsyncTestCase):
         self.assertListEqual(sorted(expected_list), sorted(args[0]))
         self.assertEqual(True, args[1])
 
+    async def test_refresh_collections_should_only_update_changed_collections(self):
+        # Arrange
+        model = BookmarkModel()
+        prim = self.stage.DefinePrim(model.get_bookmarks_base_path(), "Scope")
+        collection_0 = Usd.CollectionAPI.Apply(prim, "collection_0")
+        collection_1 = Usd.CollectionAPI.Apply(prim, "collection_1")
+        collection_0.CreateIncludesRel().SetTargets(["/World/item_0"])
+        collection_1.CreateIncludesRel().SetTargets(["/World/item_1"])
+        model.set_items(model._get_items_from_usd())  # noqa PLW0212
+        collection_0_item, collection_1_item, _ = model.get_item_children()
+
+        # Act
+        collection_0.GetIncludesRel().AddTarget("/World/item_2")
+        collection_0.GetIncludesRel().AddTarget(collection_1.GetCollectionPath())
+        with patch.object(BookmarkModel, "_get_items_from_usd") as usd_items_mock:
+            model.refresh_collections([str(collection_0.GetCollectionPath())])
+            for _ in range(2):
+                await omni.kit.app.get_app().next_update_async()
+
+        # Assert
+        self.assertEqual(0, usd_items_mock.call_count)
+        items = model.get_item_children()
+        self.assertEqual(2, len(items))
+        self.assertIs(collection_0_item, items[0])
+        self.assertIsInstance(items[1], CreateBookmarkItem)
+        self.assertListEqual(["collection_1", "item_0", "item_2"], [i.title for i in collection_0_item.children])
+        self.assertIs(collection_0_item, collection_0_item.children[0].parent)
+        self.assertListEqual(["item_1"], [i.title for i in collection_0_item.children[0].children])
+        self.assertIsNot(collection_1_item, collection_0_item.children[0])
+
+    async def test_refresh_collections_should_create_an_item_per_parent(self):
+        # Arrange
+        model = BookmarkModel()
+        prim = self.stage.DefinePrim(model.get_bookmarks_base_path(), "Scope")
+        parent_0 = Usd.CollectionAPI.Apply(prim, "parent_0")
+        parent_1 = Usd.CollectionAPI.Apply(prim, "parent_1")
+        child = Usd.CollectionAPI.Apply(prim, "child")
+        child.CreateIncludesRel().SetTargets(["/World/item_0"])
+        parent_0.CreateIncludesRel().SetTargets([child.GetCollectionPath()])
+        parent_1.CreateIncludesRel().SetTargets([child.GetCollectionPath()])
+        model.set_items(model._get_items_from_usd())  # noqa PLW0212
+        parent_0_item, parent_1_item, _ = model.get_item_children()
+        child_items = [parent_0_item.children[0], parent_1_item.children[0]]
+
+        # Act
+        parent_0.GetIncludesRel().ClearTargets(True)
+        parent_1.GetIncludesRel().ClearTargets(True)
+        model._update_collections([str(parent_0.GetCollectionPath())])  # noqa PLW0212
+        partially_moved_items = model.get_item_children()
+        model._update_collections([str(parent_1.GetCollectionPath())])  # noqa PLW0212
+
+        # Assert
+        self.assertIsNot(child_items[0], child_items[1])
+        self.assertIs(parent_0_item, child_items[0].parent)
+        self.assertIs(parent_1_item, child_items[1].parent)
+        # The collection is still included in the second parent
+        self.assertListEqual([parent_0_item, parent_1_item], partially_moved_items[:-1])
+
+        items = model.get_item_children()
+        self.assertListEqual(["child", "parent_0", "parent_1"], [i.title for i in items[:-1]])
+        self.assertIsNone(items[0].parent)
+        self.assertListEqual(["item_0"], [i.title for i in items[0].children])
+        self.assertIs(items[0], items[0].children[0].parent)
+        self.assertListEqual([], parent_0_item.children)
+        self.assertListEqual([], parent_1_item.children)
+
+    async def test_benchmark_refresh_collections(self):
+        # Arrange
+        model = BookmarkModel()
+        bookmarks_per_collection = _BENCHMARK_BOOKMARK_COUNT // _BENCHMARK_COLLECTION_COUNT
+        with Sdf.ChangeBlock():
+            prim = self.stage.DefinePrim(model.get_bookmarks_base_path(), "Scope")
+            for index in range(_BENCHMARK_COLLECTION_COUNT):
+                collection = Usd.CollectionAPI.Apply(prim, f"collection_{index}")
+                collection.CreateIncludesRel().SetTargets(
+                    [f"/World/mesh_{index}_{item}" for item in range(bookmarks_per_collection)]
+                )
+
+        # Act
+        start = time.perf_counter()
+        model.set_items(model._get_items_from_usd())  # noqa PLW0212
+        full_duration = time.perf_counter() - start
+
+        collection.GetIncludesRel().AddTarget("/World/new_mesh")
+        model._update_collections([str(collection.GetCollectionPath())])  # noqa PLW0212
+        update_duration = model.last_refresh_duration
+
+        carb.log_info(
+            f"Bookmarks refresh for {_BENCHMARK_BOOKMARK_COUNT} bookmarks in {_BENCHMARK_COLLECTION_COUNT} "
+            f"collections: full {full_duration:.3f}s, single collection {update_duration:.4f}s"
+        )
+
+        # Assert
+        updated_item = model.find_item(str(collection.GetCollectionPath()), lambda item, data: item.data == data)
+        self.assertEqual(bookmarks_per_collection + 1, len(updated_item.children))
+        self.assertEqual(_BENCHMARK_COLLECTION_COUNT + 1, len(model.get_item_children()))
+
     async def __run_test_enable_listeners(self, enable: bool):
         # Arrange
         model = BookmarkModel()
@@ -15,7 +15,7 @@
 * limitations under the License.
 """
 
-from typing import Any, Iterable, TypedDict
+from typing import Any, Iterable, List, Tuple, TypedDict
 
 import carb
 import omni.kit.commands
@@ -297,4 +297,66 @@ class RemoveOverrideCommand(omni.kit.commands.Command):
                 self._edit_target_undo.undo()
 
 
+class SetAttributeValuesCommand(omni.kit.commands.Command):
+    """
+    Author the default values of many attributes on a layer inside a single Sdf change block. **Command**.
+
+    Missing attribute specs are created with the given type and variability, in over prim specs if the prims have no
+    spec on the layer.
+
+    Args:
+        values (List[Tuple[Sdf.Path, Any, Sdf.ValueTypeName, Sdf.Variability]]): The attribute spec paths, values, type
+            names and variabilities.
+        layer (Sdf.Layer): The layer to author the values on.
+    """
+
+    def __init__(self, values: List[Tuple[Sdf.Path, Any, Sdf.ValueTypeName, Sdf.Variability]], layer: Sdf.Layer):
+        self._values = values
+        self._layer = layer
+        # (property path, spec existed, previous default value)
+        self._previous_values: List[Tuple[Sdf.Path, bool, Any]] = []
+        # The highest prim specs created to author the values
+        self._created_prim_paths: List[Sdf.Path] = []
+
+    def do(self):
+        self._previous_values = []
+        self._created_prim_paths = []
+        with Sdf.ChangeBlock():
+            for prop_path, value, type_name, variability in self._values:
+                prop_path = Sdf.Path(prop_path)
+                attr_spec = self._layer.GetAttributeAtPath(prop_path)
+                if attr_spec:
+                    self._previous_values.append(
+                        (prop_path, True, attr_spec.default if attr_spec.HasDefaultValue() else None)
+                    )
+                else:
+                    prim_path = prop_path.GetPrimPath()
+                    if not self._layer.GetPrimAtPath(prim_path):
+                        self._created_prim_paths.append(
+                            next(path for path in prim_path.GetPrefixes() if not self._layer.GetPrimAtPath(path))
+                        )
+                    prim_spec = Sdf.CreatePrimInLayer(self._layer, prim_path)
+                    attr_spec = Sdf.AttributeSpec(prim_spec, prop_path.name, type_name, variability)
+                    self._previous_values.append((prop_path, False, None))
+                attr_spec.default = value
+
+    def undo(self):
+        with Sdf.ChangeBlock():
+            for prop_path, existed, value in reversed(self._previous_values):
+                attr_spec = self._layer.GetAttributeAtPath(prop_path)
+                if not attr_spec:
+                    continue
+                if not existed:
+                    attr_spec.owner.RemoveProperty(attr_spec)
+                elif value is None:
+                    attr_spec.ClearDefaultValue()
+                else:
+                    attr_spec.default = value
+            for prim_path in reversed(self._created_prim_paths):
+                if self._layer.GetPrimAtPath(prim_path):
+                    _remove_prim_spec(self._layer, prim_path)
+        self._previous_values = []
+        self._created_prim_paths = []
+
+
 omni.kit.commands.register_all_commands_in_module(__name__)
@@ -284,3 +284,38 @@ class TestCustomCommands(omni.kit.test.AsyncTestCase):
         self.assertEqual(len(stack), 1)
         # Should be empty because we removed the override and prim
         self.assertEqual(len(stack2), 0)
+
+    async def test_set_attribute_values_do_undo(self):
+        # Arrange
+        layer1, prims = await self.__layer_setup()
+        root_prim = prims[0]
+        child_prim = prims[1]
+        root_layer = self.stage.GetRootLayer()
+        visibility_path = root_prim.GetPath().AppendProperty("visibility")
+        child_purpose_path = child_prim.GetPath().AppendProperty("purpose")
+        with Usd.EditContext(self.stage, root_layer):
+            self.stage.GetAttributeAtPath(visibility_path).Set(UsdGeom.Tokens.inherited)
+
+        # Act
+        omni.kit.commands.execute(
+            "SetAttributeValues",
+            values=[
+                (visibility_path, UsdGeom.Tokens.invisible, Sdf.ValueTypeNames.Token, Sdf.VariabilityVarying),
+                (child_purpose_path, UsdGeom.Tokens.render, Sdf.ValueTypeNames.Token, Sdf.VariabilityUniform),
+            ],
+            layer=root_layer,
+        )
+        done_values = [self.stage.GetAttributeAtPath(path).Get() for path in [visibility_path, child_purpose_path]]
+        # The created spec of the uniform attribute keeps its variability
+        done_variability = root_layer.GetAttributeAtPath(child_purpose_path).variability
+        omni.kit.undo.undo()
+
+        # Assert
+        self.assertListEqual([UsdGeom.Tokens.invisible, UsdGeom.Tokens.render], done_values)
+        self.assertEqual(Sdf.VariabilityUniform, done_variability)
+        self.assertEqual(UsdGeom.Tokens.inherited, self.stage.GetAttributeAtPath(visibility_path).Get())
+        self.assertEqual(UsdGeom.Tokens.default_, self.stage.GetAttributeAtPath(child_purpose_path).Get())
+        # The prim spec created for the child attribute was removed, the existing one was kept
+        self.assertTrue(root_layer.GetPrimAtPath(root_prim.GetPath()))
+        self.assertFalse(root_layer.GetPrimAtPath(child_prim.GetPath()))
+        self.assertFalse(layer1.GetPrimAtPath(root_prim.GetPath()))
@@ -16,7 +16,7 @@
 """
 
 import abc
-from typing import Any, List, Optional
+from typing import Any, Callable, List, Optional
 
 from omni.flux.utils.widget.tree_widget import TreeItemBase as _TreeItemBase
 
@@ -35,6 +35,8 @@ class ItemBase(_TreeItemBase):
         self._enabled = True
         self._can_have_children = True
         self._children = []
+        self._children_loader = None
+        self._has_unloaded_children = False
 
     @property
     @abc.abstractmethod
@@ -47,6 +49,8 @@ class ItemBase(_TreeItemBase):
                 "_enabled": None,
                 "_can_have_children": None,
                 "_children": None,
+                "_children_loader": None,
+                "_has_unloaded_children": None,
             }
         )
         return default_attr
@@ -90,9 +94,22 @@ class ItemBase(_TreeItemBase):
 
     @property
     def children(self) -> List["ItemBase"]:
-        """The item's children"""
+        """The item's children. Children set with a loader are created the first time they are accessed."""
+        self._load_children()
         return self._children
 
+    @property
+    def children_loaded(self) -> bool:
+        """Whether the item's children were created or are still waiting for their loader to be called"""
+        return self._children_loader is None
+
+    @property
+    def has_children(self) -> bool:
+        """Whether the item has children, without creating the children if they were not loaded yet"""
+        if self._children_loader is not None:
+            return self._has_unloaded_children
+        return bool(self._children)
+
     @property
     def can_have_children(self) -> bool:
         """
@@ -110,6 +127,27 @@ class ItemBase(_TreeItemBase):
         """Should be overridden by the inheriting class."""
         pass
 
+    def set_children_loader(
+        self, loader: Callable[["ItemBase"], List["ItemBase"]], has_children: bool = True
+    ) -> None:
+        """
+        Defer the creation of the item's children until they are first accessed
+
+        Args:
+            loader: a callback receiving the item and returning its children
+            has_children: whether the loader is expected to return children. Used to draw the expansion arrow.
+        """
+        self._children = []
+        self._children_loader = loader
+        self._has_unloaded_children = has_children
+
+    def _load_children(self) -> None:
+        if self._children_loader is None:
+            return
+        loader = self._children_loader
+        self._children_loader = None
+        self.set_children(loader(self), sort=False)
+
     def set_children(self, children: List["ItemBase"], sort: bool = True) -> None:
         """
         Set an item's children and the children's parent
@@ -118,6 +156,7 @@ class ItemBase(_TreeItemBase):
             children: the list of children to set
             sort: whether the children should be sorted
         """
+        self._children_loader = None
         for child in children:
             child.parent = self
         self._children = children
@@ -126,6 +165,7 @@ class ItemBase(_TreeItemBase):
 
     def clear_children(self) -> None:
         """Clear all the item's children"""
+        self._children_loader = None
         self._children.clear()
 
     def append_child(self, child: "ItemBase", sort: bool = True) -> None:
@@ -136,6 +176,7 @@ class ItemBase(_TreeItemBase):
             child: the item to append
             sort: whether the children should be sorted after appending the child
         """
+        self._load_children()
         child.parent = self
         self._children.append(child)
         if sort:
@@ -149,6 +190,7 @@ class ItemBase(_TreeItemBase):
             child: the item to insert
             index: the index at which to insert the child
         """
+        self._load_children()
         child.parent = self
         self._children.insert(index, child)
 
@@ -159,6 +201,7 @@ class ItemBase(_TreeItemBase):
         Args:
             child: the item to remove
         """
+        self._load_children()
         self._children.remove(child)
         child.parent = None
 
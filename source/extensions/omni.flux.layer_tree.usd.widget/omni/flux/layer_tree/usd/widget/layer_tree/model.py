@@ -17,10 +17,11 @@
 
 import abc
 import weakref
+from collections import deque
 from contextlib import contextmanager
 from functools import partial
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
 
 import carb
 import omni.kit.usd.layers as _layers
@@ -31,6 +32,7 @@ from omni.flux.utils.common.layer_utils import save_layer_as as _save_layer_as
 from omni.flux.utils.widget.file_pickers.file_picker import open_file_picker as _open_file_picker
 from omni.flux.utils.widget.tree_widget import TreeModelBase as _TreeModelBase
 from omni.kit import commands, undo
+from pxr import Sdf
 
 from .item_model import ItemBase, LayerItem
 
@@ -41,6 +43,9 @@ class LayerModel(_TreeModelBase[ItemBase]):
     temporary items (such as a TemporaryLayerItem). Permanent additions/removals should be done through the
     layer functions (create_layer, set_layer_parent, etc.) and refresh function to fetch the updated
     data.
+
+    The sublayer items are created lazily, the first time the children of their parent item are accessed. When the
+    listeners are enabled, the layer events only update the items of the layers they affect.
     """
 
     def __init__(
@@ -79,6 +84,13 @@ class LayerModel(_TreeModelBase[ItemBase]):
         self._items = []
         self._ignore_refresh = False
 
+        # {layer identifier: item}
+        self._items_by_identifier: Dict[str, LayerItem] = {}
+        # The edit target and every layer it is a sublayer of
+        self._authoring_identifiers: Optional[Set[str]] = None
+        # The edit target the authoring identifiers were computed for
+        self._authoring_edit_target: Optional[str] = None
+
         self._layer_events = None
         self._stage_events = None
 
@@ -106,6 +118,9 @@ class LayerModel(_TreeModelBase[ItemBase]):
             {
                 "_items": None,
                 "_ignore_refresh": None,
+                "_items_by_identifier": None,
+                "_authoring_identifiers": None,
+                "_authoring_edit_target": None,
                 "_layer_events": None,
                 "_stage_events": None,
                 "_context_name": None,
@@ -136,9 +151,11 @@ class LayerModel(_TreeModelBase[ItemBase]):
         """Force a refresh of the model."""
         if not self.stage or self._ignore_refresh:
             return
-        root_layer = self.stage.GetRootLayer()
-        root_item = self._create_layer_items(root_layer, None)
-        self.set_items([root_item])
+        self._items_by_identifier = {}
+        self._authoring_identifiers = None
+        self._authoring_edit_target = None
+        root_items = self._create_layer_items([self.stage.GetRootLayer()], None)
+        self.set_items(root_items)
 
     def enable_listeners(self, value: bool) -> None:
         """
@@ -562,6 +579,30 @@ class LayerModel(_TreeModelBase[ItemBase]):
                 break
         return found
 
+    def get_layer_item(self, identifier: str) -> Optional[LayerItem]:
+        """
+        Get the item of a layer from its identifier. The items of the parent layers will be created if required.
+
+        Args:
+            identifier: the identifier of the layer
+
+        Returns:
+            The item of the layer or None if the layer is not part of the layer tree
+        """
+        item = self._items_by_identifier.get(identifier)
+        if item is not None:
+            return item
+        # Create the items breadth-first until the layer is found
+        queue = deque(self._items)
+        while queue:
+            parent = queue.popleft()
+            loaded = parent.children_loaded
+            queue.extend(parent.children)
+            item = None if loaded else self._items_by_identifier.get(identifier)
+            if item is not None:
+                return item
+        return None
+
     def get_item_index(self, item: ItemBase, parent: Optional[ItemBase] = None) -> int:
         """
         Get an item's index.
@@ -590,24 +631,29 @@ class LayerModel(_TreeModelBase[ItemBase]):
         """
         return len(self._items if parent is None else parent.children)
 
-    def get_item_children(self, parent: Optional[ItemBase] = None, recursive: bool = False) -> List[ItemBase]:
+    def get_item_children(
+        self, parent: Optional[ItemBase] = None, recursive: bool = False, loaded_only: bool = False
+    ) -> List[ItemBase]:
         """
         Get the model's items or item's children.
 
         Args:
             parent: if this is not None, it will return the parent's children
             recursive: whether the items should be listed recursively or only top-level
+            loaded_only: whether to only list the children that were already created instead of creating them
 
         Returns:
             The items in the model or children in the parent
         """
+        if loaded_only and parent is not None and not parent.children_loaded:
+            return []
         items = self._items if parent is None else parent.children
         if not recursive:
             return items
 
         children = []
         for item in items:
-            children = children + self.get_item_children(item, True)
+            children.extend(self.get_item_children(item, True, loaded_only))
         return items + children
 
     def get_item_value_model_count(self, item: ItemBase) -> int:
@@ -648,8 +694,7 @@ class LayerModel(_TreeModelBase[ItemBase]):
         elif source is not None and item_target is not None:
             self.move_sublayer(source, item_target)
 
-    def _create_layer_items(self, layer, parent):
-        children = []
+    def _get_sublayers(self, layer: Sdf.Layer) -> Iterable[Sdf.Layer]:
         for sub_layer in layer.subLayerPaths:
             sub_layer_path = layer.ComputeAbsolutePath(sub_layer)
             if layer.realPath == sub_layer_path:
@@ -657,27 +702,32 @@ class LayerModel(_TreeModelBase[ItemBase]):
             child_layer = _layers.LayerUtils.find_layer(sub_layer_path)
             if child_layer is None:
                 continue
-            children.append(self._create_layer_items(child_layer, layer))
-
-        is_dirty = False
-        dirty_layers = _layers.LayerUtils.get_dirty_layers(self.stage)
-        for dirty_layer in dirty_layers:
-            if layer.identifier == dirty_layer:
-                is_dirty = True
+            yield child_layer
+
+    def _get_authoring_identifiers(self) -> Set[str]:
+        """Get the edit target identifier and the identifiers of every layer the edit target is a sublayer of"""
+        if self._authoring_identifiers is not None:
+            return self._authoring_identifiers
+
+        self._authoring_identifiers = set()
+        edit_target = _layers.LayerUtils.get_edit_target(self.stage)
+        self._authoring_edit_target = edit_target
+        # (layer, identifiers of the parent layers)
+        stack = [(self.stage.GetRootLayer(), ())]
+        visited = set()
+        while stack:
+            layer, parents = stack.pop()
+            if layer.identifier == edit_target:
+                self._authoring_identifiers = {*parents, layer.identifier}
                 break
+            if layer.identifier in visited:
+                continue
+            visited.add(layer.identifier)
+            stack.extend((child, (*parents, layer.identifier)) for child in self._get_sublayers(layer))
+        return self._authoring_identifiers
 
-        # If any of the children is the edit target, all parents cannot be muted
-        def has_authoring_child_recursive(items):
-            has_authoring = False
-            for item in items:
-                has_authoring = has_authoring or item.data["authoring"] or has_authoring_child_recursive(item.children)
-                if has_authoring:
-                    break
-            return has_authoring
-
-        excludes = {}
-        custom_data = layer.customLayerData.get(_LayerCustomData.ROOT.value, {})
-
+    def _get_layers_data(self, layers: List[Sdf.Layer], root: bool = False) -> List[dict]:
+        """Get the item data of the given layers. The layer states are fetched once for the whole list."""
         exclude_functions = {
             _LayerCustomData.EXCLUDE_REMOVE: self._exclude_remove_fn,
             _LayerCustomData.EXCLUDE_LOCK: self._exclude_lock_fn,
@@ -686,37 +736,117 @@ class LayerModel(_TreeModelBase[ItemBase]):
             _LayerCustomData.EXCLUDE_ADD_CHILD: self._exclude_add_child_fn,
             _LayerCustomData.EXCLUDE_MOVE: self._exclude_move_fn,
         }
-
-        for exclude_type in _LayerCustomData:
-            if exclude_type == _LayerCustomData.ROOT:
-                continue
-            value = custom_data.get(exclude_type.value, None)
-            if value is None:
-                value = (
-                    layer.identifier in exclude_functions[exclude_type]() if exclude_functions[exclude_type] else False
-                )
-            excludes[exclude_type] = value
+        excluded_identifiers = {
+            exclude_type: set(exclude_fn()) if exclude_fn else set()
+            for exclude_type, exclude_fn in exclude_functions.items()
+        }
 
         layers_state = _layers.get_layers(self._context).get_layers_state()
-        layer_name = _layers.LayerUtils.get_custom_layer_name(layer) if parent is not None else "Root Layer"
-        is_authoring = _layers.LayerUtils.get_edit_target(self.stage) == layer.identifier
-        layer_data = {
-            "locked": layers_state.is_layer_locked(layer.identifier),
-            "visible": not layers_state.is_layer_locally_muted(layer.identifier)
-            and not layers_state.is_layer_globally_muted(layer.identifier),
-            "savable": layers_state.is_layer_savable(layer.identifier),
-            "authoring": is_authoring,
-            "dirty": is_dirty,
-            "layer": layer,
-            "can_toggle_mute": not is_authoring and not has_authoring_child_recursive(children),
-            "exclude_remove": excludes[_LayerCustomData.EXCLUDE_REMOVE],
-            "exclude_lock": excludes[_LayerCustomData.EXCLUDE_LOCK],
-            "exclude_mute": excludes[_LayerCustomData.EXCLUDE_MUTE],
-            "exclude_edit_target": excludes[_LayerCustomData.EXCLUDE_EDIT_TARGET],
-            "exclude_add_child": excludes[_LayerCustomData.EXCLUDE_ADD_CHILD],
-            "exclude_move": excludes[_LayerCustomData.EXCLUDE_MOVE],
+        dirty_layers = set(_layers.LayerUtils.get_dirty_layers(self.stage))
+        edit_target = _layers.LayerUtils.get_edit_target(self.stage)
+        # If any of the children is the edit target, all parents cannot be muted
+        authoring_identifiers = self._get_authoring_identifiers()
+
+        layers_data = []
+        for layer in layers:
+            excludes = {}
+            custom_data = layer.customLayerData.get(_LayerCustomData.ROOT.value, {})
+            for exclude_type in exclude_functions:
+                value = custom_data.get(exclude_type.value, None)
+                if value is None:
+                    value = layer.identifier in excluded_identifiers[exclude_type]
+                excludes[exclude_type] = value
+
+            layers_data.append(
+                {
+                    "title": "Root Layer" if root else _layers.LayerUtils.get_custom_layer_name(layer),
+                    "locked": layers_state.is_layer_locked(layer.identifier),
+                    "visible": not layers_state.is_layer_locally_muted(layer.identifier)
+                    and not layers_state.is_layer_globally_muted(layer.identifier),
+                    "savable": layers_state.is_layer_savable(layer.identifier),
+                    "authoring": edit_target == layer.identifier,
+                    "dirty": layer.identifier in dirty_layers,
+                    "layer": layer,
+                    "can_toggle_mute": layer.identifier not in authoring_identifiers,
+                    "exclude_remove": excludes[_LayerCustomData.EXCLUDE_REMOVE],
+                    "exclude_lock": excludes[_LayerCustomData.EXCLUDE_LOCK],
+                    "exclude_mute": excludes[_LayerCustomData.EXCLUDE_MUTE],
+                    "exclude_edit_target": excludes[_LayerCustomData.EXCLUDE_EDIT_TARGET],
+                    "exclude_add_child": excludes[_LayerCustomData.EXCLUDE_ADD_CHILD],
+                    "exclude_move": excludes[_LayerCustomData.EXCLUDE_MOVE],
+                }
+            )
+        return layers_data
+
+    def _create_layer_items(self, layers: List[Sdf.Layer], parent: Optional[LayerItem]) -> List[LayerItem]:
+        """Create the items of the given layers. Their children will only be created when they are first accessed."""
+        items = []
+        for layer, layer_data in zip(layers, self._get_layers_data(layers, root=parent is None)):
+            item = LayerItem(layer_data.pop("title"), layer_data, parent)
+            item.set_children_loader(self._load_layer_children, has_children=bool(layer.subLayerPaths))
+            self._items_by_identifier[layer.identifier] = item
+            items.append(item)
+        return items
+
+    def _load_layer_children(self, item: LayerItem) -> List[LayerItem]:
+        return self._create_layer_items(list(self._get_sublayers(item.data["layer"])), item)
+
+    def _iter_loaded_items(self, items: Iterable[ItemBase]) -> Iterable[ItemBase]:
+        for item in items:
+            yield item
+            if item.children_loaded:
+                yield from self._iter_loaded_items(item.children)
+
+    def _update_layer_children(self, item: LayerItem) -> None:
+        """Update the children of an item after its sublayers changed, keeping the items of the unchanged sublayers"""
+        if not item.children_loaded:
+            # The children will be created from the current sublayers when accessed
+            item.set_children_loader(self._load_layer_children, has_children=bool(item.data["layer"].subLayerPaths))
+            self._item_changed(item)
+            return
+
+        existing_items = {child.data["layer"].identifier: child for child in item.children}
+        sublayers = list(self._get_sublayers(item.data["layer"]))
+        new_items = {
+            child.data["layer"].identifier: child
+            for child in self._create_layer_items(
+                [layer for layer in sublayers if layer.identifier not in existing_items], item
+            )
         }
-        return LayerItem(layer_name, layer_data, parent, children)
+        children = [existing_items.pop(layer.identifier, None) or new_items[layer.identifier] for layer in sublayers]
+
+        # Only drop the removed items from the index if the layer was not moved under another loaded item
+        for removed_item in self._iter_loaded_items(existing_items.values()):
+            identifier = removed_item.data["layer"].identifier
+            if self._items_by_identifier.get(identifier) is removed_item:
+                del self._items_by_identifier[identifier]
+
+        item.set_children(children, sort=False)
+        self._item_changed(item)
+
+    def _update_items_data(self, items: Iterable[LayerItem]) -> None:
+        """Update the state data of existing items and notify the items that changed"""
+        items = [item for item in items if item is not None]
+        if not items:
+            return
+        layers_data = self._get_layers_data([item.data["layer"] for item in items])
+        for item, layer_data in zip(items, layers_data):
+            layer_data.pop("title")
+            if all(item.data.get(key) == value for key, value in layer_data.items()):
+                continue
+            # Update the data in place to keep any other value stored in the item data
+            item.data.update(layer_data)
+            self._item_changed(item)
+
+    def _update_authoring_items(self) -> None:
+        """Update the items of the layers that changed authoring state"""
+        previous_identifiers = self._get_authoring_identifiers()
+        previous_edit_target = self._authoring_edit_target
+        self._authoring_identifiers = None
+        changed_identifiers = previous_identifiers.symmetric_difference(self._get_authoring_identifiers())
+        # The edit target can move to a parent or child layer without changing the authoring identifiers set
+        changed_identifiers.update({previous_edit_target, self._authoring_edit_target})
+        self._update_items_data(self._items_by_identifier.get(identifier) for identifier in changed_identifiers)
 
     def _on_save_layer_as_internal(self, success, error_message, layers):
         """
@@ -762,7 +892,27 @@ class LayerModel(_TreeModelBase[ItemBase]):
             _layers.LayerEventType.EDIT_TARGET_CHANGED,
         ]:
             return
-        self.refresh()
+        if not self.stage or self._ignore_refresh:
+            return
+        if not self._items:
+            self.refresh()
+            return
+        if payload.event_type == _layers.LayerEventType.EDIT_TARGET_CHANGED:
+            self._update_authoring_items()
+            return
+
+        # Refresh everything if the event doesn't say which layers changed
+        identifiers = payload.identifiers_or_spec_paths
+        if not identifiers:
+            self.refresh()
+        elif payload.event_type == _layers.LayerEventType.SUBLAYERS_CHANGED:
+            for identifier in identifiers:
+                item = self._items_by_identifier.get(identifier)
+                if item is not None:
+                    self._update_layer_children(item)
+            self._update_authoring_items()
+        else:
+            self._update_items_data(self._items_by_identifier.get(identifier) for identifier in identifiers)
 
     def __on_stage_events(self, event):
         if event.type not in [
@@ -17,6 +17,7 @@
 
 import asyncio
 import functools
+from collections import deque
 
 import carb
 from omni import kit, ui, usd
@@ -217,17 +218,23 @@ class LayerTreeWidget:
     async def __refresh_async(self):
         # Refresh the expansion states
         await kit.app.get_app().next_update_async()
-        for item in self._model.get_item_children(None, True):
-            self._layer_tree_widget.set_expanded(
-                item, self._tree_expanded.get(item.data["layer"].identifier, self._expansion_default), False
-            )
+        # Only walk through the expanded items so the children of collapsed items don't get created
+        items = deque(self._model.get_item_children(None))
+        while items:
+            item = items.popleft()
+            expanded = self._tree_expanded.get(item.data["layer"].identifier, self._expansion_default)
+            self._layer_tree_widget.set_expanded(item, expanded, False)
+            if expanded:
+                items.extend(self._model.get_item_children(item))
 
     def on_selection_changed(self, items: list[_ItemBase]):
         self._layer_tree_widget.on_selection_changed(items)
         # Update the import & create button states
         self._update_button_state(items)
         # Update the delegate gradients
-        self._delegate.on_item_selected(items, self._model.get_item_children(recursive=True), self._model)
+        self._delegate.on_item_selected(
+            items, self._model.get_item_children(recursive=True, loaded_only=True), self._model
+        )
 
     def _on_item_changed(self, _model, _item):
         if self._refresh_task:
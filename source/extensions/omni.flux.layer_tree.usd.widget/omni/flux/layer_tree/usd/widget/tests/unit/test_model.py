@@ -17,13 +17,16 @@
 
 import stat
 import tempfile
+import time
 import weakref
 from functools import partial
 from pathlib import Path
 from typing import List, Optional
 from unittest.mock import Mock, call, patch
 
+import carb
 import omni.kit
+import omni.kit.app
 import omni.kit.test
 import omni.usd
 from omni.flux.layer_tree.usd.core import LayerCustomData as _LayerCustomData
@@ -34,6 +37,9 @@ from omni.kit.usd.layers import LayerUtils
 from omni.kit.window.popup_dialog import MessageDialog
 from pxr import Sdf
 
+_BENCHMARK_MOD_COUNT = 100
+_BENCHMARK_MOD_DEPTH = 10
+
 
 class TestModel(omni.kit.test.AsyncTestCase):
 
@@ -259,6 +265,110 @@ class TestModel(omni.kit.test.AsyncTestCase):
         finally:
             layer0_path.chmod(stat.S_IWRITE)
 
+    async def test_refresh_should_create_children_lazily(self):
+        # Arrange
+        layer0 = Sdf.Layer.CreateAnonymous()
+        layer1 = Sdf.Layer.CreateAnonymous()
+
+        root = self.stage.GetRootLayer()
+        root.subLayerPaths.append(layer0.identifier)
+        layer0.subLayerPaths.append(layer1.identifier)
+
+        model = LayerModel()
+
+        # Act
+        model.refresh()
+        root_item = model.get_item_children()[0]
+        loaded_items = model.get_item_children(recursive=True, loaded_only=True)
+        layer1_item = model.get_layer_item(layer1.identifier)
+
+        # Assert
+        self.assertEqual([root_item], loaded_items)
+        self.assertTrue(root_item.children_loaded)
+        self.assertEqual(layer1, layer1_item.data["layer"])
+        self.assertEqual(layer0, layer1_item.parent.data["layer"])
+        self.assertFalse(layer1_item.children_loaded)
+        self.assertFalse(layer1_item.has_children)
+        self.assertIsNone(model.get_layer_item("missing.usda"))
+
+    async def test_layer_events_should_only_update_affected_items(self):
+        # Arrange
+        layer0 = Sdf.Layer.CreateAnonymous()
+        layer1 = Sdf.Layer.CreateAnonymous()
+        layer2 = Sdf.Layer.CreateAnonymous()
+
+        root = self.stage.GetRootLayer()
+        root.subLayerPaths.append(layer0.identifier)
+        root.subLayerPaths.append(layer1.identifier)
+
+        model = LayerModel()
+        model.enable_listeners(True)
+        root_item = model.get_item_children()[0]
+        layer0_item, layer1_item = model.get_item_children(root_item)
+        layer0_item.data["package"] = True
+
+        # Act
+        model.set_lock_layer(layer0_item, True)
+        layer1.subLayerPaths.append(layer2.identifier)
+        for _ in range(3):
+            await omni.kit.app.get_app().next_update_async()
+
+        # Assert
+        self.assertEqual([layer0_item, layer1_item], model.get_item_children(root_item))
+        self.assertTrue(layer0_item.data["locked"])
+        self.assertTrue(layer0_item.data["package"])
+        self.assertEqual([layer2], [i.data["layer"] for i in model.get_item_children(layer1_item)])
+
+        model.enable_listeners(False)
+
+    async def test_edit_target_changed_parent_to_child_should_update_authoring_items(self):
+        await self.__run_edit_target_changed(child_to_parent=False)
+
+    async def test_edit_target_changed_child_to_parent_should_update_authoring_items(self):
+        await self.__run_edit_target_changed(child_to_parent=True)
+
+    async def test_benchmark_refresh_deep_sublayer_stack(self):
+        # Arrange
+        root = self.stage.GetRootLayer()
+        layers = []
+        with Sdf.ChangeBlock():
+            for _ in range(_BENCHMARK_MOD_COUNT):
+                parent = root
+                for _ in range(_BENCHMARK_MOD_DEPTH):
+                    layer = Sdf.Layer.CreateAnonymous()
+                    parent.subLayerPaths.append(layer.identifier)
+                    layers.append(layer)
+                    parent = layer
+
+        model = LayerModel()
+
+        # Act
+        start = time.perf_counter()
+        model.refresh()
+        first_level_items = model.get_item_children(model.get_item_children()[0])
+        loaded_first_level_items = [item for item in first_level_items if item.children_loaded]
+        lazy_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        model.refresh()
+        items = model.get_item_children(recursive=True)
+        full_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = [model.get_layer_item(layer.identifier) for layer in layers]
+        lookup_duration = time.perf_counter() - start
+
+        carb.log_info(
+            f"Layer tree of {len(layers)} layers: first level {lazy_duration:.3f}s, full tree {full_duration:.3f}s, "
+            f"indexed lookup {lookup_duration:.4f}s"
+        )
+
+        # Assert
+        self.assertEqual(_BENCHMARK_MOD_COUNT, len(first_level_items))
+        self.assertListEqual([], loaded_first_level_items)
+        self.assertEqual(len(layers) + 1, len(items))
+        self.assertEqual(layers, [item.data["layer"] for item in found])
+
     async def test_delete_layer_no_parent_quick_return(self):
         # Arrange
         root_item = LayerItem("root")
@@ -996,3 +1106,34 @@ class TestModel(omni.kit.test.AsyncTestCase):
 
         # Assert
         self.assertEqual(expected_result, result)
+
+    async def __run_edit_target_changed(self, child_to_parent: bool):
+        # Arrange
+        parent_layer = Sdf.Layer.CreateAnonymous()
+        child_layer = Sdf.Layer.CreateAnonymous()
+
+        root = self.stage.GetRootLayer()
+        root.subLayerPaths.append(parent_layer.identifier)
+        parent_layer.subLayerPaths.append(child_layer.identifier)
+
+        previous_layer, new_layer = (child_layer, parent_layer) if child_to_parent else (parent_layer, child_layer)
+        LayerUtils.set_edit_target(self.stage, previous_layer.identifier)
+
+        model = LayerModel()
+        model.enable_listeners(True)
+        root_item = model.get_item_children()[0]
+        parent_item = model.get_item_children(root_item)[0]
+        child_item = model.get_item_children(parent_item)[0]
+        items = {parent_layer.identifier: parent_item, child_layer.identifier: child_item}
+
+        # Act
+        LayerUtils.set_edit_target(self.stage, new_layer.identifier)
+        for _ in range(3):
+            await omni.kit.app.get_app().next_update_async()
+
+        # Assert
+        self.assertFalse(root_item.data["authoring"])
+        self.assertFalse(items[previous_layer.identifier].data["authoring"])
+        self.assertTrue(items[new_layer.identifier].data["authoring"])
+
+        model.enable_listeners(False)
@@ -0,0 +1,174 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["MDLParameterCache", "MDLParameterDescriptor", "get_mdl_parameter_cache_instance"]
+
+import dataclasses
+from typing import Dict, Optional, Tuple
+
+import omni.client
+from pxr import Sdf, Usd, UsdShade
+
+# (MDL path, sub-identifier, file modified time)
+MDLKey = Tuple[str, str, str]
+
+_INSTANCE = None
+
+
+@dataclasses.dataclass(frozen=True)
+class MDLParameterDescriptor:
+    """The part of a shader parameter item that only depends on the MDL definition of the parameter"""
+
+    display_name: Optional[str]
+    description: str
+    display_group: str
+    # The options of a list parameter and the default option, None for any other parameter
+    options: Optional[Tuple[str, ...]]
+    default_option: Optional[str]
+    has_color_space: bool
+
+    @classmethod
+    def from_attribute(cls, attr: Usd.Attribute) -> "MDLParameterDescriptor":
+        shade_input = UsdShade.Input(attr)
+        description = "No description"
+        metadata = attr.GetAllMetadata()
+        if shade_input and metadata.get("documentation"):
+            description = metadata.get("documentation", description)
+
+        options = None
+        default_option = None
+        if shade_input and shade_input.HasRenderType() and shade_input.HasSdrMetadataByKey("options"):
+            # This is not the standard USD way to get default. The standard way is Sdr. But out shader compiler
+            # produces this metadata in the session layer, so it will be working for MDL
+            default_value = attr.GetCustomData().get("default", 0)
+            options = tuple(option.split(":")[0] for option in shade_input.GetSdrMetadataByKey("options").split("|"))
+            default_option = options[default_value]
+
+        return cls(
+            display_name=attr.GetMetadata(Sdf.PropertySpec.DisplayNameKey) or None,
+            description=description,
+            display_group=attr.GetDisplayGroup(),
+            options=options,
+            default_option=default_option,
+            has_color_space=bool(attr.GetMetadata("colorSpace")),
+        )
+
+
+class MDLParameterCache:
+    """
+    Cache the parameter descriptors of the MDL shaders, keyed by (MDL path, sub-identifier, file modified time), and
+    the shader prims of a stage whose MDL parameters were already loaded.
+
+    Editing the MDL file changes its modified time, so the parameters are loaded again.
+    """
+
+    def __init__(self):
+        # {MDL key: {attribute name: descriptor}}
+        self._descriptors: Dict[MDLKey, Dict[str, MDLParameterDescriptor]] = {}
+        # {(MDL path, file modified time): sub-identifier annotations}
+        self._annotations: Dict[Tuple[str, str], Dict] = {}
+        # {shader prim path: MDL key} for the prims of the stage with the `_stage_id` session layer
+        self._loaded_shaders: Dict[Sdf.Path, MDLKey] = {}
+        self._stage_id: Optional[str] = None
+
+    @staticmethod
+    async def get_key_async(
+        mdl_file: str, sub_identifier: Optional[str], modified_times: Optional[Dict[str, str]] = None
+    ) -> MDLKey:
+        """
+        Args:
+            mdl_file: the resolved MDL path
+            sub_identifier: the MDL sub-identifier of the shader
+            modified_times: {MDL path: file modified time} already read during the current refresh, updated with the
+                            modified time of the MDL file if it is not in it yet
+
+        Returns:
+            The cache key of the MDL shader
+        """
+        modified_time = modified_times.get(mdl_file) if modified_times is not None else None
+        if modified_time is None:
+            result, entry = await omni.client.stat_async(mdl_file)
+            modified_time = str(entry.modified_time) if result == omni.client.Result.OK else ""
+            if modified_times is not None:
+                modified_times[mdl_file] = modified_time
+        return mdl_file, sub_identifier or "", modified_time
+
+    def get_annotations(self, key: MDLKey) -> Optional[Dict]:
+        return self._annotations.get((key[0], key[2]))
+
+    def set_annotations(self, key: MDLKey, annotations: Dict):
+        self._annotations[(key[0], key[2])] = annotations
+
+    def get_descriptor(self, key: Optional[MDLKey], attr: Usd.Attribute) -> MDLParameterDescriptor:
+        """
+        Get the descriptor of a shader parameter, only read from the attribute the first time
+
+        Args:
+            key: the key of the MDL shader of the attribute. None to not cache the descriptor.
+            attr: the shader attribute
+
+        Returns:
+            The parameter descriptor
+        """
+        if key is None:
+            return MDLParameterDescriptor.from_attribute(attr)
+        descriptors = self._descriptors.setdefault(key, {})
+        name = attr.GetName()
+        descriptor = descriptors.get(name)
+        if descriptor is None:
+            descriptor = MDLParameterDescriptor.from_attribute(attr)
+            descriptors[name] = descriptor
+        return descriptor
+
+    def is_loaded(self, shader_prim: Usd.Prim, key: MDLKey) -> bool:
+        """
+        Args:
+            shader_prim: the shader prim
+            key: the current key of the MDL shader of the prim
+
+        Returns:
+            True if the MDL parameters of the prim were loaded for the same MDL and still exist
+        """
+        if self._get_stage_id(shader_prim) != self._stage_id or self._loaded_shaders.get(shader_prim.GetPath()) != key:
+            return False
+        # The loaded parameters may have been removed, by an undo for example
+        return all(shader_prim.HasAttribute(name) for name in self._descriptors.get(key, {}))
+
+    def set_loaded(self, shader_prim: Usd.Prim, key: MDLKey):
+        stage_id = self._get_stage_id(shader_prim)
+        if self._stage_id != stage_id:
+            self._stage_id = stage_id
+            self._loaded_shaders = {}
+        self._loaded_shaders[shader_prim.GetPath()] = key
+
+    @staticmethod
+    def _get_stage_id(prim: Usd.Prim) -> str:
+        # The anonymous session layer is unique to the stage, and doesn't keep the stage alive
+        return prim.GetStage().GetSessionLayer().identifier
+
+    def clear(self):
+        self._descriptors = {}
+        self._annotations = {}
+        self._loaded_shaders = {}
+        self._stage_id = None
+
+
+def get_mdl_parameter_cache_instance() -> MDLParameterCache:
+    global _INSTANCE
+    if _INSTANCE is None:
+        _INSTANCE = MDLParameterCache()
+    return _INSTANCE
@@ -16,8 +16,10 @@
 """
 
 import asyncio
+import time
 from typing import Dict, List, Optional, Union
 
+import carb
 import omni.kit
 import omni.kit.material.library
 import omni.ui as ui
@@ -38,6 +40,7 @@ from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
 from pxr import Sdf, UsdShade, Vt
 
 from .lookup_table import LOOKUP_TABLE
+from .mdl_parameter_cache import get_mdl_parameter_cache_instance as _get_mdl_parameter_cache_instance
 
 
 @omni.usd.handle_exception
@@ -88,6 +91,8 @@ class MaterialPropertyWidget:
             "_tree_column_widths": None,
             "_lookup_table": None,
             "_paths": None,
+            "_mdl_parameter_cache": None,
+            "_refresh_start": None,
         }
         for attr, value in self._default_attr.items():
             setattr(self, attr, value)
@@ -104,6 +109,9 @@ class MaterialPropertyWidget:
         self._lookup_table = lookup_table or LOOKUP_TABLE
 
         self._create_color_space_attributes = create_color_space_attributes
+        self._mdl_parameter_cache = _get_mdl_parameter_cache_instance()
+        # Time between the last refresh request and the refreshed items, in seconds
+        self.last_refresh_duration = None
 
         self.__create_ui(field_builders=field_builders)
 
@@ -143,6 +151,8 @@ class MaterialPropertyWidget:
         Args:
             paths: the USD prim paths to use
         """
+        if self._refresh_start is None:
+            self._refresh_start = time.perf_counter()
         asyncio.ensure_future(self._deferred_refresh(paths))
 
     @omni.usd.handle_exception
@@ -155,18 +165,17 @@ class MaterialPropertyWidget:
         """
         if paths is not None:
             self._paths = paths
+        if self._refresh_start is None:
+            self._refresh_start = time.perf_counter()
 
-        def loaded_mdl_subids(mtl_list, filename):
-            mdl_dict = {}
-            for mtl in mtl_list:
-                mdl_dict[mtl.name] = mtl.annotations
-
-            material_annotations[filename] = mdl_dict
+        def loaded_mdl_subids(mtl_list, key):
+            self._mdl_parameter_cache.set_annotations(key, {mtl.name: mtl.annotations for mtl in mtl_list})
 
         # Wait 1 frame to make sure the USD it up-to-date
         await omni.kit.app.get_app().next_update_async()
 
         if not self._root_frame or not self._root_frame.visible:
+            self._refresh_start = None
             return
 
         if self.__usd_listener_instance and self._property_model:  # noqa PLE0203
@@ -181,9 +190,12 @@ class MaterialPropertyWidget:
 
             shader_paths = []
             mtl_paths = []
-            material_annotations = {}
             # relative attr name to item
             attr_added: dict[str, list[_USDAttributeItem]] = {}
+            # {shader attribute path: MDL key} to reuse the parameter descriptors of the shaders using the same MDL
+            attr_mdl_keys: dict[Sdf.Path, tuple[str, str, str]] = {}
+            # {MDL path: file modified time} to only read the modified time of each MDL file once per refresh
+            mdl_modified_times: dict[str, str] = {}
 
             with _USDDisableAllListenersBlock(self.__usd_listener_instance):
                 for prim in prims:
@@ -201,12 +213,17 @@ class MaterialPropertyWidget:
                         shader = UsdShade.Shader(shader_prim if shader_prim else prim)
                         asset = shader.GetSourceAsset("mdl") if shader else None
                         mdl_file = asset.resolvedPath if asset else None
+                        mdl_key = None
                         if mdl_file:
                             mtl_paths.append(mdl_file)
-                            await omni.kit.material.library.get_subidentifier_from_mdl(
-                                mdl_file=mdl_file,
-                                on_complete_fn=lambda l, f=mdl_file: loaded_mdl_subids(mtl_list=l, filename=f),
+                            mdl_key = await self._mdl_parameter_cache.get_key_async(
+                                mdl_file, shader.GetSourceAssetSubIdentifier("mdl"), mdl_modified_times
                             )
+                            if self._mdl_parameter_cache.get_annotations(mdl_key) is None:
+                                await omni.kit.material.library.get_subidentifier_from_mdl(
+                                    mdl_file=mdl_file,
+                                    on_complete_fn=lambda l, k=mdl_key: loaded_mdl_subids(mtl_list=l, key=k),
+                                )
 
                         # load the mdl parameters
                         ignore_list = [
@@ -220,7 +237,11 @@ class MaterialPropertyWidget:
                         ]
 
                         # TODO Bug OM-76692 - Causes "reorder properties" attribute to be added on viewport selection
-                        await _load_mdl_parameters_for_prim_async(self._context, shader_prim, recreate=True)
+                        # Only load the parameters again if the MDL of the shader changed since they were loaded
+                        if mdl_key is None or not self._mdl_parameter_cache.is_loaded(shader_prim, mdl_key):
+                            await _load_mdl_parameters_for_prim_async(self._context, shader_prim, recreate=True)
+                            if mdl_key is not None:
+                                self._mdl_parameter_cache.set_loaded(shader_prim, mdl_key)
 
                         # get child attributes
                         for shader_attr in shader_prim.GetAttributes():
@@ -243,6 +264,8 @@ class MaterialPropertyWidget:
 
                             if not any(name in shader_attr.GetName() for name in ignore_list):
                                 attr_added.setdefault(attr_name, []).append(shader_attr)
+                                if mdl_key is not None:
+                                    attr_mdl_keys[shader_attr.GetPath()] = mdl_key
 
                         # add source color space
                         if shader.GetShaderId() == "UsdUVTexture":
@@ -276,37 +299,22 @@ class MaterialPropertyWidget:
                     attr_name = attr.GetName()
                     display_attr_names = [attr_name]
                     attribute_paths = [attr_.GetPath() for attr_ in attrs]
-                    display_name = attr.GetMetadata(Sdf.PropertySpec.DisplayNameKey)
-                    if display_name:
-                        display_attr_names = [display_name]
+                    # Materials using the same MDL share the descriptors: only the attribute paths are bound again
+                    descriptor = self._mdl_parameter_cache.get_descriptor(attr_mdl_keys.get(attr.GetPath()), attr)
+                    if descriptor.display_name:
+                        display_attr_names = [descriptor.display_name]
                     if attr_name in self._lookup_table:
                         display_attr_names = [self._lookup_table[attr_name]["name"]]
 
-                    # description
-                    shade_input = UsdShade.Input(attr)
-                    description = "No description"
-                    metadata = attr.GetAllMetadata()
-                    if shade_input and metadata.get("documentation"):
-                        description = metadata.get("documentation", description)
-                    descriptions = [description]
-
-                    if shade_input and shade_input.HasRenderType() and shade_input.HasSdrMetadataByKey("options"):
-                        options = shade_input.GetSdrMetadataByKey("options").split("|")
-
-                        # This is not the standard USD way to get default. The
-                        # standard way is Sdr. But out shader compiler produces
-                        # this metadata in the session layer, so it will be
-                        # working for MDL
-                        custom = attr.GetCustomData()
-                        default_value = custom.get("default", 0)
-
-                        str_options = [option.split(":")[0] for option in options]
+                    descriptions = [descriptor.description]
+
+                    if descriptor.options is not None:
                         attr_item = _USDAttrListItem(
                             self._context_name,
                             attribute_paths,
                             None,
-                            str_options[default_value],
-                            str_options,
+                            descriptor.default_option,
+                            list(descriptor.options),
                             display_attr_names=display_attr_names,
                             display_attr_names_tooltip=descriptions,
                         )
@@ -319,9 +327,8 @@ class MaterialPropertyWidget:
                         attr_item.set_display_attr_names(display_attr_names)
                         attr_item.set_display_attr_names_tooltip(descriptions)
 
-                    attr_display_group = attr.GetDisplayGroup()
-                    if attr_display_group:
-                        group_name = attr_display_group
+                    if descriptor.display_group:
+                        group_name = descriptor.display_group
                     # if this is in the lookup table, we override
                     elif attr_name in self._lookup_table:
                         group_name = self._lookup_table[attr_name]["group"]
@@ -335,8 +342,7 @@ class MaterialPropertyWidget:
                     # texture attribute will get color space attribute
                     color_space_item = None
                     if self._create_color_space_attributes:
-                        color_space_metadata = attr.GetMetadata("colorSpace")
-                        if color_space_metadata:
+                        if descriptor.has_color_space:
                             # this is a texture
                             color_space_item = _USDMetadataListItem(
                                 self._context_name,
@@ -366,6 +372,14 @@ class MaterialPropertyWidget:
         self._property_model.set_prim_paths(valid_paths)
         self._property_model.set_items(items)
         self.__usd_listener_instance.add_model(self._property_model)
+
+        if self._refresh_start is not None:
+            self.last_refresh_duration = time.perf_counter() - self._refresh_start
+            self._refresh_start = None
+            carb.log_verbose(
+                f"[omni.flux.properties_pane.materials.usd.widget] Refreshed {len(self._paths)} materials in "
+                f"{self.last_refresh_duration:.4f}s"
+            )
         self._refresh_done()
 
     @property
@@ -1,3 +1,4 @@
-__all__ = ("TestMaterialPropertyWidget",)
+__all__ = ("TestMaterialPropertyWidget", "TestMDLParameterCache")
 
 from .e2e import TestMaterialPropertyWidget
+from .unit import TestMDLParameterCache
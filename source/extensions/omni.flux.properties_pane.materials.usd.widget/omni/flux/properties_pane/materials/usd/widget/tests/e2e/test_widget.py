@@ -5,6 +5,7 @@ import functools
 import os
 import pathlib
 import uuid
+from unittest.mock import patch
 
 import carb.input
 import omni.kit.app
@@ -14,6 +15,7 @@ import omni.kit.ui_test
 import omni.ui as ui
 import omni.usd
 from omni.flux.properties_pane.materials.usd.widget import MaterialPropertyWidget
+from omni.flux.properties_pane.materials.usd.widget import setup_ui as _setup_ui
 from omni.flux.utils.common.omni_url import OmniUrl
 from pxr import UsdShade
 
@@ -148,3 +150,40 @@ class TestMaterialPropertyWidget(omni.kit.test.AsyncTestCase):
             self.assertTrue(len(window_refs) == 1, "Preview window not found")
             for window_ref in window_refs:
                 window_ref.widget.destroy()
+
+    async def test_refresh_should_reuse_loaded_mdl_parameters(self):
+        # Arrange
+        stage = omni.usd.get_context().get_stage()
+        mat_path = stage.GetPrimAtPath("/World/Looks/Paint_Matte").GetPath()
+        _setup_ui._get_mdl_parameter_cache_instance().clear()  # noqa PLW0212
+
+        async with AsyncTestMeterialPropertyHelper() as helper:
+            refresh_done = asyncio.Event()
+            _sub = helper.property_widget.subscribe_refresh_done(refresh_done.set)  # noqa F841
+
+            with patch.object(
+                _setup_ui,
+                "_load_mdl_parameters_for_prim_async",
+                wraps=_setup_ui._load_mdl_parameters_for_prim_async,  # noqa PLW0212
+            ) as load_mock:
+                # Act
+                helper.property_widget.refresh([mat_path])
+                await refresh_done.wait()
+                first_items = helper.property_widget.property_model.get_all_items()
+                first_duration = helper.property_widget.last_refresh_duration
+
+                refresh_done.clear()
+                helper.property_widget.refresh([mat_path])
+                await refresh_done.wait()
+                second_items = helper.property_widget.property_model.get_all_items()
+                second_duration = helper.property_widget.last_refresh_duration
+
+            carb.log_info(
+                f"Material properties time to interactive: first {first_duration:.4f}s, then {second_duration:.4f}s"
+            )
+
+        # Assert
+        self.assertEqual(load_mock.call_count, 1)
+        self.assertEqual(len(first_items), len(second_items))
+        self.assertIsNotNone(first_duration)
+        self.assertIsNotNone(second_duration)
@@ -0,0 +1,3 @@
+__all__ = ("TestMDLParameterCache",)
+
+from .test_mdl_parameter_cache import TestMDLParameterCache
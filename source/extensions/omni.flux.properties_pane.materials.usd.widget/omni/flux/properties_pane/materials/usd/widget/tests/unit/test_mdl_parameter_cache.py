@@ -0,0 +1,65 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import omni.client
+import omni.kit.test
+from omni.flux.properties_pane.materials.usd.widget.mdl_parameter_cache import MDLParameterCache
+
+
+class TestMDLParameterCache(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.mdl_file = str(Path(self.temp_dir.name) / "Test.mdl")
+        Path(self.mdl_file).write_text("mdl 1.6;\n", encoding="utf8")
+
+    # After running each test
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+        self.temp_dir = None
+
+    async def test_get_key_async_should_only_stat_each_file_once_per_refresh(self):
+        # Arrange
+        modified_times = {}
+
+        with patch.object(omni.client, "stat_async", wraps=omni.client.stat_async) as stat_mock:
+            # Act
+            key_0 = await MDLParameterCache.get_key_async(self.mdl_file, "Test_0", modified_times)
+            key_1 = await MDLParameterCache.get_key_async(self.mdl_file, None, modified_times)
+            refresh_count = stat_mock.call_count
+            await MDLParameterCache.get_key_async(self.mdl_file, "Test_0", {})
+
+        # Assert
+        self.assertEqual(1, refresh_count)
+        self.assertEqual(2, stat_mock.call_count)
+        self.assertEqual((self.mdl_file, "Test_0", modified_times[self.mdl_file]), key_0)
+        self.assertEqual((self.mdl_file, "", modified_times[self.mdl_file]), key_1)
+        self.assertNotEqual("", modified_times[self.mdl_file])
+
+    async def test_get_key_async_missing_file_should_have_no_modified_time(self):
+        # Arrange
+        missing_file = str(Path(self.temp_dir.name) / "Missing.mdl")
+
+        # Act
+        key = await MDLParameterCache.get_key_async(missing_file, "Missing")
+
+        # Assert
+        self.assertEqual((missing_file, "Missing", ""), key)
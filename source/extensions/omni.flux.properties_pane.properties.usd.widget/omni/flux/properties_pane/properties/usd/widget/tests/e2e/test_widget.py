@@ -16,6 +16,9 @@
 * limitations under the License.
 """
 
+import time
+
+import carb
 import carb.input
 import omni.kit.clipboard
 import omni.kit.undo
@@ -25,13 +28,15 @@ from omni.flux.properties_pane.properties.usd.widget import PropertyWidget as _P
 from omni.kit import ui_test
 from omni.kit.test.async_unittest import AsyncTestCase
 from omni.kit.test_suite.helpers import get_test_data_path, open_stage, wait_stage_loading
-from pxr import Gf
+from pxr import Gf, Sdf, UsdGeom
 
 WINDOW_HEIGHT = 1000
 WINDOW_WIDTH = 1436
 
 _CONTEXT_NAME = ""
 
+_BENCHMARK_PRIM_COUNTS = (1, 100, 1_000)
+
 
 class TestUSDPropertiesWidget(AsyncTestCase):
     # Before running each test
@@ -158,3 +163,56 @@ class TestUSDPropertiesWidget(AsyncTestCase):
             self.assertEqual(xf_tr.Get(), Gf.Vec3d(2.2, 0.0, 0.0))
 
         await self.__destroy(_window, _widget)
+
+    async def test_benchmark_notice_to_ui_latency(self):
+        """
+        Measure the time between a USD change on the selected prims and the update of the item showing it
+        """
+        # setup
+        _window, _widget = await self.__setup_widget()  # Keep in memory during test
+        stage = omni.usd.get_context().get_stage()
+        with Sdf.ChangeBlock():
+            for index in range(max(_BENCHMARK_PRIM_COUNTS)):
+                UsdGeom.Cube.Define(stage, f"/Benchmark/cube_{index}")
+
+        results = {}
+        for prim_count in _BENCHMARK_PRIM_COUNTS:
+            prim_paths = [f"/Benchmark/cube_{index}" for index in range(prim_count)]
+            _widget.refresh(prim_paths)
+            await omni.kit.ui_test.wait_n_updates(5)
+
+            model = _widget.property_model
+            double_sided_item = next(
+                item
+                for item in model.get_all_items()
+                if getattr(item, "attribute_paths", None)
+                and item.attribute_paths[0] == Sdf.Path(f"{prim_paths[0]}.doubleSided")
+            )
+            value = not double_sided_item.value_models[0].get_value_as_bool()
+
+            # Changes are forwarded right away to the items showing the changed attributes
+            start = time.perf_counter()
+            with Sdf.ChangeBlock():
+                for prim_path in prim_paths:
+                    stage.GetPrimAtPath(prim_path).GetAttribute("doubleSided").Set(value)
+            latency = time.perf_counter() - start
+
+            start = time.perf_counter()
+            model.refresh()
+            full_refresh_duration = time.perf_counter() - start
+
+            results[prim_count] = (latency, full_refresh_duration, value, double_sided_item.value_models[0].get_value())
+            await omni.kit.ui_test.wait_n_updates(2)
+
+        for prim_count, (latency, full_refresh_duration, _, _) in results.items():
+            carb.log_info(
+                f"Property widget with {prim_count} selected prims: notice to UI {latency:.4f}s, "
+                f"full refresh {full_refresh_duration:.4f}s"
+            )
+
+        # we check that the item value was updated before the next frame
+        for _, _, expected_value, displayed_value in results.values():
+            self.assertEqual(expected_value, displayed_value)
+        self.assertLess(results[max(_BENCHMARK_PRIM_COUNTS)][0], results[max(_BENCHMARK_PRIM_COUNTS)][1])
+
+        await self.__destroy(_window, _widget)
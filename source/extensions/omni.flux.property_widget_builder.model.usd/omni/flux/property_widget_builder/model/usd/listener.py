@@ -15,11 +15,14 @@
 * limitations under the License.
 """
 
+import asyncio
 import typing
-from typing import Dict, List
+from typing import Dict, List, Set
 
+import omni.kit.app
+import omni.usd
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
-from pxr import Tf, Usd
+from pxr import Sdf, Tf, Usd
 
 if typing.TYPE_CHECKING:
     from .model import USDModel as _USDModel
@@ -56,13 +59,27 @@ class DisableAllListenersBlock:
 
 class USDListener:
     def __init__(self):
-        """USD listener for the property widget"""
-        self._default_attr = {"_listeners": None, "_models": None, "_tmp_models": None}
+        """
+        USD listener for the property widget.
+
+        The first change of a frame is forwarded right away to the items showing the changed attributes. The other
+        changes of the same frame are coalesced and forwarded on the next frame.
+        """
+        self._default_attr = {
+            "_listeners": None,
+            "_models": None,
+            "_tmp_models": None,
+            "_pending_attribute_paths": None,
+            "_throttle_task": None,
+        }
         for attr, value in self._default_attr.items():
             setattr(self, attr, value)
         self._models: List["_USDModel"] = []
         self._tmp_models: List["_USDModel"] = []
         self._listeners: Dict[Usd.Stage, Tf.Listener] = {}
+        # {model: changed attribute paths}
+        self._pending_attribute_paths: Dict["_USDModel", Set[Sdf.Path]] = {}
+        self._throttle_task = None
 
     def tmp_enable_all_listeners(self):
         for model in self._tmp_models:
@@ -86,30 +103,50 @@ class USDListener:
             self._listeners.pop(stage)
 
     def _on_usd_changed(self, notice, stage):
+        property_paths = [
+            path
+            for path in [*notice.GetChangedInfoOnlyPaths(), *notice.GetResyncedPaths()]
+            if path.IsPropertyPath()
+        ]
+        if not property_paths:
+            return
+
         for model in self._models:
+            # The edit check is done on notice, the model is not editing anymore when the changes are forwarded
             if model.supress_usd_events_during_widget_edit:
                 continue
 
             if stage != model.stage:
                 continue
 
-            should_refresh = False
-            for resynced_path in [*notice.GetChangedInfoOnlyPaths(), *notice.GetResyncedPaths()]:
-                if "." not in str(resynced_path):  # not an attribute
-                    continue
-                attr = stage.GetPropertyAtPath(resynced_path)
-                if not attr.IsValid():
-                    continue
-                prim = attr.GetPrim()
-                if not prim.IsValid():
-                    continue
-                if prim.GetPath() not in model.prim_paths:
-                    continue
-                should_refresh = True
-                break
-
-            if should_refresh:
-                model.refresh()
+            prim_paths = model.prim_path_set
+            changed_paths = {path for path in property_paths if path.GetPrimPath() in prim_paths}
+            if changed_paths:
+                self._pending_attribute_paths.setdefault(model, set()).update(changed_paths)
+
+        if not self._pending_attribute_paths:
+            return
+        if self._throttle_task is None:
+            self._refresh_pending_attributes()
+            self._throttle_task = asyncio.ensure_future(self._throttle_refresh_async())
+
+    @omni.usd.handle_exception
+    async def _throttle_refresh_async(self):
+        await omni.kit.app.get_app().next_update_async()
+        self._throttle_task = None
+        self._refresh_pending_attributes()
+
+    def _refresh_pending_attributes(self):
+        pending_attribute_paths = self._pending_attribute_paths
+        self._pending_attribute_paths = {}
+        for model, attribute_paths in pending_attribute_paths.items():
+            # The model could have been removed since the changes were received
+            if model not in self._models:
+                continue
+            stage = model.stage
+            if not stage:
+                continue
+            model.refresh_attributes([path for path in attribute_paths if stage.GetPropertyAtPath(path).IsValid()])
 
     def refresh_all(self):
         """Refresh all attributes"""
@@ -146,5 +183,7 @@ class USDListener:
     def destroy(self):
         for listener in self._listeners.values():
             listener.Revoke()
+        if self._throttle_task:
+            self._throttle_task.cancel()
 
         _reset_default_attrs(self)
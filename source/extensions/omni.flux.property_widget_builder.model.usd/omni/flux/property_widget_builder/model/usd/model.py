@@ -17,7 +17,7 @@
 
 import abc
 import typing
-from typing import List, Union
+from typing import Dict, Iterable, List, Set, Union
 
 import omni.usd
 from omni.flux.property_widget_builder.widget import Model as _Model
@@ -48,6 +48,11 @@ class USDModel(_Model):
         self._context_name = context_name
         self._context = omni.usd.get_context(self._context_name)
         self._prim_paths = []
+        self._prim_path_set: Set[Sdf.Path] = set()
+        # {attribute path: items showing the attribute}
+        self._attribute_items: Dict[Sdf.Path, List[_USDAttributeItem]] = {}
+        # Items that don't expose the attributes they show
+        self._has_unindexed_items = False
         self._subscriptions = []
         self.supress_usd_events_during_widget_edit = False
 
@@ -67,6 +72,9 @@ class USDModel(_Model):
                 "_context_name": None,
                 "_context": None,
                 "_prim_paths": None,
+                "_prim_path_set": None,
+                "_attribute_items": None,
+                "_has_unindexed_items": None,
                 "_subscriptions": None,
                 "_value_changed_callbacks": None,
             }
@@ -88,9 +96,15 @@ class USDModel(_Model):
         """The current used attribute paths"""
         return self._prim_paths
 
+    @property
+    def prim_path_set(self) -> Set[Sdf.Path]:
+        """The current used prim paths, as a set for fast lookups"""
+        return self._prim_path_set
+
     def set_prim_paths(self, value: List[Sdf.Path]):
         """The current used attribute paths"""
         self._prim_paths = value
+        self._prim_path_set = {Sdf.Path(str(path)) for path in value}
 
     @property
     def default_attrs(self):
@@ -122,12 +136,45 @@ class USDModel(_Model):
             for child in _item.children:
                 add_listeners(child)
 
+        def index_attributes(_item):
+            attribute_paths = getattr(_item, "attribute_paths", None)
+            if attribute_paths is not None:
+                for attribute_path in attribute_paths:
+                    self._attribute_items.setdefault(Sdf.Path(str(attribute_path)), []).append(_item)
+            elif not _item.can_have_children:
+                self._has_unindexed_items = True
+            for child in _item.children:
+                index_attributes(child)
+
         self._subscriptions.clear()
         self._value_changed_callbacks.clear()
+        self._attribute_items = {}
+        self._has_unindexed_items = False
         for item in items:
             add_listeners(item)
+            index_attributes(item)
         super().set_items(items)
 
+    def refresh_attributes(self, attribute_paths: Iterable[Sdf.Path]):
+        """
+        Refresh the items showing the given attributes only
+
+        Args:
+            attribute_paths: the paths of the attributes that changed
+        """
+        if self._has_unindexed_items:
+            self.refresh()
+            return
+
+        # Use a dict as an ordered set of unique items
+        items = {}
+        for attribute_path in attribute_paths:
+            for item in self._attribute_items.get(attribute_path, []):
+                items[id(item)] = item
+        for item in items.values():
+            item.refresh()
+            self._item_changed(item)
+
     def _on_item_model_begin_edit(self, _):
         self.supress_usd_events_during_widget_edit = True
 
@@ -20,8 +20,9 @@ __all__ = [
     "get_usd_listener_instance",
     "UsdSelectionHistoryModel",
     "UsdSelectionHistoryItem",
+    "SelectionHistoryPersistence",
 ]
 
 from .extension import UsdSelectionHistoryUSDWidgetExtension, get_usd_listener_instance
 from .item_model import SelectionHistoryItem as UsdSelectionHistoryItem
-from .model import UsdSelectionHistoryModel
+from .model import SelectionHistoryPersistence, UsdSelectionHistoryModel
@@ -16,6 +16,7 @@
 """
 
 import typing
+from typing import Optional
 
 from omni.flux.selection_history_tree.widget import SelectionHistoryItem as _SelectionHistoryItem
 
@@ -24,9 +25,41 @@ if typing.TYPE_CHECKING:
 
 
 class SelectionHistoryItem(_SelectionHistoryItem):
-    def __init__(self, title: str, data: "Usd.Prim" = None, tooltip: str = ""):
+    def __init__(
+        self,
+        title: str,
+        data: "Usd.Prim" = None,
+        tooltip: str = "",
+        stage: Optional["Usd.Stage"] = None,
+        path: Optional[str] = None,
+    ):
+        """
+        Args:
+            title: the title of the item
+            data: the prim of the item
+            tooltip: the tooltip of the item
+            stage: the stage to get the prim from when it is not given, the first time the prim is needed
+            path: the path of the prim to get from the stage
+        """
         super().__init__(title, data=data, tooltip=tooltip)
+        self._stage = stage
+        self._path = path
+
+    @property
+    def path(self) -> str:
+        """The path of the prim, without getting the prim from the stage"""
+        if self._path is None:
+            self._path = str(self._data.GetPath())
+        return self._path
+
+    @property
+    def data(self) -> "Usd.Prim":
+        """The prim of the item. Items loaded from a previous session get their prim lazily."""
+        if self._data is None and self._stage is not None:
+            self._data = self._stage.GetPrimAtPath(self._path)
+            self._stage = None
+        return self._data
 
     def is_valid(self) -> bool:
         """Return True is the item is valid or not"""
-        return self._data.IsValid()
+        return self.data.IsValid()
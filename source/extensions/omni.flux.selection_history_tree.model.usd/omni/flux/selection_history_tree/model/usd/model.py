@@ -15,22 +15,46 @@
 * limitations under the License.
 """
 
+import asyncio
+import os
+from enum import Enum
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 
+import carb
+import carb.settings
+import omni.kit.app
 import omni.usd
 from omni.flux.selection_history_tree.widget import SelectionHistoryModel as _SelectionHistoryModel
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
+from omni.flux.utils.common.path_utils import read_json_file as _read_json_file
+from omni.flux.utils.common.path_utils import write_json_file as _write_json_file
 
 from .extension import get_usd_listener_instance as _get_usd_listener_instance
 from .item_model import SelectionHistoryItem as _SelectionHistoryItem
 
+CARB_SETTING_PERSISTENCE = "/exts/omni.flux.selection_history_tree.model.usd/persistence"
+CARB_SETTING_PERSIST_DELAY_FRAMES = "/exts/omni.flux.selection_history_tree.model.usd/persist_delay_frames"
+
+_CUSTOM_DATA_KEY = "SelectionHistoryList"
+_SIDECAR_SUFFIX = ".selection_history.json"
+
+
+class SelectionHistoryPersistence(Enum):
+    """Where the selection history is saved"""
+
+    ROOT_LAYER = "root_layer"  # custom layer data of the root layer, saved with the stage
+    SESSION_LAYER = "session_layer"  # custom layer data of the session layer, lost when the stage is closed
+    SIDECAR = "sidecar"  # json file next to the root layer, saved without dirtying the stage
+    NONE = "none"
+
 
 class UsdSelectionHistoryModel(_SelectionHistoryModel):
     def __init__(self, context_name: str = ""):
         super().__init__()
         self._default_attr = {
             "_stage_event": None,
+            "_persist_task": None,
         }
         for attr, value in self._default_attr.items():
             setattr(self, attr, value)
@@ -40,6 +64,22 @@ class UsdSelectionHistoryModel(_SelectionHistoryModel):
         self._usd_context = omni.usd.get_context(context_name)
         self._stage = self._usd_context.get_stage()
         self._stage_event = None
+        self._persist_task = None
+        self.__persist_frames_left = 0
+
+        settings = carb.settings.get_settings()
+        try:
+            self._persistence = SelectionHistoryPersistence(
+                settings.get(CARB_SETTING_PERSISTENCE) or SelectionHistoryPersistence.ROOT_LAYER.value
+            )
+        except ValueError:
+            carb.log_warn(f"Invalid selection history persistence: {settings.get(CARB_SETTING_PERSISTENCE)}")
+            self._persistence = SelectionHistoryPersistence.ROOT_LAYER
+        persist_delay_frames = settings.get(CARB_SETTING_PERSIST_DELAY_FRAMES)
+        self._persist_delay_frames = 1 if persist_delay_frames is None else max(int(persist_delay_frames), 0)
+        # Number of times the history was written, to measure the debounce
+        self.persist_count = 0
+
         # the selection history should always be active, even when we don't see the widget
         self.enable_listeners(True)
 
@@ -47,6 +87,23 @@ class UsdSelectionHistoryModel(_SelectionHistoryModel):
     def stage(self):
         return self._stage
 
+    @property
+    def persistence(self) -> SelectionHistoryPersistence:
+        return self._persistence
+
+    @persistence.setter
+    def persistence(self, value: SelectionHistoryPersistence):
+        self._persistence = SelectionHistoryPersistence(value)
+
+    @property
+    def persist_delay_frames(self) -> int:
+        """Number of frames without a new selection to wait for before saving the history"""
+        return self._persist_delay_frames
+
+    @persist_delay_frames.setter
+    def persist_delay_frames(self, value: int):
+        self._persist_delay_frames = max(int(value), 0)
+
     def _block_list_selection(func):  # noqa N805
         def do(self, *args, **kwargs):  # noqa PLC0103
             self.__block_list_selection = True  # noqa PLW0212
@@ -89,6 +146,8 @@ class UsdSelectionHistoryModel(_SelectionHistoryModel):
 
     def reset(self):
         """Reset the model"""
+        # Save the pending history in the stage it was selected in before the items are replaced
+        self.flush()
         # when we open stage, we delete the old stage listener, and re-add a new one
         self.enable_listeners(False)
         super().reset()
@@ -110,42 +169,116 @@ class UsdSelectionHistoryModel(_SelectionHistoryModel):
                 continue
             items.insert(0, _SelectionHistoryItem(prim.GetName(), data=prim, tooltip=str(prim.GetPath())))
         if items:
-            self.insert_items(items)
-            self.__add_items_to_custom_layer()
+            # Selecting the last selected prim again doesn't change the history: nothing to save
+            if self.insert_items(items):
+                self.__schedule_persist()
         # TODO BUG REMIX-1278
         # self.set_active_items(items)
         self.__block_list_selection = False
 
+    def __get_sidecar_path(self, stage) -> Optional[str]:
+        real_path = stage.GetRootLayer().realPath
+        return real_path + _SIDECAR_SUFFIX if real_path else None
+
+    def __read_history(self, stage) -> Optional[Dict[str, str]]:
+        if self._persistence == SelectionHistoryPersistence.SIDECAR:
+            sidecar_path = self.__get_sidecar_path(stage)
+            if not sidecar_path or not os.path.exists(sidecar_path):
+                return None
+            try:
+                return _read_json_file(sidecar_path).get(_CUSTOM_DATA_KEY)
+            except (IOError, ValueError) as e:
+                carb.log_warn(f"Unable to read the selection history {sidecar_path}: {e}")
+                return None
+        if self._persistence == SelectionHistoryPersistence.SESSION_LAYER:
+            return stage.GetSessionLayer().customLayerData.get(_CUSTOM_DATA_KEY)
+        if self._persistence == SelectionHistoryPersistence.ROOT_LAYER:
+            return stage.GetRootLayer().customLayerData.get(_CUSTOM_DATA_KEY)
+        return None
+
     def __load_items_from_custom_layer_metadata(self):
         # Load Selection items from previous sessions if it exists
         stage = self._usd_context.get_stage()
         if not stage:
             return
-        layer = stage.GetRootLayer()
-        selection_history_dict = layer.customLayerData.get("SelectionHistoryList")
+        selection_history_dict = self.__read_history(stage)
         if selection_history_dict:
             selection_history_dict_keys = list(selection_history_dict.keys())
             selection_history_dict_keys.sort(key=int, reverse=True)
             items = []
             for key in selection_history_dict_keys:
-                cur_data = selection_history_dict[key]
-                prim = stage.GetPrimAtPath(str(cur_data))
-                items.append(_SelectionHistoryItem(Path(str(cur_data)).name, data=prim, tooltip=str(cur_data)))
+                cur_data = str(selection_history_dict[key])
+                # The prims are only fetched from the stage when the items are used
+                items.append(
+                    _SelectionHistoryItem(Path(cur_data).name, tooltip=cur_data, stage=stage, path=cur_data)
+                )
             if items:
                 self.insert_items(items)
 
+    def __schedule_persist(self):
+        if self._persistence == SelectionHistoryPersistence.NONE:
+            return
+        # Every new selection restarts the countdown: a burst of selections is only saved once
+        self.__persist_frames_left = self._persist_delay_frames
+        if self._persist_delay_frames == 0:
+            self.__cancel_persist()
+            self.__add_items_to_custom_layer()
+            return
+        if self._persist_task is None or self._persist_task.done():
+            self._persist_task = asyncio.ensure_future(self.__deferred_persist())
+
+    async def __deferred_persist(self):
+        while self.__persist_frames_left > 0:
+            await omni.kit.app.get_app().next_update_async()
+            self.__persist_frames_left -= 1
+        self._persist_task = None
+        self.__add_items_to_custom_layer()
+
+    def __cancel_persist(self):
+        if self._persist_task is not None:
+            self._persist_task.cancel()
+        self._persist_task = None
+        self.__persist_frames_left = 0
+
+    def flush(self):
+        """Save the selection history right away if a save is pending"""
+        if self._persist_task is None:
+            return
+        self.__cancel_persist()
+        self.__add_items_to_custom_layer()
+
     def __add_items_to_custom_layer(self):
+        # The context can already hold a new stage when the history of the previous one is flushed
+        stage = self._stage
+        if not stage or self._persistence == SelectionHistoryPersistence.NONE:
+            return
+        sidecar_path = None
+        if self._persistence == SelectionHistoryPersistence.SIDECAR:
+            sidecar_path = self.__get_sidecar_path(stage)
+            if not sidecar_path:
+                # The stage was never saved: there is no file to save the history next to
+                return
         selection_history_dict = {}
         for index, item in enumerate(self.get_item_children(None)):
-            selection_history_dict.update({str(index): str(item.data.GetPath())})
+            selection_history_dict.update({str(index): item.path})
+        self.persist_count += 1
+
+        if sidecar_path:
+            if not _write_json_file(sidecar_path, {_CUSTOM_DATA_KEY: selection_history_dict}, raise_if_error=False):
+                carb.log_warn(f"Unable to write the selection history {sidecar_path}")
+            return
+
         # Add current list items to custom layer data
-        stage = self._usd_context.get_stage()
-        layer = stage.GetRootLayer()
+        if self._persistence == SelectionHistoryPersistence.SESSION_LAYER:
+            layer = stage.GetSessionLayer()
+        else:
+            layer = stage.GetRootLayer()
         current_data = layer.customLayerData
-        current_data.update({"SelectionHistoryList": selection_history_dict})
+        current_data.update({_CUSTOM_DATA_KEY: selection_history_dict})
         layer.customLayerData = current_data
 
     def destroy(self):
+        self.__cancel_persist()
         self.enable_listeners(False)
         self._usd_listener = None
         _reset_default_attrs(self)
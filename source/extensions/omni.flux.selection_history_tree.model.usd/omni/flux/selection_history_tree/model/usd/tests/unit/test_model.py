@@ -16,14 +16,21 @@
 """
 
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import patch
 
+import carb
 import omni.kit
 import omni.kit.test
 import omni.usd
+from omni.flux.selection_history_tree.model.usd import UsdSelectionHistoryItem as _SelectionHistoryItem
+from omni.flux.selection_history_tree.model.usd import SelectionHistoryPersistence as _SelectionHistoryPersistence
 from omni.flux.selection_history_tree.model.usd import UsdSelectionHistoryModel as _UsdSelectionHistoryModel
 from omni.kit.test_suite.helpers import get_test_data_path, wait_stage_loading
+from pxr import Sdf
+
+_BENCHMARK_SELECTION_COUNT = 1_000
 
 
 class TestUSDSelectionHistoryModel(omni.kit.test.AsyncTestCase):
@@ -117,3 +124,121 @@ class TestUSDSelectionHistoryModel(omni.kit.test.AsyncTestCase):
         )
 
         await self._open_default_stage()
+
+    async def test_rapid_selections_should_be_saved_once(self):
+        # Arrange
+        model = _UsdSelectionHistoryModel()
+        model.persist_delay_frames = 3
+        paths = ["/World/Cube0", "/World/Cube1", "/World/Cube2"]
+
+        # Act
+        for path in paths:
+            omni.usd.get_context().get_selection().set_selected_prim_paths([path], False)
+            await omni.kit.app.get_app().next_update_async()
+        count_before_delay = model.persist_count
+        for _ in range(5):
+            await omni.kit.app.get_app().next_update_async()
+
+        # Assert
+        self.assertEqual(count_before_delay, 0)
+        self.assertEqual(model.persist_count, 1)
+        self.assertEqual(
+            self.stage.GetRootLayer().customLayerData.get("SelectionHistoryList"),
+            {"0": paths[2], "1": paths[1], "2": paths[0]},
+        )
+
+        model.destroy()
+
+    async def test_reset_should_save_pending_history(self):
+        # Arrange
+        model = _UsdSelectionHistoryModel()
+        model.persist_delay_frames = 10
+        omni.usd.get_context().get_selection().set_selected_prim_paths(["/World/Cube0"], False)
+        await omni.kit.app.get_app().next_update_async()
+        count_before_reset = model.persist_count
+
+        # Act
+        model.reset()
+
+        # Assert
+        self.assertEqual(count_before_reset, 0)
+        self.assertEqual(model.persist_count, 1)
+        self.assertEqual(
+            self.stage.GetRootLayer().customLayerData.get("SelectionHistoryList"), {"0": "/World/Cube0"}
+        )
+
+        model.destroy()
+
+    async def test_insert_same_item_should_compare_paths_without_getting_prims(self):
+        # Arrange
+        model = _UsdSelectionHistoryModel()
+        model.enable_listeners(False)
+        items = [
+            _SelectionHistoryItem("Cube0", tooltip="/World/Cube0", stage=self.stage, path="/World/Cube0")
+            for _ in range(2)
+        ]
+
+        # Act
+        model.insert_items(items)
+
+        # Assert
+        self.assertListEqual([items[0]], model.get_item_children(None))
+        self.assertIsNone(items[0]._data)  # noqa PLW0212
+        self.assertIsNone(items[1]._data)  # noqa PLW0212
+
+        model.destroy()
+
+    async def test_session_layer_persistence_should_save_in_session_layer(self):
+        # Arrange
+        model = _UsdSelectionHistoryModel()
+        model.persistence = _SelectionHistoryPersistence.SESSION_LAYER
+        model.persist_delay_frames = 0
+
+        # Act
+        omni.usd.get_context().get_selection().set_selected_prim_paths(["/World/Cube0"], False)
+        for _ in range(2):
+            await omni.kit.app.get_app().next_update_async()
+
+        # Assert
+        self.assertEqual(
+            self.stage.GetSessionLayer().customLayerData.get("SelectionHistoryList"), {"0": "/World/Cube0"}
+        )
+
+        model.destroy()
+
+    async def test_benchmark_rapid_selections(self):
+        # Arrange
+        model = _UsdSelectionHistoryModel()
+        model.enable_listeners(False)
+        with Sdf.ChangeBlock():
+            for index in range(_BENCHMARK_SELECTION_COUNT):
+                self.stage.DefinePrim(f"/World/Benchmark/prim_{index}", "Xform")
+        paths = [f"/World/Benchmark/prim_{index}" for index in range(_BENCHMARK_SELECTION_COUNT)]
+        results = {}
+
+        for label, delay_frames in (("every selection", 0), ("debounced", 1)):
+            model.reset()
+            model.enable_listeners(False)
+            model.persist_delay_frames = delay_frames
+            model.persist_count = 0
+
+            # Act
+            start = time.perf_counter()
+            for path in paths:
+                model._on_stage_selection_changed([path])  # noqa PLW0212
+            model.flush()
+            results[label] = (time.perf_counter() - start, model.persist_count)
+
+        for label, (duration, count) in results.items():
+            carb.log_info(
+                f"Selection history ({label}) for {_BENCHMARK_SELECTION_COUNT} selections: "
+                f"{count} writes, {duration:.3f}s"
+            )
+
+        # Assert
+        self.assertEqual(len(model.get_item_children(None)), model.MAX_LIST_LENGTH)
+        self.assertEqual(results["every selection"][1], _BENCHMARK_SELECTION_COUNT)
+        self.assertEqual(results["debounced"][1], 1)
+        self.assertLess(results["debounced"][0], results["every selection"][0])
+
+        model.destroy()
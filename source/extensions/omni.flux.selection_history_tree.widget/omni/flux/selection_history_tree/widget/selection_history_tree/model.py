@@ -16,6 +16,7 @@
 """
 
 import abc
+import collections
 from typing import Any, Callable, List, Optional
 
 from omni import ui
@@ -30,7 +31,8 @@ class SelectionHistoryModel(ui.AbstractItemModel):
 
     def __init__(self):
         super().__init__()
-        self.__items = []
+        # Ring buffer of the history: the oldest items are dropped once the list is full
+        self.__items = collections.deque(maxlen=self.MAX_LIST_LENGTH)
         self.__on_active_items_changed = _Event()
 
     def refresh(self) -> None:
@@ -39,30 +41,42 @@ class SelectionHistoryModel(ui.AbstractItemModel):
 
     def reset(self):
         """Reset the model"""
-        self.__items = []
+        self.__items = collections.deque(maxlen=self.MAX_LIST_LENGTH)
         self.refresh()
 
-    def insert_items(self, items: List[SelectionHistoryItem], idx: int = 0) -> None:
+    def insert_items(self, items: List[SelectionHistoryItem], idx: int = 0) -> bool:
         """
         Insert items at the given position
 
         Args:
             items: the items to insert
             idx: the index on the list
+
+        Returns:
+            True if at least one item was added to the list
         """
         item_added = False
         for item in items:
-            if self.__items and item.data == self.__items[0].data:
+            if self.__items and self._is_same_item(item, self.__items[0]):
                 continue
+            if len(self.__items) == self.MAX_LIST_LENGTH:
+                # An item inserted past the end of a full list would be dropped right away
+                if idx >= self.MAX_LIST_LENGTH:
+                    continue
+                self.__items.pop()
             self.__items.insert(idx, item)
             item_added = True
-            list_len = len(self.__items)
-            # Check if the list exceeds the max length, if it does pop the last element
-            if list_len == self.MAX_LIST_LENGTH + 1:
-                self.__items.pop()
         # If a new item is added to list, update the items stored in custom layer
         if item_added:
             self.refresh()
+        return item_added
+
+    @staticmethod
+    def _is_same_item(item: SelectionHistoryItem, other: SelectionHistoryItem) -> bool:
+        """Whether both items hold the same data. Items with a path are compared without getting their data."""
+        if hasattr(item, "path") and hasattr(other, "path"):
+            return item.path == other.path
+        return item.data == other.data
 
     def set_active_items(self, items: List[SelectionHistoryItem]) -> None:
         """
@@ -123,7 +137,7 @@ class SelectionHistoryModel(ui.AbstractItemModel):
         """Returns all the children when the widget asks it."""
         # Since we are doing a flat list, we return the children of root only.
         # If it's not root we return.
-        return self.__items if not item else []
+        return list(self.__items) if not item else []
 
     def get_item_value_model_count(self, item: Optional[SelectionHistoryItem] = None):
         """The number of columns"""
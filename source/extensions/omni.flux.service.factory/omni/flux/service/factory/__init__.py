@@ -15,7 +15,14 @@
 * limitations under the License.
 """
 
-__all__ = ["TrexServiceFactoryExtension", "get_instance", "ServiceBase"]
+__all__ = [
+    "TrexServiceFactoryExtension",
+    "get_instance",
+    "ServiceBase",
+    "ResponseCache",
+    "get_response_cache_instance",
+]
 
 from .extension import TrexServiceFactoryExtension, get_instance
+from .response_cache import ResponseCache, get_response_cache_instance
 from .services import ServiceBase
@@ -20,6 +20,8 @@ import carb.settings
 import omni.ext
 from omni.flux.factory.base import FactoryBase as _FactoryBase
 
+from .response_cache import create_response_cache_instance as _create_response_cache_instance
+from .response_cache import destroy_response_cache_instance as _destroy_response_cache_instance
 from .services.base import ServiceBase as _ServiceBase
 
 _SETUP_INSTANCE = None
@@ -40,6 +42,7 @@ class TrexServiceFactoryExtension(omni.ext.IExt):
         global _SETUP_INSTANCE
         carb.log_info("[omni.flux.service.factory] Startup")
 
+        _create_response_cache_instance()
         _SETUP_INSTANCE = _FactoryBase[_ServiceBase]()
 
     def on_shutdown(self):
@@ -48,3 +51,4 @@ class TrexServiceFactoryExtension(omni.ext.IExt):
         if _SETUP_INSTANCE:
             _SETUP_INSTANCE.destroy()
         _SETUP_INSTANCE = None
+        _destroy_response_cache_instance()
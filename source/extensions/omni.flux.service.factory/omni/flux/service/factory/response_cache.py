@@ -0,0 +1,396 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = [
+    "CachedResponse",
+    "ResponseCache",
+    "ResponseCacheRoute",
+    "create_response_cache_instance",
+    "destroy_response_cache_instance",
+    "get_response_cache_instance",
+]
+
+import functools
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, Optional, Tuple, Type
+
+import carb
+import carb.settings
+import omni.usd
+from fastapi.routing import APIRoute
+from pxr import Sdf, Tf, Usd
+from starlette.requests import Request
+from starlette.responses import Response
+
+_SETTING_ENABLED = "/exts/omni.flux.service.factory/response_cache/enabled"
+_SETTING_MAX_ENTRIES = "/exts/omni.flux.service.factory/response_cache/max_entries"
+
+# Headers computed again from the cached body or set by the cache itself
+_COMPUTED_HEADERS = {"content-length", "content-type", "etag", "x-cache"}
+
+_INSTANCE = None
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """
+    A successful response stored in the response cache
+    """
+
+    body: bytes
+    etag: str
+    media_type: Optional[str]
+    context_name: str
+    generation: int
+    status_code: int = 200
+    # The headers set by the endpoint, except the ones computed from the body
+    headers: Tuple[Tuple[str, str], ...] = ()
+
+
+class ResponseCache:
+    """
+    Cache the responses of GET endpoints until the next stage generation of their USD context.
+
+    The stage generation of a tracked USD context is bumped by its stage events (open, close, selection, save, etc.),
+    by the change notices of its stage and by the change notices of the layers used by its stage. Responses get a
+    strong `ETag` computed from their body and requests sending a matching `If-None-Match` header get an empty 304
+    response.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self._max_entries = max_entries
+        # {context name: stage generation}
+        self._generations: Dict[str, int] = {}
+        # {context name: number of endpoints running}
+        self._running: Dict[str, int] = {}
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+        self._listeners = [
+            Tf.Notice.RegisterGlobally(Sdf.Notice.LayersDidChange, self._on_layers_changed),
+            Tf.Notice.RegisterGlobally(Sdf.Notice.LayerDirtinessChanged, self._on_layer_dirtiness_changed),
+            Tf.Notice.RegisterGlobally(Usd.Notice.StageEditTargetChanged, self._on_stage_notice),
+            Tf.Notice.RegisterGlobally(Usd.Notice.LayerMutingChanged, self._on_stage_notice),
+        ]
+        # {context name: stage event subscription}
+        self._stage_event_subs = {}
+        self.track_context("")
+
+    @property
+    def generation(self) -> int:
+        """The stage generation of the default USD context"""
+        return self.get_generation()
+
+    def get_generation(self, context_name: str = "") -> int:
+        """
+        Args:
+            context_name: The USD context name
+
+        Returns:
+            The stage generation the cached responses of the USD context were computed for
+        """
+        return self._generations.get(context_name, 0)
+
+    @property
+    def hit_ratio(self) -> float:
+        """The ratio of cacheable requests answered without running the endpoint"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_statistics(self) -> Dict[str, float]:
+        """
+        Returns:
+            The hit, miss and 304 counters, the hit ratio and the number of cached responses
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "hit_ratio": self.hit_ratio,
+            "entries": len(self._entries),
+            "generation": self.generation,
+        }
+
+    def track_context(self, context_name: str):
+        """
+        Bump the stage generation on the stage events of the given USD context.
+
+        Args:
+            context_name: The USD context name
+        """
+        if context_name in self._stage_event_subs:
+            return
+        context = omni.usd.get_context(context_name)
+        if not context:
+            return
+        self._stage_event_subs[context_name] = context.get_stage_event_stream().create_subscription_to_pop(
+            functools.partial(self._on_stage_event, context_name),
+            name=f"omni.flux.service.factory.ResponseCache.{context_name}",
+        )
+
+    def invalidate(self, context_name: Optional[str] = None):
+        """
+        Bump the stage generation and drop the cached responses
+
+        Args:
+            context_name: The USD context to invalidate the responses of. If None, every context will be invalidated.
+        """
+        if context_name is None:
+            context_names = set(self._generations) | set(self._stage_event_subs)
+            context_names.update(entry.context_name for entry in self._entries.values())
+        else:
+            context_names = {context_name}
+        for name in context_names:
+            self._generations[name] = self._generations.get(name, 0) + 1
+        for key in [key for key, entry in self._entries.items() if entry.context_name in context_names]:
+            del self._entries[key]
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None or entry.generation != self.get_generation(entry.context_name):
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(
+        self,
+        key: Hashable,
+        body: bytes,
+        media_type: Optional[str],
+        context_name: str = "",
+        status_code: int = 200,
+        headers: Iterable[Tuple[str, str]] = (),
+    ) -> CachedResponse:
+        entry = CachedResponse(
+            body=body,
+            etag=self.compute_etag(body),
+            media_type=media_type,
+            context_name=context_name,
+            generation=self.get_generation(context_name),
+            status_code=status_code,
+            headers=tuple((name, value) for name, value in headers if name.lower() not in _COMPUTED_HEADERS),
+        )
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    async def handle(
+        self, request: Request, handler: Callable[[Request], Awaitable[Response]], context_name: str = ""
+    ) -> Response:
+        """
+        Answer a GET request from the cache or run the endpoint and cache its successful response.
+
+        Args:
+            request: The incoming request
+            handler: The endpoint request handler
+            context_name: The USD context the endpoint reads
+
+        Returns:
+            The cached, 304 or computed response
+        """
+        key = self.get_request_key(request, context_name=context_name)
+        entry = self.get(key)
+        if entry is not None:
+            self.hits += 1
+            return self._build_response(request, entry, "HIT")
+
+        self.misses += 1
+        generation = self.get_generation(context_name)
+        self._running[context_name] = self._running.get(context_name, 0) + 1
+        try:
+            response = await handler(request)
+        finally:
+            self._running[context_name] -= 1
+        # Streamed, partial or failed responses are never cached
+        body = getattr(response, "body", None)
+        if not 200 <= response.status_code < 300 or response.status_code == 206 or body is None:
+            return response
+        # The stage changed while the endpoint was running
+        if generation != self.get_generation(context_name):
+            response.headers["ETag"] = self.compute_etag(body)
+            return response
+
+        entry = self.put(
+            key,
+            body,
+            response.media_type or response.headers.get("content-type"),
+            context_name=context_name,
+            status_code=response.status_code,
+            headers=response.headers.items(),
+        )
+        return self._build_response(request, entry, "MISS")
+
+    @staticmethod
+    def get_request_key(request: Request, context_name: str = "") -> Tuple:
+        """
+        Returns:
+            The cache key of a request: the USD context, the route path and the sorted query parameters
+        """
+        return context_name, request.method, request.url.path, tuple(sorted(request.query_params.multi_items()))
+
+    @staticmethod
+    def compute_etag(body: bytes) -> str:
+        return f'"{hashlib.sha1(body).hexdigest()}"'  # noqa S324
+
+    @staticmethod
+    def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+        """
+        Compare an ETag with an `If-None-Match` header value using the weak comparison defined for that header.
+        """
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        return any(
+            candidate.strip().removeprefix("W/") == etag.removeprefix("W/") for candidate in if_none_match.split(",")
+        )
+
+    def _build_response(self, request: Request, entry: CachedResponse, cache_status: str) -> Response:
+        if self.etag_matches(entry.etag, request.headers.get("if-none-match")):
+            self.not_modified += 1
+            response = Response(status_code=304)
+        else:
+            response = Response(content=entry.body, status_code=entry.status_code, media_type=entry.media_type)
+        for name, value in entry.headers:
+            response.headers.append(name, value)
+        response.headers["ETag"] = entry.etag
+        response.headers["X-Cache"] = cache_status
+        return response
+
+    def _get_contexts_using_layers(self, layers: Iterable[Sdf.Layer]) -> Iterable[str]:
+        layers = [layer for layer in layers if layer]
+        if not layers:
+            return []
+        context_names = []
+        for context_name in self._stage_event_subs:
+            # Nothing to invalidate if no response of the context is cached or being computed
+            if not self._running.get(context_name) and not any(
+                entry.context_name == context_name for entry in self._entries.values()
+            ):
+                continue
+            context = omni.usd.get_context(context_name)
+            stage = context.get_stage() if context else None
+            if not stage:
+                continue
+            used_layers = stage.GetUsedLayers(includeClipLayers=False)
+            if any(layer in used_layers for layer in layers):
+                context_names.append(context_name)
+        return context_names
+
+    def _on_layers_changed(self, notice, _):
+        for context_name in self._get_contexts_using_layers(notice.GetLayers()):
+            self.invalidate(context_name)
+
+    def _on_layer_dirtiness_changed(self, _, layer):
+        for context_name in self._get_contexts_using_layers([layer]):
+            self.invalidate(context_name)
+
+    def _on_stage_notice(self, _, stage):
+        for context_name in self._stage_event_subs:
+            context = omni.usd.get_context(context_name)
+            if context and context.get_stage() == stage:
+                self.invalidate(context_name)
+
+    def _on_stage_event(self, context_name: str, _):
+        self.invalidate(context_name)
+
+    def destroy(self):
+        carb.log_info(f"[omni.flux.service.factory] Response cache statistics: {self.get_statistics()}")
+        for listener in self._listeners:
+            listener.Revoke()
+        self._listeners = []
+        self._stage_event_subs = {}
+        self._entries.clear()
+
+
+class ResponseCacheRoute(APIRoute):
+    """
+    A route answering GET requests through the response cache when it is enabled
+    """
+
+    # The USD context the endpoints of the route read
+    context_name: str = ""
+
+    _CONTEXT_ROUTES: Dict[str, Type["ResponseCacheRoute"]] = {}
+
+    @classmethod
+    def for_context(cls, context_name: str) -> Type["ResponseCacheRoute"]:
+        """
+        Args:
+            context_name: The USD context the endpoints of the route read
+
+        Returns:
+            A route class caching the responses until the stage of the given USD context changes
+        """
+        if not context_name:
+            return cls
+        route_class = cls._CONTEXT_ROUTES.get(context_name)
+        if route_class is None:
+            route_class = type(cls.__name__, (cls,), {"context_name": context_name})
+            cls._CONTEXT_ROUTES[context_name] = route_class
+        return route_class
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        handler = super().get_route_handler()
+        if "GET" not in self.methods:
+            return handler
+
+        async def cached_route_handler(request: Request) -> Response:
+            cache = get_response_cache_instance()
+            if cache is None:
+                return await handler(request)
+            return await cache.handle(request, handler, context_name=self.context_name)
+
+        return cached_route_handler
+
+
+def create_response_cache_instance() -> Optional[ResponseCache]:
+    """
+    Create the response cache if it is enabled in the settings
+
+    Returns:
+        The response cache instance or None if the cache is disabled
+    """
+    global _INSTANCE
+    destroy_response_cache_instance()
+    settings = carb.settings.get_settings()
+    if settings.get(_SETTING_ENABLED) is False:
+        return None
+    _INSTANCE = ResponseCache(max_entries=settings.get(_SETTING_MAX_ENTRIES) or 512)
+    return _INSTANCE
+
+
+def get_response_cache_instance() -> Optional[ResponseCache]:
+    """
+    Returns:
+        The response cache instance or None if the cache is disabled
+    """
+    return _INSTANCE
+
+
+def destroy_response_cache_instance():
+    global _INSTANCE
+    if _INSTANCE:
+        _INSTANCE.destroy()
+    _INSTANCE = None
@@ -16,16 +16,24 @@
 """
 
 import abc
-from typing import Any, Optional, Type, Union
+import itertools
+from typing import Any, Callable, Iterable, Optional, Type, Union
 
 from fast_version import VersionedAPIRouter
 from fastapi import Depends, Path, Query
+from fastapi.responses import StreamingResponse
 from omni.flux.factory.base import PluginBase
+from omni.flux.service.shared import NDJSON_MEDIA_TYPE as _NDJSON_MEDIA_TYPE
 from omni.flux.service.shared import BaseServiceModel
+from omni.flux.service.shared import stream_ndjson as _stream_ndjson
+from omni.flux.service.shared import validation_cache_scope as _validation_cache_scope
 from omni.services.core import exceptions
 from omni.services.core.routers import ServiceAPIRouter
 from pydantic import Field, ValidationError, create_model
 
+from ..response_cache import ResponseCacheRoute as _ResponseCacheRoute
+from ..response_cache import get_response_cache_instance as _get_response_cache_instance
+
 
 class APIRouter(VersionedAPIRouter, ServiceAPIRouter):
     pass
@@ -36,10 +44,25 @@ class ServiceBase(PluginBase, abc.ABC):
     A base class used to define a Service.
 
     All endpoints must be defined within the implementation of the `register_endpoints` function.
+
+    Every request runs in a validation cache scope: validators decorated with `cached_validator` are only evaluated
+    once per request and stage edit generation, whether they are called by a parameter model or an endpoint body.
+
+    Services setting `cache_responses` to True answer their GET endpoints from the response cache until the stage of
+    their USD context changes. Only endpoints deriving their response from the stage should be cached.
     """
 
-    def __init__(self, *args, **kwargs):
-        self._router = APIRouter()
+    cache_responses: bool = False
+
+    def __init__(self, *args, context_name: str = "", **kwargs):
+        router_kwargs = {}
+        if self.cache_responses:
+            router_kwargs["route_class"] = _ResponseCacheRoute.for_context(context_name)
+            response_cache = _get_response_cache_instance()
+            if response_cache:
+                response_cache.track_context(context_name)
+
+        self._router = APIRouter(dependencies=[Depends(ServiceBase._validation_cache_dependency)], **router_kwargs)
 
         self.register_endpoints()
 
@@ -95,6 +118,14 @@ class ServiceBase(PluginBase, abc.ABC):
         # Inject the hidden fields in the model
         return create_model(base_model.__name__, **fields, __base__=base_model)
 
+    @staticmethod
+    async def _validation_cache_dependency():
+        """
+        Request dependency sharing a validation cache between the parameter validation and the endpoint body
+        """
+        with _validation_cache_scope():
+            yield
+
     @staticmethod
     def validate_path_param(
         base_model: Type[BaseServiceModel], description: Optional[str] = None, validate_list: bool = False, **kwargs
@@ -123,7 +154,8 @@ class ServiceBase(PluginBase, abc.ABC):
                 else:
                     validation_value = value
                 # Dynamically create an instance of the model and validate the input
-                model = base_model.parse_obj({field_name: validation_value, **kwargs})
+                with _validation_cache_scope():
+                    model = base_model.parse_obj({field_name: validation_value, **kwargs})
                 # Return the model rather than the input string
                 return model
             except (ValueError, ValidationError) as e:
@@ -142,6 +174,33 @@ class ServiceBase(PluginBase, abc.ABC):
         """
         return Query(default_value, description=description)
 
+    @staticmethod
+    def stream_ndjson_response(items: Iterable[Any], serialize: Callable[[Any], Any] = None) -> StreamingResponse:
+        """
+        Stream items as a newline-delimited JSON response.
+
+        The first item is computed before the response starts so a `ValueError` raised by a lazy iterable is returned
+        as a 422 error rather than interrupting the stream. A later error ends the stream with an `{"error": ...}` line.
+
+        Args:
+            items: The items to stream, one JSON value per line
+            serialize: Convert an item to a JSON-serializable value
+
+        Raises:
+            exceptions.KitServicesBaseException: If the first item raised a `ValueError`
+
+        Returns:
+            The streaming response
+        """
+        iterator = iter(items)
+        try:
+            first_items = list(itertools.islice(iterator, 1))
+        except ValueError as e:
+            ServiceBase.raise_error(422, e)
+        return StreamingResponse(
+            _stream_ndjson(itertools.chain(first_items, iterator), serialize=serialize), media_type=_NDJSON_MEDIA_TYPE
+        )
+
     @staticmethod
     def raise_error(status_code: int, details: Union[Exception, str]):
         """
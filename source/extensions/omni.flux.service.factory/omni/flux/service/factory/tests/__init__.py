@@ -15,4 +15,6 @@
 * limitations under the License.
 """
 
+from .unit.test_response_cache import TestResponseCache
 from .unit.test_service_base import TestServiceBase
+from .unit.test_validation_cache import TestValidationCache
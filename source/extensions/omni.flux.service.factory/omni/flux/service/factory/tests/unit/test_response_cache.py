@@ -0,0 +1,229 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import carb
+import omni.usd
+from fastapi.testclient import TestClient
+from omni.flux.service.factory import ResponseCache, ServiceBase, get_response_cache_instance
+from omni.flux.service.factory.response_cache import (
+    create_response_cache_instance,
+    destroy_response_cache_instance,
+)
+from omni.kit.test.async_unittest import AsyncTestCase
+from omni.services.core import main
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+class _CachedService(ServiceBase):
+    cache_responses = True
+
+    def __init__(self):
+        self.call_count = 0
+        super().__init__()
+
+    @classmethod
+    @property
+    def prefix(cls) -> str:
+        return "/test-response-cache"
+
+    def register_endpoints(self):
+        @self.router.get(path="/prims")
+        async def get_prims(prefix: str = "") -> list[str]:
+            self.call_count += 1
+            stage = omni.usd.get_context().get_stage()
+            return [str(prim.GetPath()) for prim in stage.Traverse() if str(prim.GetPath()).startswith(prefix)]
+
+        @self.router.get(path="/headers")
+        async def get_headers(response: Response) -> str:
+            self.call_count += 1
+            response.status_code = 203
+            response.headers["X-Custom"] = "value"
+            return "OK"
+
+        @self.router.put(path="/prims")
+        async def put_prims() -> str:
+            self.call_count += 1
+            return "OK"
+
+
+class TestResponseCache(AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        await omni.usd.get_context().new_stage_async()
+        self.stage = omni.usd.get_context().get_stage()
+        self.stage.DefinePrim("/World")
+
+        self.cache = get_response_cache_instance()
+        self.cache.invalidate()
+        self.cache.hits = 0
+        self.cache.misses = 0
+        self.cache.not_modified = 0
+
+        self.service = _CachedService()
+        main.register_router(router=self.service.router, prefix=self.service.prefix)
+
+        host = carb.settings.get_settings().get("/exts/omni.services.transport.server.http/host")
+        port = carb.settings.get_settings().get("/exts/omni.services.transport.server.http/port")
+        self.client = TestClient(main.get_app(), base_url=f"http://{host}:{port}")
+
+    # After running each test
+    async def tearDown(self):
+        main.deregister_router(router=self.service.router)
+        await omni.usd.get_context().close_stage_async()
+
+        self.client = None
+        self.service = None
+        self.cache = None
+        self.stage = None
+
+    async def test_get_same_request_should_return_cached_response(self):
+        # Act
+        first_response = self.client.get(f"{self.service.prefix}/prims")
+        second_response = self.client.get(f"{self.service.prefix}/prims")
+
+        # Assert
+        self.assertEqual(1, self.service.call_count)
+        self.assertEqual(first_response.json(), second_response.json())
+        self.assertEqual(first_response.headers["ETag"], second_response.headers["ETag"])
+        self.assertEqual("MISS", first_response.headers["X-Cache"])
+        self.assertEqual("HIT", second_response.headers["X-Cache"])
+        self.assertEqual(0.5, self.cache.hit_ratio)
+
+    async def test_get_different_query_should_not_share_response(self):
+        # Act
+        self.client.get(f"{self.service.prefix}/prims", params={"prefix": "/World"})
+        self.client.get(f"{self.service.prefix}/prims", params={"prefix": "/Other"})
+
+        # Assert
+        self.assertEqual(2, self.service.call_count)
+
+    async def test_get_if_none_match_should_return_not_modified(self):
+        # Arrange
+        etag = self.client.get(f"{self.service.prefix}/prims").headers["ETag"]
+
+        # Act
+        response = self.client.get(f"{self.service.prefix}/prims", headers={"If-None-Match": etag})
+
+        # Assert
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(b"", response.content)
+        self.assertEqual(etag, response.headers["ETag"])
+        self.assertEqual(1, self.cache.not_modified)
+
+    async def test_get_stage_changed_should_compute_new_response(self):
+        # Arrange
+        first_response = self.client.get(f"{self.service.prefix}/prims")
+
+        # Act
+        self.stage.DefinePrim("/World/Mesh")
+        second_response = self.client.get(
+            f"{self.service.prefix}/prims", headers={"If-None-Match": first_response.headers["ETag"]}
+        )
+
+        # Assert
+        self.assertEqual(2, self.service.call_count)
+        self.assertEqual(200, second_response.status_code)
+        self.assertIn("/World/Mesh", second_response.json())
+        self.assertNotEqual(first_response.headers["ETag"], second_response.headers["ETag"])
+
+    async def test_get_cached_response_should_replay_status_code_and_headers(self):
+        # Act
+        first_response = self.client.get(f"{self.service.prefix}/headers")
+        second_response = self.client.get(f"{self.service.prefix}/headers")
+
+        # Assert
+        self.assertEqual(1, self.service.call_count)
+        for response in [first_response, second_response]:
+            self.assertEqual(203, response.status_code)
+            self.assertEqual("value", response.headers["X-Custom"])
+            self.assertEqual("OK", response.json())
+        self.assertEqual("HIT", second_response.headers["X-Cache"])
+
+    async def test_stage_changed_should_only_invalidate_its_context(self):
+        # Arrange
+        context_name = "test_response_cache"
+        context = omni.usd.create_context(context_name)
+        await context.new_stage_async()
+        self.cache.track_context(context_name)
+        request = Request({"type": "http", "method": "GET", "path": "/prims", "query_string": b"", "headers": []})
+        default_key = ResponseCache.get_request_key(request)
+        other_key = ResponseCache.get_request_key(request, context_name=context_name)
+        self.cache.put(default_key, b"default", "application/json")
+        self.cache.put(other_key, b"other", "application/json", context_name=context_name)
+
+        try:
+            # Act
+            context.get_stage().DefinePrim("/World")
+
+            # Assert
+            self.assertIsNotNone(self.cache.get(default_key))
+            self.assertIsNone(self.cache.get(other_key))
+
+            self.cache.put(other_key, b"other", "application/json", context_name=context_name)
+            self.stage.DefinePrim("/World/Mesh")
+            self.assertIsNone(self.cache.get(default_key))
+            self.assertIsNotNone(self.cache.get(other_key))
+        finally:
+            await context.close_stage_async()
+            omni.usd.destroy_context(context_name)
+
+    async def test_put_should_not_be_cached(self):
+        # Act
+        self.client.put(f"{self.service.prefix}/prims")
+        response = self.client.put(f"{self.service.prefix}/prims")
+
+        # Assert
+        self.assertEqual(2, self.service.call_count)
+        self.assertNotIn("X-Cache", response.headers)
+
+    async def test_etag_matches_should_use_weak_comparison(self):
+        # Arrange
+        etag = ResponseCache.compute_etag(b"body")
+
+        # Act / Assert
+        self.assertTrue(ResponseCache.etag_matches(etag, etag))
+        self.assertTrue(ResponseCache.etag_matches(etag, f'"other", W/{etag}'))
+        self.assertTrue(ResponseCache.etag_matches(etag, "*"))
+        self.assertFalse(ResponseCache.etag_matches(etag, '"other"'))
+        self.assertFalse(ResponseCache.etag_matches(etag, None))
+
+    async def test_destroy_or_disabled_cache_should_reset_instance(self):
+        # Arrange
+        settings = carb.settings.get_settings()
+        setting_path = "/exts/omni.flux.service.factory/response_cache/enabled"
+        enabled = settings.get(setting_path)
+
+        try:
+            # Act
+            created_cache = create_response_cache_instance()
+            destroy_response_cache_instance()
+            destroyed_instance = get_response_cache_instance()
+
+            create_response_cache_instance()
+            settings.set(setting_path, False)
+            disabled_cache = create_response_cache_instance()
+            disabled_instance = get_response_cache_instance()
+        finally:
+            settings.set(setting_path, True if enabled is None else enabled)
+            create_response_cache_instance()
+
+        # Assert
+        self.assertIsNotNone(created_cache)
+        self.assertIsNone(destroyed_instance)
+        self.assertIsNone(disabled_cache)
+        self.assertIsNone(disabled_instance)
@@ -15,6 +15,7 @@
 * limitations under the License.
 """
 
+import json
 from unittest.mock import call, patch
 
 from fastapi import Depends, Query
@@ -152,3 +153,17 @@ class TestServiceBase(AsyncTestCase):
         # Assert
         self.assertEqual(cm.exception.status_code, error_code)
         self.assertEqual(cm.exception.detail, str(error_message))
+
+    async def test_stream_ndjson_response_interrupted_items_should_end_with_error_line(self):
+        # Arrange
+        def items():
+            yield from range(3)
+            raise RuntimeError("Accessed invalid expired prim")
+
+        # Act
+        response = TestService.stream_ndjson_response(items())
+        chunks = [chunk async for chunk in response.body_iterator]
+
+        # Assert
+        lines = [json.loads(line) for line in "".join(chunks).splitlines()]
+        self.assertListEqual([0, 1, 2, {"error": "Accessed invalid expired prim"}], lines)
@@ -0,0 +1,186 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import time
+
+import carb
+import omni.usd
+from fastapi.testclient import TestClient
+from omni.flux.service.factory import ServiceBase
+from omni.flux.service.shared import (
+    BaseServiceModel,
+    cached_validator,
+    get_validation_cache,
+    validation_cache_scope,
+)
+from omni.kit.test.async_unittest import AsyncTestCase
+from omni.services.core import main
+from pxr import Sdf
+from pydantic import root_validator
+
+_BENCHMARK_PRIM_COUNT = 1_000
+_BENCHMARK_REQUEST_COUNT = 20
+
+
+class _CountingValidators:
+    call_count = 0
+
+    @classmethod
+    @cached_validator
+    def is_valid_prim(cls, prim_path: str, context_name: str):
+        cls.call_count += 1
+        if not omni.usd.get_context(context_name).get_stage().GetPrimAtPath(prim_path):
+            raise ValueError(f"The prim path does not exist in the current stage: {prim_path}")
+        return prim_path
+
+
+class _PrimPathsModel(BaseServiceModel):
+    prim_paths: list[str]
+    context_name: str = ""
+
+    @root_validator(allow_reuse=True)
+    def prim_paths_valid(cls, values):  # noqa N805
+        for prim_path in values.get("prim_paths"):
+            _CountingValidators.is_valid_prim(prim_path, values.get("context_name"))
+        return values
+
+
+class _ValidationCacheService(ServiceBase):
+    @classmethod
+    @property
+    def prefix(cls) -> str:
+        return "/test-validation-cache"
+
+    def register_endpoints(self):
+        @self.router.get(path="/{prim_paths:path}")
+        async def validate_prims(
+            prim_paths: _PrimPathsModel = ServiceBase.validate_path_param(  # noqa B008
+                _PrimPathsModel, validate_list=True
+            ),
+        ) -> int:
+            # The endpoint body validates the same prims again, like the replacement services do
+            for prim_path in prim_paths.prim_paths:
+                _CountingValidators.is_valid_prim(prim_path, prim_paths.context_name)
+            return len(prim_paths.prim_paths)
+
+
+class TestValidationCache(AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        await omni.usd.get_context().new_stage_async()
+        self.stage = omni.usd.get_context().get_stage()
+        _CountingValidators.call_count = 0
+
+    # After running each test
+    async def tearDown(self):
+        await omni.usd.get_context().close_stage_async()
+        self.stage = None
+
+    def _create_prims(self, count: int) -> list[str]:
+        layer = self.stage.GetRootLayer()
+        prim_paths = [f"/World/Prim_{index}" for index in range(count)]
+        with Sdf.ChangeBlock():
+            for prim_path in prim_paths:
+                Sdf.CreatePrimInLayer(layer, prim_path).specifier = Sdf.SpecifierDef
+        return prim_paths
+
+    async def test_cached_validator_no_scope_should_not_memoize(self):
+        # Arrange
+        prim_path = self._create_prims(1)[0]
+
+        # Act
+        _CountingValidators.is_valid_prim(prim_path, "")
+        _CountingValidators.is_valid_prim(prim_path, "")
+
+        # Assert
+        self.assertIsNone(get_validation_cache())
+        self.assertEqual(2, _CountingValidators.call_count)
+
+    async def test_cached_validator_in_scope_should_memoize_values_and_errors(self):
+        # Arrange
+        prim_path = self._create_prims(1)[0]
+
+        # Act
+        with validation_cache_scope() as cache:
+            for _ in range(3):
+                _CountingValidators.is_valid_prim(prim_path, "")
+                with self.assertRaises(ValueError):
+                    _CountingValidators.is_valid_prim("/World/Invalid", "")
+
+        # Assert
+        self.assertEqual(2, _CountingValidators.call_count)
+        self.assertEqual(2, cache.misses)
+        self.assertEqual(4, cache.hits)
+        self.assertIsNone(get_validation_cache())
+
+    async def test_cached_validator_stage_edit_should_invalidate_results(self):
+        # Arrange
+        prim_path = self._create_prims(1)[0]
+
+        with validation_cache_scope() as cache:
+            _CountingValidators.is_valid_prim(prim_path, "")
+
+            # Act
+            self.stage.RemovePrim(prim_path)
+
+            # Assert
+            with self.assertRaises(ValueError):
+                _CountingValidators.is_valid_prim(prim_path, "")
+            self.assertEqual(1, cache.generation)
+
+        self.assertEqual(2, _CountingValidators.call_count)
+
+    async def test_validation_cache_scope_nested_should_share_cache(self):
+        # Act
+        with validation_cache_scope() as outer_cache:
+            with validation_cache_scope() as inner_cache:
+                pass
+            still_active = get_validation_cache()
+
+        # Assert
+        self.assertIs(outer_cache, inner_cache)
+        self.assertIs(outer_cache, still_active)
+
+    async def test_benchmark_service_request_should_validate_each_prim_once(self):
+        # Arrange
+        prim_paths = self._create_prims(_BENCHMARK_PRIM_COUNT)
+
+        service = _ValidationCacheService()
+        main.register_router(router=service.router, prefix=service.prefix)
+        host = carb.settings.get_settings().get("/exts/omni.services.transport.server.http/host")
+        port = carb.settings.get_settings().get("/exts/omni.services.transport.server.http/port")
+        client = TestClient(main.get_app(), base_url=f"http://{host}:{port}")
+
+        try:
+            # Act
+            start = time.perf_counter()
+            for _ in range(_BENCHMARK_REQUEST_COUNT):
+                response = client.get(f"{service.prefix}/{','.join(prim_paths)}")
+                self.assertTrue(response.is_success)
+            duration = time.perf_counter() - start
+        finally:
+            main.deregister_router(router=service.router)
+
+        carb.log_info(
+            f"Validated {_BENCHMARK_REQUEST_COUNT} requests of {_BENCHMARK_PRIM_COUNT} prims: "
+            f"{_BENCHMARK_REQUEST_COUNT / duration:.1f} requests/s, "
+            f"{_CountingValidators.call_count} validator evaluations"
+        )
+
+        # Assert
+        # The parameter model and the endpoint body share the request validation cache
+        self.assertEqual(_BENCHMARK_PRIM_COUNT * _BENCHMARK_REQUEST_COUNT, _CountingValidators.call_count)
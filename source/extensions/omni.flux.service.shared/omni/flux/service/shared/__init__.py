@@ -15,6 +15,20 @@
 * limitations under the License.
 """
 
-__all__ = ["BaseServiceModel"]
+__all__ = [
+    "NDJSON_MEDIA_TYPE",
+    "BaseServiceModel",
+    "ValidationCache",
+    "cached_validator",
+    "decode_cursor",
+    "encode_cursor",
+    "get_validation_cache",
+    "paginate",
+    "stream_ndjson",
+    "validate_page",
+    "validation_cache_scope",
+]
 
 from .base_model import BaseServiceModel
+from .pagination import NDJSON_MEDIA_TYPE, decode_cursor, encode_cursor, paginate, stream_ndjson, validate_page
+from .validation_cache import ValidationCache, cached_validator, get_validation_cache, validation_cache_scope
@@ -0,0 +1,140 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["NDJSON_MEDIA_TYPE", "decode_cursor", "encode_cursor", "paginate", "stream_ndjson", "validate_page"]
+
+import asyncio
+import base64
+import binascii
+import itertools
+import json
+from typing import Any, AsyncIterator, Callable, Iterable, Optional, Tuple, TypeVar
+
+import carb
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+_T = TypeVar("_T")
+
+
+def encode_cursor(value: str) -> str:
+    """
+    Encode the key of the last item of a page into an opaque, URL-safe cursor
+
+    Args:
+        value: The key of the last item returned
+
+    Returns:
+        The cursor to send back to get the next page
+    """
+    return base64.urlsafe_b64encode(value.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> str:
+    """
+    Decode a cursor created with `encode_cursor`
+
+    Args:
+        cursor: The cursor received in the request
+
+    Raises:
+        ValueError: If the cursor is not valid
+
+    Returns:
+        The key of the last item of the previous page
+    """
+    try:
+        return base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+    except (binascii.Error, UnicodeError) as e:
+        raise ValueError(f"The cursor is not valid: {cursor}") from e
+
+
+def validate_page(limit: Optional[int], cursor: Optional[str]):
+    """
+    Validate the pagination parameters of a query
+
+    Args:
+        limit: The maximum number of items in the page
+        cursor: The cursor of the page
+
+    Raises:
+        ValueError: If the limit is not positive or the cursor is not valid
+    """
+    if limit is not None and limit < 1:
+        raise ValueError(f"The limit must be greater than 0: {limit}")
+    if cursor is not None:
+        decode_cursor(cursor)
+
+
+def paginate(
+    items: Iterable[_T], limit: Optional[int], get_key: Callable[[_T], str]
+) -> Tuple[list[_T], Optional[str]]:
+    """
+    Consume a page of items from a lazy iterable.
+
+    Only `limit + 1` items are consumed so the rest of the iterable is never computed.
+
+    Args:
+        items: The items in a stable order
+        limit: The maximum number of items in the page. If None, every item is returned.
+        get_key: Get the key of an item used to resume the iteration after it
+
+    Returns:
+        The page items and the cursor of the next page, or None if this is the last page
+    """
+    if limit is None:
+        return list(items), None
+
+    page = list(itertools.islice(items, limit + 1))
+    if len(page) <= limit:
+        return page, None
+    page = page[:limit]
+    return page, encode_cursor(get_key(page[-1]))
+
+
+async def stream_ndjson(
+    items: Iterable[Any], serialize: Callable[[Any], Any] = None, chunk_size: int = 256
+) -> AsyncIterator[str]:
+    """
+    Stream items as newline-delimited JSON, yielding control to the event loop between chunks.
+
+    The response status is already sent when the items are consumed, so an error raised by a lazy iterable (for
+    example a stage traversal invalidated by a stage edit between chunks) ends the stream with an `{"error": ...}` line
+    instead of silently truncating it.
+
+    Args:
+        items: The items to stream. Lazy iterables are consumed as the response is sent.
+        serialize: Convert an item to a JSON-serializable value
+        chunk_size: The number of lines sent per chunk
+
+    Returns:
+        An async iterator of NDJSON chunks
+    """
+    lines = []
+    try:
+        for item in items:
+            lines.append(json.dumps(serialize(item) if serialize else item))
+            if len(lines) >= chunk_size:
+                yield "\n".join(lines) + "\n"
+                lines = []
+                # Let the app process other events while the rest of the items are computed
+                await asyncio.sleep(0)
+    except Exception as e:  # noqa PLW0718
+        carb.log_warn(f"The NDJSON stream was interrupted: {e}")
+        lines.append(json.dumps({"error": str(e) or type(e).__name__}))
+    if lines:
+        yield "\n".join(lines) + "\n"
@@ -0,0 +1,154 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["ValidationCache", "cached_validator", "get_validation_cache", "validation_cache_scope"]
+
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from pxr import Tf, Usd
+
+_VALIDATION_CACHE: ContextVar[Optional["ValidationCache"]] = ContextVar("flux_service_validation_cache", default=None)
+
+
+class ValidationCache:
+    """
+    Memoize validation results for the duration of a request.
+
+    Any change to a USD stage invalidates the cached results so a validator never returns a result computed for a
+    previous stage edit generation.
+    """
+
+    def __init__(self):
+        # {key: (valid, returned value or raised error)}
+        self._results: Dict[Hashable, Tuple[bool, Any]] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._listener = Tf.Notice.RegisterGlobally(Usd.Notice.ObjectsChanged, self._on_objects_changed)
+
+    @property
+    def generation(self) -> int:
+        """The number of stage changes since the cache was created"""
+        return self._generation
+
+    def get_or_compute(self, key: Hashable, compute_fn: Callable[[], Any]) -> Any:
+        """
+        Get the cached result of a validation or compute it.
+
+        Args:
+            key: a unique key for the validation and its arguments
+            compute_fn: the validation to run if no result is cached
+
+        Raises:
+            ValueError: The cached or raised validation error
+
+        Returns:
+            The value returned by the validation
+        """
+        result = self._results.get(key)
+        if result is not None:
+            self.hits += 1
+            valid, value = result
+            if valid:
+                return value
+            raise value
+
+        self.misses += 1
+        try:
+            value = compute_fn()
+        except ValueError as e:
+            self._results[key] = (False, e)
+            raise
+        self._results[key] = (True, value)
+        return value
+
+    def clear(self):
+        self._results.clear()
+
+    def _on_objects_changed(self, *_):
+        self._generation += 1
+        self.clear()
+
+    def destroy(self):
+        if self._listener:
+            self._listener.Revoke()
+        self._listener = None
+        self.clear()
+
+
+def get_validation_cache() -> Optional[ValidationCache]:
+    """
+    Returns:
+        The validation cache of the current scope or None if no scope is active
+    """
+    return _VALIDATION_CACHE.get()
+
+
+@contextmanager
+def validation_cache_scope():
+    """
+    Create a validation cache for the duration of the context. Nested scopes share the outermost cache.
+    """
+    cache = _VALIDATION_CACHE.get()
+    if cache is not None:
+        yield cache
+        return
+
+    cache = ValidationCache()
+    token = _VALIDATION_CACHE.set(cache)
+    try:
+        yield cache
+    finally:
+        cache.destroy()
+        try:
+            _VALIDATION_CACHE.reset(token)
+        except ValueError:
+            # The scope was exited in a different context than the one it was entered in
+            _VALIDATION_CACHE.set(None)
+
+
+def _make_cache_key(func: Callable, *args, **kwargs) -> Hashable:
+    return func.__module__, func.__qualname__, args, tuple(sorted(kwargs.items()))
+
+
+def cached_validator(func: Callable) -> Callable:
+    """
+    Memoize the result of a validator in the active validation cache scope.
+
+    The validator is called normally when no scope is active or when the arguments are not hashable. Both returned
+    values and raised `ValueError` are memoized.
+
+    The decorated function exposes `cache_key(*args, **kwargs)` so bulk validators can share the per-item results.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = _VALIDATION_CACHE.get()
+        if cache is None:
+            return func(*args, **kwargs)
+        key = _make_cache_key(func, *args, **kwargs)
+        try:
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+        return cache.get_or_compute(key, lambda: func(*args, **kwargs))
+
+    wrapper.cache_key = functools.partial(_make_cache_key, func)
+    return wrapper
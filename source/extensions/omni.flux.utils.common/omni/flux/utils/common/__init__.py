@@ -16,12 +16,14 @@
 """
 
 __all__ = [
+    "FluxUtilsCommonExtension",
     "Event",
     "EventSubscription",
     "async_wrap",
     "reset_default_attrs",
     "Converter",
     "Serializer",
+    "lazy_import",
 ]
 
 # `layer_utils` and `path_utils` should be imported directly from the module to add context to the import:
@@ -33,5 +35,7 @@ __all__ = [
 # respective modules.
 
 from .event import *
+from .extension import FluxUtilsCommonExtension
+from .imports import lazy_import
 from .serialize import Converter, Serializer
 from .utils import *
@@ -0,0 +1,45 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["FluxUtilsCommonExtension"]
+
+import carb
+import omni.ext
+import omni.usd
+
+from .material_binding_index import destroy_material_binding_indices as _destroy_material_binding_indices
+from .material_binding_index import drop_closed_material_binding_indices as _drop_closed_material_binding_indices
+
+
+class FluxUtilsCommonExtension(omni.ext.IExt):
+    def on_startup(self, _ext_id):
+        carb.log_info("[omni.flux.utils.common] Startup")
+        # Indices of the stages of other contexts are dropped the next time an index is requested
+        self._stage_event_sub = (
+            omni.usd.get_context()
+            .get_stage_event_stream()
+            .create_subscription_to_pop(self._on_stage_event, name="MaterialBindingIndexStageEvent")
+        )
+
+    def _on_stage_event(self, event):
+        if event.type == int(omni.usd.StageEventType.CLOSED):
+            _drop_closed_material_binding_indices()
+
+    def on_shutdown(self):
+        carb.log_info("[omni.flux.utils.common] Shutdown")
+        self._stage_event_sub = None
+        _destroy_material_binding_indices()
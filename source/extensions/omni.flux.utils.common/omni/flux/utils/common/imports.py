@@ -0,0 +1,61 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["lazy_import"]
+
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+
+_LOCK = threading.Lock()
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import a module without executing it until one of its attributes is used.
+
+    Use it for heavy dependencies (numpy, PIL, ...) that are only needed when a feature is used, to keep their import
+    cost out of the app startup:
+
+        np = lazy_import("numpy")
+        Image = lazy_import("PIL.Image")
+
+    The parent packages of the module are imported right away. Modules that are already imported are returned as-is.
+
+    Args:
+        name: the absolute name of the module to import
+
+    Returns:
+        The module
+    """
+    with _LOCK:
+        module = sys.modules.get(name)
+        if module is not None:
+            return module
+        spec = importlib.util.find_spec(name)
+        if spec is None:
+            raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+        spec.loader = importlib.util.LazyLoader(spec.loader)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        # Bind the module to its parent package like the import statement does, so `import a.b` then `a.b` works
+        parent_name, _, child_name = name.rpartition(".")
+        if parent_name:
+            setattr(sys.modules[parent_name], child_name, module)
+        return module
@@ -0,0 +1,274 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = [
+    "MaterialBindingIndex",
+    "destroy_material_binding_indices",
+    "drop_closed_material_binding_indices",
+    "get_material_binding_index",
+]
+
+from typing import Dict, Iterable, List, Optional, Set
+
+from pxr import Sdf, Tf, Usd, UsdGeom, UsdShade, UsdUtils
+
+_BINDING_PREFIX = UsdShade.Tokens.materialBinding
+_COLLECTION_PREFIX = "collection:"
+
+# {root layer identifier: index}
+_INDICES: Dict[str, "MaterialBindingIndex"] = {}
+
+
+def _is_bindable(prim: Usd.Prim) -> bool:
+    return prim.IsA(UsdGeom.Imageable) or prim.IsA(UsdGeom.Subset)
+
+
+class MaterialBindingIndex:
+    """
+    Index the resolved material bindings of a stage in both directions: prim -> material and material -> bound prims.
+
+    The bindings are resolved in bulk with `UsdShade.MaterialBindingAPI.ComputeBoundMaterials` the first time the index
+    is queried. Changes to the prims or to their `material:binding` relationships only resolve the bindings of the
+    changed subtrees again, while changes to collection-based bindings or to the material prims resolve every binding
+    again.
+    """
+
+    def __init__(self, stage: Usd.Stage, purpose: str = UsdShade.Tokens.allPurpose):
+        self._stage = stage
+        self._purpose = purpose
+
+        # {bound prim path: material path}
+        self._prim_materials: Dict[Sdf.Path, Sdf.Path] = {}
+        # {material path: bound prim paths}
+        self._material_prims: Dict[Sdf.Path, Set[Sdf.Path]] = {}
+        # The material prims of the stage, used as an ordered set
+        self._materials: Dict[Sdf.Path, None] = {}
+
+        self._built = False
+        self._dirty_roots: Set[Sdf.Path] = set()
+        # Stages opened in a USD context are in the stage cache until they are closed
+        self._cached = UsdUtils.StageCache.Get().Contains(stage)
+        self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+
+    @property
+    def stage(self) -> Usd.Stage:
+        return self._stage
+
+    @property
+    def closed(self) -> bool:
+        """Whether the stage of the index expired or was closed by its USD context"""
+        if self._stage.expired:
+            return True
+        return self._cached and not UsdUtils.StageCache.Get().Contains(self._stage)
+
+    def get_bound_material(self, prim_path: Sdf.Path) -> Optional[Sdf.Path]:
+        """
+        Args:
+            prim_path: The path of a bindable prim
+
+        Returns:
+            The path of the material bound to the prim, or None if no material is bound
+        """
+        self._update()
+        return self._prim_materials.get(Sdf.Path(prim_path))
+
+    def get_bound_prims(self, material_path: Sdf.Path) -> Set[Sdf.Path]:
+        """
+        Args:
+            material_path: The path of a material
+
+        Returns:
+            The paths of the prims the material is bound to
+        """
+        self._update()
+        return set(self._material_prims.get(Sdf.Path(material_path), ()))
+
+    def get_assigned_materials(self) -> Set[Sdf.Path]:
+        """
+        Returns:
+            The paths of the materials bound to at least one prim
+        """
+        self._update()
+        return set(self._material_prims)
+
+    def get_materials(self) -> List[Sdf.Path]:
+        """
+        Returns:
+            The paths of every material of the stage
+        """
+        self._update()
+        return list(self._materials)
+
+    def invalidate(self, prim_path: Optional[Sdf.Path] = None):
+        """
+        Resolve the bindings again on the next query
+
+        Args:
+            prim_path: The root of the subtree to resolve again. If None, every binding will be resolved again.
+        """
+        if prim_path is None or prim_path == Sdf.Path.absoluteRootPath:
+            self._built = False
+            self._dirty_roots.clear()
+            return
+        if self._built:
+            self._dirty_roots.add(prim_path)
+
+    def _update(self):
+        if not self._built:
+            self._build()
+            return
+        if not self._dirty_roots:
+            return
+
+        # Only keep the highest dirty roots
+        roots = []
+        for path in sorted(self._dirty_roots):
+            if not roots or not path.HasPrefix(roots[-1]):
+                roots.append(path)
+        self._dirty_roots.clear()
+
+        root_set = set(roots)
+        for prim_path in [path for path in self._prim_materials if self._is_under(path, root_set)]:
+            self._remove_binding(prim_path)
+        previous_materials = {path for path in self._materials if self._is_under(path, root_set)}
+        for material_path in previous_materials:
+            del self._materials[material_path]
+
+        for root in roots:
+            prim = self._stage.GetPrimAtPath(root)
+            if prim:
+                self._index_prims(Usd.PrimRange(prim, Usd.TraverseInstanceProxies(Usd.PrimAllPrimsPredicate)))
+
+        # Prims outside of the dirty subtrees can be bound to the materials that were removed, or have a binding
+        # targeting a material that was just created
+        if previous_materials != {path for path in self._materials if self._is_under(path, root_set)}:
+            self._build()
+
+    def _build(self):
+        self._prim_materials = {}
+        self._material_prims = {}
+        self._materials = {}
+        self._dirty_roots.clear()
+        self._index_prims(
+            Usd.PrimRange(self._stage.GetPseudoRoot(), Usd.TraverseInstanceProxies(Usd.PrimAllPrimsPredicate))
+        )
+        self._built = True
+
+    def _index_prims(self, prims: Iterable[Usd.Prim]):
+        bindable_prims = []
+        for prim in prims:
+            if prim.IsA(UsdShade.Material):
+                # Same materials as `Usd.Stage.TraverseAll`, instance proxies excluded
+                if not prim.IsInstanceProxy():
+                    self._materials[prim.GetPath()] = None
+            elif _is_bindable(prim):
+                bindable_prims.append(prim)
+        if not bindable_prims:
+            return
+
+        materials, _ = UsdShade.MaterialBindingAPI.ComputeBoundMaterials(bindable_prims, self._purpose)
+        for prim, material in zip(bindable_prims, materials):
+            if not material:
+                continue
+            prim_path = prim.GetPath()
+            material_path = material.GetPath()
+            self._prim_materials[prim_path] = material_path
+            self._material_prims.setdefault(material_path, set()).add(prim_path)
+
+    def _remove_binding(self, prim_path: Sdf.Path):
+        material_path = self._prim_materials.pop(prim_path)
+        bound_prims = self._material_prims.get(material_path)
+        if bound_prims is None:
+            return
+        bound_prims.discard(prim_path)
+        if not bound_prims:
+            del self._material_prims[material_path]
+
+    @staticmethod
+    def _is_under(path: Sdf.Path, roots: Set[Sdf.Path]) -> bool:
+        return any(prefix in roots for prefix in path.GetPrefixes())
+
+    def _on_objects_changed(self, notice, _):
+        if not self._built:
+            return
+        for path in notice.GetResyncedPaths():
+            if not path.IsPropertyPath():
+                self.invalidate(path)
+            else:
+                self._on_property_changed(path)
+            if not self._built:
+                return
+        for path in notice.GetChangedInfoOnlyPaths():
+            if path.IsPropertyPath():
+                self._on_property_changed(path)
+            if not self._built:
+                return
+
+    def _on_property_changed(self, path: Sdf.Path):
+        name = path.name
+        # Collection-based bindings and collections can bind materials to any prim of the stage
+        if name.startswith(_COLLECTION_PREFIX) or (name.startswith(_BINDING_PREFIX) and ":collection" in name):
+            self.invalidate()
+        elif name.startswith(_BINDING_PREFIX):
+            # Direct bindings are inherited by the descendants
+            self.invalidate(path.GetPrimPath())
+
+    def destroy(self):
+        if self._listener:
+            self._listener.Revoke()
+        self._listener = None
+        self._prim_materials = {}
+        self._material_prims = {}
+        self._materials = {}
+        self._built = False
+
+
+def get_material_binding_index(stage: Usd.Stage) -> MaterialBindingIndex:
+    """
+    Get the shared material binding index of a stage
+
+    Args:
+        stage: The stage to get the index for
+
+    Returns:
+        The binding index of the stage
+    """
+    drop_closed_material_binding_indices()
+
+    key = stage.GetRootLayer().identifier
+    index = _INDICES.get(key)
+    if index is not None and index.stage == stage:
+        return index
+    if index is not None:
+        index.destroy()
+    index = MaterialBindingIndex(stage)
+    _INDICES[key] = index
+    return index
+
+
+def drop_closed_material_binding_indices():
+    """Drop the indices of the stages that were closed, releasing the stages"""
+    for identifier, index in list(_INDICES.items()):
+        if index.closed:
+            index.destroy()
+            del _INDICES[identifier]
+
+
+def destroy_material_binding_indices():
+    for index in _INDICES.values():
+        index.destroy()
+    _INDICES.clear()
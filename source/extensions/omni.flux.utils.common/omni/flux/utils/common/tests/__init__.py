@@ -16,7 +16,9 @@
 """
 
 from .unit.test_decorators import TestLimitRecursion
+from .unit.test_imports import TestLazyImport
 from .unit.test_layer_utils import TestLayerUtils
+from .unit.test_material_binding_index import TestMaterialBindingIndex
 from .unit.test_omni_url import TestOmniUrl
 from .unit.test_path_utils import TestPathUtils
 from .unit.test_serialize import TestSerializer
@@ -0,0 +1,90 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import omni.kit.test
+from omni.flux.utils.common import lazy_import
+
+_MODULE_NAME = "flux_test_lazy_import_module"
+_PACKAGE_NAME = "flux_test_lazy_import_package"
+# Set by the test module when it is executed. Reading the module attributes would execute it.
+_EXECUTED_VARIABLE = "FLUX_TEST_LAZY_IMPORT_EXECUTED"
+
+
+class TestLazyImport(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        (Path(self.temp_dir.name) / f"{_MODULE_NAME}.py").write_text(
+            f"import os\nos.environ['{_EXECUTED_VARIABLE}'] = '1'\nVALUE = 42\n", encoding="utf8"
+        )
+        package_dir = Path(self.temp_dir.name) / _PACKAGE_NAME
+        package_dir.mkdir()
+        (package_dir / "__init__.py").write_text("", encoding="utf8")
+        (package_dir / "child.py").write_text("VALUE = 42\n", encoding="utf8")
+        sys.path.insert(0, self.temp_dir.name)
+
+    # After running each test
+    async def tearDown(self):
+        sys.path.remove(self.temp_dir.name)
+        sys.modules.pop(_MODULE_NAME, None)
+        sys.modules.pop(f"{_PACKAGE_NAME}.child", None)
+        sys.modules.pop(_PACKAGE_NAME, None)
+        os.environ.pop(_EXECUTED_VARIABLE, None)
+        self.temp_dir.cleanup()
+
+    async def test_lazy_import_should_execute_module_on_first_attribute_access(self):
+        # Arrange
+        module = lazy_import(_MODULE_NAME)
+
+        # Act
+        executed_before_access = _EXECUTED_VARIABLE in os.environ
+        value = module.VALUE
+
+        # Assert
+        self.assertFalse(executed_before_access)
+        self.assertEqual(value, 42)
+        self.assertIn(_EXECUTED_VARIABLE, os.environ)
+        self.assertIs(lazy_import(_MODULE_NAME), sys.modules[_MODULE_NAME])
+
+    async def test_lazy_import_submodule_should_be_bound_to_its_parent_package(self):
+        # Act
+        module = lazy_import(f"{_PACKAGE_NAME}.child")
+        package = sys.modules[_PACKAGE_NAME]
+
+        # Assert
+        self.assertIs(package.child, module)
+        self.assertEqual(package.child.VALUE, 42)
+
+    async def test_lazy_import_should_return_imported_modules(self):
+        # Arrange
+        import json
+
+        # Act
+        module = lazy_import("json")
+
+        # Assert
+        self.assertIs(module, json)
+
+    async def test_lazy_import_missing_module_should_raise(self):
+        # Act
+        with self.assertRaises(ModuleNotFoundError):
+            lazy_import("flux_test_missing_module")
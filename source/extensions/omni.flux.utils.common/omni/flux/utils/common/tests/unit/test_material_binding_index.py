@@ -0,0 +1,167 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import time
+
+import carb
+import omni.kit.test
+from omni.flux.utils.common.material_binding_index import (
+    MaterialBindingIndex,
+    destroy_material_binding_indices,
+    get_material_binding_index,
+)
+from pxr import Sdf, Usd, UsdGeom, UsdShade, UsdUtils
+
+_BENCHMARK_MESH_COUNT = 5_000
+
+
+class TestMaterialBindingIndex(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.stage = Usd.Stage.CreateInMemory()
+        self.index = MaterialBindingIndex(self.stage)
+
+    # After running each test
+    async def tearDown(self):
+        self.index.destroy()
+        self.index = None
+        self.stage = None
+
+    def _create_material(self, index: int) -> UsdShade.Material:
+        return UsdShade.Material.Define(self.stage, f"/Looks/mat_{index}")
+
+    def _create_mesh(self, index: int, material: UsdShade.Material = None) -> UsdGeom.Mesh:
+        mesh = UsdGeom.Mesh.Define(self.stage, f"/meshes/mesh_{index}/mesh")
+        if material:
+            UsdShade.MaterialBindingAPI.Apply(mesh.GetPrim()).Bind(material)
+        return mesh
+
+    async def test_get_bound_material_should_resolve_bindings_in_both_directions(self):
+        # Arrange
+        material_0 = self._create_material(0)
+        self._create_material(1)
+        self._create_mesh(0, material_0)
+        self._create_mesh(1, material_0)
+        self._create_mesh(2)
+
+        # Act
+        mesh_0_material = self.index.get_bound_material("/meshes/mesh_0/mesh")
+        mesh_2_material = self.index.get_bound_material("/meshes/mesh_2/mesh")
+        bound_prims = self.index.get_bound_prims("/Looks/mat_0")
+
+        # Assert
+        self.assertEqual(mesh_0_material, Sdf.Path("/Looks/mat_0"))
+        self.assertIsNone(mesh_2_material)
+        self.assertSetEqual(bound_prims, {Sdf.Path("/meshes/mesh_0/mesh"), Sdf.Path("/meshes/mesh_1/mesh")})
+        self.assertListEqual(self.index.get_materials(), [Sdf.Path("/Looks/mat_0"), Sdf.Path("/Looks/mat_1")])
+        self.assertSetEqual(self.index.get_assigned_materials(), {Sdf.Path("/Looks/mat_0")})
+
+    async def test_binding_changes_should_update_index(self):
+        # Arrange
+        material_0 = self._create_material(0)
+        material_1 = self._create_material(1)
+        self._create_mesh(0, material_0)
+        mesh_1 = self._create_mesh(1, material_0)
+        self.index.get_materials()
+
+        # Act
+        UsdShade.MaterialBindingAPI(mesh_1.GetPrim()).Bind(material_1)
+        self.stage.RemovePrim("/meshes/mesh_0")
+        # Bindings are inherited by the descendants
+        parent = self.stage.GetPrimAtPath("/meshes")
+        UsdShade.MaterialBindingAPI.Apply(parent).Bind(material_0)
+        self._create_mesh(2)
+
+        # Assert
+        self.assertEqual(self.index.get_bound_material("/meshes/mesh_1/mesh"), Sdf.Path("/Looks/mat_1"))
+        self.assertEqual(self.index.get_bound_material("/meshes/mesh_2/mesh"), Sdf.Path("/Looks/mat_0"))
+        self.assertIsNone(self.index.get_bound_material("/meshes/mesh_0/mesh"))
+        self.assertNotIn(Sdf.Path("/meshes/mesh_0/mesh"), self.index.get_bound_prims("/Looks/mat_0"))
+
+    async def test_material_prim_changes_should_update_bindings_outside_of_the_changed_subtree(self):
+        # Arrange
+        material_0 = self._create_material(0)
+        self._create_mesh(0, material_0)
+        mesh_1 = self._create_mesh(1)
+        # Dangling binding: the material does not exist yet
+        UsdShade.MaterialBindingAPI.Apply(mesh_1.GetPrim()).GetDirectBindingRel().SetTargets(["/Looks/mat_1"])
+        self.index.get_materials()
+
+        # Act
+        self.stage.RemovePrim("/Looks/mat_0")
+        self._create_material(1)
+
+        # Assert
+        self.assertIsNone(self.index.get_bound_material("/meshes/mesh_0/mesh"))
+        self.assertSetEqual(self.index.get_bound_prims("/Looks/mat_0"), set())
+        self.assertEqual(self.index.get_bound_material("/meshes/mesh_1/mesh"), Sdf.Path("/Looks/mat_1"))
+        self.assertListEqual(self.index.get_materials(), [Sdf.Path("/Looks/mat_1")])
+
+    async def test_get_material_binding_index_should_drop_the_indices_of_closed_stages(self):
+        # Arrange
+        stage = Usd.Stage.CreateInMemory()
+        stage_cache = UsdUtils.StageCache.Get()
+        stage_id = stage_cache.Insert(stage)
+        index = get_material_binding_index(stage)
+
+        try:
+            # Act
+            same_index = get_material_binding_index(stage)
+            stage_cache.Erase(stage_id)
+            get_material_binding_index(self.stage)
+
+            # Assert
+            self.assertIs(index, same_index)
+            self.assertTrue(index.closed)
+            self.assertIsNone(index._listener)  # noqa PLW0212
+            self.assertIsNot(index, get_material_binding_index(stage))
+        finally:
+            stage_cache.Erase(stage_id)
+            destroy_material_binding_indices()
+
+    async def test_benchmark_bound_materials(self):
+        # Arrange
+        materials = [self._create_material(index) for index in range(10)]
+        with Sdf.ChangeBlock():
+            for index in range(_BENCHMARK_MESH_COUNT):
+                self._create_mesh(index, materials[index % len(materials)])
+        mesh_paths = [f"/meshes/mesh_{index}/mesh" for index in range(_BENCHMARK_MESH_COUNT)]
+
+        # Act
+        start = time.perf_counter()
+        expected = {}
+        for mesh_path in mesh_paths:
+            material, _ = UsdShade.MaterialBindingAPI(self.stage.GetPrimAtPath(mesh_path)).ComputeBoundMaterial()
+            expected[Sdf.Path(mesh_path)] = material.GetPath()
+        per_prim_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indexed = {Sdf.Path(mesh_path): self.index.get_bound_material(mesh_path) for mesh_path in mesh_paths}
+        index_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for mesh_path in mesh_paths:
+            self.index.get_bound_material(mesh_path)
+        lookup_duration = time.perf_counter() - start
+
+        carb.log_info(
+            f"Bound materials of {_BENCHMARK_MESH_COUNT} meshes: per prim {per_prim_duration:.3f}s, "
+            f"index build and lookup {index_duration:.3f}s, indexed lookup {lookup_duration:.4f}s"
+        )
+
+        # Assert
+        self.assertDictEqual(indexed, expected)
@@ -0,0 +1,96 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["AttributeEdit", "SetMaterialAttributesCommand"]
+
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+import carb
+import omni.kit.commands
+from pxr import Sdf
+
+
+@dataclass(frozen=True)
+class AttributeEdit:
+    """
+    An attribute value to author on a layer
+    """
+
+    prop_path: str
+    value: Any
+    # The type used to create the attribute spec if it doesn't exist yet
+    type_name: Optional[Sdf.ValueTypeName] = None
+
+
+class SetMaterialAttributesCommand(omni.kit.commands.Command):
+    """
+    Author many attribute values on a layer inside a single Sdf change block. **Command**.
+
+    Args:
+        edits (List[AttributeEdit]): The attribute values to author.
+        layer (Sdf.Layer): The layer to author the values on.
+    """
+
+    def __init__(self, edits: List[AttributeEdit], layer: Sdf.Layer):
+        self._edits = edits
+        self._layer = layer
+        # (property path, spec existed, previous default value)
+        self._previous_values: List[Tuple[Sdf.Path, bool, Any]] = []
+
+    def do(self):
+        self._previous_values = []
+        with Sdf.ChangeBlock():
+            for edit in self._edits:
+                prop_path = Sdf.Path(edit.prop_path)
+                attr_spec = self._layer.GetAttributeAtPath(prop_path)
+                if attr_spec:
+                    self._previous_values.append(
+                        (prop_path, True, attr_spec.default if attr_spec.HasDefaultValue() else None)
+                    )
+                else:
+                    prim_spec = self._layer.GetPrimAtPath(prop_path.GetPrimPath())
+                    if not prim_spec or edit.type_name is None:
+                        carb.log_warn(f"{self.__class__.__name__}: Unable to create the attribute '{prop_path}'")
+                        continue
+                    # Author the attribute the same way `Usd.Prim.CreateAttribute` does
+                    attr_spec = Sdf.AttributeSpec(
+                        prim_spec, prop_path.name, edit.type_name, Sdf.VariabilityVarying, declaresCustom=True
+                    )
+                    self._previous_values.append((prop_path, False, None))
+
+                if edit.value is None:
+                    attr_spec.ClearDefaultValue()
+                else:
+                    attr_spec.default = edit.value
+
+    def undo(self):
+        with Sdf.ChangeBlock():
+            for prop_path, existed, value in reversed(self._previous_values):
+                attr_spec = self._layer.GetAttributeAtPath(prop_path)
+                if not attr_spec:
+                    continue
+                if not existed:
+                    attr_spec.owner.RemoveProperty(attr_spec)
+                elif value is None:
+                    attr_spec.ClearDefaultValue()
+                else:
+                    attr_spec.default = value
+        self._previous_values = []
+
+
+omni.kit.commands.register_all_commands_in_module(__name__)
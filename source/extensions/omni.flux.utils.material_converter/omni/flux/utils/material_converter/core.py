@@ -15,13 +15,18 @@
 * limitations under the License.
 """
 
-from typing import TYPE_CHECKING, Optional, Tuple
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import carb
 import omni.kit
+import omni.kit.commands
+import omni.kit.undo
 import omni.usd
 from pxr import Sdf, Usd, UsdShade
 
+from .commands import AttributeEdit as _AttributeEdit
 from .mapping import Converters as _ConvertersEnum
 
 if TYPE_CHECKING:
@@ -29,6 +34,19 @@ if TYPE_CHECKING:
     from .utils import SupportedShaderInputs as _SupportedShaderInputs
 
 
+@dataclass
+class _MaterialConversion:
+    """
+    A material conversion with its temporary output material created
+    """
+
+    converter: "ConverterBase"
+    input_shader_prim: Optional[Usd.Prim]
+    output_shader_prim: Usd.Prim
+    output_material_path: Sdf.Path
+    has_source_prop_spec: bool
+
+
 class MaterialConverterCore:
     @staticmethod
     async def convert(context_name: str, converter: "ConverterBase") -> Tuple[bool, Optional[str], bool]:
@@ -49,12 +67,106 @@ class MaterialConverterCore:
         if not stage:
             return False, f"Unable to get the stage in context with name {context_name}", False
 
+        conversion, result = MaterialConverterCore._prepare_conversion(context_name, stage, converter)
+        if not conversion:
+            return result
+
+        if conversion.input_shader_prim:
+            # TODO Bug OM-90672: `load_mdl_parameters_for_prim_async` will not work with non-default contexts
+            # In the meantime, we create attributes on the temporary material and then set them
+            # When the bug is resolved, cleanup all the material creation & alt translation functions
+            await MaterialConverterCore._create_material_attributes(
+                context_name, converter, conversion.input_shader_prim, conversion.output_shader_prim
+            )
+            # await MaterialConverterCore._convert_material_attributes(
+            #     context_name, converter, input_shader_prim, output_shader_prim
+            # )
+
+        return MaterialConverterCore._finalize_conversion(context_name, stage, conversion)
+
+    @staticmethod
+    async def convert_batch(
+        context_name: str, converters: List["ConverterBase"]
+    ) -> List[Tuple[bool, Optional[str], bool]]:
+        """
+        Convert many materials at once.
+
+        The attribute edits of every material are computed first and then authored in a single change block. The whole
+        conversion is grouped in a single undo entry.
+
+        Args:
+            context_name: the context to use
+            converters: the converters to use, one per material
+
+        Returns:
+            A list of (Success, message, skipped or not), in the order of the converters
+        """
+        context = omni.usd.get_context(context_name)
+        if not context:
+            return [(False, f"Unable to get the context with name {context_name}", False)] * len(converters)
+        stage = context.get_stage()
+        if not stage:
+            return [(False, f"Unable to get the stage in context with name {context_name}", False)] * len(converters)
+
+        root_layer = stage.GetRootLayer()
+        session_layer = stage.GetSessionLayer()
+
+        start = time.perf_counter()
+        results: List[Optional[Tuple[bool, Optional[str], bool]]] = [None] * len(converters)
+        conversions: List[Tuple[int, _MaterialConversion]] = []
+        edits: List[_AttributeEdit] = []
+
+        with omni.kit.undo.group():
+            # Create the temporary output materials & compute all the attribute edits
+            for index, converter in enumerate(converters):
+                conversion, result = MaterialConverterCore._prepare_conversion(context_name, stage, converter)
+                if not conversion:
+                    results[index] = result
+                    continue
+                if conversion.input_shader_prim:
+                    edits.extend(
+                        MaterialConverterCore._compute_attribute_edits(
+                            root_layer,
+                            session_layer,
+                            converter,
+                            conversion.input_shader_prim,
+                            conversion.output_shader_prim,
+                        )
+                    )
+                conversions.append((index, conversion))
+
+            # Author all the attribute values at once
+            if edits:
+                omni.kit.commands.execute("SetMaterialAttributesCommand", edits=edits, layer=root_layer)
+
+            # Replace the input materials with the converted materials
+            for index, conversion in conversions:
+                results[index] = MaterialConverterCore._finalize_conversion(context_name, stage, conversion)
+
+        duration = time.perf_counter() - start
+        carb.log_info(
+            f"Converted {len(conversions)} materials with {len(edits)} attribute edits in {duration:.3f}s "
+            f"({len(edits) / duration if duration else 0:.0f} edits/s)"
+        )
+
+        return results
+
+    @staticmethod
+    def _prepare_conversion(
+        context_name: str, stage: Usd.Stage, converter: "ConverterBase"
+    ) -> Tuple[Optional[_MaterialConversion], Optional[Tuple[bool, Optional[str], bool]]]:
+        """
+        Create the temporary output material of a conversion.
+
+        Returns:
+            The conversion, or None and the result of the conversion if nothing should be converted
+        """
         root_layer = stage.GetRootLayer()
 
         # If the input prim is not defined on this layer, we don't need to convert anything
         prim_spec = root_layer.GetPrimAtPath(converter.input_material_prim.GetPath())
         if not prim_spec:
-            return True, f"Input material prim was not defined on layer: '{root_layer.identifier}'", True
+            return None, (True, f"Input material prim was not defined on layer: '{root_layer.identifier}'", True)
 
         # Get a valid prim path for a temporary output prim
         output_material_path = Sdf.Path(
@@ -76,7 +188,7 @@ class MaterialConverterCore:
 
             input_shader_prim = input_shader.GetPrim()
             if not input_shader_prim:
-                return False, "Unable to fetch input material shader prim", False
+                return None, (False, "Unable to fetch input material shader prim", False)
 
         output_shader_prim = None
         if has_source_prop_spec:
@@ -93,20 +205,29 @@ class MaterialConverterCore:
             )
 
         if not output_shader_prim:
-            return False, "Unable to fetch output material shader prim", False
+            return None, (False, "Unable to fetch output material shader prim", False)
 
-        if input_shader:
-            # TODO Bug OM-90672: `load_mdl_parameters_for_prim_async` will not work with non-default contexts
-            # In the meantime, we create attributes on the temporary material and then set them
-            # When the bug is resolved, cleanup all the material creation & alt translation functions
-            await MaterialConverterCore._create_material_attributes(
-                context_name, converter, input_shader_prim, output_shader_prim
-            )
-            # await MaterialConverterCore._convert_material_attributes(
-            #     context_name, converter, input_shader_prim, output_shader_prim
-            # )
+        return (
+            _MaterialConversion(
+                converter=converter,
+                input_shader_prim=input_shader_prim,
+                output_shader_prim=output_shader_prim,
+                output_material_path=output_material_path,
+                has_source_prop_spec=has_source_prop_spec,
+            ),
+            None,
+        )
 
-        input_material_path = converter.input_material_prim.GetPath()
+    @staticmethod
+    def _finalize_conversion(
+        context_name: str, stage: Usd.Stage, conversion: _MaterialConversion
+    ) -> Tuple[bool, Optional[str], bool]:
+        """
+        Replace the input material with the temporary output material of a conversion
+        """
+        root_layer = stage.GetRootLayer()
+        input_material_path = conversion.converter.input_material_prim.GetPath()
+        output_material_path = conversion.output_material_path
 
         # Delete the original material
         omni.kit.commands.execute(
@@ -120,7 +241,7 @@ class MaterialConverterCore:
         # Using commands here will increment the name and cause the replacement to fail
         root_layer.GetPrimAtPath(output_material_path).name = input_material_path.name
 
-        if has_source_prop_spec:
+        if conversion.has_source_prop_spec:
             # Make sure we fix the connections to point to the newly renamed prim
             final_material_prim = stage.GetPrimAtPath(input_material_path)
             for attr in final_material_prim.GetAttributes():
@@ -305,6 +426,31 @@ class MaterialConverterCore:
         root_layer = stage.GetRootLayer()
         session_layer = stage.GetSessionLayer()
 
+        for edit in MaterialConverterCore._compute_attribute_edits(
+            root_layer, session_layer, converter, input_shader_prim, output_shader_prim
+        ):
+            omni.kit.commands.execute(
+                "ChangePropertyCommand",
+                prop_path=edit.prop_path,
+                value=edit.value,
+                prev=None,
+                target_layer=root_layer,
+                type_to_create_if_not_exist=edit.type_name,
+                usd_context_name=context_name,
+            )
+
+    @staticmethod
+    def _compute_attribute_edits(
+        root_layer: Sdf.Layer,
+        session_layer: Sdf.Layer,
+        converter: "ConverterBase",
+        input_shader_prim: "Usd.Prim",
+        output_shader_prim: "Usd.Prim",
+    ) -> List[_AttributeEdit]:
+        """
+        Compute the attribute values to author on the output shader without modifying the stage
+        """
+        edits = []
         for attr in converter.attributes:
             output_attr_path = str(output_shader_prim.GetPath().AppendProperty(attr.output_attr_name))
 
@@ -313,15 +459,7 @@ class MaterialConverterCore:
                 # If a default output value was set, add it to the output shader if it doesn't exist already
                 if attr.output_default_value is not None and not input_shader_prim.HasAttribute(attr.output_attr_name):
                     translated_type, _ = attr.translate_alt_fn(None, None, None)
-                    omni.kit.commands.execute(
-                        "ChangePropertyCommand",
-                        prop_path=output_attr_path,
-                        value=attr.output_default_value,
-                        prev=None,
-                        target_layer=root_layer,
-                        type_to_create_if_not_exist=translated_type,
-                        usd_context_name=context_name,
-                    )
+                    edits.append(_AttributeEdit(output_attr_path, attr.output_default_value, translated_type))
                 continue
 
             input_attr = input_shader_prim.GetAttribute(attr.input_attr_name)
@@ -342,16 +480,8 @@ class MaterialConverterCore:
                     input_attr_value = value
 
             translated_type, translated_value = attr.translate_alt_fn(input_attr_type, input_attr_value, input_attr)
-
-            omni.kit.commands.execute(
-                "ChangePropertyCommand",
-                prop_path=output_attr_path,
-                value=translated_value,
-                prev=None,
-                target_layer=root_layer,
-                type_to_create_if_not_exist=translated_type,
-                usd_context_name=context_name,
-            )
+            edits.append(_AttributeEdit(output_attr_path, translated_value, translated_type))
+        return edits
 
     @staticmethod
     def _get_default_value(usd_property):
@@ -20,4 +20,5 @@ from .e2e.test_utils import TestUtils
 from .unit.base.test_attribute_base import TestAttributeBase
 from .unit.base.test_converter_base import TestConverterBase
 from .unit.impl.test_omni_pbr_to_aperture_pbr import TestOmniPBRToAperturePBRConverterBuilderUnit
+from .unit.test_commands import TestSetMaterialAttributesCommand
 from .unit.test_core import TestConverterBuilder, TestCore
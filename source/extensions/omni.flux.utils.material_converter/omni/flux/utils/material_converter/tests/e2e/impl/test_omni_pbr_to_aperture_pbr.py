@@ -86,3 +86,45 @@ class TestOmniPBRToAperturePBRConverterBuilderE2E(omni.kit.test.AsyncTestCase):
         with open(aperture_pbr_path, "r") as expected_file:  # noqa PLW1514
             with open(aperture_pbr_temp_path, "r") as actual_file:  # noqa PLW1514
                 self.assertEqual(expected_file.read(), actual_file.read())
+
+    async def test_convert_batch_should_produce_expected_output(self):
+        # Setup the file paths
+        base_temp_path = Path(self.temp_dir.name)
+        omni_pbr_temp_path = base_temp_path / "omni_pbr.usda"
+        aperture_pbr_temp_path = base_temp_path / "aperture_pbr.usda"
+
+        omni_pbr_path = get_test_data_path(__name__, "usd/omni_pbr.usda")
+        aperture_pbr_path = get_test_data_path(__name__, "usd/aperture_pbr.usda")
+
+        # Copy the test input to avoid accidentally modifying it
+        shutil.copy(omni_pbr_path, omni_pbr_temp_path)
+
+        # Open the copied stage
+        await self.context.open_stage_async(str(omni_pbr_temp_path))
+        stage = self.context.get_stage()
+        root_layer = stage.GetRootLayer()
+
+        converter_builder = OmniPBRToAperturePBRConverterBuilder()
+
+        # Convert all the different prims in the stage at once
+        converters = []
+        for prim_path in _PRIM_PATHS:
+            prim = stage.GetPrimAtPath(prim_path)
+
+            self.assertTrue(bool(prim))
+
+            converters.append(converter_builder.build(prim, SupportedShaderOutputs.APERTURE_PBR_OPACITY.value))
+
+        results = await MaterialConverterCore.convert_batch("", converters)
+
+        self.assertEqual(len(_PRIM_PATHS), len(results))
+        for prim_path, (success, message, was_skipped) in zip(_PRIM_PATHS, results):
+            self.assertTrue(success)
+            self.assertEqual(f"Completed prim '{prim_path}' conversion on layer {root_layer.identifier}", message)
+            self.assertFalse(was_skipped)
+
+        self.context.save_as_stage(str(aperture_pbr_temp_path))
+
+        with open(aperture_pbr_path, "r") as expected_file:  # noqa PLW1514
+            with open(aperture_pbr_temp_path, "r") as actual_file:  # noqa PLW1514
+                self.assertEqual(expected_file.read(), actual_file.read())
@@ -0,0 +1,117 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import time
+
+import carb
+import omni.kit.commands
+import omni.kit.test
+import omni.kit.undo
+import omni.usd
+from omni.flux.utils.material_converter.commands import AttributeEdit
+from pxr import Sdf
+
+_BENCHMARK_MATERIAL_COUNT = 1_000
+_BENCHMARK_ATTRIBUTE_COUNT = 10
+
+
+class TestSetMaterialAttributesCommand(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        await omni.usd.get_context().new_stage_async()
+        self.stage = omni.usd.get_context().get_stage()
+
+    async def tearDown(self):
+        await omni.usd.get_context().close_stage_async()
+        self.stage = None
+
+    def _create_shaders(self, count: int):
+        layer = self.stage.GetRootLayer()
+        with Sdf.ChangeBlock():
+            for index in range(count):
+                material = Sdf.CreatePrimInLayer(layer, f"/World/Looks/Material_{index}")
+                material.specifier = Sdf.SpecifierDef
+                material.typeName = "Material"
+                Sdf.PrimSpec(material, "Shader", Sdf.SpecifierDef, "Shader")
+
+    def _get_edits(self, count: int, value_offset: int = 0):
+        return [
+            AttributeEdit(
+                f"/World/Looks/Material_{index}/Shader.inputs:attribute_{attribute}",
+                index + attribute + value_offset,
+                Sdf.ValueTypeNames.Int,
+            )
+            for index in range(count)
+            for attribute in range(_BENCHMARK_ATTRIBUTE_COUNT)
+        ]
+
+    async def test_do_undo_should_author_and_restore_attributes(self):
+        # Arrange
+        layer = self.stage.GetRootLayer()
+        self._create_shaders(2)
+        existing_attr = Sdf.AttributeSpec(
+            layer.GetPrimAtPath("/World/Looks/Material_0/Shader"), "inputs:attribute_0", Sdf.ValueTypeNames.Int
+        )
+        existing_attr.default = -1
+
+        # Act
+        omni.kit.commands.execute("SetMaterialAttributesCommand", edits=self._get_edits(2), layer=layer)
+
+        # Assert
+        self.assertEqual(0, layer.GetAttributeAtPath("/World/Looks/Material_0/Shader.inputs:attribute_0").default)
+        self.assertEqual(10, layer.GetAttributeAtPath("/World/Looks/Material_1/Shader.inputs:attribute_9").default)
+        self.assertTrue(layer.GetAttributeAtPath("/World/Looks/Material_1/Shader.inputs:attribute_9").custom)
+
+        # Undo
+        omni.kit.undo.undo()
+
+        self.assertEqual(-1, layer.GetAttributeAtPath("/World/Looks/Material_0/Shader.inputs:attribute_0").default)
+        self.assertIsNone(layer.GetAttributeAtPath("/World/Looks/Material_1/Shader.inputs:attribute_9"))
+
+    async def test_benchmark_set_material_attributes(self):
+        # Arrange
+        layer = self.stage.GetRootLayer()
+        self._create_shaders(_BENCHMARK_MATERIAL_COUNT)
+        edits = self._get_edits(_BENCHMARK_MATERIAL_COUNT)
+
+        # Act
+        start = time.perf_counter()
+        with omni.kit.undo.group():
+            for edit in edits:
+                omni.kit.commands.execute(
+                    "ChangePropertyCommand",
+                    prop_path=edit.prop_path,
+                    value=edit.value,
+                    prev=None,
+                    target_layer=layer,
+                    type_to_create_if_not_exist=edit.type_name,
+                )
+        per_attribute_duration = time.perf_counter() - start
+
+        batch_edits = self._get_edits(_BENCHMARK_MATERIAL_COUNT, value_offset=1)
+        start = time.perf_counter()
+        omni.kit.commands.execute("SetMaterialAttributesCommand", edits=batch_edits, layer=layer)
+        batch_duration = time.perf_counter() - start
+
+        carb.log_info(
+            f"Authoring {len(edits)} material attributes: per-attribute commands "
+            f"{len(edits) / per_attribute_duration:.0f} edits/s, "
+            f"batched command {len(edits) / batch_duration:.0f} edits/s"
+        )
+
+        # Assert
+        for edit in batch_edits[:: _BENCHMARK_ATTRIBUTE_COUNT]:
+            self.assertEqual(edit.value, layer.GetAttributeAtPath(edit.prop_path).default)
@@ -15,7 +15,7 @@
 * limitations under the License.
 """
 
-from typing import Any, Optional, Tuple
+from typing import Any, Callable, Optional, Tuple
 
 import carb
 import omni.usd
@@ -23,6 +23,9 @@ from omni.flux.validator.factory import CheckBase as _CheckBase
 from omni.flux.validator.factory import SetupDataTypeVar as _SetupDataTypeVar
 from pxr import Sdf
 
+from .result_accumulator import ResultAccumulator as _ResultAccumulator
+from .result_accumulator import ResultStatus as _ResultStatus
+
 
 class CheckBaseUSD(_CheckBase):
     class Data(_CheckBase.Data):
@@ -31,6 +34,42 @@ class CheckBaseUSD(_CheckBase):
 
     data_type = Data
 
+    # Maximum number of progress callbacks per second emitted by the result accumulators
+    progress_rate = 10.0
+    # Maximum number of item lines in the messages rendered by the result accumulators
+    max_message_items = 1000
+
+    def create_result_accumulator(
+        self,
+        header: str,
+        item_count: int,
+        formatter: Optional[Callable[[_ResultStatus, Any, Any], str]] = None,
+        progress_scale: float = 1.0,
+    ) -> _ResultAccumulator:
+        """
+        Create an accumulator collecting the per-item outcomes of the check or the fix, emitting the throttled progress
+        of the plugin and rendering its message.
+
+        Args:
+            header: the first line of the message. Example: "Check:\n"
+            item_count: the number of items that will be added
+            formatter: the function rendering the message of an item from its status, path and detail
+            progress_scale: the progress value of the last item
+
+        Returns:
+            The result accumulator
+        """
+        kwargs = {"formatter": formatter} if formatter else {}
+        return _ResultAccumulator(
+            header,
+            item_count,
+            on_progress=self.on_progress,
+            progress_rate=self.progress_rate,
+            max_message_items=self.max_message_items,
+            progress_scale=progress_scale,
+            **kwargs,
+        )
+
     @omni.usd.handle_exception
     async def check(
         self, schema_data: Data, context_plugin_data: Any, selector_plugin_data: Any
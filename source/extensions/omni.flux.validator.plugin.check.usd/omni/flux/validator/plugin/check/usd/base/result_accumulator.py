@@ -0,0 +1,153 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["ResultAccumulator", "ResultStatus"]
+
+import time
+from array import array
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional
+
+
+class ResultStatus(IntEnum):
+    PASS = 0
+    FAIL = 1
+    SKIP = 2
+    SUCCESS = 3
+
+
+def _default_formatter(status: ResultStatus, path: Any, detail: Any) -> str:
+    return f"{status.name}: {path}" if detail is None else f"{status.name}: {path} {detail}"
+
+
+class ResultAccumulator:
+    """
+    Collect the per-item outcomes of a check or a fix and report them to the validation.
+
+    The outcomes are stored in compact arrays and the message is only rendered when requested, with at most
+    `max_message_items` lines. The progress is emitted at most `progress_rate` times per second, the last item always
+    being emitted.
+    """
+
+    def __init__(
+        self,
+        header: str,
+        item_count: int,
+        on_progress: Optional[Callable[[float, str, bool], None]] = None,
+        formatter: Callable[[ResultStatus, Any, Any], str] = _default_formatter,
+        progress_rate: float = 10.0,
+        max_message_items: int = 1000,
+        progress_scale: float = 1.0,
+    ):
+        """
+        Args:
+            header: the first line of the message. Example: "Check:\n"
+            item_count: the number of items that will be added, used to compute the progress
+            on_progress: the callback to emit the progress with
+            formatter: the function rendering the message of an item from its status, path and detail
+            progress_rate: the maximum number of progress callbacks per second. 0 to emit every item.
+            max_message_items: the maximum number of item lines in the message. 0 to render every item.
+            progress_scale: the progress value of the last item
+        """
+        self._header = header
+        self._item_count = item_count
+        self._on_progress = on_progress
+        self._formatter = formatter
+        self._progress_interval = 1 / progress_rate if progress_rate > 0 else 0
+        self._max_message_items = max_message_items
+        self._progress_scale = progress_scale
+
+        self._statuses = array("B")
+        self._paths: List[Any] = []
+        # Sparse details: only the items with a detail are stored
+        self._details: Dict[int, Any] = {}
+        self._fail_count = 0
+        self._last_emit_time: Optional[float] = None
+        self._message: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self._fail_count == 0
+
+    @property
+    def fail_count(self) -> int:
+        return self._fail_count
+
+    def __len__(self) -> int:
+        return len(self._statuses)
+
+    def add(self, status: ResultStatus, path: Any, detail: Any = None):
+        """
+        Add the outcome of an item
+
+        Args:
+            status: the outcome of the item
+            path: the path of the item
+            detail: optional data given to the formatter to render the message of the item
+        """
+        index = len(self._statuses)
+        self._statuses.append(status)
+        self._paths.append(path)
+        if detail is not None:
+            self._details[index] = detail
+        if status == ResultStatus.FAIL:
+            self._fail_count += 1
+        self._message = None
+
+        if self._on_progress is None:
+            return
+        now = time.perf_counter()
+        is_last = index + 1 >= self._item_count
+        if (
+            not is_last
+            and self._last_emit_time is not None
+            and now - self._last_emit_time < self._progress_interval
+        ):
+            return
+        self._last_emit_time = now
+        self._on_progress(self.get_progress(), self.get_item_message(index), self.success)
+
+    def get_progress(self) -> float:
+        if not self._item_count:
+            return self._progress_scale
+        return min(len(self._statuses) / self._item_count, 1) * self._progress_scale
+
+    def get_status(self, index: int) -> ResultStatus:
+        return ResultStatus(self._statuses[index])
+
+    def get_item_message(self, index: int) -> str:
+        return self._formatter(ResultStatus(self._statuses[index]), self._paths[index], self._details.get(index))
+
+    def get_paths(self, status: ResultStatus) -> List[Any]:
+        """Get the paths of the items with the given status"""
+        return [path for path, item_status in zip(self._paths, self._statuses) if item_status == status]
+
+    def render(self) -> str:
+        """Render the message, truncated to `max_message_items` lines"""
+        if self._message is not None:
+            return self._message
+
+        count = len(self._statuses)
+        rendered = count
+        if self._max_message_items and count > self._max_message_items:
+            rendered = self._max_message_items
+        lines = [self._header]
+        lines.extend(f"- {self.get_item_message(index)}\n" for index in range(rendered))
+        if rendered < count:
+            lines.append(f"- ... {count - rendered} more items, {self._fail_count} failed in total\n")
+        self._message = "".join(lines)
+        return self._message
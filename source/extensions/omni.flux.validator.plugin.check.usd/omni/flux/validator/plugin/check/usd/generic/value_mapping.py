@@ -15,18 +15,22 @@
 * limitations under the License.
 """
 
+import dataclasses
 import operator
 from collections.abc import Iterable
 from enum import Enum
 from functools import partial
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import omni.kit.app
 import omni.kit.commands
 from omni import ui, usd
+from pxr import Sdf, Usd
 from pydantic import BaseModel, validator
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD  # noqa PLE0402
+from ..base.result_accumulator import ResultStatus as _ResultStatus  # noqa PLE0402
 
 
 class Operator(Enum):
@@ -46,6 +50,16 @@ class AttributeMapping(BaseModel):
     output_value: Any | None = None
     # Mapping function will be used in priority over the output_value if set
     mapping_fn: str | None = None  # String following the lambda format for the mapping function
+    # If set, the mapping function receives numpy arrays: the values of every matched attribute are mapped in one call
+    vectorized: bool = False
+
+
+@dataclasses.dataclass
+class _AttributeValue:
+    attribute: Usd.Attribute
+    value_type: type
+    value: Any
+    mapped: bool = False
 
 
 class ValueMapping(_CheckBaseUSD):
@@ -137,46 +151,32 @@ class ValueMapping(_CheckBaseUSD):
             any: data that you want to pass. For now this is used no where. So you can pass whatever you want (None)
         """
         message = "Check:\n"
-        progress = 0
         success = True
 
-        self.on_progress(progress, "Start", success)
+        self.on_progress(0, "Start", success)
 
         if selector_plugin_data:  # noqa PLR1702
-            progress_delta = 1 / len(selector_plugin_data)
+            results = self.create_result_accumulator(message, len(selector_plugin_data), self._format_result)
+            reference_values = {}
 
             for prim in selector_plugin_data:
-                is_valid = True
-                progress_message = f"SKIP: The prim ({prim.GetPath()}) does not have mappable attributes"
+                status = _ResultStatus.SKIP
+                mapped_attr_name = None
 
                 for attr_name, attr_mappings in schema_data.attributes.items():
                     attribute = prim.GetAttribute(attr_name)
                     if not attribute:
                         continue
-                    for mapping in attr_mappings:
-                        input_value = attribute.Get()
-                        input_type = type(input_value)
-                        if self.__OPERATOR_MAP[mapping.operator](
-                            input_value, input_type(mapping.input_value) if mapping.input_value else None
-                        ):
-                            is_valid = False
-                            progress_message = (
-                                f"FAIL: The prim ({prim.GetPath()}) has the attribute '{attr_name}' "
-                                f"that must to be mapped"
-                            )
-                            break
-                    if is_valid:
-                        progress_message = (
-                            f"SKIP: The prim ({prim.GetPath()}) has the attribute '{attr_name}' "
-                            f"but does not match a mapping predicate"
-                        )
-                    else:
+                    mapped_attr_name = attr_name
+                    input_value = attribute.Get()
+                    if any(self._matches(mapping, input_value, reference_values) for mapping in attr_mappings):
+                        status = _ResultStatus.FAIL
                         break
 
-                message += f"- {progress_message}\n"
-                progress += progress_delta
-                success &= is_valid
-                self.on_progress(progress, progress_message, success)
+                results.add(status, prim.GetPath(), mapped_attr_name)
+
+            success = results.success
+            message = results.render()
         else:
             message += "- SKIP: No selected prims"
 
@@ -200,59 +200,118 @@ class ValueMapping(_CheckBaseUSD):
             any: data that you want to pass. For now this is used no where. So you can pass whatever you want (None)
         """
         message = "Fix:\n"
-        progress = 0
         success = True
 
-        self.on_progress(progress, "Start", success)
+        self.on_progress(0, "Start", success)
 
         if selector_plugin_data:  # noqa PLR1702
-            progress_delta = 1 / len(selector_plugin_data)
-
+            # Read the values once per attribute
+            attribute_values = {attr_name: [] for attr_name in schema_data.attributes}
+            prim_attribute_values = []
             for prim in selector_plugin_data:
-                is_valid = True
-                progress_message = f"SKIP: The prim ({prim.GetPath()}) does not have mappable attributes"
-
-                for attr_name, attr_mappings in schema_data.attributes.items():
+                prim_values = []
+                for attr_name in schema_data.attributes:
                     attribute = prim.GetAttribute(attr_name)
                     if not attribute:
                         continue
-                    was_mapped = False
-                    for mapping in attr_mappings:
-                        input_value = attribute.Get()
-                        input_type = type(input_value)
-                        if self.__OPERATOR_MAP[mapping.operator](
-                            input_value, input_type(mapping.input_value) if mapping.input_value else None
-                        ):
-                            output_value = mapping.output_value
-                            if mapping.mapping_fn:
-                                output_value = eval(mapping.mapping_fn)(input_value)  # noqa PLW0123
-                            omni.kit.commands.execute(
-                                "ChangeProperty",
-                                prop_path=prim.GetProperty(attr_name).GetPath(),
-                                value=input_type(output_value),
-                                prev=None,
-                                usd_context_name=context_plugin_data,
-                            )
-                            was_mapped = True
-                    progress_message = (
-                        f"SUCCESS: The attribute '{attr_name}' for the prim ({prim.GetPath()}) was mapped"
-                        if was_mapped
-                        else (
-                            f"SKIP: The prim ({prim.GetPath()}) has the attribute '{attr_name}' "
-                            f"but does not match a mapping predicate"
-                        )
-                    )
-
-                message += f"- {progress_message}\n"
-                progress += progress_delta
-                success &= is_valid
-                self.on_progress(progress, progress_message, success)
+                    value = attribute.Get()
+                    attribute_value = _AttributeValue(attribute, type(value), value)
+                    attribute_values[attr_name].append(attribute_value)
+                    prim_values.append((attr_name, attribute_value))
+                prim_attribute_values.append((prim, prim_values))
+
+            # Apply the mappings in order, every mapping seeing the values mapped by the previous ones
+            reference_values = {}
+            for attr_name, attr_mappings in schema_data.attributes.items():
+                for mapping in attr_mappings:
+                    mapping_fn = eval(mapping.mapping_fn) if mapping.mapping_fn else None  # noqa PLW0123
+                    matched = [
+                        attribute_value
+                        for attribute_value in attribute_values[attr_name]
+                        if self._matches(mapping, attribute_value.value, reference_values)
+                    ]
+                    if not matched:
+                        continue
+                    output_values = self._map_values(mapping, mapping_fn, [value.value for value in matched])
+                    for attribute_value, output_value in zip(matched, output_values):
+                        attribute_value.value = self._cast_value(attribute_value.value_type, output_value)
+                        attribute_value.mapped = True
+
+            # Apply every edit at once, in a single undoable command
+            edit_target = selector_plugin_data[0].GetStage().GetEditTarget()
+            values = [
+                (
+                    edit_target.MapToSpecPath(attribute_value.attribute.GetPath()),
+                    attribute_value.value,
+                    attribute_value.attribute.GetTypeName(),
+                    attribute_value.attribute.GetVariability(),
+                )
+                for _, prim_values in prim_attribute_values
+                for _, attribute_value in prim_values
+                if attribute_value.mapped
+            ]
+            if values:
+                omni.kit.commands.execute("SetAttributeValues", values=values, layer=edit_target.GetLayer())
+
+            results = self.create_result_accumulator(message, len(prim_attribute_values), self._format_result)
+            for prim, prim_values in prim_attribute_values:
+                status = _ResultStatus.SKIP
+                mapped_attr_name = None
+                if prim_values:
+                    mapped_attr_name, attribute_value = prim_values[-1]
+                    if attribute_value.mapped:
+                        status = _ResultStatus.SUCCESS
+                results.add(status, prim.GetPath(), mapped_attr_name)
+            message = results.render()
         else:
             message += "- SKIP: No selected prims"
 
         self._fixed = True
         return success, message, None
 
+    @staticmethod
+    def _format_result(status: _ResultStatus, prim_path: Sdf.Path, attr_name: Optional[str]) -> str:
+        if attr_name is None:
+            return f"SKIP: The prim ({prim_path}) does not have mappable attributes"
+        if status == _ResultStatus.FAIL:
+            return f"FAIL: The prim ({prim_path}) has the attribute '{attr_name}' that must to be mapped"
+        if status == _ResultStatus.SUCCESS:
+            return f"SUCCESS: The attribute '{attr_name}' for the prim ({prim_path}) was mapped"
+        return f"SKIP: The prim ({prim_path}) has the attribute '{attr_name}' but does not match a mapping predicate"
+
+    def _matches(self, mapping: AttributeMapping, value: Any, reference_values: Dict[Tuple[int, type], Any]) -> bool:
+        """Compare a value with the mapping input value, converted once per value type"""
+        key = (id(mapping), type(value))
+        if key not in reference_values:
+            reference_values[key] = type(value)(mapping.input_value) if mapping.input_value else None
+        return self.__OPERATOR_MAP[mapping.operator](value, reference_values[key])
+
+    @staticmethod
+    def _map_values(
+        mapping: AttributeMapping, mapping_fn: Optional[Callable[[Any], Any]], input_values: List[Any]
+    ) -> List[Any]:
+        if not mapping_fn:
+            return [mapping.output_value] * len(input_values)
+        if not mapping.vectorized:
+            return [mapping_fn(value) for value in input_values]
+
+        arrays = [np.asarray(value) for value in input_values]
+        if len({array.shape for array in arrays}) != 1 or arrays[0].dtype == object:
+            return [mapping_fn(array) for array in arrays]
+        # Scalars and arrays of the same shape are stacked and mapped in a single call
+        output_values = np.asarray(mapping_fn(np.stack(arrays)))
+        if output_values.ndim == 0:
+            return [output_values] * len(arrays)
+        return list(output_values)
+
+    @staticmethod
+    def _cast_value(value_type: type, value: Any) -> Any:
+        if isinstance(value, np.generic):
+            value = value.item()
+        elif isinstance(value, np.ndarray):
+            value = value.tolist()
+        return value_type(value)
+
     def _on_operator_field_edit_end(self, schema_data: Data, attr_name: str, mapping_index: int, model, _):
         new_attributes = schema_data.attributes.copy()
         new_attributes[attr_name][mapping_index].operator = list(Operator)[
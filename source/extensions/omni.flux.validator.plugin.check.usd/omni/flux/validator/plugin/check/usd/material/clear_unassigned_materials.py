@@ -20,11 +20,13 @@ from typing import Any, Tuple
 import omni.kit.app
 import omni.kit.material.library
 from omni import ui, usd
+from omni.flux.utils.common.material_binding_index import get_material_binding_index as _get_material_binding_index
 from omni.flux.validator.factory import SetupDataTypeVar as _SetupDataTypeVar
 from omni.usd.commands import prim_can_be_removed_without_destruction as _prim_can_be_removed_without_destruction
-from pxr import UsdShade
+from pxr import Sdf
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD  # noqa PLE0402
+from ..base.result_accumulator import ResultStatus as _ResultStatus  # noqa PLE0402
 
 
 class ClearUnassignedMaterial(_CheckBaseUSD):
@@ -38,35 +40,36 @@ class ClearUnassignedMaterial(_CheckBaseUSD):
 
     def get_not_assigned_materials(self, stage, assigned_materials):
         return [
-            str(prim.GetPath())
-            for prim in stage.TraverseAll()
-            if prim.IsA(UsdShade.Material)
-            and _prim_can_be_removed_without_destruction(stage, prim.GetPath())
-            and prim.GetPath() not in assigned_materials
+            str(material_path)
+            for material_path in _get_material_binding_index(stage).get_materials()
+            if material_path not in assigned_materials
+            and _prim_can_be_removed_without_destruction(stage, material_path)
         ]
 
     def get_assigned_materials(self, message, stage, selector_plugin_data):
         assigned_materials = set()
-        progress = 0
-        progress_delta = 0.9 / len(selector_plugin_data)
+        results = self.create_result_accumulator(
+            message, len(selector_plugin_data), self._format_result, progress_scale=0.9
+        )
+        binding_index = _get_material_binding_index(stage)
 
         for p in selector_plugin_data:
             prim = stage.GetPrimAtPath(p.GetPath())
 
-            result_message = f"- Checking: {str(p.GetPath())}\n"
-
             if not omni.usd.is_prim_material_supported(prim):
+                results.add(_ResultStatus.SKIP, prim.GetPath())
                 continue
-            mat, _rel = UsdShade.MaterialBindingAPI(prim).ComputeBoundMaterial()
-            if mat:
-                assigned_materials.add(mat.GetPrim().GetPath())
+            material_path = binding_index.get_bound_material(prim.GetPath())
+            if material_path:
+                assigned_materials.add(material_path)
 
-            message += result_message
-            progress += progress_delta
-
-            self.on_progress(progress, result_message, True)
+            results.add(_ResultStatus.PASS, prim.GetPath())
         return assigned_materials
 
+    @staticmethod
+    def _format_result(status: _ResultStatus, prim_path: Sdf.Path, _detail: Any) -> str:
+        return f"- Checking: {prim_path}\n"
+
     @usd.handle_exception
     async def _check(
         self, schema_data: Data, context_plugin_data: _SetupDataTypeVar, selector_plugin_data: Any
@@ -15,14 +15,17 @@
 * limitations under the License.
 """
 
+import collections
+import functools
 import re
-from typing import Any, List, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
 import omni.ui as ui
 import omni.usd
-from pxr import Sdf
+from pxr import Sdf, Usd
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD  # noqa PLE0402
+from ..base.result_accumulator import ResultStatus as _ResultStatus  # noqa PLE0402
 
 
 class StripExtraAttributes(_CheckBaseUSD):
@@ -49,6 +52,8 @@ class StripExtraAttributes(_CheckBaseUSD):
             "skel:joints",
             "subdivisionScheme",  # needed for smooth normals when using vertex interpolation
         ]
+        # Only report the attributes that would be removed and how many times, without removing them
+        dry_run: bool = False
 
     name = "StripExtraAttributes"
     tooltip = "This plugin will remove any non-essential properties from a mesh prim"
@@ -58,12 +63,55 @@ class StripExtraAttributes(_CheckBaseUSD):
     def get_regex_str(self, schema_data: Data):
         return f"^(?:{'|'.join(schema_data.keep_list)})$"
 
+    def get_keep_function(self, schema_data: Data) -> Callable[[str], bool]:
+        """
+        Compile the keep list once: the plain names are looked up in a set, the patterns are matched with a single
+        regex, and the result is memoized per property name.
+
+        Args:
+            schema_data: the data from the schema.
+
+        Returns:
+            A function returning True if the property with the given name must be kept
+        """
+        names = {entry for entry in schema_data.keep_list if re.escape(entry) == entry}
+        patterns = [entry for entry in schema_data.keep_list if entry not in names]
+        regex = re.compile(f"^(?:{'|'.join(patterns)})$") if patterns else None
+
+        @functools.lru_cache(maxsize=None)
+        def keep(name: str) -> bool:
+            return name in names or bool(regex and regex.match(name))
+
+        return keep
+
+    @staticmethod
+    def get_extra_attributes(prim: Usd.Prim, keep: Callable[[str], bool]) -> List[str]:
+        """
+        Get the attributes with an authored value that are not kept, from the specs of the prim stack
+
+        Args:
+            prim: the prim to get the attributes from
+            keep: the function returning True if a property must be kept
+
+        Returns:
+            The sorted attribute names
+        """
+        extra_attributes = set()
+        for prim_spec in prim.GetPrimStack():
+            for attr_spec in prim_spec.attributes:
+                name = attr_spec.name
+                if name in extra_attributes or keep(name):
+                    continue
+                if attr_spec.HasDefaultValue() or prim_spec.layer.GetNumTimeSamplesForPath(attr_spec.path):
+                    extra_attributes.add(name)
+        return sorted(extra_attributes)
+
     @omni.usd.handle_exception
     async def _check(
         self, schema_data: Data, context_plugin_data: Any, selector_plugin_data: Any
     ) -> Tuple[bool, str, Any]:
         """
-        Function that will be executed to check if the input prims have up to date geom subsets
+        Function that will be executed to check if the input prims have attributes that are not in the keep list
 
         Args:
             schema_data: the data from the schema.
@@ -72,30 +120,24 @@ class StripExtraAttributes(_CheckBaseUSD):
 
         Returns: True if the check passed, False if not
         """
-        message = "Check:\n"
-        all_pass = True
-        # Regex to match an entire string against a list of options.
-        keep_regex = re.compile(self.get_regex_str(schema_data))
+        results = self.create_result_accumulator("Check:\n", len(selector_plugin_data), self._format_result)
+        keep = self.get_keep_function(schema_data)
         for prim in selector_plugin_data:
-            bad_props = []
-            for attr in prim.GetAttributes():
-                if attr.HasAuthoredValue() and not keep_regex.match(attr.GetName()):
-                    bad_props.append(attr.GetName())
-
+            bad_props = self.get_extra_attributes(prim, keep)
             if len(bad_props) > 0:
-                message += f"- FAIL: {str(prim.GetPath())}, {bad_props}\n"
-                all_pass = False
+                results.add(_ResultStatus.FAIL, prim.GetPath(), bad_props)
             else:
-                message += f"- PASS: {str(prim.GetPath())}\n"
+                results.add(_ResultStatus.PASS, prim.GetPath())
 
-        return all_pass, message, None
+        return results.success, results.render(), None
 
     @omni.usd.handle_exception
     async def _fix(
         self, schema_data: Data, context_plugin_data: Any, selector_plugin_data: Any
     ) -> Tuple[bool, str, Any]:
         """
-        Function that will be executed to triangulate the mesh prims (including geom subsets)
+        Function that will be executed to remove the attributes that are not in the keep list from the edit target
+        layer
 
         Args:
             schema_data: the data from the schema.
@@ -104,23 +146,55 @@ class StripExtraAttributes(_CheckBaseUSD):
 
         Returns: True if the data where fixed, False if not
         """
-        message = "Fix:\n"
-        all_pass = True
-        # Regex to match an entire string against a list of options.
-        keep_regex = re.compile(self.get_regex_str(schema_data))
-        with Sdf.ChangeBlock():
-            for prim in selector_plugin_data:
-                attr_to_remove = []
-                for attr in prim.GetAttributes():
-                    if attr.HasAuthoredValue() and not keep_regex.match(attr.GetName()):
-                        attr_to_remove.append(attr.GetName())
+        results = self.create_result_accumulator("Fix:\n", len(selector_plugin_data), self._format_result)
+        keep = self.get_keep_function(schema_data)
+        # {attribute name: number of prims}
+        statistics = collections.Counter()
 
-                for attr in attr_to_remove:
-                    prim.RemoveProperty(attr)
+        # [(prim spec, attribute specs to remove)]
+        removals = []
+        for prim in selector_plugin_data:
+            attr_to_remove = self.get_extra_attributes(prim, keep)
+            statistics.update(attr_to_remove)
+
+            edit_target = prim.GetStage().GetEditTarget()
+            prim_spec = edit_target.GetLayer().GetPrimAtPath(edit_target.MapToSpecPath(prim.GetPath()))
+            if prim_spec and attr_to_remove:
+                attributes = prim_spec.attributes
+                removals.append((prim_spec, [attributes[name] for name in attr_to_remove if name in attributes]))
 
-                message += f"- PASS: {str(prim.GetPath())}\n"
+            if schema_data.dry_run and attr_to_remove:
+                results.add(_ResultStatus.SKIP, prim.GetPath(), attr_to_remove)
+            else:
+                results.add(_ResultStatus.PASS, prim.GetPath())
 
-        return all_pass, message, None
+        if schema_data.dry_run:
+            return True, results.render() + self._format_statistics(statistics, len(selector_plugin_data)), None
+
+        with Sdf.ChangeBlock():
+            for prim_spec, attr_specs in removals:
+                for attr_spec in attr_specs:
+                    prim_spec.RemoveProperty(attr_spec)
+
+        return results.success, results.render(), None
+
+    @staticmethod
+    def _format_result(status: _ResultStatus, prim_path: Sdf.Path, attr_names: Optional[List[str]]) -> str:
+        if status == _ResultStatus.FAIL:
+            return f"FAIL: {prim_path}, {attr_names}"
+        if status == _ResultStatus.SKIP:
+            return f"DRY RUN: {prim_path}, would remove {attr_names}"
+        return f"{status.name}: {prim_path}"
+
+    @staticmethod
+    def _format_statistics(statistics: collections.Counter, prim_count: int) -> str:
+        message = (
+            f"Statistics:\n- {sum(statistics.values())} attributes would be removed, "
+            f"{len(statistics)} unique names, {prim_count} prims\n"
+        )
+        for name, count in statistics.most_common():
+            message += f"- {name}: {count}\n"
+        return message
 
     @omni.usd.handle_exception
     async def _build_ui(self, schema_data: Data) -> Any:
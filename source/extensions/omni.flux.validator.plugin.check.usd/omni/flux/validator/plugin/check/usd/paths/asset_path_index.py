@@ -0,0 +1,155 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["AssetPathIndex", "PrimAssetPaths"]
+
+import dataclasses
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import omni.client
+from omni.flux.utils.common import path_utils as _path_utils
+from pxr import Ar, Sdf, Usd
+
+
+@dataclasses.dataclass
+class PrimAssetPaths:
+    prim: Usd.Prim
+    # The specs of the prim, from the strongest to the weakest
+    prim_stack: List[Sdf.PrimSpec]
+    # {attribute name: strongest attribute spec with a default value}
+    asset_attributes: Dict[str, Sdf.AttributeSpec] = dataclasses.field(default_factory=dict)
+    # The references of every spec of the prim stack, with the layer they are authored in
+    references: List[Tuple[Sdf.Reference, Sdf.Layer]] = dataclasses.field(default_factory=list)
+
+
+class AssetPathIndex:
+    """
+    Index the asset-valued attributes and the references of prims from the Sdf specs of their prim stack, without
+    creating a `Usd.Attribute` for every property of the prims.
+
+    The asset path resolutions are memoized per anchor, so a path shared by many prims is only resolved once.
+    """
+
+    def __init__(self, prims: Iterable[Usd.Prim], asset_attributes: bool = True, references: bool = True):
+        """
+        Args:
+            prims: the prims to index
+            asset_attributes: index the `asset` attributes of the prims
+            references: index the references of the prims
+        """
+        self._items = [self._index_prim(prim, asset_attributes, references) for prim in prims]
+        # {(anchor, asset path): path}
+        self._relative_paths: Dict[Tuple[str, str], str] = {}
+        self._anchored_paths: Dict[Tuple[str, str], str] = {}
+        self._resolved_paths: Dict[str, str] = {}
+
+    def __iter__(self) -> Iterator[PrimAssetPaths]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @staticmethod
+    def _index_prim(prim: Usd.Prim, asset_attributes: bool, references: bool) -> PrimAssetPaths:
+        item = PrimAssetPaths(prim, prim.GetPrimStack())
+        blocked = set()
+        for prim_spec in item.prim_stack:
+            if asset_attributes:
+                for attr_spec in prim_spec.attributes:
+                    name = attr_spec.name
+                    if name in item.asset_attributes or name in blocked or not attr_spec.HasDefaultValue():
+                        continue
+                    # The strongest default value is the composed value of the attribute
+                    default = attr_spec.default
+                    if (
+                        attr_spec.typeName != Sdf.ValueTypeNames.Asset
+                        or default is None
+                        or isinstance(default, Sdf.ValueBlock)
+                    ):
+                        blocked.add(name)
+                        continue
+                    item.asset_attributes[name] = attr_spec
+            if references and prim_spec.hasReferences:
+                item.references.extend(
+                    (reference, prim_spec.layer) for reference in prim_spec.referenceList.GetAddedOrExplicitItems()
+                )
+        return item
+
+    @staticmethod
+    def get_absolute_asset_paths(item: PrimAssetPaths) -> List[Tuple[str, Sdf.AttributeSpec]]:
+        """
+        Args:
+            item: the indexed prim
+
+        Returns:
+            The absolute asset paths of the prim attributes, sorted by attribute name, with their attribute spec
+        """
+        result = []
+        for name in sorted(item.asset_attributes):
+            attr_spec = item.asset_attributes[name]
+            asset_path = str(attr_spec.default.path)
+            if asset_path and _path_utils.is_absolute_path(asset_path):
+                result.append((asset_path, attr_spec))
+        return result
+
+    def make_relative(self, anchor: str, asset_path: str) -> str:
+        """
+        Args:
+            anchor: the URL to make the path relative to. Example: the identifier of a layer
+            asset_path: the absolute asset path
+
+        Returns:
+            The relative path, or the path itself if it can't be made relative
+        """
+        key = (anchor, asset_path)
+        relative_path = self._relative_paths.get(key)
+        if relative_path is None:
+            relative_path = omni.client.make_relative_url(anchor, asset_path)
+            self._relative_paths[key] = relative_path
+        return relative_path
+
+    def anchor(self, layer: Sdf.Layer, asset_path: str) -> str:
+        """
+        Args:
+            layer: the layer the asset path is authored in
+            asset_path: the authored asset path
+
+        Returns:
+            The asset path anchored to the layer
+        """
+        key = (layer.identifier, asset_path)
+        anchored_path = self._anchored_paths.get(key)
+        if anchored_path is None:
+            anchored_path = Sdf.ComputeAssetPathRelativeToLayer(layer, asset_path)
+            self._anchored_paths[key] = anchored_path
+        return anchored_path
+
+    def resolve(self, asset_path: str) -> str:
+        """
+        Resolve an absolute asset path, with the resolver context of the stage bound
+
+        Args:
+            asset_path: the absolute asset path
+
+        Returns:
+            The resolved path, or an empty string if the asset doesn't exist
+        """
+        resolved_path = self._resolved_paths.get(asset_path)
+        if resolved_path is None:
+            resolved_path = str(Ar.GetResolver().Resolve(asset_path))
+            self._resolved_paths[asset_path] = resolved_path
+        return resolved_path
@@ -15,14 +15,16 @@
 * limitations under the License.
 """
 
-from typing import Any, Tuple
+from functools import partial
+from typing import Any, List, Optional, Tuple
 
 import omni.ui as ui
 import omni.usd
-from omni.flux.utils.common import path_utils as _path_utils
-from pxr import Sdf
+from pxr import Ar, Sdf
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD  # noqa PLE0402
+from ..base.result_accumulator import ResultStatus as _ResultStatus  # noqa PLE0402
+from .asset_path_index import AssetPathIndex as _AssetPathIndex
 
 
 class RelativeAssetPaths(_CheckBaseUSD):
@@ -48,24 +50,18 @@ class RelativeAssetPaths(_CheckBaseUSD):
 
         Returns: True if the check passed, False if not
         """
-        message = "Check:\n"
-        all_pass = True
-        for prim in selector_plugin_data:
-            abs_paths = []
-            for attr in prim.GetAttributes():
-                if attr.GetTypeName() == Sdf.ValueTypeNames.Asset and attr.Get():
-                    attr_path = str(attr.Get().path)
-                    if _path_utils.is_absolute_path(attr_path):
-                        abs_paths.append(attr_path)
-                        break
-
+        results = self.create_result_accumulator(
+            "Check:\n", len(selector_plugin_data), partial(self._format_result, "references:")
+        )
+        index = _AssetPathIndex(selector_plugin_data, references=False)
+        for item in index:
+            abs_paths = [asset_path for asset_path, _ in index.get_absolute_asset_paths(item)]
             if len(abs_paths) > 0:
-                message += f"- FAIL: {str(prim.GetPath())} references: {abs_paths}\n"
-                all_pass = False
+                results.add(_ResultStatus.FAIL, item.prim.GetPath(), abs_paths)
             else:
-                message += f"- PASS: {str(prim.GetPath())}\n"
+                results.add(_ResultStatus.PASS, item.prim.GetPath())
 
-        return all_pass, message, None
+        return results.success, results.render(), None
 
     @omni.usd.handle_exception
     async def _fix(
@@ -81,32 +77,48 @@ class RelativeAssetPaths(_CheckBaseUSD):
 
         Returns: True if the data where fixed, False if not
         """
-        message = "Fix:\n"
-        all_pass = True
+        results = self.create_result_accumulator(
+            "Fix:\n", len(selector_plugin_data), partial(self._format_result, "failed to make path relative:")
+        )
         stage = omni.usd.get_context(context_plugin_data).get_stage()
         base_path = stage.GetRootLayer().identifier
-        with Sdf.ChangeBlock():
-            for prim in selector_plugin_data:
+        edit_target = stage.GetEditTarget()
+        index = _AssetPathIndex(selector_plugin_data, references=False)
+
+        # [(prim path, attribute name, relative path)]
+        edits = []
+        with Ar.ResolverContextBinder(stage.GetPathResolverContext()):
+            for item in index:
                 failing_paths = []
-                for attr in prim.GetAttributes():
-                    if attr.GetTypeName() == Sdf.ValueTypeNames.Asset and attr.Get():
-                        attr_path = str(attr.Get().path)
-                        if _path_utils.is_absolute_path(attr_path):
-                            abs_path = attr.Get().resolvedPath
-                            rel_path = omni.client.make_relative_url(base_path, abs_path)
-                            if rel_path == abs_path:
-                                # making the path relative failed
-                                failing_paths.append(attr_path)
-                            else:
-                                attr.Set(rel_path)
+                for asset_path, attr_spec in index.get_absolute_asset_paths(item):
+                    abs_path = index.resolve(asset_path)
+                    rel_path = index.make_relative(base_path, abs_path)
+                    if rel_path == abs_path:
+                        # making the path relative failed
+                        failing_paths.append(asset_path)
+                    else:
+                        edits.append((item.prim.GetPath(), attr_spec.name, rel_path))
 
                 if len(failing_paths) > 0:
-                    message += f"- FAIL: {str(prim.GetPath())} failed to make path relative: {failing_paths}\n"
-                    all_pass = False
+                    results.add(_ResultStatus.FAIL, item.prim.GetPath(), failing_paths)
                 else:
-                    message += f"- PASS: {str(prim.GetPath())}\n"
+                    results.add(_ResultStatus.PASS, item.prim.GetPath())
 
-        return all_pass, message, None
+        with Sdf.ChangeBlock():
+            for prim_path, attr_name, rel_path in edits:
+                prim_spec = Sdf.CreatePrimInLayer(edit_target.GetLayer(), edit_target.MapToSpecPath(prim_path))
+                attr_spec = prim_spec.attributes.get(attr_name)
+                if not attr_spec:
+                    attr_spec = Sdf.AttributeSpec(prim_spec, attr_name, Sdf.ValueTypeNames.Asset)
+                attr_spec.default = Sdf.AssetPath(rel_path)
+
+        return results.success, results.render(), None
+
+    @staticmethod
+    def _format_result(reason: str, status: _ResultStatus, prim_path: Sdf.Path, paths: Optional[List[str]]) -> str:
+        if status == _ResultStatus.FAIL:
+            return f"FAIL: {prim_path} {reason} {paths}"
+        return f"{status.name}: {prim_path}"
 
     @omni.usd.handle_exception
     async def _build_ui(self, schema_data: Data) -> Any:
@@ -23,6 +23,7 @@ from omni.flux.utils.common import path_utils as _path_utils
 from pxr import Sdf
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD  # noqa PLE0402
+from .asset_path_index import AssetPathIndex as _AssetPathIndex
 
 
 class RelativeReferences(_CheckBaseUSD):
@@ -50,18 +51,16 @@ class RelativeReferences(_CheckBaseUSD):
         """
         message = "Check:\n"
         all_pass = True
-        for prim in selector_plugin_data:
-            refs_and_layers = omni.usd.get_composed_references_from_prim(prim)
-            abs_references = []
-            for ref, _ in refs_and_layers:
-                if _path_utils.is_absolute_path(str(ref.assetPath)):
-                    abs_references.append(str(ref.assetPath))
+        for item in _AssetPathIndex(selector_plugin_data, asset_attributes=False):
+            abs_references = [
+                str(ref.assetPath) for ref, _ in item.references if _path_utils.is_absolute_path(str(ref.assetPath))
+            ]
 
             if len(abs_references) > 0:
-                message += f"- FAIL: {str(prim.GetPath())} references: {abs_references}\n"
+                message += f"- FAIL: {str(item.prim.GetPath())} references: {abs_references}\n"
                 all_pass = False
             else:
-                message += f"- PASS: {str(prim.GetPath())}\n"
+                message += f"- PASS: {str(item.prim.GetPath())}\n"
 
         return all_pass, message, None
 
@@ -91,12 +90,16 @@ class RelativeReferences(_CheckBaseUSD):
             if layer == cur_layer:
                 break
             weaker_layers.add(layer)
-        for prim in selector_plugin_data:
-            refs_and_layers = omni.usd.get_composed_references_from_prim(prim)
+        edit_target = stage.GetEditTarget()
+        index = _AssetPathIndex(selector_plugin_data, asset_attributes=False)
+
+        # [(spec path in the edit target layer, references list op)]
+        edits = []
+        for item in index:
             abs_in_current_layer = False
             abs_in_weaker_layer = False
             unfixiable = False
-            for ref, ref_layer in refs_and_layers:
+            for ref, ref_layer in item.references:
                 if _path_utils.is_absolute_path(str(ref.assetPath)):
                     if ref_layer == cur_layer:
                         abs_in_current_layer = True
@@ -109,11 +112,11 @@ class RelativeReferences(_CheckBaseUSD):
             if abs_in_weaker_layer:
                 # absolute path in a sublayer - need to flatten all the weaker references into this layer to fix it.
                 refs = []
-                for ref, ref_layer in refs_and_layers:
+                for ref, ref_layer in item.references:
                     if ref_layer in weaker_layers:
                         # Need to convert references to absolute paths.
-                        abs_path = Sdf.ComputeAssetPathRelativeToLayer(ref_layer, ref.assetPath)
-                        rel_path = omni.client.make_relative_url(base_path, abs_path)
+                        abs_path = index.anchor(ref_layer, ref.assetPath)
+                        rel_path = index.make_relative(base_path, abs_path)
                         refs.append(
                             Sdf.Reference(
                                 assetPath=rel_path,
@@ -122,37 +125,44 @@ class RelativeReferences(_CheckBaseUSD):
                             )
                         )
 
-                prim.GetReferences().SetReferences(refs)
+                edits.append(
+                    (edit_target.MapToSpecPath(item.prim.GetPath()), Sdf.ReferenceListOp.CreateExplicit(refs))
+                )
             elif abs_in_current_layer:
                 # absolute path in the current edit layer - need to fix it without stomping lower level references.
-                stack = prim.GetPrimStack()
-                for prim_spec in stack:
+                for prim_spec in item.prim_stack:
                     if prim_spec.layer == cur_layer:
                         op = prim_spec.GetInfo(Sdf.PrimSpec.ReferencesKey)
                         if op.isExplicit:
-                            op.explicitItems = self._make_refs_relative(cur_layer, op.explicitItems)
+                            op.explicitItems = self._make_refs_relative(index, cur_layer, op.explicitItems)
                         else:
-                            op.addedItems = self._make_refs_relative(cur_layer, op.addedItems)
-                            op.prependedItems = self._make_refs_relative(cur_layer, op.prependedItems)
-                            op.appendedItems = self._make_refs_relative(cur_layer, op.appendedItems)
-                            op.deletedItems = self._make_refs_relative(cur_layer, op.deletedItems)
-                            op.orderedItems = self._make_refs_relative(cur_layer, op.orderedItems)
+                            op.addedItems = self._make_refs_relative(index, cur_layer, op.addedItems)
+                            op.prependedItems = self._make_refs_relative(index, cur_layer, op.prependedItems)
+                            op.appendedItems = self._make_refs_relative(index, cur_layer, op.appendedItems)
+                            op.deletedItems = self._make_refs_relative(index, cur_layer, op.deletedItems)
+                            op.orderedItems = self._make_refs_relative(index, cur_layer, op.orderedItems)
 
-                        prim_spec.SetInfo(Sdf.PrimSpec.ReferencesKey, op)
+                        edits.append((prim_spec.path, op))
                         break
             if unfixiable:
-                message += f"- FAIL: absolute reference exists above current EditTarget. {str(prim.GetPath())}\n"
+                message += f"- FAIL: absolute reference exists above current EditTarget. {str(item.prim.GetPath())}\n"
                 all_pass = False
             else:
-                message += f"- PASS: {str(prim.GetPath())}\n"
+                message += f"- PASS: {str(item.prim.GetPath())}\n"
+
+        # Write every edit at once, once the prim stacks were read
+        with Sdf.ChangeBlock():
+            for spec_path, op in edits:
+                prim_spec = Sdf.CreatePrimInLayer(cur_layer, spec_path)
+                prim_spec.SetInfo(Sdf.PrimSpec.ReferencesKey, op)
 
         return all_pass, message, None
 
-    def _make_refs_relative(self, layer, refs):
+    def _make_refs_relative(self, index: _AssetPathIndex, layer, refs):
         ret_refs = []
         for ref in refs:
             if _path_utils.is_absolute_path(str(ref.assetPath)):
-                rel_path = omni.client.make_relative_url(layer.identifier, str(ref.assetPath))
+                rel_path = index.make_relative(layer.identifier, str(ref.assetPath))
                 ref_new = Sdf.Reference(
                     assetPath=rel_path,
                     primPath=ref.primPath,
@@ -18,6 +18,7 @@
 from .e2e.generic.test_value_mapping import *
 from .e2e.meta.test_default_prim_ui import *
 from .unit.ai.test_generate_pbr_material import *
+from .unit.base.test_result_accumulator import *
 from .unit.generic.test_value_mapping import *
 from .unit.material.test_default_material import *
 from .unit.material.test_material_shaders import *
@@ -28,6 +29,7 @@ from .unit.mesh.test_strip_extra_attributes import *
 from .unit.mesh.test_triangulate import *
 from .unit.meta.test_default_prim import *
 from .unit.meta.test_wrap_root_prims import *
+from .unit.paths.test_asset_path_index import *
 from .unit.paths.test_relative_asset_paths import *
 from .unit.paths.test_relative_references import *
 from .unit.test_print_prims import *
@@ -0,0 +1,105 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import time
+from unittest.mock import Mock, call, patch
+
+import carb
+import omni.kit.test
+from omni.flux.validator.plugin.check.usd.base.result_accumulator import ResultAccumulator, ResultStatus
+
+_BENCHMARK_ITEM_COUNT = 200_000
+
+
+class TestResultAccumulator(omni.kit.test.AsyncTestCase):
+    async def test_render_should_match_item_lines(self):
+        # Arrange
+        results = ResultAccumulator("Check:\n", 3)
+
+        # Act
+        results.add(ResultStatus.PASS, "/Cube")
+        results.add(ResultStatus.FAIL, "/Sphere", "references: ['C:/texture.dds']")
+        results.add(ResultStatus.SKIP, "/Cone")
+
+        # Assert
+        self.assertFalse(results.success)
+        self.assertEqual(1, results.fail_count)
+        self.assertListEqual(["/Sphere"], results.get_paths(ResultStatus.FAIL))
+        self.assertEqual(
+            "Check:\n- PASS: /Cube\n- FAIL: /Sphere references: ['C:/texture.dds']\n- SKIP: /Cone\n", results.render()
+        )
+
+    async def test_render_should_truncate_huge_selections(self):
+        # Arrange
+        results = ResultAccumulator("Fix:\n", 10, max_message_items=2)
+
+        # Act
+        for index in range(10):
+            results.add(ResultStatus.FAIL if index % 2 else ResultStatus.PASS, f"/Cube_{index}")
+
+        # Assert
+        self.assertEqual(
+            "Fix:\n- PASS: /Cube_0\n- FAIL: /Cube_1\n- ... 8 more items, 5 failed in total\n", results.render()
+        )
+
+    async def test_add_should_throttle_progress_and_emit_last_item(self):
+        # Arrange
+        progress_mock = Mock()
+        results = ResultAccumulator("Check:\n", 4, on_progress=progress_mock, progress_rate=1.0)
+
+        # Act
+        with patch.object(time, "perf_counter", return_value=10.0):
+            for index in range(4):
+                results.add(ResultStatus.PASS, f"/Cube_{index}")
+
+        # Assert
+        self.assertListEqual(
+            [call(0.25, "PASS: /Cube_0", True), call(1.0, "PASS: /Cube_3", True)], progress_mock.call_args_list
+        )
+
+    async def test_benchmark_accumulate_200k_items(self):
+        # Arrange
+        paths = [f"/RootNode/meshes/mesh_{index}/mesh" for index in range(_BENCHMARK_ITEM_COUNT)]
+        progress_mock = Mock()
+
+        # Act
+        start = time.perf_counter()
+        message = "Check:\n"
+        for index, path in enumerate(paths):
+            progress_message = f"PASS: {path}"
+            message += f"- {progress_message}\n"
+            progress_mock((index + 1) / len(paths), progress_message, True)
+        per_item_duration = time.perf_counter() - start
+        per_item_calls = progress_mock.call_count
+
+        progress_mock.reset_mock()
+        start = time.perf_counter()
+        results = ResultAccumulator("Check:\n", len(paths), on_progress=progress_mock)
+        for path in paths:
+            results.add(ResultStatus.PASS, path)
+        rendered = results.render()
+        accumulator_duration = time.perf_counter() - start
+
+        carb.log_info(
+            f"Results of {_BENCHMARK_ITEM_COUNT} items: per item {per_item_duration:.3f}s ({per_item_calls} progress "
+            f"calls), accumulator {accumulator_duration:.3f}s ({progress_mock.call_count} progress calls)"
+        )
+
+        # Assert
+        self.assertTrue(message.startswith(rendered[: rendered.rindex("- ...")]))
+        self.assertLess(progress_mock.call_count, per_item_calls)
+        self.assertEqual(call(1.0, f"PASS: {paths[-1]}", True), progress_mock.call_args)
@@ -15,13 +15,43 @@
 * limitations under the License.
 """
 
+import os
+import time
 from unittest.mock import Mock, call, patch
 
+import carb
 import omni.kit.commands
 import omni.kit.test
+import omni.kit.undo
+import omni.usd
 from omni.flux.validator.plugin.check.usd.generic.value_mapping import AttributeMapping, Operator, ValueMapping
 from pxr import Sdf, Usd, UsdShade
 
+_BENCHMARK_PRIM_COUNT = 20_000 if os.environ.get("FLUX_RUN_LARGE_BENCHMARKS") else 2_000
+
+
+def _reference_fix(schema_data: ValueMapping.Data, prims: list, context_name: str):
+    """The previous fix implementation, limited to the `gt` operator: one read, evaluation and command per mapping"""
+    for prim in prims:
+        for attr_name, attr_mappings in schema_data.attributes.items():
+            attribute = prim.GetAttribute(attr_name)
+            if not attribute:
+                continue
+            for mapping in attr_mappings:
+                input_value = attribute.Get()
+                input_type = type(input_value)
+                if mapping.operator == Operator.gt and input_value > input_type(mapping.input_value):
+                    output_value = mapping.output_value
+                    if mapping.mapping_fn:
+                        output_value = eval(mapping.mapping_fn)(input_value)  # noqa PLW0123
+                    omni.kit.commands.execute(
+                        "ChangeProperty",
+                        prop_path=attribute.GetPath(),
+                        value=input_type(output_value),
+                        prev=None,
+                        usd_context_name=context_name,
+                    )
+
 
 class TestValueMappingUnit(omni.kit.test.AsyncTestCase):
     async def test_not_empty_attribute_name_empty_should_raise_value_error(self):
@@ -154,6 +184,97 @@ class TestValueMappingUnit(omni.kit.test.AsyncTestCase):
         await self.__run_fix(False, True)
         await self.__run_fix(False, False)
 
+    async def test_benchmark_fix_should_match_reference_implementation(self):
+        # Arrange
+        context = omni.usd.get_context()
+        await context.new_stage_async()
+        stage = context.get_stage()
+
+        attr_name = "inputs:emissive_intensity"
+        variants = ["reference", "compiled", "vectorized"]
+        prims = {}
+        with Sdf.ChangeBlock():
+            for variant in variants:
+                prims[variant] = []
+                for index in range(_BENCHMARK_PRIM_COUNT):
+                    shader = UsdShade.Shader.Define(stage, f"/World/{variant}/Shader_{index}")
+                    shader.CreateInput("emissive_intensity", Sdf.ValueTypeNames.Float).Set(float(index % 10))
+                    prims[variant].append(shader.GetPrim())
+
+        def create_schema_data(vectorized: bool) -> ValueMapping.Data:
+            mappings = [
+                AttributeMapping.construct(
+                    operator=Operator.gt, input_value=4.0, mapping_fn="lambda x: x * 0.5", vectorized=vectorized
+                ),
+                AttributeMapping.construct(operator=Operator.gt, input_value=3.0, output_value=3.0),
+            ]
+            schema_data = ValueMapping.Data.construct()
+            schema_data.attributes = {attr_name: mappings}
+            return schema_data
+
+        durations = {}
+
+        # Act
+        with patch.object(ValueMapping, "on_progress"):
+            start = time.perf_counter()
+            _reference_fix(create_schema_data(False), prims["reference"], "")
+            durations["reference"] = time.perf_counter() - start
+
+            for variant in variants[1:]:
+                start = time.perf_counter()
+                success, _, _ = await ValueMapping()._fix(  # noqa PLW0212
+                    create_schema_data(variant == "vectorized"), "", prims[variant]
+                )
+                durations[variant] = time.perf_counter() - start
+                self.assertTrue(success)
+
+        carb.log_info(
+            f"Value mapping of {_BENCHMARK_PRIM_COUNT} prims: "
+            + ", ".join(f"{variant} {duration:.3f}s" for variant, duration in durations.items())
+        )
+
+        # Assert
+        expected = [prim.GetAttribute(attr_name).Get() for prim in prims["reference"]]
+        for variant in variants[1:]:
+            self.assertListEqual(expected, [prim.GetAttribute(attr_name).Get() for prim in prims[variant]])
+
+        await context.close_stage_async()
+
+    async def test_fix_should_be_undone_in_a_single_step(self):
+        # Arrange
+        context = omni.usd.get_context()
+        await context.new_stage_async()
+        stage = context.get_stage()
+
+        attr_name = "inputs:emissive_intensity"
+        # The shaders are defined in a sublayer: the fix creates the attribute specs on the root layer
+        sublayer = Sdf.Layer.CreateAnonymous()
+        stage.GetRootLayer().subLayerPaths.append(sublayer.identifier)
+        prims = []
+        with Usd.EditContext(stage, sublayer):
+            for index in range(3):
+                shader = UsdShade.Shader.Define(stage, f"/World/Looks/Shader_{index}")
+                shader.CreateInput("emissive_intensity", Sdf.ValueTypeNames.Float).Set(float(index))
+                prims.append(shader.GetPrim())
+
+        mapping = AttributeMapping.construct(operator=Operator.ge, input_value=1.0, output_value=5.0)
+        schema_data = ValueMapping.Data.construct()
+        schema_data.attributes = {attr_name: [mapping]}
+
+        # Act
+        with patch.object(ValueMapping, "on_progress"):
+            success, _, _ = await ValueMapping()._fix(schema_data, "", prims)  # noqa PLW0212
+        fixed_values = [prim.GetAttribute(attr_name).Get() for prim in prims]
+        omni.kit.undo.undo()
+
+        # Assert
+        self.assertTrue(success)
+        self.assertListEqual([0.0, 5.0, 5.0], fixed_values)
+        self.assertListEqual([0.0, 1.0, 2.0], [prim.GetAttribute(attr_name).Get() for prim in prims])
+        self.assertFalse(stage.GetRootLayer().GetPrimAtPath("/World"))
+
+        await context.close_stage_async()
+
     async def __run_check(self, has_mappable_attr: bool, match_predicate: bool):
         # Arrange
         emissive_intensity = ValueMapping()
@@ -274,11 +395,16 @@ class TestValueMappingUnit(omni.kit.test.AsyncTestCase):
         if should_change:
             self.assertEqual(
                 call(
-                    "ChangeProperty",
-                    prop_path=Sdf.Path(f"{shader_path}.{attr_name}"),
-                    value=float(mapping.output_value),
-                    prev=None,
-                    usd_context_name="",
+                    "SetAttributeValues",
+                    values=[
+                        (
+                            Sdf.Path(f"{shader_path}.{attr_name}"),
+                            float(mapping.output_value),
+                            Sdf.ValueTypeNames.Float,
+                            Sdf.VariabilityVarying,
+                        )
+                    ],
+                    layer=stage.GetRootLayer(),
                 ),
                 execute_mock.call_args,
             )
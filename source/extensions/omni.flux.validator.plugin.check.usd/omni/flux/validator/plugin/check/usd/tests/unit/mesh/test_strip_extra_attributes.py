@@ -15,10 +15,23 @@
 * limitations under the License.
 """
 
+import os
+import re
+import time
+from unittest.mock import patch
+
+import carb
 import omni.usd
 from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
+from omni.flux.validator.plugin.check.usd.mesh.strip_extra_attributes import (
+    StripExtraAttributes as _StripExtraAttributes,
+)
 from omni.kit.test.async_unittest import AsyncTestCase
 from omni.kit.test_suite.helpers import arrange_windows, get_test_data_path, open_stage, wait_stage_loading
+from pxr import Sdf, Usd, UsdGeom
+
+_BENCHMARK_MESH_COUNT = 2_000 if os.environ.get("FLUX_RUN_LARGE_BENCHMARKS") else 200
+_BENCHMARK_PRIMVAR_COUNT = 300
 
 
 class TestStripExtraAttributes(AsyncTestCase):
@@ -135,3 +148,71 @@ class TestStripExtraAttributes(AsyncTestCase):
         self.assertTrue(prim.GetAttribute("normals"))
         self.assertTrue(prim.GetAttribute("xformOp:test"))
         self.assertTrue(prim.GetAttribute("primvars:skel:jointWeights"))
+
+    def _create_meshes_stage(self, mesh_count: int, primvar_count: int) -> Usd.Stage:
+        stage = Usd.Stage.CreateInMemory()
+        with Sdf.ChangeBlock():
+            for index in range(mesh_count):
+                mesh = UsdGeom.Mesh.Define(stage, f"/meshes/mesh_{index}")
+                mesh.CreatePointsAttr([(0, 0, 0), (1, 0, 0), (0, 1, 0)])
+                primvars_api = UsdGeom.PrimvarsAPI(mesh)
+                for primvar_index in range(primvar_count):
+                    primvars_api.CreatePrimvar(f"extra_{primvar_index}", Sdf.ValueTypeNames.Float).Set(1.0)
+        return stage
+
+    async def test_fix_dry_run_should_only_report_statistics(self):
+        # Arrange
+        stage = self._create_meshes_stage(2, 3)
+        prims = [stage.GetPrimAtPath("/meshes/mesh_0"), stage.GetPrimAtPath("/meshes/mesh_1")]
+        schema_data = _StripExtraAttributes.Data(dry_run=True)
+
+        with patch.object(_StripExtraAttributes, "on_progress"):
+            # Act
+            success, message, _ = await _StripExtraAttributes()._fix(schema_data, "", prims)  # noqa PLW0212
+
+        # Assert
+        self.assertTrue(success)
+        self.assertIn("DRY RUN: /meshes/mesh_0, would remove ['primvars:extra_0'", message)
+        self.assertIn("- 6 attributes would be removed, 3 unique names, 2 prims\n", message)
+        self.assertIn("- primvars:extra_2: 2\n", message)
+        self.assertTrue(prims[0].GetAttribute("primvars:extra_0"))
+
+    async def test_benchmark_fix_meshes_with_many_primvars(self):
+        # Arrange
+        legacy_stage = self._create_meshes_stage(_BENCHMARK_MESH_COUNT, _BENCHMARK_PRIMVAR_COUNT)
+        stage = self._create_meshes_stage(_BENCHMARK_MESH_COUNT, _BENCHMARK_PRIMVAR_COUNT)
+        schema_data = _StripExtraAttributes.Data()
+        plugin = _StripExtraAttributes()
+
+        # Act
+        legacy_prims = [prim for prim in legacy_stage.Traverse() if prim.IsA(UsdGeom.Mesh)]
+        start = time.perf_counter()
+        keep_regex = re.compile(plugin.get_regex_str(schema_data))
+        with Sdf.ChangeBlock():
+            for prim in legacy_prims:
+                attr_to_remove = [
+                    attr.GetName()
+                    for attr in prim.GetAttributes()
+                    if attr.HasAuthoredValue() and not keep_regex.match(attr.GetName())
+                ]
+                for attr in attr_to_remove:
+                    prim.RemoveProperty(attr)
+        legacy_duration = time.perf_counter() - start
+
+        prims = [prim for prim in stage.Traverse() if prim.IsA(UsdGeom.Mesh)]
+        with patch.object(_StripExtraAttributes, "on_progress"):
+            start = time.perf_counter()
+            success, _, _ = await plugin._fix(schema_data, "", prims)  # noqa PLW0212
+            spec_duration = time.perf_counter() - start
+
+        removed_count = _BENCHMARK_MESH_COUNT * _BENCHMARK_PRIMVAR_COUNT
+        carb.log_info(
+            f"Strip {removed_count} attributes from {_BENCHMARK_MESH_COUNT} meshes: "
+            f"per attribute {legacy_duration:.3f}s ({removed_count / legacy_duration:.0f}/s), "
+            f"spec level {spec_duration:.3f}s ({removed_count / spec_duration:.0f}/s)"
+        )
+
+        # Assert
+        self.assertTrue(success)
+        self.assertEqual(legacy_stage.GetRootLayer().ExportToString(), stage.GetRootLayer().ExportToString())
+        self.assertFalse(prims[0].GetAttribute("primvars:extra_0"))
@@ -0,0 +1,115 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from unittest.mock import patch
+
+import omni.kit.test
+from omni.flux.validator.plugin.check.usd.paths.asset_path_index import AssetPathIndex
+from pxr import Sdf, Usd
+
+
+class TestAssetPathIndex(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.stage = Usd.Stage.CreateInMemory()
+        self.strong_layer = self.stage.GetRootLayer()
+        self.weak_layer = Sdf.Layer.CreateAnonymous()
+        self.strong_layer.subLayerPaths.append(self.weak_layer.identifier)
+
+    # After running each test
+    async def tearDown(self):
+        self.stage = None
+        self.strong_layer = None
+        self.weak_layer = None
+
+    def _create_attribute(self, layer: Sdf.Layer, name: str, type_name: Sdf.ValueTypeName, value=None):
+        prim_spec = Sdf.CreatePrimInLayer(layer, "/Looks/Shader")
+        prim_spec.specifier = Sdf.SpecifierDef
+        attr_spec = Sdf.AttributeSpec(prim_spec, name, type_name)
+        if value is not None:
+            attr_spec.default = value
+        return attr_spec
+
+    async def test_index_should_keep_the_strongest_asset_opinion(self):
+        # Arrange
+        strong_spec = self._create_attribute(
+            self.strong_layer, "inputs:strong", Sdf.ValueTypeNames.Asset, Sdf.AssetPath("/textures/strong.dds")
+        )
+        self._create_attribute(
+            self.weak_layer, "inputs:strong", Sdf.ValueTypeNames.Asset, Sdf.AssetPath("/textures/weak.dds")
+        )
+        # A spec without a default value does not hide the weaker opinions
+        self._create_attribute(self.strong_layer, "inputs:weak", Sdf.ValueTypeNames.Asset)
+        weak_spec = self._create_attribute(
+            self.weak_layer, "inputs:weak", Sdf.ValueTypeNames.Asset, Sdf.AssetPath("./textures/weak.dds")
+        )
+
+        # Act
+        index = AssetPathIndex([self.stage.GetPrimAtPath("/Looks/Shader")])
+
+        # Assert
+        self.assertEqual(1, len(index))
+        item = next(iter(index))
+        self.assertDictEqual({"inputs:strong": strong_spec, "inputs:weak": weak_spec}, item.asset_attributes)
+        self.assertListEqual([("/textures/strong.dds", strong_spec)], AssetPathIndex.get_absolute_asset_paths(item))
+
+    async def test_index_blocked_or_non_asset_opinions_should_hide_the_weaker_opinions(self):
+        # Arrange
+        self._create_attribute(self.strong_layer, "inputs:blocked", Sdf.ValueTypeNames.Asset, Sdf.ValueBlock())
+        self._create_attribute(self.strong_layer, "inputs:string", Sdf.ValueTypeNames.String, "/textures/strong.dds")
+        for name in ["inputs:blocked", "inputs:string"]:
+            self._create_attribute(
+                self.weak_layer, name, Sdf.ValueTypeNames.Asset, Sdf.AssetPath("/textures/weak.dds")
+            )
+
+        # Act
+        index = AssetPathIndex([self.stage.GetPrimAtPath("/Looks/Shader")])
+
+        # Assert
+        item = next(iter(index))
+        self.assertDictEqual({}, item.asset_attributes)
+        self.assertListEqual([], AssetPathIndex.get_absolute_asset_paths(item))
+
+    async def test_index_should_collect_the_references_of_every_spec(self):
+        # Arrange
+        for layer, asset_path in [(self.strong_layer, "./strong.usda"), (self.weak_layer, "./weak.usda")]:
+            prim_spec = Sdf.CreatePrimInLayer(layer, "/Looks/Shader")
+            prim_spec.referenceList.Prepend(Sdf.Reference(asset_path))
+
+        # Act
+        index = AssetPathIndex([self.stage.GetPrimAtPath("/Looks/Shader")], asset_attributes=False)
+
+        # Assert
+        item = next(iter(index))
+        self.assertListEqual(
+            [("./strong.usda", self.strong_layer), ("./weak.usda", self.weak_layer)],
+            [(reference.assetPath, layer) for reference, layer in item.references],
+        )
+
+    async def test_anchor_should_compute_each_path_once(self):
+        # Arrange
+        index = AssetPathIndex([])
+
+        # Act
+        with patch.object(
+            Sdf, "ComputeAssetPathRelativeToLayer", wraps=Sdf.ComputeAssetPathRelativeToLayer
+        ) as compute_mock:
+            values = [index.anchor(self.weak_layer, "./textures/texture.dds") for _ in range(3)]
+
+        # Assert
+        self.assertEqual(1, compute_mock.call_count)
+        self.assertEqual(1, len(set(values)))
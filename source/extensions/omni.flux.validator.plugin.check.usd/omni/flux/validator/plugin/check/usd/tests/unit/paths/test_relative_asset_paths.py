@@ -15,12 +15,22 @@
 * limitations under the License.
 """
 
+import os
+import time
 from pathlib import Path
+from unittest.mock import Mock, patch
 
+import carb
 import omni.usd
+from omni.flux.utils.common import path_utils as _path_utils
 from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
+from omni.flux.validator.plugin.check.usd.paths.relative_asset_paths import RelativeAssetPaths as _RelativeAssetPaths
 from omni.kit.test.async_unittest import AsyncTestCase
 from omni.kit.test_suite.helpers import arrange_windows, get_test_data_path, open_stage, wait_stage_loading
+from pxr import Sdf, Usd
+
+_BENCHMARK_ATTRIBUTE_COUNT = 500_000 if os.environ.get("FLUX_RUN_LARGE_BENCHMARKS") else 20_000
+_BENCHMARK_ATTRIBUTES_PER_PRIM = 5
 
 
 class TestRelativeAssetPaths(AsyncTestCase):
@@ -203,3 +213,52 @@ class TestRelativeAssetPaths(AsyncTestCase):
 
         attr = prim.GetAttribute("inputs:diffuse_texture")
         self.assertEqual(str(attr.Get().path), "../texture.png")
+
+    async def test_benchmark_check_asset_attributes(self):
+        # Arrange
+        stage = Usd.Stage.CreateInMemory()
+        layer = stage.GetRootLayer()
+        prim_count = _BENCHMARK_ATTRIBUTE_COUNT // _BENCHMARK_ATTRIBUTES_PER_PRIM
+        with Sdf.ChangeBlock():
+            for index in range(prim_count):
+                prim_spec = Sdf.CreatePrimInLayer(layer, f"/Looks/mat_{index}/Shader")
+                prim_spec.specifier = Sdf.SpecifierDef
+                prim_spec.typeName = "Shader"
+                for attr_index in range(_BENCHMARK_ATTRIBUTES_PER_PRIM):
+                    attr_spec = Sdf.AttributeSpec(prim_spec, f"inputs:texture_{attr_index}", Sdf.ValueTypeNames.Asset)
+                    # Every 10th prim has an absolute path
+                    folder = "/textures" if index % 10 == 0 and attr_index == 0 else "./textures"
+                    attr_spec.default = Sdf.AssetPath(f"{folder}/texture_{index % 100}.dds")
+                Sdf.AttributeSpec(prim_spec, "inputs:roughness", Sdf.ValueTypeNames.Float).default = 0.5
+        prims = [stage.GetPrimAtPath(f"/Looks/mat_{index}/Shader") for index in range(prim_count)]
+
+        # Act
+        start = time.perf_counter()
+        expected = set()
+        for prim in prims:
+            for attr in prim.GetAttributes():
+                if attr.GetTypeName() == Sdf.ValueTypeNames.Asset and attr.Get():
+                    if _path_utils.is_absolute_path(str(attr.Get().path)):
+                        expected.add(str(prim.GetPath()))
+                        break
+        per_attribute_duration = time.perf_counter() - start
+
+        with patch.object(_RelativeAssetPaths, "on_progress"):
+            start = time.perf_counter()
+            success, message, _ = await _RelativeAssetPaths()._check(Mock(), "", prims)  # noqa PLW0212
+            index_duration = time.perf_counter() - start
+
+        carb.log_info(
+            f"Relative asset paths check of {_BENCHMARK_ATTRIBUTE_COUNT} asset attributes: "
+            f"per attribute {per_attribute_duration:.3f}s, spec index {index_duration:.3f}s"
+        )
+
+        # Assert
+        self.assertFalse(success)
+        self.assertEqual(len(expected), prim_count // 10)
+        self.assertIn("FAIL: /Looks/mat_0/Shader references: ['/textures/texture_0.dds']", message)
+        self.assertIn("PASS: /Looks/mat_1/Shader", message)
+        # The message is truncated to the first prims
+        for prim in prims[:100]:
+            path = str(prim.GetPath())
+            self.assertEqual(path in expected, f"FAIL: {path} references" in message)
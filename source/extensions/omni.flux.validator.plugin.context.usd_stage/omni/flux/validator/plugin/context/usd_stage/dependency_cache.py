@@ -0,0 +1,141 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["DependencyGraph", "DependencyGraphCache", "get_dependency_graph_cache_instance"]
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+import omni.client
+from pxr import Sdf, UsdUtils
+
+_INSTANCE = None
+
+
+@dataclass
+class DependencyGraph:
+    """
+    The layer dependencies of a root layer
+    """
+
+    root_identifier: str
+    # The real path of every dependency layer, in the `UsdUtils.ComputeAllDependencies` order
+    layers: List[str] = field(default_factory=list)
+    # The layers without any composition dependency on the other layers of the graph
+    leaf_layers: Set[str] = field(default_factory=set)
+    # The (size, modified time) of every layer when the graph was computed
+    signatures: Dict[str, Optional[Tuple[int, str]]] = field(default_factory=dict)
+
+
+class DependencyGraphCache:
+    """
+    Cache the dependency graphs of root layers so the dependencies are only computed again when a layer changed
+    """
+
+    def __init__(self):
+        self._graphs: Dict[str, DependencyGraph] = {}
+
+    def get(self, root_layer: Sdf.Layer) -> DependencyGraph:
+        """
+        Get the dependency graph of a root layer. The graph is only computed if no valid graph was cached.
+
+        A cached graph is valid if no layer of the graph was modified on disk or has unsaved changes in memory.
+
+        Args:
+            root_layer: the root layer to get the dependencies for
+
+        Returns:
+            The dependency graph of the layer
+        """
+        identifier = root_layer.identifier
+        graph = self._graphs.get(identifier)
+        if graph is not None and self._is_valid(graph):
+            return graph
+
+        graph = self._compute(identifier)
+        self._graphs[identifier] = graph
+        return graph
+
+    def invalidate(self, identifier: Optional[str] = None):
+        """
+        Invalidate the cached graphs
+
+        Args:
+            identifier: the root layer identifier to invalidate the graph for. If None, every graph will be invalidated.
+        """
+        if identifier is None:
+            self._graphs.clear()
+            return
+        self._graphs.pop(identifier, None)
+
+    @staticmethod
+    def _get_signature(path: str) -> Optional[Tuple[int, str]]:
+        result, entry = omni.client.stat(path)
+        if result != omni.client.Result.OK:
+            return None
+        return entry.size, str(entry.modified_time)
+
+    def _is_valid(self, graph: DependencyGraph) -> bool:
+        for path, signature in graph.signatures.items():
+            # Unsaved changes could have changed the dependencies
+            layer = Sdf.Layer.Find(path)
+            if layer and layer.dirty:
+                return False
+            if signature is None or self._get_signature(path) != signature:
+                return False
+        return bool(graph.signatures)
+
+    def _compute(self, identifier: str) -> DependencyGraph:
+        graph = DependencyGraph(root_identifier=identifier)
+        (all_layers, _assets, _unresolved) = UsdUtils.ComputeAllDependencies(identifier)
+
+        layer_paths = [layer.realPath for layer in all_layers]
+        known_paths = {omni.client.normalize_url(path) for path in layer_paths}
+        for layer, path in zip(all_layers, layer_paths):
+            graph.layers.append(path)
+            graph.signatures[path] = self._get_signature(path)
+
+            # A leaf layer doesn't compose any other layer of the graph
+            dependencies = (
+                layer.GetCompositionAssetDependencies()
+                if hasattr(layer, "GetCompositionAssetDependencies")
+                else layer.GetExternalReferences()
+            )
+            if not any(
+                omni.client.normalize_url(layer.ComputeAbsolutePath(dependency)) in known_paths
+                for dependency in dependencies
+                if dependency
+            ):
+                graph.leaf_layers.add(path)
+        return graph
+
+    def destroy(self):
+        self.invalidate()
+
+
+def get_dependency_graph_cache_instance() -> DependencyGraphCache:
+    global _INSTANCE
+    if _INSTANCE is None:
+        _INSTANCE = DependencyGraphCache()
+    return _INSTANCE
+
+
+def destroy_dependency_graph_cache_instance():
+    global _INSTANCE
+    if _INSTANCE is not None:
+        _INSTANCE.destroy()
+    _INSTANCE = None
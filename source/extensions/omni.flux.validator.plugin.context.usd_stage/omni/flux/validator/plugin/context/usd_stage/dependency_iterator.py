@@ -15,6 +15,7 @@
 * limitations under the License.
 """
 
+import asyncio
 from pathlib import Path
 from typing import Any, Awaitable, Callable, List, Optional, Tuple
 
@@ -25,9 +26,10 @@ import omni.usd
 from omni.flux.validator.factory import InOutDataFlow as _InOutDataFlow
 from omni.flux.validator.factory import SetupDataTypeVar as _SetupDataTypeVar
 from omni.flux.validator.factory import utils as _validator_factory_utils
-from pxr import UsdUtils
+from pxr import Sdf
 
 from .base.context_base_usd import ContextBaseUSD as _ContextBaseUSD
+from .dependency_cache import get_dependency_graph_cache_instance as _get_dependency_graph_cache_instance
 
 
 class DependencyIterator(_ContextBaseUSD):
@@ -37,6 +39,11 @@ class DependencyIterator(_ContextBaseUSD):
         # will close each dependency layer at the end. But NOT the main layer. Use close_stage_on_exit for the main
         # layer
         close_dependency_between_round: bool = True
+        # will process the dependency layers that don't compose other dependency layers concurrently, each one in a
+        # separate stage. The main layer is always processed last, in the main context. Only enable this if the check
+        # plugins of the schema can run concurrently.
+        process_leaf_layers_concurrently: bool = False
+        max_concurrent_leaf_layers: int = 4
 
         _compatible_data_flow_names = ["InOutData"]
         data_flows: Optional[List[_InOutDataFlow]] = None  # override base argument with the good typing
@@ -46,6 +53,11 @@ class DependencyIterator(_ContextBaseUSD):
     tooltip = "This plugin will iterate and open all dependencies (sublayers, references, etc etc)"
     data_type = Data
 
+    def __init__(self):
+        super().__init__()
+        self.__progress = 0
+        self.__progress_step = 0
+
     @omni.usd.handle_exception
     async def _check(self, schema_data: Data, parent_context: _SetupDataTypeVar) -> Tuple[bool, str]:
         """
@@ -78,51 +90,143 @@ class DependencyIterator(_ContextBaseUSD):
 
         Returns: True if ok + message + data that need to be passed into another plugin
         """
-        progress = 0
-        self.on_progress(progress, "Start", True)
+        self.on_progress(0, "Start", True)
         context = await self._set_current_context(schema_data, parent_context)
         if not context:
             return False, f"The context {schema_data.computed_context} doesn't exist!", None
         stage = context.get_stage()
 
         root_layer = stage.GetRootLayer()
-        root_layer_identifier = root_layer.identifier
-        (all_layers, _assets, _unresolved) = UsdUtils.ComputeAllDependencies(root_layer_identifier)
+        # The dependency graph is shared between the runs and only computed again if a layer changed
+        graph = _get_dependency_graph_cache_instance().get(root_layer)
+        all_layers = list(graph.layers)
+        leaf_layers = set()
+        if not all_layers:
+            all_layers = [layer.realPath for layer in stage.GetLayerStack() if not layer.anonymous]
+        elif schema_data.process_leaf_layers_concurrently:
+            leaf_layers = graph.leaf_layers - {root_layer.realPath}
 
         if not all_layers:
-            all_layers = [layer for layer in stage.GetLayerStack() if not layer.anonymous]
-        if all_layers:  # noqa
-            size_layers = len(all_layers)
-            to_add = 1 / size_layers
-            for i, layer in enumerate(reversed(all_layers)):
-                file_path = layer.realPath
+            return (
+                True,
+                f"0 dependencies processed for: {omni.client.normalize_url(context.get_stage_url())}",
+                stage,
+            )
+
+        self.__progress = 0
+        self.__progress_step = 1 / len(all_layers)
 
-                _validator_factory_utils.push_input_data(schema_data, [str(file_path)])
+        # Keep the processed layers with unsaved changes alive so the next rounds see them. The other layers are
+        # reloaded from disk when a next round needs them.
+        dirty_layers = []
 
+        # Leaf layers don't compose any other dependency so they can be processed concurrently in separate stages
+        if leaf_layers:
+            success, message = await self.__process_leaf_layers(
+                schema_data,
+                run_callback,
+                [path for path in reversed(all_layers) if path in leaf_layers],
+                dirty_layers,
+            )
+            if not success:
+                return False, message, None
+
+        remaining_layers = [path for path in reversed(all_layers) if path not in leaf_layers]
+        size_layers = len(remaining_layers)
+        for i, file_path in enumerate(remaining_layers):
+            _validator_factory_utils.push_input_data(schema_data, [str(file_path)])
+
+            # Re-use the opened stage if it is already opened on the layer
+            current_stage = context.get_stage()
+            if not current_stage or current_stage.GetRootLayer().realPath != file_path:
                 result, error = await context.open_stage_async(file_path)
                 if not result:
-                    return False, f"Can't open the file {file_path: {error}}", None
-                progress += to_add / 2
-                self.on_progress(progress, f"Opened {Path(file_path).name}", True)
-                await run_callback(schema_data.computed_context)
-                if schema_data.save_all_layers_on_exit:
-                    result, error, _saved_layers = await context.save_stage_async()
-                    if not result:
-                        return False, f"Can't save the file {file_path: {error}}", None
+                    return False, f"Can't open the file {file_path}: {error}", None
+            self.__add_progress(f"Opened {Path(file_path).name}")
 
-                    _validator_factory_utils.push_output_data(schema_data, [str(file_path)])
+            await run_callback(schema_data.computed_context)
+            if schema_data.save_all_layers_on_exit:
+                result, error, _saved_layers = await context.save_stage_async()
+                if not result:
+                    return False, f"Can't save the file {file_path}: {error}", None
+
+                _validator_factory_utils.push_output_data(schema_data, [str(file_path)])
 
-                if schema_data.close_dependency_between_round and i != size_layers - 1:
-                    await self._close_stage(schema_data.computed_context)
+            self.__keep_if_dirty(context.get_stage().GetRootLayer(), dirty_layers)
+            if schema_data.close_dependency_between_round and i != size_layers - 1:
+                await self._close_stage(schema_data.computed_context)
 
-                progress += to_add / 2
-                self.on_progress(progress, f"Processed {Path(file_path).name}", True)
+            self.__add_progress(f"Processed {Path(file_path).name}")
         return (
             True,
             f"{len(all_layers)} dependencies processed for: {omni.client.normalize_url(context.get_stage_url())}",
             stage,
         )
 
+    @staticmethod
+    def __keep_if_dirty(layer: Sdf.Layer, dirty_layers: List[Sdf.Layer]):
+        if layer and layer.dirty and layer not in dirty_layers:
+            dirty_layers.append(layer)
+
+    def __add_progress(self, message: str):
+        self.__progress += self.__progress_step / 2
+        self.on_progress(self.__progress, message, True)
+
+    async def __process_leaf_layers(
+        self,
+        schema_data: Data,
+        run_callback: Callable[[_SetupDataTypeVar], Awaitable[None]],
+        leaf_layers: List[str],
+        dirty_layers: List[Sdf.Layer],
+    ) -> Tuple[bool, str]:
+        queue = list(leaf_layers)
+        errors = []
+
+        async def process_layers(context_name: str):
+            context = omni.usd.get_context(context_name)
+            # Only destroy the contexts created for the run
+            created_context = context is None
+            if created_context:
+                context = omni.usd.create_context(context_name)
+            try:
+                while queue and not errors:
+                    file_path = queue.pop(0)
+                    _validator_factory_utils.push_input_data(schema_data, [str(file_path)])
+
+                    result, error = await context.open_stage_async(file_path)
+                    if not result:
+                        errors.append(f"Can't open the file {file_path}: {error}")
+                        return
+                    self.__add_progress(f"Opened {Path(file_path).name}")
+
+                    await run_callback(context_name)
+                    if schema_data.save_all_layers_on_exit:
+                        result, error, _saved_layers = await context.save_stage_async()
+                        if not result:
+                            errors.append(f"Can't save the file {file_path}: {error}")
+                            return
+
+                        _validator_factory_utils.push_output_data(schema_data, [str(file_path)])
+
+                    self.__keep_if_dirty(context.get_stage().GetRootLayer(), dirty_layers)
+                    await self._close_stage(context_name)
+                    self.__add_progress(f"Processed {Path(file_path).name}")
+            finally:
+                await self._close_stage(context_name)
+                if created_context:
+                    omni.usd.destroy_context(context_name)
+
+        worker_count = max(1, min(schema_data.max_concurrent_leaf_layers, len(queue)))
+        await asyncio.gather(
+            *[
+                process_layers(f"{schema_data.computed_context}_{self.name}_{index}")
+                for index in range(worker_count)
+            ]
+        )
+        if errors:
+            return False, errors[0]
+        return True, f"{len(leaf_layers)} leaf dependencies processed"
+
     async def _on_exit(self, schema_data: Data, parent_context: _SetupDataTypeVar) -> Tuple[bool, str]:
         """
         Function that will be called to after the check of the data. For example, save the input USD stage
@@ -22,6 +22,7 @@ from omni.flux.validator.factory import get_instance as _get_factory_instance
 
 from .asset_importer import AssetImporter as _AssetImporter
 from .current_stage import CurrentStage as _CurrentStage
+from .dependency_cache import destroy_dependency_graph_cache_instance as _destroy_dependency_graph_cache_instance
 from .dependency_iterator import DependencyIterator as _DependencyIterator
 from .texture_importer import TextureImporter as _TextureImporter
 from .usd_directory import USDDirectory as _USDDirectory
@@ -42,3 +43,4 @@ class FluxValidatorPluginContextUSDStageExtension(omni.ext.IExt):
         _get_factory_instance().unregister_plugins(
             [_USDFile, _USDDirectory, _CurrentStage, _DependencyIterator, _AssetImporter, _TextureImporter]
         )
+        _destroy_dependency_graph_cache_instance()
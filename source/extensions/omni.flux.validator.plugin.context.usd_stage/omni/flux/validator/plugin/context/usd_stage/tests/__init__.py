@@ -20,4 +20,5 @@ from .e2e.test_current_stage import *
 from .e2e.test_texture_importer import *
 from .e2e.test_usd_file import *
 from .unit.test_asset_importer import *
+from .unit.test_dependency_cache import *
 from .unit.test_texture_importer import *
@@ -0,0 +1,89 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import tempfile
+from pathlib import Path
+
+import omni.kit.test
+from omni.flux.validator.plugin.context.usd_stage.dependency_cache import DependencyGraphCache
+from pxr import Sdf
+
+
+class TestDependencyGraphCacheUnit(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = DependencyGraphCache()
+
+        # root.usda -> sublayer.usda -> reference.usda
+        temp_path = Path(self.temp_dir.name)
+        self.reference_path = str(temp_path / "reference.usda")
+        self.sublayer_path = str(temp_path / "sublayer.usda")
+        self.root_path = str(temp_path / "root.usda")
+
+        reference_layer = Sdf.Layer.CreateNew(self.reference_path)
+        Sdf.CreatePrimInLayer(reference_layer, "/Mesh").specifier = Sdf.SpecifierDef
+        reference_layer.Save()
+
+        sublayer = Sdf.Layer.CreateNew(self.sublayer_path)
+        prim_spec = Sdf.CreatePrimInLayer(sublayer, "/Root")
+        prim_spec.specifier = Sdf.SpecifierDef
+        prim_spec.referenceList.Prepend(Sdf.Reference("./reference.usda", "/Mesh"))
+        sublayer.Save()
+
+        root_layer = Sdf.Layer.CreateNew(self.root_path)
+        root_layer.subLayerPaths.append("./sublayer.usda")
+        root_layer.Save()
+
+        self.reference_layer = reference_layer
+        self.sublayer = sublayer
+        self.root_layer = root_layer
+
+    async def tearDown(self):
+        self.cache.destroy()
+        self.reference_layer = None
+        self.sublayer = None
+        self.root_layer = None
+        self.temp_dir.cleanup()
+
+    async def test_get_should_compute_layers_and_leaf_layers(self):
+        # Act
+        graph = self.cache.get(self.root_layer)
+
+        # Assert
+        self.assertSetEqual(
+            {self.root_layer.realPath, self.sublayer.realPath, self.reference_layer.realPath}, set(graph.layers)
+        )
+        self.assertSetEqual({self.reference_layer.realPath}, graph.leaf_layers)
+
+    async def test_get_should_reuse_graph_until_a_layer_changes(self):
+        # Act
+        first_graph = self.cache.get(self.root_layer)
+        second_graph = self.cache.get(self.root_layer)
+
+        # Unsaved changes invalidate the graph
+        Sdf.CreatePrimInLayer(self.sublayer, "/Other").specifier = Sdf.SpecifierDef
+        third_graph = self.cache.get(self.root_layer)
+
+        # Assert
+        self.assertIs(first_graph, second_graph)
+        self.assertIsNot(first_graph, third_graph)
+
+        # Saved changes invalidate the graph
+        self.sublayer.Save()
+        fourth_graph = self.cache.get(self.root_layer)
+        self.assertIsNot(third_graph, fourth_graph)
+        self.assertIs(fourth_graph, self.cache.get(self.root_layer))
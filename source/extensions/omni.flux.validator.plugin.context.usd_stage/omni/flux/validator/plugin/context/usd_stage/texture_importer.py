@@ -27,7 +27,7 @@ import omni.kit.commands
 import omni.kit.undo
 import omni.ui as ui
 import omni.usd
-from omni.flux.asset_importer.core import get_texture_sets as _get_texture_sets
+from omni.flux.asset_importer.core import TextureSetIndex as _TextureSetIndex
 from omni.flux.asset_importer.core.data_models import SUPPORTED_TEXTURE_EXTENSIONS as _SUPPORTED_TEXTURE_EXTENSIONS
 from omni.flux.asset_importer.core.data_models import TextureTypes as _TextureTypes
 from omni.flux.asset_importer.widget.texture_import_list import TextureImportItem as _TextureImportItem
@@ -251,13 +251,15 @@ class TextureImporter(_ContextBaseUSD):
         if not success:
             return False, message, []
 
+        # The keys are already normalized URLs, so the grouped paths can be used as-is without re-wrapping them
         all_paths = {str(texture_url): texture_type for texture_url, texture_type in schema_data_template.input_files}
-        texture_sets = _get_texture_sets(list(all_paths.keys()))
+        texture_sets = _TextureSetIndex(all_paths.keys()).texture_sets
         for mat_prefix, texture_types in texture_sets.items():
+            set_paths = [path for _, path in texture_types]
             schema = self.Data(**schema_data_template.dict())
-            schema.input_files = [(path, all_paths[str(_OmniUrl(path))]) for _, path in texture_types]
+            schema.input_files = [(path, all_paths[path]) for path in set_paths]
             schema.display_name_mass_template = str(mat_prefix)
-            schema.display_name_mass_template_tooltip = "\n".join([str(_OmniUrl(path)) for _, path in texture_types])
+            schema.display_name_mass_template_tooltip = "\n".join(set_paths)
             schema.uuid = str(uuid.uuid4())
             result.append(schema)
 
@@ -15,6 +15,12 @@
 * limitations under the License.
 """
 
-__all__ = ["FluxValidatorPluginSelectorUSDExtension"]
+__all__ = [
+    "FluxValidatorPluginSelectorUSDExtension",
+    "StageTraversal",
+    "StageTraversalResult",
+    "get_stage_traversal_instance",
+]
 
 from .extension import FluxValidatorPluginSelectorUSDExtension
+from .stage_traversal import StageTraversal, StageTraversalResult, get_stage_traversal_instance
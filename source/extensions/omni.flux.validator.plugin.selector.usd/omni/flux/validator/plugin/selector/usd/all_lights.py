@@ -65,10 +65,7 @@ class AllLights(_SelectorUSDBase):
         )
 
         all_lights = []
-        for prim in self._get_prims(schema_data, context_plugin_data):
-            # Make sure the prim is a light
-            if not (prim.HasAPI(UsdLux.LightAPI) if hasattr(UsdLux, "LightAPI") else prim.IsA(UsdLux.Light)):
-                continue
+        for prim in self._get_traversal(schema_data, context_plugin_data).lights:
             # Only attempt filtering if we set the light_types in the schema data
             if light_types:
                 valid_light_type = False
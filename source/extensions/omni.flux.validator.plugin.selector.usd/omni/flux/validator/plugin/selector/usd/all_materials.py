@@ -19,7 +19,6 @@ from typing import Any, Tuple
 
 import omni.ui as ui
 import omni.usd
-from pxr import UsdShade
 
 from .base.base_selector import SelectorUSDBase as _SelectorUSDBase
 
@@ -47,12 +46,8 @@ class AllMaterials(_SelectorUSDBase):
         Returns: True if ok + message + the selected data
         """
 
-        all_shaders = [
-            prim_ref
-            for prim_ref in self._get_prims(schema_data, context_plugin_data)
-            if prim_ref.IsA(UsdShade.Material)
-        ]
-        return True, "Ok", all_shaders
+        all_materials = list(self._get_traversal(schema_data, context_plugin_data).materials)
+        return True, "Ok", all_materials
 
     @omni.usd.handle_exception
     async def _build_ui(self, schema_data: Data) -> Any:
@@ -19,7 +19,6 @@ from typing import Any, Tuple
 
 import omni.ui as ui
 import omni.usd
-from pxr import UsdGeom
 
 from .base.base_selector import SelectorUSDBase as _SelectorUSDBase
 
@@ -47,11 +46,11 @@ class AllMeshes(_SelectorUSDBase):
         Returns: True if ok + message + the selected data
         """
 
-        prims = self._get_prims(schema_data, context_plugin_data)
+        traversal = self._get_traversal(schema_data, context_plugin_data)
         if schema_data.include_geom_subset:
-            all_geos = [prim_ref for prim_ref in prims if prim_ref.IsA(UsdGeom.Mesh) or prim_ref.IsA(UsdGeom.Subset)]
+            all_geos = list(traversal.meshes_and_geom_subsets)
         else:
-            all_geos = [prim_ref for prim_ref in prims if prim_ref.IsA(UsdGeom.Mesh)]
+            all_geos = list(traversal.meshes)
         return True, "Ok", all_geos
 
     @omni.usd.handle_exception
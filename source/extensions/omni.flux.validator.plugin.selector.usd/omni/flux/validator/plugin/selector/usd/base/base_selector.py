@@ -18,11 +18,13 @@
 from typing import Any
 
 import omni.usd
-from omni.flux.utils.common.utils import get_omni_prims as _get_omni_prims
 from omni.flux.validator.factory import SelectorBase as _SelectorBase
 from omni.flux.validator.factory import SetupDataTypeVar as _SetupDataTypeVar
 from pxr import Sdf, Usd
 
+from ..stage_traversal import StageTraversalResult as _StageTraversalResult
+from ..stage_traversal import get_stage_traversal_instance as _get_stage_traversal_instance
+
 
 class SelectorUSDBase(_SelectorBase):
     class Data(_SelectorBase.Data):
@@ -44,6 +46,24 @@ class SelectorUSDBase(_SelectorBase):
             Sdf._TestTakeOwnership(root_layer)  # noqa
             await context.close_stage_async()
 
+    def _get_traversal(self, schema_data: Any, context_plugin_data: _SetupDataTypeVar) -> _StageTraversalResult:
+        """
+        Get the bucketed prims of the stage based on the given schema data and context plugin data.
+
+        The stage is walked once and the result is shared by every selector plugin until the stage changes.
+
+        Args:
+            schema_data: The data of the plugin from the schema.
+            context_plugin_data: The context plugin data.
+
+        Returns:
+            The bucketed prims of the stage
+        """
+        stage = omni.usd.get_context(context_plugin_data).get_stage()
+        return _get_stage_traversal_instance().get(
+            stage, select_from_root_layer_only=schema_data.select_from_root_layer_only
+        )
+
     def _get_prims(self, schema_data: Any, context_plugin_data: _SetupDataTypeVar) -> list["Usd.Prim"]:
         """
         Retrieve prims based on the given schema data and context plugin data.
@@ -58,17 +78,4 @@ class SelectorUSDBase(_SelectorBase):
         Returns:
             A list of prims.
         """
-        stage = omni.usd.get_context(context_plugin_data).get_stage()
-
-        def traverse_instanced_children(prim, layer):
-            for child in prim.GetFilteredChildren(Usd.PrimAllPrimsPredicate):
-                # Discard omniverse prims
-                if child.GetPath() in _get_omni_prims():
-                    continue
-                # If filtering for root layer prims, make sure the prim spec exists on the root layer
-                if schema_data.select_from_root_layer_only and not layer.GetPrimAtPath(child.GetPath()):
-                    continue
-                yield child
-                yield from traverse_instanced_children(child, layer)
-
-        return list(traverse_instanced_children(stage.GetPseudoRoot(), stage.GetRootLayer()))
+        return list(self._get_traversal(schema_data, context_plugin_data).prims)
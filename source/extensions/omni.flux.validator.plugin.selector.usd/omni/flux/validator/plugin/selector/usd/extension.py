@@ -28,6 +28,7 @@ from .all_shaders import AllShaders as _AllShaders
 from .all_textures import AllTextures as _AllTextures
 from .nothing import Nothing as _Nothing
 from .root_prims import RootPrims as _RootPrims
+from .stage_traversal import destroy_stage_traversal_instance as _destroy_stage_traversal_instance
 
 
 class FluxValidatorPluginSelectorUSDExtension(omni.ext.IExt):
@@ -44,3 +45,4 @@ class FluxValidatorPluginSelectorUSDExtension(omni.ext.IExt):
         _get_factory_instance().unregister_plugins(
             [_AllLights, _AllPrims, _AllMeshes, _AllMaterials, _AllShaders, _AllTextures, _Nothing, _RootPrims]
         )
+        _destroy_stage_traversal_instance()
@@ -0,0 +1,279 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["StageTraversal", "StageTraversalResult", "get_stage_traversal_instance", "destroy_stage_traversal_instance"]
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from omni.flux.asset_importer.core.data_models import SUPPORTED_TEXTURE_EXTENSIONS as _SUPPORTED_TEXTURE_EXTENSIONS
+from omni.flux.utils.common.path_utils import get_invalid_extensions as _get_invalid_extensions
+from omni.flux.utils.common.utils import get_omni_prims as _get_omni_prims
+from pxr import Sdf, Tf, Usd, UsdGeom, UsdLux, UsdShade
+
+_INPUTS_NAMESPACE = "inputs:"
+
+_INSTANCE = None
+
+
+@dataclass
+class StageTraversalResult:
+    """
+    The prims of a stage, bucketed by schema type during a single traversal
+    """
+
+    prims: List[Usd.Prim] = field(default_factory=list)
+    meshes: List[Usd.Prim] = field(default_factory=list)
+    geom_subsets: List[Usd.Prim] = field(default_factory=list)
+    meshes_and_geom_subsets: List[Usd.Prim] = field(default_factory=list)
+    materials: List[Usd.Prim] = field(default_factory=list)
+    shaders: List[Usd.Prim] = field(default_factory=list)
+    lights: List[Usd.Prim] = field(default_factory=list)
+    # (texture input property path, input base name, resolved texture path). Computed on demand.
+    texture_inputs: Optional[List[Tuple[str, str, str]]] = None
+    # The paths of the prims. Computed on demand.
+    prim_paths: Optional[Set[Sdf.Path]] = None
+
+    def get_prim_paths(self) -> Set[Sdf.Path]:
+        """
+        Returns:
+            The paths of every prim of the result
+        """
+        if self.prim_paths is None:
+            self.prim_paths = {prim.GetPath() for prim in self.prims}
+        return self.prim_paths
+
+    def get_texture_inputs(self, filtered_input_names: Optional[List[str]] = None) -> List[Tuple[str, str]]:
+        """
+        Get the shader inputs pointing to a supported texture file
+
+        Args:
+            filtered_input_names: If set, only the inputs with one of those base names will be returned
+
+        Returns:
+            A list of tuples of (texture input property path, resolved texture path)
+        """
+        if self.texture_inputs is None:
+            self.texture_inputs = self.__extract_texture_inputs()
+
+        if not filtered_input_names:
+            return [(input_path, asset_path) for input_path, _, asset_path in self.texture_inputs]
+
+        input_names = frozenset(filtered_input_names)
+        return [
+            (input_path, asset_path)
+            for input_path, input_name, asset_path in self.texture_inputs
+            if input_name in input_names
+        ]
+
+    def __extract_texture_inputs(self) -> List[Tuple[str, str, str]]:
+        texture_inputs = []
+        valid_extensions = {}
+        for shader_prim in self.shaders:
+            for attr in shader_prim.GetAuthoredAttributes():
+                attr_name = attr.GetName()
+                # Make sure the attribute is a shader input that expects an asset
+                if not attr_name.startswith(_INPUTS_NAMESPACE):
+                    continue
+                if attr.GetTypeName() != Sdf.ValueTypeNames.Asset:
+                    continue
+                value = attr.Get()
+                if value is None:
+                    continue
+                # Make sure the asset is a supported texture
+                texture_asset_path = value.resolvedPath
+                if texture_asset_path not in valid_extensions:
+                    valid_extensions[texture_asset_path] = not _get_invalid_extensions(
+                        file_paths=[texture_asset_path], valid_extensions=_SUPPORTED_TEXTURE_EXTENSIONS
+                    )
+                if not valid_extensions[texture_asset_path]:
+                    continue
+                # Store the texture property and the asset path
+                texture_inputs.append(
+                    (str(attr.GetPath()), attr_name[len(_INPUTS_NAMESPACE) :], str(texture_asset_path))
+                )
+        return texture_inputs
+
+
+class StageTraversal:
+    """
+    Walk a stage once and share the bucketed prims with every selector plugin.
+
+    The result of a walk is cached per stage and per root-layer filter until a change notice is received for the stage.
+    """
+
+    MAX_CACHED_STAGES = 4
+
+    def __init__(self):
+        self._results: OrderedDict[Usd.Stage, Dict[bool, StageTraversalResult]] = OrderedDict()
+        self._listeners: Dict[Usd.Stage, Tf.Listener] = {}
+
+    def get(self, stage: Usd.Stage, select_from_root_layer_only: bool = False) -> StageTraversalResult:
+        """
+        Get the bucketed prims of a stage. The stage is only traversed if no valid cached walk exists.
+
+        Args:
+            stage: the stage to traverse
+            select_from_root_layer_only: only keep prims with a prim spec in the root layer
+
+        Returns:
+            The bucketed prims of the stage
+        """
+        stage_results = self._results.get(stage)
+        if stage_results is None:
+            # Only keep the walks of the most recently used stages
+            while len(self._results) >= self.MAX_CACHED_STAGES:
+                self.invalidate(next(iter(self._results)))
+            stage_results = {}
+            self._results[stage] = stage_results
+            self._listeners[stage] = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_usd_changed, stage)
+        else:
+            self._results.move_to_end(stage)
+
+        result = stage_results.get(select_from_root_layer_only)
+        if result is None:
+            result = self.traverse(stage, select_from_root_layer_only=select_from_root_layer_only)
+            stage_results[select_from_root_layer_only] = result
+        return result
+
+    @staticmethod
+    def traverse(stage: Usd.Stage, select_from_root_layer_only: bool = False) -> StageTraversalResult:
+        """
+        Traverse a stage and bucket every prim by schema type. This does not use the cache.
+
+        Omniverse prims, and prims without a spec in the root layer when `select_from_root_layer_only` is True, are
+        pruned with all of their children.
+
+        Args:
+            stage: the stage to traverse
+            select_from_root_layer_only: only keep prims with a prim spec in the root layer
+
+        Returns:
+            The bucketed prims of the stage
+        """
+        result = StageTraversalResult()
+        omni_prims = _get_omni_prims()
+        root_layer = stage.GetRootLayer()
+        schema_buckets = {}
+
+        prim_range = iter(Usd.PrimRange(stage.GetPseudoRoot(), Usd.PrimAllPrimsPredicate))
+        # Skip the pseudo-root
+        next(prim_range)
+        for prim in prim_range:
+            prim_path = prim.GetPath()
+            # Discard omniverse prims & prims not on the root layer if filtering for root layer prims
+            if prim_path in omni_prims or (select_from_root_layer_only and not root_layer.GetPrimAtPath(prim_path)):
+                prim_range.PruneChildren()
+                continue
+
+            result.prims.append(prim)
+
+            # The schema checks only depend on the prim type and applied schemas so only compute them once per type
+            schema_key = (prim.GetTypeName(), tuple(prim.GetAppliedSchemas()))
+            buckets = schema_buckets.get(schema_key)
+            if buckets is None:
+                buckets = StageTraversal.__get_prim_buckets(prim, result)
+                schema_buckets[schema_key] = buckets
+            for bucket in buckets:
+                bucket.append(prim)
+
+        return result
+
+    @staticmethod
+    def __get_prim_buckets(prim: Usd.Prim, result: StageTraversalResult) -> List[List[Usd.Prim]]:
+        buckets = []
+        is_mesh = prim.IsA(UsdGeom.Mesh)
+        is_geom_subset = prim.IsA(UsdGeom.Subset)
+        if is_mesh:
+            buckets.append(result.meshes)
+        if is_geom_subset:
+            buckets.append(result.geom_subsets)
+        if is_mesh or is_geom_subset:
+            buckets.append(result.meshes_and_geom_subsets)
+        if prim.IsA(UsdShade.Material):
+            buckets.append(result.materials)
+        if prim.IsA(UsdShade.Shader):
+            buckets.append(result.shaders)
+        if prim.HasAPI(UsdLux.LightAPI) if hasattr(UsdLux, "LightAPI") else prim.IsA(UsdLux.Light):
+            buckets.append(result.lights)
+        return buckets
+
+    def invalidate(self, stage: Optional[Usd.Stage] = None):
+        """
+        Invalidate the cached walks
+
+        Args:
+            stage: the stage to invalidate the walks for. If None, every cached walk will be invalidated.
+        """
+        for cached_stage in list(self._results.keys()):
+            if stage is None or cached_stage == stage:
+                del self._results[cached_stage]
+                self._listeners.pop(cached_stage).Revoke()
+
+    def _on_usd_changed(self, notice, stage):
+        if notice.GetResyncedPaths():
+            # Prims were added, removed or changed type: the buckets are not valid anymore
+            self.invalidate(stage)
+            return
+        stage_results = self._results.get(stage, {})
+        # Adding or removing an `over` on an existing prim can be an info-only change, but it changes which prims have
+        # a spec in the root layer
+        root_layer_result = stage_results.get(True)
+        if root_layer_result is not None and self.__root_layer_prims_changed(
+            stage, root_layer_result, notice.GetChangedInfoOnlyPaths()
+        ):
+            del stage_results[True]
+        # Only values changed: the prims are still valid but the texture inputs could have changed
+        for result in stage_results.values():
+            result.texture_inputs = None
+
+    @staticmethod
+    def __root_layer_prims_changed(stage: Usd.Stage, result: StageTraversalResult, paths: List[Sdf.Path]) -> bool:
+        root_layer = stage.GetRootLayer()
+        prim_paths = result.get_prim_paths()
+        omni_prims = None
+        for path in paths:
+            prim_path = path.GetPrimPath()
+            if prim_path == Sdf.Path.absoluteRootPath:
+                continue
+            if (prim_path in prim_paths) == bool(root_layer.GetPrimAtPath(prim_path)):
+                continue
+            if omni_prims is None:
+                omni_prims = _get_omni_prims()
+            # Omniverse prims and their children are never selected
+            if any(prefix in omni_prims for prefix in prim_path.GetPrefixes()):
+                continue
+            return True
+        return False
+
+    def destroy(self):
+        self.invalidate()
+
+
+def get_stage_traversal_instance() -> StageTraversal:
+    global _INSTANCE
+    if _INSTANCE is None:
+        _INSTANCE = StageTraversal()
+    return _INSTANCE
+
+
+def destroy_stage_traversal_instance():
+    global _INSTANCE
+    if _INSTANCE is not None:
+        _INSTANCE.destroy()
+    _INSTANCE = None
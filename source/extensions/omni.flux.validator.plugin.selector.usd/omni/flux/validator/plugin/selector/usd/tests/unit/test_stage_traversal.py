@@ -0,0 +1,186 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import carb
+from omni.flux.utils.common.utils import get_omni_prims as _get_omni_prims
+from omni.flux.validator.plugin.selector.usd import StageTraversal as _StageTraversal
+from omni.kit.test.async_unittest import AsyncTestCase
+from pxr import Sdf, Usd, UsdGeom, UsdShade
+
+_BENCHMARK_PRIM_COUNTS = [1_000, 100_000]
+_BENCHMARK_LARGE_PRIM_COUNT = 1_000_000
+
+
+def _create_synthetic_stage(prim_count: int, texture_path: str) -> Usd.Stage:
+    """Create a stage with `prim_count` prims: groups of 1 Xform, 1 Mesh, 1 Material & 1 textured Shader"""
+    stage = Usd.Stage.CreateInMemory()
+    layer = stage.GetRootLayer()
+    with Sdf.ChangeBlock():
+        for index in range(prim_count // 4):
+            group = Sdf.CreatePrimInLayer(layer, f"/Root/Group_{index}")
+            group.specifier = Sdf.SpecifierDef
+            group.typeName = "Xform"
+            mesh = Sdf.PrimSpec(group, "Mesh", Sdf.SpecifierDef, "Mesh")
+            material = Sdf.PrimSpec(group, "Material", Sdf.SpecifierDef, "Material")
+            shader = Sdf.PrimSpec(material, "Shader", Sdf.SpecifierDef, "Shader")
+            texture = Sdf.AttributeSpec(shader, "inputs:diffuse_texture", Sdf.ValueTypeNames.Asset)
+            texture.default = Sdf.AssetPath(texture_path)
+            Sdf.AttributeSpec(mesh, "doubleSided", Sdf.ValueTypeNames.Bool).default = True
+    return stage
+
+
+def _legacy_get_prims(stage: Usd.Stage, root_layer_only: bool = False):
+    def traverse(prim, layer):
+        for child in prim.GetFilteredChildren(Usd.PrimAllPrimsPredicate):
+            if child.GetPath() in _get_omni_prims():
+                continue
+            if root_layer_only and not layer.GetPrimAtPath(child.GetPath()):
+                continue
+            yield child
+            yield from traverse(child, layer)
+
+    return list(traverse(stage.GetPseudoRoot(), stage.GetRootLayer()))
+
+
+class TestStageTraversal(AsyncTestCase):
+    async def setUp(self):
+        self.traversal = _StageTraversal()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.texture_path = Path(self.temp_dir.name) / "T_Albedo.dds"
+        self.texture_path.touch()
+        self.invalid_texture_path = Path(self.temp_dir.name) / "T_Albedo.txt"
+        self.invalid_texture_path.touch()
+
+    async def tearDown(self):
+        self.traversal.destroy()
+        self.traversal = None
+        self.temp_dir.cleanup()
+
+    async def test_traverse_should_bucket_prims_like_the_legacy_selectors(self):
+        # Arrange
+        stage = _create_synthetic_stage(40, str(self.texture_path))
+        stage.DefinePrim("/Render/Vars", "Scope")
+        sublayer = Sdf.Layer.CreateAnonymous()
+        stage.GetRootLayer().subLayerPaths.append(sublayer.identifier)
+        with Usd.EditContext(stage, sublayer):
+            stage.DefinePrim("/Root/Group_0/SublayerMesh", "Mesh")
+            UsdGeom.Subset.Define(stage, "/Root/Group_0/Mesh/Subset")
+
+        for root_layer_only in [False, True]:
+            with self.subTest(root_layer_only=root_layer_only):
+                # Act
+                result = self.traversal.get(stage, select_from_root_layer_only=root_layer_only)
+
+                # Assert
+                legacy_prims = _legacy_get_prims(stage, root_layer_only=root_layer_only)
+                self.assertListEqual(result.prims, legacy_prims)
+                self.assertListEqual(result.meshes, [p for p in legacy_prims if p.IsA(UsdGeom.Mesh)])
+                self.assertListEqual(
+                    result.meshes_and_geom_subsets,
+                    [p for p in legacy_prims if p.IsA(UsdGeom.Mesh) or p.IsA(UsdGeom.Subset)],
+                )
+                self.assertListEqual(result.materials, [p for p in legacy_prims if p.IsA(UsdShade.Material)])
+                self.assertListEqual(result.shaders, [p for p in legacy_prims if p.IsA(UsdShade.Shader)])
+                self.assertNotIn(Sdf.Path("/Render/Vars"), [p.GetPath() for p in result.prims])
+
+    async def test_get_should_reuse_walk_until_stage_changes(self):
+        # Arrange
+        stage = _create_synthetic_stage(8, str(self.texture_path))
+
+        # Act
+        first_result = self.traversal.get(stage)
+        texture_inputs = first_result.get_texture_inputs(filtered_input_names=["diffuse_texture"])
+        second_result = self.traversal.get(stage)
+
+        # Assert
+        self.assertIs(first_result, second_result)
+        self.assertEqual(2, len(texture_inputs))
+        self.assertListEqual([], first_result.get_texture_inputs(filtered_input_names=["normalmap_texture"]))
+
+        # Value changes only invalidate the texture inputs
+        shader = stage.GetPrimAtPath("/Root/Group_0/Material/Shader")
+        shader.GetAttribute("inputs:diffuse_texture").Set(Sdf.AssetPath(str(self.invalid_texture_path)))
+        self.assertIs(first_result, self.traversal.get(stage))
+        self.assertEqual(1, len(first_result.get_texture_inputs()))
+
+        # Structure changes invalidate the whole walk
+        stage.DefinePrim("/Root/NewMesh", "Mesh")
+        third_result = self.traversal.get(stage)
+        self.assertIsNot(first_result, third_result)
+        self.assertIn(Sdf.Path("/Root/NewMesh"), [p.GetPath() for p in third_result.meshes])
+
+    async def test_get_root_layer_only_should_update_when_root_layer_specs_change(self):
+        # Arrange
+        stage = _create_synthetic_stage(8, str(self.texture_path))
+        sublayer = Sdf.Layer.CreateAnonymous()
+        stage.GetRootLayer().subLayerPaths.append(sublayer.identifier)
+        with Usd.EditContext(stage, sublayer):
+            stage.DefinePrim("/Root/Group_0/SublayerMesh", "Mesh")
+        first_result = self.traversal.get(stage, select_from_root_layer_only=True)
+        all_prims_result = self.traversal.get(stage)
+
+        # Act
+        Sdf.CreatePrimInLayer(stage.GetRootLayer(), "/Root/Group_0/SublayerMesh")
+        second_result = self.traversal.get(stage, select_from_root_layer_only=True)
+
+        # Assert
+        self.assertNotIn(Sdf.Path("/Root/Group_0/SublayerMesh"), [p.GetPath() for p in first_result.prims])
+        self.assertIn(Sdf.Path("/Root/Group_0/SublayerMesh"), [p.GetPath() for p in second_result.meshes])
+        self.assertListEqual(second_result.prims, _legacy_get_prims(stage, root_layer_only=True))
+        self.assertListEqual(self.traversal.get(stage).prims, all_prims_result.prims)
+
+    async def test_benchmark_traversal(self):
+        await self.__run_benchmark(_BENCHMARK_PRIM_COUNTS)
+
+    @unittest.skipUnless(os.environ.get("FLUX_RUN_LARGE_BENCHMARKS"), "Set FLUX_RUN_LARGE_BENCHMARKS to run")
+    async def test_benchmark_traversal_large(self):
+        await self.__run_benchmark([_BENCHMARK_LARGE_PRIM_COUNT])
+
+    async def __run_benchmark(self, prim_counts):
+        for prim_count in prim_counts:
+            stage = _create_synthetic_stage(prim_count, str(self.texture_path))
+
+            # Selecting prims, meshes, materials, shaders & textures used to walk the stage 5 times
+            start = time.perf_counter()
+            legacy_prims = _legacy_get_prims(stage)
+            legacy_duration = time.perf_counter() - start
+
+            start = time.perf_counter()
+            result = self.traversal.get(stage)
+            result.get_texture_inputs()
+            walk_duration = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(4):
+                self.traversal.get(stage)
+            cached_duration = time.perf_counter() - start
+
+            carb.log_info(
+                f"Stage traversal of {len(legacy_prims)} prims: legacy single walk {legacy_duration:.3f}s, "
+                f"bucketed walk {walk_duration:.3f}s, 4 cached selections {cached_duration:.6f}s"
+            )
+
+            self.assertEqual(len(legacy_prims), len(result.prims))
+            self.assertEqual(prim_count // 4, len(result.meshes))
+            self.assertEqual(prim_count // 4, len(result.get_texture_inputs()))
+            self.traversal.invalidate(stage)
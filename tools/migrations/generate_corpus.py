@@ -0,0 +1,71 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+
+Generate a corpus of local USD files to measure the throughput of the migrations CLI.
+
+Example:
+
+    python generate_corpus.py ./corpus --count 1000 --mods 20
+    python migrations_cli.py distant-lights-z-direction -d ./corpus -r -w 4
+"""
+import argparse
+from pathlib import Path
+
+_LAYER_TEMPLATE = """#usda 1.0
+(
+    defaultPrim = "RootNode"
+)
+
+def Xform "RootNode"
+{{
+{lights}
+}}
+"""
+
+_LIGHT_TEMPLATE = """    def DistantLight "light_{index}"
+    {{
+        float inputs:intensity = 1000
+        float3 xformOp:rotateXYZ = ({x}, {y}, {z})
+        uniform token[] xformOpOrder = ["xformOp:rotateXYZ"]
+    }}
+"""
+
+
+def setup_cli() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate a corpus of USD files with distant lights.")
+    parser.add_argument("directory", type=Path, help="Path to the directory to generate the USD files in")
+    parser.add_argument("--count", "-c", type=int, default=1000, help="Number of USD files to generate")
+    parser.add_argument("--mods", "-m", type=int, default=10, help="Number of sub-directories to spread the files in")
+    parser.add_argument("--lights", "-l", type=int, default=10, help="Number of distant lights in each USD file")
+    return parser.parse_args()
+
+
+def generate(directory: Path, count: int, mods: int, lights: int):
+    for index in range(count):
+        mod_directory = directory / f"mod_{index % max(mods, 1):04d}"
+        mod_directory.mkdir(parents=True, exist_ok=True)
+        layer = _LAYER_TEMPLATE.format(
+            lights="".join(
+                _LIGHT_TEMPLATE.format(index=light, x=light * 10, y=index % 90, z=light * 5) for light in range(lights)
+            )
+        )
+        (mod_directory / f"mod_{index:06d}.usda").write_text(layer, encoding="utf8")
+    print(f"Generated {count} USD files in {directory}")
+
+
+if __name__ == "__main__":
+    _args = setup_cli()
+    generate(_args.directory, _args.count, _args.mods, _args.lights)
@@ -15,18 +15,83 @@
 * limitations under the License.
 """
 import argparse
+import copy
+import heapq
 import json
 import platform
+import re
 import subprocess
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+_USD_SUFFIXES = {".usd", ".usda", ".usdb", ".usdc"}
+# Printed by the mass validation CLI every time a schema is processed
+_GLOBAL_PROGRESS_PATTERN = re.compile(r"Global progress (\d+)/(\d+)")
+_FIXES_APPLIED_KEY = "fixes_applied"
 
 
 class Migrations(Enum):
     DistantLightsZDirection = "distant-lights-z-direction"
 
 
+class JournalStatus(Enum):
+    Completed = "completed"
+    Failed = "failed"
+
+
+class Journal:
+    """
+    Persisted progress of a sharded migration, used to skip the files completed in a previous run.
+
+    Every processed file appends a line to the journal, so the progress is kept even if the migration crashes.
+    """
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._lock = threading.Lock()
+        # {file path: {"status": str, "duration": float, "modified_time": int}}
+        self._files: Dict[str, Dict] = {}
+        if path.exists():
+            with open(path, "r", encoding="utf8") as journal_file:
+                for line in journal_file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # The last line can be incomplete if the migration crashed while writing it
+                        continue
+                    self._files[entry["file"]] = entry
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def is_completed(self, file: Path) -> bool:
+        """A file is completed if it was migrated and not modified since"""
+        entry = self._files.get(str(file))
+        return (
+            entry is not None
+            and entry["status"] == JournalStatus.Completed.value
+            and entry["modified_time"] == _get_modified_time(file)
+        )
+
+    def record(self, file: Path, status: JournalStatus, duration: float):
+        entry = {
+            "file": str(file),
+            "status": status.value,
+            "duration": duration,
+            "modified_time": _get_modified_time(file),
+        }
+        with self._lock:
+            self._files[str(file)] = entry
+            with open(self._path, "a", encoding="utf8") as journal_file:
+                journal_file.write(json.dumps(entry) + "\n")
+
+
 def setup_cli() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run various compatibility migrations in a command line tool.")
 
@@ -63,6 +128,34 @@ def setup_cli() -> argparse.Namespace:
         help="Recursively search for USD files in the given directory. Will be ignored if `--file` is given."
     )
 
+    lights_parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        help=(
+            "Split the USD files of the directory across this number of processes. The progress is saved in a "
+            "journal and the files completed in a previous run are skipped. Will be ignored if `--file` is given."
+        )
+    )
+
+    lights_parser.add_argument(
+        "--batch-size",
+        "-b",
+        type=int,
+        default=50,
+        help="Number of USD files migrated by each process before starting a new one. Only used with `--workers`."
+    )
+
+    lights_parser.add_argument(
+        "--journal",
+        "-j",
+        type=Path,
+        help=(
+            "Path to the progress journal. Only used with `--workers`. "
+            "Defaults to a `.jsonl` file named after the migration in the directory."
+        )
+    )
+
     return parser.parse_args()
 
 
@@ -76,10 +169,16 @@ def validate_args(args: argparse.Namespace):
             raise FileNotFoundError("The selected file does not exist.")
         if file.suffix not in [".usd", ".usda", ".usdc"]:
             raise ValueError("The selected file is not a USD file. Valid file types are: `.usd`, `.usda`, `.usdc`")
+        if args.workers is not None:
+            print("Warning: --workers flag is ignored when processing a file")
     elif args.directory:
         directory = Path(args.directory)
         if not directory.exists() or not directory.is_dir():
             raise FileNotFoundError("The selected directory does not exist.")
+        if args.workers is not None and args.workers < 1:
+            raise ValueError("The number of workers must be at least 1.")
+        if args.batch_size < 1:
+            raise ValueError("The batch size must be at least 1.")
 
 
 def execute(args: argparse.Namespace):
@@ -107,6 +206,10 @@ def __run_distant_lights_migrations(args: argparse.Namespace):
             "If you wish to process a single file instead, use the `--file` (or `-f`) flag",
             "If you wish to process all the files in the directory as well as all the included sub-directories, add the `--recursive` (or `-r`) flag",
         ]
+    if args.directory and args.workers:
+        additional_info.append(
+            f"The files will be split across {args.workers} processes and the progress will be saved in a journal"
+        )
 
     continue_token = "continue"
     quit_token = "q"
@@ -134,6 +237,15 @@ def __run_distant_lights_migrations(args: argparse.Namespace):
     print("\nExecuting the migration")
     print("*"*separator_length)
 
+    if args.directory and args.workers:
+        __run_sharded_migration(
+            args,
+            Migrations.DistantLightsZDirection,
+            (Path(__file__).parent / "./distant_lights_migration_file.json").resolve(),
+            (Path(__file__).parent / "./distant_lights_migration_directory.json").resolve(),
+        )
+        return
+
     # Depending on the input, select the appropriate schema
     schema_path = "./distant_lights_migration_file.json" if args.file else "./distant_lights_migration_directory.json"
     schema_path = (Path(__file__).parent / schema_path).resolve()
@@ -157,12 +269,8 @@ def __run_distant_lights_migrations(args: argparse.Namespace):
         schema_file_path = schema_file.name
 
     try:
-        # Call Kit using: lightspeed.app.trex.ingestcraft.cli.bat or lightspeed.app.trex.ingestcraft.cli.sh
-        extension = ".bat" if platform.system().lower() == "windows" else ".sh"
-        exec_path = str(Path(__file__).parent.parent.parent / "lightspeed.app.trex.ingestcraft.cli") + extension
-
         # Execute the process
-        cmd = [exec_path, "--schema", schema_file_path]
+        cmd = [_get_kit_cli_path(), "--schema", schema_file_path]
         with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT) as process:
             for line in process.stdout:
                 print(line.decode(errors="replace"), end="")
@@ -170,6 +278,175 @@ def __run_distant_lights_migrations(args: argparse.Namespace):
         Path(schema_file_path).unlink(missing_ok=True)
 
 
+def _get_kit_cli_path() -> str:
+    # Call Kit using: lightspeed.app.trex.ingestcraft.cli.bat or lightspeed.app.trex.ingestcraft.cli.sh
+    extension = ".bat" if platform.system().lower() == "windows" else ".sh"
+    return str(Path(__file__).parent.parent.parent / "lightspeed.app.trex.ingestcraft.cli") + extension
+
+
+def _get_modified_time(file: Path) -> Optional[int]:
+    try:
+        return file.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _find_usd_files(directory: Path, recursive: bool, ignore_paths: Optional[List[str]] = None) -> List[Path]:
+    """Find the USD files like the `USDDirectory` context plugin does"""
+    if any(ignore_path in directory.as_posix() for ignore_path in ignore_paths or []):
+        return []
+    files = []
+    for entry in sorted(directory.iterdir()):
+        if entry.is_file() and entry.suffix in _USD_SUFFIXES:
+            files.append(entry)
+        elif recursive and entry.is_dir():
+            files.extend(_find_usd_files(entry, recursive, ignore_paths))
+    return files
+
+
+def _is_validated(file: Path, fixes: List[str]) -> bool:
+    """Check the metadata written by the `FileMetadataWritter` resultor plugin"""
+    metadata_path = file.with_suffix(file.suffix + ".meta")
+    if not metadata_path.exists():
+        return False
+    try:
+        with open(metadata_path, "r", encoding="utf8") as metadata_file:
+            fixes_applied = json.load(metadata_file).get(_FIXES_APPLIED_KEY) or []
+    except (OSError, ValueError):
+        return False
+    return bool(set(fixes).intersection(fixes_applied))
+
+
+def _split_in_shards(files: List[Path], count: int) -> List[List[Path]]:
+    """Split the files in shards of similar total size, assigning the largest files first"""
+    shards = [[] for _ in range(count)]
+    # (total size, shard index)
+    heap = [(0, index) for index in range(count)]
+    for file in sorted(files, key=lambda f: f.stat().st_size, reverse=True):
+        size, index = heapq.heappop(heap)
+        shards[index].append(file)
+        heapq.heappush(heap, (size + file.stat().st_size, index))
+    return [shard for shard in shards if shard]
+
+
+def __run_batch(
+    worker_index: int,
+    files: List[Path],
+    file_schema: dict,
+    on_file_processed: Callable[[int, Path, bool, float], None],
+    cli_path: str,
+) -> List[Path]:
+    """
+    Migrate the files in a single Kit process, with one schema per file.
+
+    Returns:
+        The files that were not processed
+    """
+    with tempfile.TemporaryDirectory() as batch_directory:
+        cmd = [cli_path]
+        names = []
+        for index, file in enumerate(files):
+            schema = copy.deepcopy(file_schema)
+            schema["name"] = f"{file_schema['name']} {index}"
+            schema["context_plugin"]["data"]["file"] = str(file)
+            schema_path = Path(batch_directory) / f"{index}.json"
+            with open(schema_path, "w", encoding="utf8") as schema_file:
+                json.dump(schema, schema_file, indent=4)
+            names.append(schema["name"])
+            cmd.extend(["--schema", str(schema_path)])
+
+        processed = 0
+        last_time = time.perf_counter()
+        # The mass validation CLI writes the failed schemas in the working directory
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, cwd=batch_directory) as process:
+            for line in process.stdout:
+                text = line.decode(errors="replace")
+                print(f"[worker {worker_index}] {text}", end="")
+                if processed >= len(files) or not _GLOBAL_PROGRESS_PATTERN.search(text):
+                    continue
+                # The schemas are processed in order: the first duration includes the Kit startup
+                now = time.perf_counter()
+                failed = (Path(batch_directory) / f"{names[processed]}_failed_schema.json").exists()
+                on_file_processed(worker_index, files[processed], not failed, now - last_time)
+                processed += 1
+                last_time = now
+    return files[processed:]
+
+
+def __run_sharded_migration(
+    args: argparse.Namespace,
+    migration: Migrations,
+    file_schema_path: Path,
+    directory_schema_path: Path,
+    cli_path: Optional[str] = None,
+):
+    with open(file_schema_path, "r") as schema_file:
+        file_schema = json.load(schema_file)
+    with open(directory_schema_path, "r") as schema_file:
+        ignore_paths = json.load(schema_file)["context_plugin"]["data"].get("ignore_paths")
+    fixes = file_schema["context_plugin"]["data"]["file_validated_fixes"]
+    file_schema["context_plugin"]["data"]["skip_validated_files"] = not args.force
+
+    directory = Path(args.directory).resolve()
+    journal = Journal(Path(args.journal) if args.journal else directory / f".{migration.value}.journal.jsonl")
+
+    files = _find_usd_files(directory, args.recursive, ignore_paths)
+    pending_files = []
+    for file in files:
+        # The files already migrated would make the whole batch fail
+        if not args.force and (journal.is_completed(file) or _is_validated(file, fixes)):
+            continue
+        pending_files.append(file)
+    print(
+        f"Found {len(files)} USD files, {len(files) - len(pending_files)} already migrated, "
+        f"{len(pending_files)} to migrate. Progress journal: {journal.path}"
+    )
+    if not pending_files:
+        return
+
+    shards = _split_in_shards(pending_files, args.workers)
+    lock = threading.Lock()
+    stats = {"completed": 0, "failed": 0}
+
+    def on_file_processed(worker_index: int, file: Path, success: bool, duration: float):
+        journal.record(file, JournalStatus.Completed if success else JournalStatus.Failed, duration)
+        with lock:
+            stats["completed" if success else "failed"] += 1
+            count = stats["completed"] + stats["failed"]
+        status = "Migrated" if success else "Failed"
+        # Single write to not interleave with the output of the other workers
+        print(f"[{count}/{len(pending_files)}] {status} {file} in {duration:.2f}s (worker {worker_index})\n", end="")
+
+    def run_shard(worker_index: int, shard: List[Path]) -> List[Path]:
+        not_processed = []
+        for start in range(0, len(shard), args.batch_size):
+            not_processed.extend(
+                __run_batch(
+                    worker_index,
+                    shard[start : start + args.batch_size],
+                    file_schema,
+                    on_file_processed,
+                    cli_path or _get_kit_cli_path(),
+                )
+            )
+        return not_processed
+
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+        results = list(executor.map(run_shard, range(len(shards)), shards))
+    duration = time.perf_counter() - start_time
+    not_processed = [file for result in results for file in result]
+
+    print("*"*96)
+    print(
+        f"Processed {stats['completed'] + stats['failed']} files with {len(shards)} workers in {duration:.2f}s "
+        f"({(stats['completed'] + stats['failed']) / duration:.2f} files/s)",
+        f"Migrated: {stats['completed']}, failed: {stats['failed']}, not processed: {len(not_processed)}",
+        *[f"Not processed: {file}" for file in not_processed],
+        sep="\n"
+    )
+
+
 if __name__ == "__main__":
     _args = setup_cli()
     validate_args(_args)
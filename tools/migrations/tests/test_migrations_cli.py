@@ -0,0 +1,178 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import generate_corpus  # noqa E402
+import migrations_cli  # noqa E402
+
+_MIGRATIONS_DIRECTORY = Path(__file__).resolve().parent.parent
+_FILE_SCHEMA_PATH = _MIGRATIONS_DIRECTORY / "distant_lights_migration_file.json"
+_DIRECTORY_SCHEMA_PATH = _MIGRATIONS_DIRECTORY / "distant_lights_migration_directory.json"
+
+# Stand-in for the mass validation CLI: processes the schemas in order like the real CLI does
+_FAKE_CLI_SCRIPT = """
+import json
+import os
+import sys
+from pathlib import Path
+
+schema_paths = [sys.argv[index + 1] for index, arg in enumerate(sys.argv) if arg == "--schema"]
+for index, schema_path in enumerate(schema_paths):
+    with open(schema_path, "r", encoding="utf8") as schema_file:
+        schema = json.load(schema_file)
+    file = Path(schema["context_plugin"]["data"]["file"])
+    if file.name == os.environ.get("FAKE_CLI_CRASH_FILE"):
+        sys.exit(1)
+    with open(os.environ["FAKE_CLI_LOG"], "a", encoding="utf8") as log_file:
+        log_file.write(file.name + "\\n")
+    if file.name == os.environ.get("FAKE_CLI_FAIL_FILE"):
+        with open(schema["name"] + "_failed_schema.json", "w", encoding="utf8") as failed_file:
+            json.dump(schema, failed_file)
+    print(f"Global progress {index + 1}/{len(schema_paths)}", flush=True)
+"""
+
+
+@pytest.fixture
+def fake_cli(tmp_path, monkeypatch) -> str:
+    script_path = tmp_path / "fake_cli.py"
+    script_path.write_text(_FAKE_CLI_SCRIPT, encoding="utf8")
+    if os.name == "nt":
+        cli_path = tmp_path / "fake_cli.bat"
+        cli_path.write_text(f'@"{sys.executable}" "{script_path}" %*\n', encoding="utf8")
+    else:
+        cli_path = tmp_path / "fake_cli.sh"
+        cli_path.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{script_path}" "$@"\n', encoding="utf8")
+        cli_path.chmod(0o755)
+    monkeypatch.setenv("FAKE_CLI_LOG", str(tmp_path / "fake_cli.log"))
+    return str(cli_path)
+
+
+@pytest.fixture
+def corpus(tmp_path) -> Path:
+    directory = tmp_path / "corpus"
+    generate_corpus.generate(directory, 6, 2, 1)
+    return directory
+
+
+def _get_processed_files(tmp_path: Path) -> list:
+    log_path = tmp_path / "fake_cli.log"
+    return log_path.read_text(encoding="utf8").splitlines() if log_path.exists() else []
+
+
+def _run_migration(directory: Path, cli_path: str, workers: int = 2, batch_size: int = 2):
+    args = argparse.Namespace(
+        directory=directory, recursive=True, force=False, workers=workers, batch_size=batch_size, journal=None
+    )
+    migration = migrations_cli.Migrations.DistantLightsZDirection
+    migrations_cli.__run_sharded_migration(args, migration, _FILE_SCHEMA_PATH, _DIRECTORY_SCHEMA_PATH, cli_path)
+    return migrations_cli.Journal(directory / f".{migration.value}.journal.jsonl")
+
+
+def test_split_in_shards_should_balance_the_file_sizes(tmp_path):
+    # Arrange
+    files = []
+    for index, size in enumerate([10, 100, 40, 60, 50]):
+        file = tmp_path / f"file_{index}.usda"
+        file.write_bytes(b"#" * size)
+        files.append(file)
+
+    # Act
+    shards = migrations_cli._split_in_shards(files, 2)  # noqa PLW0212
+    single_file_shards = migrations_cli._split_in_shards(files[:2], 4)  # noqa PLW0212
+
+    # Assert
+    assert sorted(file for shard in shards for file in shard) == sorted(files)
+    assert sorted(sum(file.stat().st_size for file in shard) for shard in shards) == [120, 140]
+    # The largest files are assigned first
+    assert [shard[0] for shard in shards] == [files[1], files[3]]
+    # Empty shards are dropped
+    assert sorted(single_file_shards) == [[files[0]], [files[1]]]
+
+
+def test_journal_should_only_complete_unmodified_migrated_files(tmp_path):
+    # Arrange
+    journal_path = tmp_path / "journal.jsonl"
+    completed_file, failed_file, modified_file = [tmp_path / f"file_{index}.usda" for index in range(3)]
+    for file in [completed_file, failed_file, modified_file]:
+        file.write_text("#usda 1.0\n", encoding="utf8")
+    journal = migrations_cli.Journal(journal_path)
+    journal.record(completed_file, migrations_cli.JournalStatus.Completed, 1.0)
+    journal.record(failed_file, migrations_cli.JournalStatus.Failed, 1.0)
+    journal.record(modified_file, migrations_cli.JournalStatus.Completed, 1.0)
+    # The last line is incomplete if the migration crashed while writing it
+    with open(journal_path, "a", encoding="utf8") as journal_file:
+        journal_file.write('{"file": "')
+
+    # Act
+    modified_time = modified_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(modified_file, ns=(modified_time, modified_time))
+    reloaded_journal = migrations_cli.Journal(journal_path)
+
+    # Assert
+    assert reloaded_journal.is_completed(completed_file)
+    assert not reloaded_journal.is_completed(failed_file)
+    assert not reloaded_journal.is_completed(modified_file)
+    assert not reloaded_journal.is_completed(tmp_path / "unknown.usda")
+
+
+def test_run_sharded_migration_should_resume_failed_files(tmp_path, corpus, fake_cli, monkeypatch):
+    # Arrange
+    files = sorted(corpus.rglob("*.usda"))
+    monkeypatch.setenv("FAKE_CLI_FAIL_FILE", files[2].name)
+
+    # Act
+    first_journal = _run_migration(corpus, fake_cli)
+    first_processed_files = _get_processed_files(tmp_path)
+    monkeypatch.delenv("FAKE_CLI_FAIL_FILE")
+    second_journal = _run_migration(corpus, fake_cli)
+
+    # Assert
+    assert sorted(first_processed_files) == sorted(file.name for file in files)
+    assert [file for file in files if not first_journal.is_completed(file)] == [files[2]]
+    # Only the failed file is migrated again
+    assert _get_processed_files(tmp_path)[len(first_processed_files) :] == [files[2].name]
+    assert all(second_journal.is_completed(file) for file in files)
+
+
+def test_run_sharded_migration_should_report_files_not_processed_by_a_crashed_batch(
+    tmp_path, corpus, fake_cli, monkeypatch, capsys
+):
+    # Arrange
+    # The corpus files have the same size: the shard keeps the order of the files found in the directory
+    files = sorted(corpus.rglob("*.usda"))
+    # A single shard with batches of 3 files: the crash stops the batch of the first 3 files
+    monkeypatch.setenv("FAKE_CLI_CRASH_FILE", files[1].name)
+
+    # Act
+    journal = _run_migration(corpus, fake_cli, workers=1, batch_size=3)
+    output = capsys.readouterr().out
+    monkeypatch.delenv("FAKE_CLI_CRASH_FILE")
+    _run_migration(corpus, fake_cli, workers=1, batch_size=3)
+
+    # Assert
+    processed_files = _get_processed_files(tmp_path)
+    assert "Migrated: 4, failed: 0, not processed: 2" in output
+    assert [file for file in files if not journal.is_completed(file)] == files[1:3]
+    # The files not processed are migrated by the next run
+    assert sorted(processed_files[4:]) == sorted(file.name for file in files[1:3])
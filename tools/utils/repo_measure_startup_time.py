@@ -15,7 +15,9 @@
 * limitations under the License.
 """
 import email
+import json
 import os
+import re
 import statistics
 import subprocess
 import sys
@@ -27,6 +29,14 @@ import requests
 CRASH_RETURN_CODE = -1
 TIMEOUT_RETURN_CODE = -2
 
+# Printed by Kit when it starts an extension: "[1.234s] [ext: omni.flux.utils.common-2.19.1] startup"
+EXTENSION_STARTUP_PATTERN = re.compile(r"\[(?P<time>\d+(?:\.\d+)?)s\] \[ext: (?P<ext_id>[^\]]+)\] startup")
+# Printed by Kit once every extension is started: "[12.345s] app ready"
+APP_READY_PATTERN = re.compile(r"\[(?P<time>\d+(?:\.\d+)?)s\] app ready")
+# Printed by Python with PYTHONPROFILEIMPORTTIME: "import time:  self [us] | cumulative | imported package"
+IMPORT_TIME_PATTERN = re.compile(r"import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \| (?P<module>.+)$")
+EXTENSION_ID_PATTERN = re.compile(r"^(?P<name>.+?)-(?P<version>\d.*)$")
+
 
 def _send_alert(body, webhook_url):
     """Post the results to the specified Slack channel's webhook"""
@@ -63,6 +73,137 @@ def _run_app_timer(app_command, time_limit):
     return round(time.time() - start, 2)
 
 
+def _run_app_profiler(app_command, time_limit):
+    """
+    Run the application once with the Python import profiler enabled.
+
+    Return the lines printed by the application, or None if it timed out.
+    """
+    env = dict(os.environ, PYTHONPROFILEIMPORTTIME="1")
+    proc = subprocess.Popen(
+        app_command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env, text=True, errors="replace"
+    )
+    try:
+        output, _ = proc.communicate(timeout=4 * time_limit)
+    except subprocess.TimeoutExpired:
+        print(f"Subprocess timeout exceeded; killinig PID={proc.pid}")
+        os.system(f"taskkill /F /PID {proc.pid}")
+        return None
+    if proc.returncode != 0:
+        print(f"The app exited with the return code {proc.returncode}, the profile might be incomplete")
+    return output.splitlines()
+
+
+def _parse_startup_profile(lines):
+    """
+    Get the startup timings of every extension from the app output.
+
+    The duration of an extension is the time until the next extension starts, which includes the import of its Python
+    modules, its `on_startup` and the loading of its plugins.
+
+    Return a list of dictionaries with the name, start time, total, import and startup durations of the extensions,
+    in seconds.
+    """
+    startups = []
+    import_times = {}
+    end_time = None
+    for line in lines:
+        match = IMPORT_TIME_PATTERN.search(line)
+        if match:
+            # Modules are only reported the first time they are imported
+            import_times.setdefault(match.group("module").strip(), int(match.group("cumulative")) / 1_000_000)
+            continue
+        match = EXTENSION_STARTUP_PATTERN.search(line)
+        if match:
+            id_match = EXTENSION_ID_PATTERN.match(match.group("ext_id"))
+            name = id_match.group("name") if id_match else match.group("ext_id")
+            startups.append((float(match.group("time")), name))
+            continue
+        match = APP_READY_PATTERN.search(line)
+        if match and end_time is None:
+            end_time = float(match.group("time"))
+
+    extensions = []
+    for index, (start, name) in enumerate(startups):
+        if index + 1 < len(startups):
+            end = startups[index + 1][0]
+        else:
+            end = end_time if end_time is not None else start
+        duration = max(end - start, 0.0)
+        # The Python module of the extensions have the name of the extension
+        import_duration = min(import_times.get(name, 0.0), duration)
+        extensions.append(
+            {
+                "name": name,
+                "start": start,
+                "duration": duration,
+                "import": import_duration,
+                "startup": duration - import_duration,
+            }
+        )
+    return extensions
+
+
+def _write_startup_profile(extensions, prefixes, output_directory):
+    """
+    Print and write the report of the slowest extensions to start, and write a Chrome trace of the startup
+    (chrome://tracing or https://ui.perfetto.dev).
+    """
+    os.makedirs(output_directory, exist_ok=True)
+
+    selected = [ext for ext in extensions if not prefixes or ext["name"].startswith(tuple(prefixes))]
+    selected.sort(key=lambda ext: ext["duration"], reverse=True)
+    name_width = max([len(ext["name"]) for ext in selected] + [len("Extension")])
+    report = [
+        f"{'Extension'.ljust(name_width)}  {'Total'.rjust(8)}  {'Import'.rjust(8)}  {'Startup'.rjust(8)}",
+        *[
+            f"{ext['name'].ljust(name_width)}  {ext['duration']:8.3f}  {ext['import']:8.3f}  {ext['startup']:8.3f}"
+            for ext in selected
+        ],
+        "",
+        f"{len(selected)} extensions out of {len(extensions)}: "
+        f"{sum(ext['duration'] for ext in selected):.3f}s, "
+        f"including {sum(ext['import'] for ext in selected):.3f}s of imports",
+    ]
+    report_path = os.path.join(output_directory, "startup_profile.txt")
+    with open(report_path, "w", encoding="utf8") as report_file:
+        report_file.write("\n".join(report) + "\n")
+    print("\n".join(report))
+
+    events = []
+    for ext in extensions:
+        start = ext["start"] * 1_000_000
+        events.append(
+            {
+                "name": ext["name"],
+                "cat": "extension",
+                "ph": "X",
+                "ts": start,
+                "dur": ext["duration"] * 1_000_000,
+                "pid": 0,
+                "tid": 0,
+                "args": {"import": ext["import"], "startup": ext["startup"]},
+            }
+        )
+        if ext["import"]:
+            # Nested in the extension event: the modules are imported before `on_startup` is called
+            events.append(
+                {
+                    "name": f"import {ext['name']}",
+                    "cat": "import",
+                    "ph": "X",
+                    "ts": start,
+                    "dur": ext["import"] * 1_000_000,
+                    "pid": 0,
+                    "tid": 0,
+                }
+            )
+    trace_path = os.path.join(output_directory, "startup_trace.json")
+    with open(trace_path, "w", encoding="utf8") as trace_file:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, trace_file)
+    print(f"\nReport: {report_path}\nChrome trace: {trace_path}")
+
+
 def setup_repo_tool(parser, _):
     parser.prog = "measure_startup_time"
     parser.description = (
@@ -86,8 +227,25 @@ def setup_repo_tool(parser, _):
         "-w",
         "--webhook_url",
         dest="webhook_url",
-        required=True,
-        help="URL to post results to Slack",
+        required=False,
+        help="URL to post results to Slack. Required unless --profile is used.",
+    )
+    parser.add_argument(
+        "-p",
+        "--profile",
+        dest="profile",
+        action="store_true",
+        help=(
+            "Run the app once and report the import and startup durations of every extension, "
+            "with a Chrome trace of the startup"
+        ),
+    )
+    parser.add_argument(
+        "-o",
+        "--profile_output",
+        dest="profile_output",
+        required=False,
+        help="Directory to write the startup profile report and trace in",
     )
 
     def run_repo_tool(options, config):
@@ -96,6 +254,24 @@ def setup_repo_tool(parser, _):
         time_limit = settings["time_limit"]
         number = settings["number"]
 
+        if options.profile:
+            lines = _run_app_profiler(app_command, time_limit)
+            if lines is None:
+                sys.exit(1)
+            extensions = _parse_startup_profile(lines)
+            if not extensions:
+                print("No extension startup found in the app output")
+                sys.exit(1)
+            _write_startup_profile(
+                extensions,
+                settings.get("profile_prefixes", []),
+                options.profile_output or settings.get("profile_output", "_build/startup_profile"),
+            )
+            sys.exit(0)
+
+        if not options.webhook_url:
+            parser.error("the following arguments are required: -w/--webhook_url")
+
         timings = [_run_app_timer(app_command, time_limit) for _ in range(number)]
         num_timeouts = len([tm for tm in timings if tm == TIMEOUT_RETURN_CODE])
         num_crashes = len([tm for tm in timings if tm == CRASH_RETURN_CODE])